@@ -389,6 +389,9 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        # Set when call_soon_threadsafe() has written to the self-pipe and
+        # the event loop has not polled for I/O since.
+        self._self_wakeup_pending = False
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -794,7 +797,14 @@ def call_soon_threadsafe(self, callback, *args, context=None):
         handle = self._call_soon(callback, args, context)
         if handle._source_traceback:
             del handle._source_traceback[-1]
-        self._write_to_self()
+        # The handle is in self._ready before the flag is checked.  If a
+        # wakeup is pending, the event loop has not polled since it was
+        # requested and will see this handle when it runs the ready
+        # callbacks, so a single write to the self-pipe serves a whole
+        # burst of calls.
+        if not self._self_wakeup_pending:
+            self._self_wakeup_pending = True
+            self._write_to_self()
         return handle
 
     def run_in_executor(self, executor, func, *args):
@@ -1852,6 +1862,9 @@ def _run_once(self):
             timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
 
         event_list = self._selector.select(timeout)
+        # Callbacks added by call_soon_threadsafe() from now on need a new
+        # wakeup; those added before are run below.
+        self._self_wakeup_pending = False
         self._process_events(event_list)
 
         # Handle 'later' callbacks that are ready.
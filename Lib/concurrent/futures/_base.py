@@ -23,6 +23,9 @@
 CANCELLED_AND_NOTIFIED = 'CANCELLED_AND_NOTIFIED'
 FINISHED = 'FINISHED'
 
+# States in which a future no longer notifies waiters.
+_DONE_STATES = frozenset([CANCELLED_AND_NOTIFIED, FINISHED])
+
 _FUTURE_STATES = [
     PENDING,
     RUNNING,
@@ -74,26 +77,24 @@ def add_cancelled(self, future):
         self.finished_futures.append(future)
 
 class _AsCompletedWaiter(_Waiter):
-    """Used by as_completed()."""
+    """Used by as_completed().
+
+    Completed futures are queued in finished_futures, which the consumer
+    swaps for an empty list (and clears the event) under the lock.  The
+    event only needs to be set when the queue becomes non-empty.
+    """
 
     def __init__(self):
         super(_AsCompletedWaiter, self).__init__()
         self.lock = threading.Lock()
 
-    def add_result(self, future):
+    def _add(self, future):
         with self.lock:
-            super(_AsCompletedWaiter, self).add_result(future)
-            self.event.set()
+            self.finished_futures.append(future)
+            if len(self.finished_futures) == 1:
+                self.event.set()
 
-    def add_exception(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_exception(future)
-            self.event.set()
-
-    def add_cancelled(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_cancelled(future)
-            self.event.set()
+    add_result = add_exception = add_cancelled = _add
 
 class _FirstCompletedWaiter(_Waiter):
     """Used by wait(return_when=FIRST_COMPLETED)."""
@@ -119,9 +120,9 @@ def __init__(self, num_pending_calls, stop_on_exception):
         self.lock = threading.Lock()
         super().__init__()
 
-    def _decrement_pending_calls(self):
+    def _decrement_pending_calls(self, n=1):
         with self.lock:
-            self.num_pending_calls -= 1
+            self.num_pending_calls -= n
             if not self.num_pending_calls:
                 self.event.set()
 
@@ -140,49 +141,60 @@ def add_cancelled(self, future):
         super().add_cancelled(future)
         self._decrement_pending_calls()
 
-class _AcquireFutures(object):
-    """A context manager that does an ordered acquire of Future conditions."""
-
-    def __init__(self, futures):
-        self.futures = sorted(futures, key=id)
-
-    def __enter__(self):
-        for future in self.futures:
-            future._condition.acquire()
-
-    def __exit__(self, *args):
-        for future in self.futures:
-            future._condition.release()
-
-def _create_and_install_waiters(fs, return_when):
+def _create_waiter(fs, return_when):
     if return_when == _AS_COMPLETED:
-        waiter = _AsCompletedWaiter()
+        return _AsCompletedWaiter()
     elif return_when == FIRST_COMPLETED:
-        waiter = _FirstCompletedWaiter()
+        return _FirstCompletedWaiter()
+    # The count is adjusted by _install_waiter() for the futures which turn
+    # out to be already done.
+    elif return_when == FIRST_EXCEPTION:
+        return _AllCompletedWaiter(len(fs), stop_on_exception=True)
+    elif return_when == ALL_COMPLETED:
+        return _AllCompletedWaiter(len(fs), stop_on_exception=False)
     else:
-        pending_count = sum(
-                f._state not in [CANCELLED_AND_NOTIFIED, FINISHED] for f in fs)
+        raise ValueError("Invalid return condition: %r" % return_when)
 
-        if return_when == FIRST_EXCEPTION:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=True)
-        elif return_when == ALL_COMPLETED:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=False)
-        else:
-            raise ValueError("Invalid return condition: %r" % return_when)
+def _install_waiter(fs, waiter):
+    """Install *waiter* on the futures of the set *fs* which are not done.
 
+    Each future is examined under its own condition only, rather than
+    holding the conditions of all futures at once, so the cost is linear in
+    the number of futures and workers are not held up while the waiter is
+    installed.  Return the set of futures which were already done; from then
+    on, the others report to *waiter* as they complete.
+    """
+    done = set()
     for f in fs:
-        f._waiters.append(waiter)
-
-    return waiter
-
+        f._condition.acquire()
+        try:
+            if f._state in _DONE_STATES:
+                done.add(f)
+            else:
+                f._waiters.append(waiter)
+        finally:
+            f._condition.release()
+    if done and isinstance(waiter, _AllCompletedWaiter):
+        waiter._decrement_pending_calls(len(done))
+    return done
+
+def _remove_waiter(fs, waiter):
+    for f in fs:
+        f._condition.acquire()
+        try:
+            f._waiters.remove(waiter)
+        except ValueError:
+            # The future was already done when the waiter was installed.
+            pass
+        finally:
+            f._condition.release()
 
-def _yield_finished_futures(fs, waiter, ref_collect):
+def _yield_finished_futures(fs, ref_collect):
     """
     Iterate on the list *fs*, yielding finished futures one by one in
     reverse order.
-    Before yielding a future, *waiter* is removed from its waiters
-    and the future is removed from each set in the collection of sets
-    *ref_collect*.
+    Before yielding a future, it is removed from each set in the collection
+    of sets *ref_collect*.
 
     The aim of this function is to avoid keeping stale references after
     the future is yielded and before the iterator resumes.
@@ -191,8 +203,6 @@ def _yield_finished_futures(fs, waiter, ref_collect):
         f = fs[-1]
         for futures_set in ref_collect:
             futures_set.remove(f)
-        with f._condition:
-            f._waiters.remove(waiter)
         del f
         # Careful not to keep a reference to the popped value
         yield fs.pop()
@@ -221,16 +231,14 @@ def as_completed(fs, timeout=None):
 
     fs = set(fs)
     total_futures = len(fs)
-    with _AcquireFutures(fs):
-        finished = set(
-                f for f in fs
-                if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        pending = fs - finished
-        waiter = _create_and_install_waiters(fs, _AS_COMPLETED)
+    # Pending futures push themselves to the waiter as they complete, so
+    # each wakeup only deals with the futures completed since the last one.
+    waiter = _create_waiter(fs, _AS_COMPLETED)
+    finished = _install_waiter(fs, waiter)
+    pending = fs - finished
     finished = list(finished)
     try:
-        yield from _yield_finished_futures(finished, waiter,
-                                           ref_collect=(fs,))
+        yield from _yield_finished_futures(finished, ref_collect=(fs,))
 
         while pending:
             if timeout is None:
@@ -251,14 +259,15 @@ def as_completed(fs, timeout=None):
 
             # reverse to keep finishing order
             finished.reverse()
-            yield from _yield_finished_futures(finished, waiter,
+            yield from _yield_finished_futures(finished,
                                                ref_collect=(fs, pending))
 
     finally:
-        # Remove waiter from unfinished futures
-        for f in fs:
-            with f._condition:
-                f._waiters.remove(waiter)
+        # Remove waiter from unfinished futures.  A finished future never
+        # notifies its waiters again, so the waiter can be left in place in
+        # those which have been yielded.
+        _remove_waiter(fs, waiter)
+        waiter.finished_futures = []
 
 DoneAndNotDoneFutures = collections.namedtuple(
         'DoneAndNotDoneFutures', 'done not_done')
@@ -286,30 +295,33 @@ def wait(fs, timeout=None, return_when=ALL_COMPLETED):
         completed. The second set, named 'not_done', contains uncompleted
         futures.
     """
-    with _AcquireFutures(fs):
-        done = set(f for f in fs
-                   if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        not_done = set(fs) - done
-
-        if (return_when == FIRST_COMPLETED) and done:
-            return DoneAndNotDoneFutures(done, not_done)
-        elif (return_when == FIRST_EXCEPTION) and done:
-            if any(f for f in done
-                   if not f.cancelled() and f.exception() is not None):
-                return DoneAndNotDoneFutures(done, not_done)
-
-        if len(done) == len(fs):
-            return DoneAndNotDoneFutures(done, not_done)
-
-        waiter = _create_and_install_waiters(fs, return_when)
-
-    waiter.event.wait(timeout)
-    for f in fs:
-        with f._condition:
-            f._waiters.remove(waiter)
+    fs = set(fs)
+    if return_when == FIRST_COMPLETED:
+        # Avoid installing a waiter on every future if one is already done.
+        done = set(f for f in fs if f._state in _DONE_STATES)
+        if done:
+            return DoneAndNotDoneFutures(done, fs - done)
+    waiter = _create_waiter(fs, return_when)
+    done = _install_waiter(fs, waiter)
+    not_done = fs - done
+
+    if not not_done:
+        return DoneAndNotDoneFutures(done, not_done)
+    if (return_when == FIRST_COMPLETED) and done:
+        pass
+    elif (return_when == FIRST_EXCEPTION) and any(
+            f for f in done if not f.cancelled() and f.exception() is not None):
+        pass
+    else:
+        waiter.event.wait(timeout)
 
+    # Only the futures which have not reported to the waiter need to have
+    # it removed: the others are finished and never notify waiters again.
+    # After that, no future can report to the waiter anymore.
+    _remove_waiter(not_done.difference(waiter.finished_futures), waiter)
     done.update(waiter.finished_futures)
-    return DoneAndNotDoneFutures(done, set(fs) - done)
+    waiter.finished_futures = []
+    return DoneAndNotDoneFutures(done, not_done - done)
 
 class Future(object):
     """Represents the result of an asynchronous computation."""
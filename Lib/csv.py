@@ -18,7 +18,7 @@
            "field_size_limit", "reader", "writer",
            "register_dialect", "get_dialect", "list_dialects", "Sniffer",
            "unregister_dialect", "__version__", "DictReader", "DictWriter",
-           "unix_dialect"]
+           "ColumnReader", "unix_dialect"]
 
 class Dialect:
     """Describe a CSV dialect.
@@ -127,6 +127,61 @@ def __next__(self):
         return d
 
 
+class ColumnReader:
+    def __init__(self, f, fieldnames=None, converters=None, batch_size=10000,
+                 dialect="excel", *args, **kwds):
+        self._fieldnames = fieldnames   # list of keys for the dict
+        # maps field names to a callable or an array typecode
+        self.converters = {} if converters is None else converters
+        self.batch_size = batch_size    # maximum number of rows per batch
+        self.reader = reader(f, dialect, *args, **kwds)
+        self.dialect = dialect
+        self.line_num = 0
+
+    def __iter__(self):
+        return self
+
+    @property
+    def fieldnames(self):
+        if self._fieldnames is None:
+            try:
+                self._fieldnames = next(self.reader)
+            except StopIteration:
+                pass
+        self.line_num = self.reader.line_num
+        return self._fieldnames
+
+    @fieldnames.setter
+    def fieldnames(self, value):
+        self._fieldnames = value
+
+    def __next__(self):
+        fieldnames = self.fieldnames
+        if not fieldnames:
+            raise StopIteration
+        converters = []
+        typecodes = []
+        for name in fieldnames:
+            converter = self.converters.get(name)
+            if isinstance(converter, str):
+                typecodes.append(converter)
+                converter = float if converter in 'fd' else int
+            else:
+                typecodes.append(None)
+            converters.append(converter)
+        columns = self.reader.readcolumns(self.batch_size, converters)
+        self.line_num = self.reader.line_num
+        if not columns[0]:
+            raise StopIteration
+        d = {}
+        for name, typecode, column in zip(fieldnames, typecodes, columns):
+            if typecode is not None:
+                from array import array
+                column = array(typecode, column)
+            d[name] = column
+        return d
+
+
 class DictWriter:
     def __init__(self, f, fieldnames, restval="", extrasaction="raise",
                  dialect="excel", *args, **kwds):
@@ -6,6 +6,8 @@
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
 import struct, sys, time, os
+import bisect
+import collections
 import zlib
 import builtins
 import io
@@ -21,9 +23,18 @@
 _COMPRESS_LEVEL_TRADEOFF = 6
 _COMPRESS_LEVEL_BEST = 9
 
+# Size of the blocks compressed in parallel by GzipFile(threads=n)
+_BLOCK_SIZE = 128 * 1024
+# Size of the dictionary each block is primed with: the deflate window
+_BLOCK_DICT_SIZE = 32 * 1024
+
+# Header of the files written by GzipFile.save_index()
+_INDEX_MAGIC = b'GZIDX\x01'
+
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=1,
+         index_interval=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -34,8 +45,9 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, threads=threads,
+    index_interval=index_interval). In this case, the encoding, errors and
+    newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -55,9 +67,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               threads=threads, index_interval=index_interval)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               threads=threads, index_interval=index_interval)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -109,6 +123,11 @@ def seek(self, off):
         self._buffer = None
         return self.file.seek(off)
 
+    def tell(self):
+        if self._read is None:
+            return self.file.tell()
+        return self.file.tell() - self._length + self._read
+
     def seekable(self):
         return True  # Allows fast-forwarding even in unseekable streams
 
@@ -131,7 +150,8 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, threads=1, index_interval=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -163,6 +183,16 @@ def __init__(self, filename=None, mode=None,
         to the last modification time field in the stream when compressing.
         If omitted or None, the current time is used.
 
+        The threads argument is the number of threads compressing the data
+        when writing.  If it is greater than 1, the data is cut into blocks
+        which are compressed in parallel and joined into a single gzip member.
+
+        The index_interval argument enables random access when reading: a
+        seek point is recorded about every index_interval bytes of
+        decompressed data, so that seek() only has to decompress data from
+        the nearest point.  The seek points can be saved with save_index()
+        and loaded again with load_index().
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
@@ -183,7 +213,7 @@ def __init__(self, filename=None, mode=None,
 
         if mode.startswith('r'):
             self.mode = READ
-            raw = _GzipReader(fileobj)
+            raw = _GzipReader(fileobj, index_interval)
             self._buffer = io.BufferedReader(raw)
             self.name = filename
 
@@ -203,6 +233,9 @@ def __init__(self, filename=None, mode=None,
                                              zlib.DEF_MEM_LEVEL,
                                              0)
             self._write_mtime = mtime
+            self._executor = None
+            if threads > 1:
+                self._init_parallel_write(compresslevel, threads)
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
 
@@ -236,6 +269,15 @@ def _init_write(self, filename):
         self.bufsize = 0
         self.offset = 0  # Current file offset for seek(), tell(), etc
 
+    def _init_parallel_write(self, compresslevel, threads):
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(threads)
+        self._max_pending = 2 * threads
+        self._compresslevel = compresslevel
+        self._pending = collections.deque()  # futures of compressed blocks
+        self._block = bytearray()  # data of the next block
+        self._block_dict = b''  # end of the previous block
+
     def _write_gzip_header(self, compresslevel):
         self.fileobj.write(b'\037\213')             # magic header
         self.fileobj.write(b'\010')                 # compression method
@@ -285,13 +327,59 @@ def write(self,data):
             length = data.nbytes
 
         if length > 0:
-            self.fileobj.write(self.compress.compress(data))
+            if self._executor is None:
+                self.fileobj.write(self.compress.compress(data))
+            else:
+                self._write_blocks(data)
             self.size += length
             self.crc = zlib.crc32(data, self.crc)
             self.offset += length
 
         return length
 
+    def _write_blocks(self, data):
+        block = self._block
+        if not isinstance(data, bytes):
+            data = data.cast('B')
+        if len(block) + len(data) < _BLOCK_SIZE:
+            block += data
+            return
+        start = _BLOCK_SIZE - len(block)
+        block += data[:start]
+        self._submit_block(bytes(block), zlib.Z_SYNC_FLUSH)
+        block.clear()
+        # Write out the finished blocks after each submission, so that no
+        # more than _max_pending blocks are held however large the data.
+        while True:
+            while len(self._pending) > self._max_pending:
+                self.fileobj.write(self._pending.popleft().result())
+            if len(data) - start < _BLOCK_SIZE:
+                break
+            self._submit_block(bytes(data[start:start + _BLOCK_SIZE]),
+                               zlib.Z_SYNC_FLUSH)
+            start += _BLOCK_SIZE
+        block += data[start:]
+
+    def _submit_block(self, data, mode):
+        # Each block is compressed on its own, primed with the end of the
+        # previous block, and ends with a sync flush so that the blocks
+        # form a single deflate stream once joined in order.
+        future = self._executor.submit(_compress_block, data,
+                                       self._compresslevel,
+                                       self._block_dict, mode)
+        self._pending.append(future)
+        if mode == zlib.Z_FULL_FLUSH:
+            self._block_dict = b''
+        else:
+            self._block_dict = data[-_BLOCK_DICT_SIZE:]
+
+    def _flush_blocks(self, fileobj, mode):
+        if self._block or mode != zlib.Z_SYNC_FLUSH:
+            self._submit_block(bytes(self._block), mode)
+            self._block.clear()
+        while self._pending:
+            fileobj.write(self._pending.popleft().result())
+
     def read(self, size=-1):
         self._check_not_closed()
         if self.mode != READ:
@@ -330,7 +418,13 @@ def close(self):
         self.fileobj = None
         try:
             if self.mode == WRITE:
-                fileobj.write(self.compress.flush())
+                if self._executor is None:
+                    fileobj.write(self.compress.flush())
+                else:
+                    try:
+                        self._flush_blocks(fileobj, zlib.Z_FINISH)
+                    finally:
+                        self._executor.shutdown()
                 write32u(fileobj, self.crc)
                 # self.size may exceed 2 GiB, or even 4 GiB
                 write32u(fileobj, self.size & 0xffffffff)
@@ -346,7 +440,10 @@ def flush(self,zlib_mode=zlib.Z_SYNC_FLUSH):
         self._check_not_closed()
         if self.mode == WRITE:
             # Ensure the compressor's buffer is flushed
-            self.fileobj.write(self.compress.flush(zlib_mode))
+            if self._executor is None:
+                self.fileobj.write(self.compress.flush(zlib_mode))
+            else:
+                self._flush_blocks(self.fileobj, zlib_mode)
             self.fileobj.flush()
 
     def fileno(self):
@@ -397,18 +494,60 @@ def readline(self, size=-1):
         self._check_not_closed()
         return self._buffer.readline(size)
 
+    def save_index(self, file):
+        """Save the seek points recorded while reading to file.
+
+        file can be a file name or a binary file object.  The index can be
+        loaded again with load_index() to seek quickly in the same data.
+        """
+        self._check_not_closed()
+        if self.mode != READ:
+            import errno
+            raise OSError(errno.EBADF,
+                          "save_index() on write-only GzipFile object")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, 'wb') as f:
+                self._buffer.raw._save_index(f)
+        else:
+            self._buffer.raw._save_index(file)
+
+    def load_index(self, file):
+        """Load seek points saved by save_index() from file.
+
+        file can be a file name or a binary file object.
+        """
+        self._check_not_closed()
+        if self.mode != READ:
+            import errno
+            raise OSError(errno.EBADF,
+                          "load_index() on write-only GzipFile object")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, 'rb') as f:
+                self._buffer.raw._load_index(f)
+        else:
+            self._buffer.raw._load_index(file)
+
 
 class _GzipReader(_compression.DecompressReader):
-    def __init__(self, fp):
+    def __init__(self, fp, index_interval=None):
         super().__init__(_PaddedFile(fp), zlib.decompressobj,
                          wbits=-zlib.MAX_WBITS)
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        # Seek points, as (offset, file offset, bits, window) tuples.  The
+        # window is None for the start of a member, otherwise the data
+        # before offset, compressed.
+        self._index = []
+        self._index_offsets = []
+        self._index_interval = index_interval
+        self._window = b''  # end of the data of the member, when indexing
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
         self._stream_size = 0  # Decompressed size of unconcatenated stream
+        self._check_trailer = True
+        self._window = b''
 
     def _read_exact(self, n):
         '''Read exactly *n* bytes from `self._fp`
@@ -484,6 +623,8 @@ def read(self, size=-1):
                 # If the _new_member flag is set, we have to
                 # jump to the next member, if there is one.
                 self._init_read()
+                if self._index_interval:
+                    self._add_seek_point(self._fp.tell(), 0, None)
                 if not self._read_gzip_header():
                     self._size = self._pos
                     return b""
@@ -492,7 +633,10 @@ def read(self, size=-1):
             # Read a chunk of data from the file
             buf = self._fp.read(io.DEFAULT_BUFFER_SIZE)
 
-            uncompress = self._decompressor.decompress(buf, size)
+            if self._index_interval:
+                uncompress = self._decompress_block(buf, size)
+            else:
+                uncompress = self._decompressor.decompress(buf, size)
             if self._decompressor.unconsumed_tail != b"":
                 self._fp.prepend(self._decompressor.unconsumed_tail)
             elif self._decompressor.unused_data != b"":
@@ -510,6 +654,111 @@ def read(self, size=-1):
         self._pos += len(uncompress)
         return uncompress
 
+    def _decompress_block(self, buf, size):
+        # Like decompress(), but stop at the end of deflate blocks to record
+        # seek points there
+        decompressor = self._decompressor
+        uncompress = decompressor.decompress_block(buf, size)
+        self._window = (self._window + uncompress)[-_BLOCK_DICT_SIZE:]
+        data_type = decompressor.data_type
+        # Stopped at the end of a block which is not the last one
+        if data_type & 128 and not data_type & 64 and not decompressor.eof:
+            offset = self._fp.tell() - len(decompressor.unconsumed_tail)
+            self._add_seek_point(offset, data_type & 7, self._window,
+                                 len(uncompress))
+        return uncompress
+
+    def _add_seek_point(self, offset, bits, window, pending=0):
+        # pending is the size of the data decompressed but not yet counted
+        # in self._pos
+        pos = self._pos + pending
+        last = self._index_offsets[-1] if self._index else 0
+        if pos - last >= self._index_interval:
+            if window is not None:
+                window = zlib.compress(window, 1)
+            self._index.append((pos, offset, bits, window))
+            self._index_offsets.append(pos)
+
+    def _seek_to_point(self, point):
+        pos, offset, bits, window = point
+        self._eof = False
+        self._pos = pos
+        if window is None:
+            self._fp.seek(offset)
+            self._new_member = True
+            self._decompressor = self._decomp_factory(**self._decomp_args)
+            return
+        window = zlib.decompress(window)
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=window)
+        if bits:
+            # The block starts in the middle of the previous byte
+            self._fp.seek(offset - 1)
+            byte = self._fp.read(1)[0]
+            self._decompressor.prime(bits, byte >> (8 - bits))
+        else:
+            self._fp.seek(offset)
+        self._new_member = False
+        self._init_read()
+        # The CRC of the member can't be checked from the middle
+        self._check_trailer = False
+        self._window = window
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._index:
+            if whence == io.SEEK_CUR:
+                offset = self._pos + offset
+                whence = io.SEEK_SET
+            elif whence == io.SEEK_END and self._size >= 0:
+                offset = self._size + offset
+                whence = io.SEEK_SET
+            if whence == io.SEEK_SET:
+                i = bisect.bisect_right(self._index_offsets, offset)
+                if i and (offset < self._pos or
+                          self._index_offsets[i - 1] > self._pos):
+                    self._seek_to_point(self._index[i - 1])
+        return super().seek(offset, whence)
+
+    def _save_index(self, f):
+        f.write(_INDEX_MAGIC)
+        f.write(struct.pack("<qqq", self._file_size(), self._size,
+                            len(self._index)))
+        for pos, offset, bits, window in self._index:
+            if window is None:
+                bits, window = -1, b''
+            f.write(struct.pack("<qqbI", pos, offset, bits, len(window)))
+            f.write(window)
+
+    def _load_index(self, f):
+        if f.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+            raise ValueError('Not a gzip index file')
+        try:
+            file_size, size, count = struct.unpack("<qqq", f.read(24))
+            if file_size != self._file_size():
+                raise ValueError('The gzip index does not match the file')
+            index = []
+            for i in range(count):
+                pos, offset, bits, length = struct.unpack("<qqbI", f.read(21))
+                window = f.read(length)
+                if len(window) != length:
+                    raise ValueError('Truncated gzip index file')
+                if bits < 0:
+                    window = None
+                index.append((pos, offset, bits, window))
+        except struct.error:
+            raise ValueError('Truncated gzip index file') from None
+        self._index = index
+        self._index_offsets = [point[0] for point in index]
+        if size >= 0:
+            self._size = size
+
+    def _file_size(self):
+        f = self._fp.file
+        pos = f.tell()
+        try:
+            return f.seek(0, io.SEEK_END)
+        finally:
+            f.seek(pos)
+
     def _add_read_data(self, data):
         self._crc = zlib.crc32(data, self._crc)
         self._stream_size = self._stream_size + len(data)
@@ -520,7 +769,11 @@ def _read_eof(self):
         # uncompressed data matches the stored values.  Note that the size
         # stored is the true file size mod 2**32.
         crc32, isize = struct.unpack("<II", self._read_exact(8))
-        if crc32 != self._crc:
+        # The check is skipped if reading started at a seek point in the
+        # middle of the member
+        if not self._check_trailer:
+            pass
+        elif crc32 != self._crc:
             raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
                                                              hex(self._crc)))
         elif isize != (self._stream_size & 0xffffffff):
@@ -539,12 +792,24 @@ def _rewind(self):
         super()._rewind()
         self._new_member = True
 
-def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=None):
+def _compress_block(data, compresslevel, zdict, mode):
+    if zdict:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                      -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                      0, zdict)
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                      -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0)
+    return compressor.compress(data) + compressor.flush(mode)
+
+def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=None,
+             threads=1):
     """Compress data in one shot and return the compressed string.
     Optional argument is the compression level, in range of 0-9.
     """
     buf = io.BytesIO()
-    with GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel, mtime=mtime) as f:
+    with GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel,
+                  mtime=mtime, threads=threads) as f:
         f.write(data)
     return buf.getvalue()
 
@@ -97,13 +97,13 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONIncrementalDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONIncrementalDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -121,7 +121,9 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         allow_nan=True, cls=None, indent=None, separators=None,
         default=None, sort_keys=False, **kw):
     """Serialize ``obj`` as a JSON formatted stream to ``fp`` (a
-    ``.write()``-supporting file-like object).
+    ``.write()``-supporting file-like object).  If ``fp`` is a binary file
+    (an instance of ``io.RawIOBase`` or ``io.BufferedIOBase``), the stream
+    is encoded to UTF-8.
 
     If ``skipkeys`` is true then ``dict`` keys that are not basic types
     (``str``, ``int``, ``float``, ``bool``, ``None``) will be skipped
@@ -166,18 +168,15 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    encoder.dump(obj, fp)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -240,6 +239,8 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
 
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
+_ITERLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def detect_encoding(b):
     bstartswith = b.startswith
@@ -357,3 +358,47 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
     if parse_constant is not None:
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
+
+
+def iterload(fp, *, mode='values', cls=None, object_hook=None,
+        parse_float=None, parse_int=None, parse_constant=None,
+        object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object) and yield the decoded values as soon as they are complete.
+
+    If ``mode`` is ``'values'`` (the default), ``fp`` contains a sequence
+    of whitespace separated JSON documents (such as JSON Lines) and every
+    document is yielded.  If it is ``'items'``, ``fp`` contains a single
+    JSON array and every element of the array is yielded.  If it is
+    ``'events'``, parsing events are yielded as ``(event, value)`` pairs;
+    see ``JSONIncrementalDecoder``.
+
+    ``fp`` is read in chunks, so the whole input does not need to fit in
+    memory.  The other arguments have the same meaning as in ``load()``.
+    """
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None and not kw):
+        decoder = _default_decoder
+    else:
+        if cls is None:
+            cls = JSONDecoder
+        if object_hook is not None:
+            kw['object_hook'] = object_hook
+        if object_pairs_hook is not None:
+            kw['object_pairs_hook'] = object_pairs_hook
+        if parse_float is not None:
+            kw['parse_float'] = parse_float
+        if parse_int is not None:
+            kw['parse_int'] = parse_int
+        if parse_constant is not None:
+            kw['parse_constant'] = parse_constant
+        decoder = cls(**kw)
+    incremental_decoder = JSONIncrementalDecoder(mode, decoder=decoder)
+    read = fp.read
+    while True:
+        data = read(_ITERLOAD_CHUNK_SIZE)
+        if not data:
+            break
+        yield from incremental_decoder.decode(data)
+    yield from incremental_decoder.decode(data, final=True)
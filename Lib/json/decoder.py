@@ -1,5 +1,6 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
 
 from json import scanner
@@ -8,7 +9,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONIncrementalDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -250,6 +251,205 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
 
     return values, end
 
+# Kinds of the decoding plans compiled from a schema by _compile_schema().
+# They are also used by _json.
+_SCALAR = 0
+_ARRAY = 1
+_MAP = 2
+_OBJECT = 3
+
+def JSONTyped(s_and_end, plan, scan_once, strict, memo,
+              _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+    s, end = s_and_end
+    if plan is None:
+        return scan_once(s, end)
+    kind, nullable, arg = plan
+    nextchar = s[end:end + 1]
+    if nullable and nextchar == 'n' and s[end:end + 4] == 'null':
+        return None, end + 4
+    if kind == _SCALAR:
+        value, newend = scan_once(s, end)
+        if type(value) is not arg:
+            if arg is float and type(value) is int:
+                value = float(value)
+            elif (not isinstance(value, arg) or
+                    type(value) is bool and arg in (int, float)):
+                raise JSONDecodeError("Expecting %s" % arg.__name__, s, end)
+        return value, newend
+    if kind == _ARRAY:
+        if nextchar != '[':
+            raise JSONDecodeError("Expecting array", s, end)
+        return JSONTypedArray((s, end + 1), arg, scan_once, strict, memo)
+    if nextchar != '{':
+        raise JSONDecodeError("Expecting object", s, end)
+    return JSONTypedObject((s, end + 1), plan, scan_once, strict, memo)
+
+def JSONTypedArray(s_and_end, plan, scan_once, strict, memo,
+                   _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+    s, end = s_and_end
+    values = []
+    nextchar = s[end:end + 1]
+    if nextchar in _ws:
+        end = _w(s, end + 1).end()
+        nextchar = s[end:end + 1]
+    if nextchar == ']':
+        return values, end + 1
+    _append = values.append
+    while True:
+        try:
+            value, end = JSONTyped((s, end), plan, scan_once, strict, memo)
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+        _append(value)
+        end = _w(s, end).end()
+        nextchar = s[end:end + 1]
+        end += 1
+        if nextchar == ']':
+            break
+        elif nextchar != ',':
+            raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
+        end = _w(s, end).end()
+    return values, end
+
+def JSONTypedObject(s_and_end, plan, scan_once, strict, memo,
+                    _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+    s, end = s_and_end
+    start = end - 1
+    if plan[0] == _MAP:
+        fields = None
+        value_plan = plan[2]
+    else:
+        cls, is_dict, ignore_unknown, fields, names, required = plan[2]
+    result = {}
+    end = _w(s, end).end()
+    nextchar = s[end:end + 1]
+    if nextchar != '}':
+        while True:
+            if nextchar != '"':
+                raise JSONDecodeError(
+                    "Expecting property name enclosed in double quotes",
+                    s, end)
+            keystart = end
+            key, end = scanstring(s, end + 1, strict)
+            end = _w(s, end).end()
+            if s[end:end + 1] != ':':
+                raise JSONDecodeError("Expecting ':' delimiter", s, end)
+            end = _w(s, end + 1).end()
+            if fields is None:
+                key = memo.setdefault(key, key)
+            else:
+                try:
+                    index, value_plan = fields[key]
+                except KeyError:
+                    if not ignore_unknown:
+                        raise JSONDecodeError("Unknown key %r" % key,
+                                              s, keystart) from None
+                    index = value_plan = key = None
+                else:
+                    key = names[index]
+            try:
+                value, end = JSONTyped((s, end), value_plan, scan_once,
+                                       strict, memo)
+            except StopIteration as err:
+                raise JSONDecodeError("Expecting value",
+                                      s, err.value) from None
+            if key is not None:
+                result[key] = value
+            end = _w(s, end).end()
+            nextchar = s[end:end + 1]
+            if nextchar == '}':
+                break
+            elif nextchar != ',':
+                raise JSONDecodeError("Expecting ',' delimiter", s, end)
+            end = _w(s, end + 1).end()
+            nextchar = s[end:end + 1]
+    end += 1
+    if fields is None:
+        return result, end
+    if len(result) != len(names):
+        for name, req in zip(names, required):
+            if req and name not in result:
+                raise JSONDecodeError("Missing key %r" % name, s, start)
+    if is_dict:
+        return result, end
+    return cls(**result), end
+
+def _compile_schema(schema, ignore_unknown):
+    # Compile a type into a decoding plan, a (kind, nullable, arg) tuple
+    # or None for any value:
+    #   (_SCALAR, nullable, cls)
+    #   (_ARRAY, nullable, item_plan)
+    #   (_MAP, nullable, value_plan)
+    #   (_OBJECT, nullable, [cls, is_dict, ignore_unknown, fields, names,
+    #                        required])
+    # where fields maps keys to (index, value_plan) pairs.  The list of
+    # an object plan is shared by all the plans of the same class, and
+    # filled after it is created to support recursive classes.
+    import dataclasses
+    import types
+    import typing
+
+    objects = {}
+
+    def unsupported(tp):
+        return TypeError('unsupported type in JSON schema: %r' % (tp,))
+
+    def compile_type(tp):
+        nullable = False
+        if type(tp) is types.Union or typing.get_origin(tp) is typing.Union:
+            args = [arg for arg in tp.__args__
+                    if arg is not None and arg is not type(None)]
+            if len(args) != 1 or len(args) == len(tp.__args__):
+                raise unsupported(tp)
+            nullable = True
+            tp = args[0]
+        if tp is typing.Any or tp is object:
+            return None
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if tp is list or origin is list:
+            return (_ARRAY, nullable, compile_type(args[0]) if args else None)
+        if tp is dict or origin is dict:
+            if args and args[0] is not str:
+                raise unsupported(tp)
+            return (_MAP, nullable, compile_type(args[1]) if args else None)
+        if origin is not None or not isinstance(tp, type):
+            raise unsupported(tp)
+        if dataclasses.is_dataclass(tp) or typing.is_typeddict(tp):
+            body = objects.get(tp)
+            if body is None:
+                body = objects[tp] = []
+                body.extend(compile_object(tp))
+            return (_OBJECT, nullable, body)
+        return (_SCALAR, nullable, tp)
+
+    def compile_object(cls):
+        hints = typing.get_type_hints(cls)
+        if typing.is_typeddict(cls):
+            is_dict = True
+            keys = [(name, name in cls.__required_keys__) for name in hints]
+        else:
+            is_dict = False
+            keys = []
+            init_fields = [f for f in dataclasses.fields(cls) if f.init]
+            for f in cls.__dataclass_fields__.values():
+                tp = hints.get(f.name)
+                if isinstance(tp, dataclasses.InitVar):
+                    hints[f.name] = tp.type
+                elif f not in init_fields:
+                    continue
+                keys.append((f.name,
+                             f.default is dataclasses.MISSING and
+                             f.default_factory is dataclasses.MISSING))
+        fields = {}
+        for index, (name, req) in enumerate(keys):
+            fields[name] = (index, compile_type(hints[name]))
+        names = tuple(name for name, req in keys)
+        required = tuple(req for name, req in keys)
+        return [cls, is_dict, ignore_unknown, fields, names, required]
+
+    return compile_type(schema)
+
 
 class JSONDecoder(object):
     """Simple JSON <http://json.org> decoder
@@ -283,7 +483,8 @@ class JSONDecoder(object):
 
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, key_cache_size=0, schema=None,
+            unknown_keys='error'):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -315,7 +516,31 @@ def __init__(self, *, object_hook=None, parse_float=None,
         characters will be allowed inside strings.  Control characters in
         this context are those with character codes in the 0-31 range,
         including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+
+        If ``key_cache_size`` is positive, the decoded object keys are kept
+        across calls to ``decode()`` until there are more than
+        ``key_cache_size`` of them, so that documents with the same keys
+        share the key strings instead of allocating new ones.  The C
+        accelerator also interns the keys and uses the keys of previously
+        decoded objects to decode and presize the next objects faster.
+
+        ``schema``, if specified, is the type of the decoded documents: a
+        dataclass or a ``TypedDict`` class, whose fields can in turn be
+        annotated with dataclasses, ``TypedDict`` classes, ``list[T]``,
+        ``dict[str, T]``, ``Optional[T]``, ``Any`` or other classes such
+        as ``int`` or ``str``.  The objects are decoded directly into the
+        instances of the classes, and a value of another type raises
+        ``JSONDecodeError``.  ``unknown_keys`` is ``'error'`` (the default)
+        to raise ``JSONDecodeError`` for keys that are not fields of the
+        class, or ``'ignore'`` to skip them.
         """
+        if not isinstance(key_cache_size, int):
+            raise TypeError('key_cache_size must be an integer')
+        if key_cache_size < 0:
+            raise ValueError('key_cache_size must be >= 0')
+        if unknown_keys not in ('error', 'ignore'):
+            raise ValueError(f"unknown_keys must be 'error' or 'ignore', "
+                             f"not {unknown_keys!r}")
         self.object_hook = object_hook
         self.parse_float = parse_float or float
         self.parse_int = parse_int or int
@@ -325,6 +550,14 @@ def __init__(self, *, object_hook=None, parse_float=None,
         self.parse_object = JSONObject
         self.parse_array = JSONArray
         self.parse_string = scanstring
+        self.parse_typed = JSONTyped
+        self.key_cache_size = key_cache_size
+        self.schema = schema
+        self.unknown_keys = unknown_keys
+        self._schema_plan = None
+        if schema is not None:
+            self._schema_plan = _compile_schema(schema,
+                                                unknown_keys == 'ignore')
         self.memo = {}
         self.scan_once = scanner.make_scanner(self)
 
@@ -354,3 +587,368 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+# Structural characters of a partially received array, object or string.
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_END = re.compile(r'["\\]')
+# Text which may be the start of the rest of a number.
+_NUMBER_TAIL = re.compile(r'(?:[.eE][-+]?)?', FLAGS).fullmatch
+
+# A decoding error at most this many characters before the end of the
+# buffered text may be caused by a value (such as "-Infinity" or a
+# "\uXXXX" escape) which was cut in the middle.
+_INCOMPLETE_TAIL = 10
+
+# States of JSONIncrementalDecoder.
+_BEFORE_ARRAY = 0
+_FIRST_VALUE = 1
+_VALUE = 2
+_COMMA = 3
+_FIRST_KEY = 4
+_KEY = 5
+_COLON = 6
+_DONE = 7
+
+_END_OF_INPUT_ERRORS = {
+    _BEFORE_ARRAY: "Expecting value",
+    _FIRST_VALUE: "Expecting value",
+    _VALUE: "Expecting value",
+    _COMMA: "Expecting ',' delimiter",
+    _FIRST_KEY: "Expecting property name enclosed in double quotes",
+    _KEY: "Expecting property name enclosed in double quotes",
+    _COLON: "Expecting ':' delimiter",
+}
+
+
+class JSONIncrementalDecoder(object):
+    """Incremental JSON decoder
+
+    Decodes JSON text which is given in chunks of ``str`` or ``bytes``,
+    and returns the decoded values as soon as they are complete.  What is
+    returned depends on *mode*:
+
+    ``'values'``
+        Each JSON document of a stream of whitespace separated documents
+        (such as JSON Lines).
+
+    ``'items'``
+        Each element of a single top-level JSON array.
+
+    ``'events'``
+        ``(event, value)`` pairs, where *event* is one of
+        ``'start_object'``, ``'end_object'``, ``'start_array'``,
+        ``'end_array'`` (with *value* ``None``), ``'key'`` or ``'value'``.
+        Only strings, numbers and constants are reported as values.
+
+    Only the part of the input which has not been decoded yet is kept in
+    memory, so memory use is bounded by the size of the largest value
+    returned rather than by the size of the input.
+
+    Values are decoded with the ``raw_decode()`` method of *decoder*, a
+    ``JSONDecoder`` instance.
+
+    """
+
+    def __init__(self, mode='values', *, decoder=None):
+        if mode not in ('values', 'items', 'events'):
+            raise ValueError(f"mode must be 'values', 'items' or 'events', "
+                             f"not {mode!r}")
+        if decoder is None:
+            decoder = JSONDecoder()
+        self.mode = mode
+        self.decoder = decoder
+        self._raw_decode = decoder.raw_decode
+        self.reset()
+
+    def reset(self):
+        """Reset the decoder to its initial state, discarding any
+        buffered input."""
+        self._buf = ''
+        self._pending = []
+        self._bytes = None
+        self._text_decoder = None
+        self._started = False
+        self._stack = []
+        self._state = _BEFORE_ARRAY if self.mode == 'items' else _VALUE
+        self._track_pos = -1
+
+    def decode(self, data, final=False):
+        """Decode the chunk *data* (a ``str``, ``bytes`` or ``bytearray``
+        instance) and return a list of the values completed by it.
+
+        If *final* is true, *data* is the last chunk of the input and an
+        incomplete value raises ``JSONDecodeError``.  The ``doc`` and
+        ``pos`` attributes of the exception refer to the part of the input
+        which was still buffered.
+
+        The chunks must be all ``str`` or all bytes; the encoding of bytes
+        is detected as with ``json.loads()``.
+        """
+        if isinstance(data, str):
+            if self._bytes is not None:
+                raise TypeError('cannot mix str and bytes input')
+            if not self._started and data:
+                if data.startswith('\ufeff'):
+                    raise JSONDecodeError(
+                        "Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                        data, 0)
+                self._started = True
+        elif isinstance(data, (bytes, bytearray)):
+            if self._bytes is None:
+                if self._started:
+                    raise TypeError('cannot mix str and bytes input')
+                self._bytes = b''
+            data = self._decode_bytes(data, final)
+        else:
+            raise TypeError(f'the JSON object must be str, bytes or '
+                            f'bytearray, not {data.__class__.__name__}')
+        if data:
+            # The chunks are only joined to the buffer when something may be
+            # decoded, so that a large value is not copied for every chunk.
+            self._pending.append(data)
+            if (self._track_pos >= 0 and not self._track_done and
+                    not self._track(data) and not final):
+                return []
+        if self._pending:
+            self._pending.insert(0, self._buf)
+            self._buf = ''.join(self._pending)
+            self._pending = []
+        if self.mode == 'events':
+            return self._decode_events(final)
+        return self._decode_values(final)
+
+    def _decode_bytes(self, data, final):
+        if self._text_decoder is None:
+            # Enough bytes are needed to detect the encoding
+            self._bytes += data
+            if len(self._bytes) < 4 and not final:
+                return ''
+            from json import detect_encoding
+            data = self._bytes
+            self._bytes = b''
+            self._started = True
+            self._text_decoder = codecs.getincrementaldecoder(
+                detect_encoding(data))('surrogatepass')
+        return self._text_decoder.decode(data, final)
+
+    def _incomplete(self, err):
+        # Whether err may be caused by the end of the buffered text.
+        return (err.pos >= len(err.doc) - _INCOMPLETE_TAIL or
+                err.msg.startswith('Unterminated string'))
+
+    def _track(self, text, pos=0):
+        # Look for the end of the array, object or string starting at
+        # self._track_pos in text, which follows the text scanned by the
+        # previous calls.  This avoids decoding a large value again for
+        # every chunk until it is complete.
+        end = len(text)
+        pos += self._track_skip
+        depth = self._track_depth
+        in_string = self._track_in_string
+        while pos < end:
+            if in_string:
+                m = _STRING_END.search(text, pos)
+                if m is None:
+                    pos = end
+                    break
+                pos = m.end()
+                if m.group() == '\\':
+                    # Skip the escaped character, possibly in the next chunk
+                    pos += 1
+                    continue
+                in_string = False
+                if not depth:
+                    self._track_done = True
+                    return True
+            else:
+                m = _STRUCTURE.search(text, pos)
+                if m is None:
+                    pos = end
+                    break
+                pos = m.end()
+                c = m.group()
+                if c == '"':
+                    in_string = True
+                elif c in '[{':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth:
+                        self._track_done = True
+                        return True
+        self._track_skip = pos - end
+        self._track_depth = depth
+        self._track_in_string = in_string
+        return False
+
+    def _scan(self, pos, final):
+        # Decode the value at pos.  Return (value, end), or None if more
+        # input is needed.
+        buf = self._buf
+        complete = final
+        if pos == self._track_pos:
+            if not complete and not self._track_done:
+                return None
+            complete = True
+        try:
+            value, end = self._raw_decode(buf, pos)
+        except JSONDecodeError as err:
+            if complete or not self._incomplete(err):
+                raise
+            if buf[pos] in '{["':
+                self._track_pos = pos
+                self._track_skip = 0
+                self._track_depth = 0
+                self._track_in_string = False
+                self._track_done = False
+                if self._track(buf, pos):
+                    raise
+            return None
+        if (not final and buf[end - 1] in '0123456789' and
+                _NUMBER_TAIL(buf, end)):
+            # A number may continue in the next chunk
+            return None
+        self._track_pos = -1
+        return value, end
+
+    def _decode_values(self, final, _w=WHITESPACE.match):
+        buf = self._buf
+        end = len(buf)
+        state = self._state
+        items = self.mode == 'items'
+        result = []
+        pos = 0
+        try:
+            while True:
+                pos = _w(buf, pos).end()
+                if pos == end:
+                    break
+                if state == _VALUE and not items:
+                    r = self._scan(pos, final)
+                    if r is None:
+                        break
+                    value, pos = r
+                    result.append(value)
+                    continue
+                nextchar = buf[pos]
+                if state == _BEFORE_ARRAY:
+                    if nextchar != '[':
+                        raise JSONDecodeError("Expecting array", buf, pos)
+                    pos += 1
+                    state = _FIRST_VALUE
+                elif nextchar == ']' and state == _FIRST_VALUE:
+                    pos += 1
+                    state = _DONE
+                elif state == _FIRST_VALUE or state == _VALUE:
+                    r = self._scan(pos, final)
+                    if r is None:
+                        break
+                    value, pos = r
+                    result.append(value)
+                    if buf[pos:pos + 1] == ',':
+                        # Skip the usual separator without another round
+                        pos += 1
+                        state = _VALUE
+                    else:
+                        state = _COMMA
+                elif state == _COMMA:
+                    if nextchar == ',':
+                        state = _VALUE
+                    elif nextchar == ']':
+                        state = _DONE
+                    else:
+                        raise JSONDecodeError("Expecting ',' delimiter",
+                                              buf, pos)
+                    pos += 1
+                else:
+                    raise JSONDecodeError("Extra data", buf, pos)
+        finally:
+            self._finish(pos, state)
+        if final and items and state != _DONE:
+            raise JSONDecodeError(_END_OF_INPUT_ERRORS[state], buf, end)
+        return result
+
+    def _decode_events(self, final, _w=WHITESPACE.match):
+        buf = self._buf
+        end = len(buf)
+        stack = self._stack
+        state = self._state
+        result = []
+        append = result.append
+        pos = 0
+        try:
+            while True:
+                pos = _w(buf, pos).end()
+                if pos == end:
+                    break
+                nextchar = buf[pos]
+                if state == _COMMA:
+                    if nextchar == ',':
+                        pos += 1
+                        state = _KEY if stack[-1] == '{' else _VALUE
+                        continue
+                    if nextchar != ('}' if stack[-1] == '{' else ']'):
+                        raise JSONDecodeError("Expecting ',' delimiter",
+                                              buf, pos)
+                elif state == _COLON:
+                    if nextchar != ':':
+                        raise JSONDecodeError("Expecting ':' delimiter",
+                                              buf, pos)
+                    pos += 1
+                    state = _VALUE
+                    continue
+                elif state == _FIRST_KEY or state == _KEY:
+                    if nextchar != '"' and not (nextchar == '}' and
+                                                state == _FIRST_KEY):
+                        raise JSONDecodeError(
+                            "Expecting property name enclosed in double "
+                            "quotes", buf, pos)
+                    if nextchar == '"':
+                        r = self._scan(pos, final)
+                        if r is None:
+                            break
+                        key, pos = r
+                        append(('key', key))
+                        state = _COLON
+                        continue
+                elif nextchar == '{':
+                    stack.append('{')
+                    append(('start_object', None))
+                    pos += 1
+                    state = _FIRST_KEY
+                    continue
+                elif nextchar == '[':
+                    stack.append('[')
+                    append(('start_array', None))
+                    pos += 1
+                    state = _FIRST_VALUE
+                    continue
+                elif not (nextchar == ']' and state == _FIRST_VALUE):
+                    r = self._scan(pos, final)
+                    if r is None:
+                        break
+                    value, pos = r
+                    append(('value', value))
+                    state = _COMMA if stack else _VALUE
+                    continue
+                # End of the current array or object
+                if stack.pop() == '{':
+                    append(('end_object', None))
+                else:
+                    append(('end_array', None))
+                pos += 1
+                state = _COMMA if stack else _VALUE
+        finally:
+            self._finish(pos, state)
+        if final and stack:
+            raise JSONDecodeError(_END_OF_INPUT_ERRORS[state], buf, end)
+        return result
+
+    def _finish(self, pos, state):
+        # Drop the decoded text from the buffer.
+        self._state = state
+        if pos:
+            self._buf = self._buf[pos:]
+            if self._track_pos >= 0:
+                self._track_pos -= pos
@@ -1,5 +1,6 @@
 """Implementation of JSONEncoder
 """
+import io
 import re
 
 try:
@@ -33,6 +34,9 @@
 
 INFINITY = float('inf')
 
+# Size of the blocks written by JSONEncoder.dump()
+DUMP_CHUNK_SIZE = 64 * 1024
+
 def py_encode_basestring(s):
     """Return a JSON representation of a Python string
 
@@ -201,6 +205,66 @@ def encode(self, o):
             chunks = list(chunks)
         return ''.join(chunks)
 
+    def encode_bytes(self, o):
+        """Return a UTF-8 encoded JSON representation of a Python data
+        structure.
+
+        >>> from json.encoder import JSONEncoder
+        >>> JSONEncoder().encode_bytes({"foo": ["bar", "baz"]})
+        b'{"foo": ["bar", "baz"]}'
+
+        """
+        c_encoder = self._make_c_encoder()
+        if c_encoder is None or type(self).encode is not JSONEncoder.encode:
+            return self.encode(o).encode('utf-8')
+        # Encode directly to bytes, without building a str first
+        return c_encoder.encode_bytes(o)
+
+    def dump(self, o, fp):
+        """Write the JSON representation of a Python data structure to
+        ``fp``, a ``.write()``-supporting file-like object.
+
+        If ``fp`` is a binary file (an instance of ``io.RawIOBase`` or
+        ``io.BufferedIOBase``), UTF-8 encoded bytes are written to it.
+        The output is written in large blocks rather than one chunk at a
+        time.
+
+        """
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+        c_encoder = self._make_c_encoder()
+        if c_encoder is not None:
+            c_encoder.dump(o, fp.write, binary)
+            return
+        write = fp.write
+        chunks = []
+        size = 0
+        for chunk in self.iterencode(o):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= DUMP_CHUNK_SIZE:
+                data = ''.join(chunks)
+                write(data.encode('utf-8') if binary else data)
+                chunks.clear()
+                size = 0
+        if chunks:
+            data = ''.join(chunks)
+            write(data.encode('utf-8') if binary else data)
+
+    def _make_c_encoder(self):
+        # Return the C encoder used for the whole output, or None if it
+        # cannot be used.
+        if (c_make_encoder is None or self.indent is not None or
+                type(self).iterencode is not JSONEncoder.iterencode):
+            return None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
+        return c_make_encoder(
+            {} if self.check_circular else None, self.default, _encoder,
+            self.indent, self.key_separator, self.item_separator,
+            self.sort_keys, self.skipkeys, self.allow_nan)
+
     def iterencode(self, o, _one_shot=False):
         """Encode the given object and yield each string
         representation as available.
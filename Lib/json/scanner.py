@@ -24,6 +24,11 @@ def py_make_scanner(context):
     object_hook = context.object_hook
     object_pairs_hook = context.object_pairs_hook
     memo = context.memo
+    # Older contexts do not have key_cache_size
+    key_cache_size = getattr(context, 'key_cache_size', 0)
+    schema_plan = getattr(context, '_schema_plan', None)
+    if schema_plan is not None:
+        parse_typed = context.parse_typed
 
     def _scan_once(string, idx):
         try:
@@ -64,9 +69,14 @@ def _scan_once(string, idx):
 
     def scan_once(string, idx):
         try:
+            if schema_plan is not None:
+                return parse_typed((string, idx), schema_plan, _scan_once,
+                                   strict, memo)
             return _scan_once(string, idx)
         finally:
-            memo.clear()
+            # The memo is only kept across calls up to key_cache_size keys
+            if len(memo) > key_cache_size:
+                memo.clear()
 
     return scan_once
 
@@ -24,6 +24,7 @@
 """
 
 import sys, os, time, io, re, traceback, warnings, weakref, collections.abc
+import operator
 
 from string import Template
 from string import Formatter as StrFormatter
@@ -31,8 +32,9 @@
 
 __all__ = ['BASIC_FORMAT', 'BufferingFormatter', 'CRITICAL', 'DEBUG', 'ERROR',
            'FATAL', 'FileHandler', 'Filter', 'Formatter', 'Handler', 'INFO',
-           'LogRecord', 'Logger', 'LoggerAdapter', 'NOTSET', 'NullHandler',
-           'StreamHandler', 'WARN', 'WARNING', 'addLevelName', 'basicConfig',
+           'JSONFormatter', 'LogRecord', 'Logger', 'LoggerAdapter', 'NOTSET',
+           'NullHandler', 'SlottedLogRecord', 'StreamHandler', 'WARN',
+           'WARNING', 'addLevelName', 'basicConfig',
            'captureWarnings', 'critical', 'debug', 'disable', 'error',
            'exception', 'fatal', 'getLevelName', 'getLogger', 'getLoggerClass',
            'info', 'log', 'makeLogRecord', 'setLoggerClass', 'shutdown',
@@ -185,6 +187,30 @@ def currentframe():
 #if not hasattr(sys, '_getframe'):
 #    _srcfile = None
 
+#
+# _normcaseCache maps the file names of code objects to their normalized case
+# for findCaller(), and _pathnameCache maps the path names of records to their
+# filename and module attributes, so that they are not computed again for
+# every logging call. They are cleared when they reach _MAX_CACHE_SIZE.
+#
+_normcaseCache = {}
+_pathnameCache = {}
+_MAX_CACHE_SIZE = 1000
+
+def _normcase(filename):
+    if len(_normcaseCache) >= _MAX_CACHE_SIZE:
+        _normcaseCache.clear()
+    rv = _normcaseCache[filename] = os.path.normcase(filename)
+    return rv
+
+def _splitPathname(pathname):
+    filename = os.path.basename(pathname)
+    rv = (filename, os.path.splitext(filename)[0])
+    if len(_pathnameCache) >= _MAX_CACHE_SIZE:
+        _pathnameCache.clear()
+    _pathnameCache[pathname] = rv
+    return rv
+
 
 def _checkLevel(level):
     if isinstance(level, int):
@@ -275,7 +301,12 @@ class LogRecord(object):
     record also includes information such as when the record was created,
     the source line where the logging call was made, and any exception
     information to be logged.
+
+    Structured fields passed with the fields argument of the logging methods
+    are available as the fields attribute, which is None otherwise.
     """
+    fields = None
+
     def __init__(self, name, level, pathname, lineno,
                  msg, args, exc_info, func=None, sinfo=None, **kwargs):
         """
@@ -310,8 +341,10 @@ def __init__(self, name, level, pathname, lineno,
         self.levelno = level
         self.pathname = pathname
         try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
+            names = _pathnameCache.get(pathname)
+            if names is None:
+                names = _splitPathname(pathname)
+            self.filename, self.module = names
         except (TypeError, ValueError, AttributeError):
             self.filename = pathname
             self.module = "Unknown module"
@@ -364,6 +397,43 @@ def getMessage(self):
             msg = msg % self.args
         return msg
 
+class SlottedLogRecord(LogRecord):
+    """
+    A LogRecord which stores its standard attributes in slots.
+
+    It uses less memory and is faster to create than LogRecord. Additional
+    attributes, such as those passed with the extra argument of the logging
+    methods, are stored in the instance dictionary as usual. To use it for
+    all the records, call setLogRecordFactory(SlottedLogRecord).
+    """
+    __slots__ = ('name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+                 'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+                 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+                 'thread', 'threadName', 'processName', 'process',
+                 'message', 'asctime')
+
+# The slots which are always set by SlottedLogRecord.__init__(), and the
+# slots which are only set when the record is formatted.
+_recordSlots = SlottedLogRecord.__slots__[:-2]
+_recordSlotsGetter = operator.attrgetter(*_recordSlots)
+_formattedSlots = SlottedLogRecord.__slots__[-2:]
+
+def _recordDict(record):
+    """
+    Return the attribute dictionary of a record, including the attributes
+    stored in the slots of a SlottedLogRecord.
+    """
+    if not isinstance(record, SlottedLogRecord):
+        return record.__dict__
+    rv = dict(zip(_recordSlots, _recordSlotsGetter(record)))
+    for name in _formattedSlots:
+        try:
+            rv[name] = getattr(record, name)
+        except AttributeError:
+            pass
+    rv.update(record.__dict__)
+    return rv
+
 #
 #   Determine which class to use when instantiating log records.
 #
@@ -394,7 +464,11 @@ def makeLogRecord(dict):
     instance.
     """
     rv = _logRecordFactory(None, None, "", 0, "", (), None, None)
-    rv.__dict__.update(dict)
+    if isinstance(rv, SlottedLogRecord):
+        for key, value in dict.items():
+            setattr(rv, key, value)
+    else:
+        rv.__dict__.update(dict)
     return rv
 
 
@@ -426,9 +500,9 @@ def validate(self):
 
     def _format(self, record):
         if defaults := self._defaults:
-            values = defaults | record.__dict__
+            values = defaults | _recordDict(record)
         else:
-            values = record.__dict__
+            values = _recordDict(record)
         return self._fmt % values
 
     def format(self, record):
@@ -448,9 +522,9 @@ class StrFormatStyle(PercentStyle):
 
     def _format(self, record):
         if defaults := self._defaults:
-            values = defaults | record.__dict__
+            values = defaults | _recordDict(record)
         else:
-            values = record.__dict__
+            values = _recordDict(record)
         return self._fmt.format(**values)
 
     def validate(self):
@@ -501,9 +575,9 @@ def validate(self):
 
     def _format(self, record):
         if defaults := self._defaults:
-            values = defaults | record.__dict__
+            values = defaults | _recordDict(record)
         else:
-            values = record.__dict__
+            values = _recordDict(record)
         return self._tpl.substitute(**values)
 
 
@@ -590,6 +664,10 @@ def __init__(self, fmt=None, datefmt=None, style='%', validate=True, *,
     default_time_format = '%Y-%m-%d %H:%M:%S'
     default_msec_format = '%s,%03d'
 
+    # The last formatted time, without the milliseconds, and what it depends
+    # on. Consecutive records are usually created in the same second.
+    _timeCache = None
+
     def formatTime(self, record, datefmt=None):
         """
         Return the creation time of the specified LogRecord as formatted text.
@@ -607,14 +685,23 @@ def formatTime(self, record, datefmt=None):
         signature as time.localtime() or time.gmtime(). To change it for all
         formatters, for example if you want all logging times to be shown in GMT,
         set the 'converter' attribute in the Formatter class.
-        """
-        ct = self.converter(record.created)
-        if datefmt:
-            s = time.strftime(datefmt, ct)
+
+        The formatted time is cached, so that it is only computed once per
+        second.
+        """
+        converter = self.converter
+        fmt = datefmt or self.default_time_format
+        # time.strftime() has a resolution of one second
+        seconds = record.created // 1
+        cache = self._timeCache
+        if (cache is not None and cache[0] == seconds and cache[1] == fmt
+            and cache[2] == converter):
+            s = cache[3]
         else:
-            s = time.strftime(self.default_time_format, ct)
-            if self.default_msec_format:
-                s = self.default_msec_format % (s, record.msecs)
+            s = time.strftime(fmt, converter(record.created))
+            self._timeCache = (seconds, fmt, converter, s)
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
         return s
 
     def formatException(self, ei):
@@ -695,6 +782,71 @@ def format(self, record):
 #
 _defaultFormatter = Formatter()
 
+class JSONFormatter(Formatter):
+    """
+    Formatter instances which render a LogRecord as a single line of JSON.
+
+    The JSON object holds the record attributes listed in fields, followed
+    by the structured fields passed with the fields argument of the logging
+    methods. The text of any exception or stack information is added under
+    the "exc_info" and "stack_info" keys. No format string is involved, and
+    the message is not %-formatted unless the record has arguments.
+    """
+    default_fields = ('created', 'levelname', 'name', 'message')
+
+    def __init__(self, fields=None, datefmt=None, encoder=None):
+        """
+        Initialize the formatter with the names of the record attributes to
+        output (default_fields if not specified), the date format used for
+        the "asctime" attribute and the json.JSONEncoder used for all the
+        records. The default encoder produces compact output and converts
+        the values which are not serializable with str().
+        """
+        Formatter.__init__(self, datefmt=datefmt)
+        if fields is None:
+            fields = self.default_fields
+        self.fields = tuple(fields)
+        if encoder is None:
+            import json
+            encoder = json.JSONEncoder(separators=(',', ':'), default=str)
+        self.encoder = encoder
+
+    def usesTime(self):
+        """
+        Check if the "asctime" attribute is output.
+        """
+        return 'asctime' in self.fields
+
+    def format(self, record):
+        """
+        Format the specified record as a line of JSON.
+        """
+        obj = {}
+        for name in self.fields:
+            if name == 'message':
+                value = record.message = record.getMessage()
+            elif name == 'asctime':
+                value = record.asctime = self.formatTime(record, self.datefmt)
+            else:
+                value = getattr(record, name, None)
+            obj[name] = value
+        if record.exc_info:
+            # Cache the traceback text to avoid converting it multiple times
+            # (it's constant anyway)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            obj['exc_info'] = record.exc_text
+        if record.stack_info:
+            obj['stack_info'] = self.formatStack(record.stack_info)
+        fields = record.fields
+        if fields is not None:
+            if not isinstance(fields, collections.abc.Mapping):
+                raise TypeError('record fields must be a mapping, not %s'
+                                % type(fields).__name__)
+            obj.update(fields)
+        return self.encoder.encode(obj)
+
 class BufferingFormatter(object):
     """
     A formatter suitable for formatting a number of records.
@@ -965,6 +1117,33 @@ def handle(self, record):
                 self.release()
         return rv
 
+    def handle_batch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        Like handle(), but the records which pass the filters are emitted
+        together with emit_batch(), with a single acquisition of the I/O
+        thread lock. Returns the list of records which were emitted.
+        """
+        records = [record for record in records if self.filter(record)]
+        if records:
+            self.acquire()
+            try:
+                self.emit_batch(records)
+            finally:
+                self.release()
+        return records
+
+    def emit_batch(self, records):
+        """
+        Do whatever it takes to actually log the specified logging records.
+
+        The base implementation calls emit() for each record. Subclasses can
+        override it to output the records more efficiently.
+        """
+        for record in records:
+            self.emit(record)
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1101,6 +1280,33 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a batch of records.
+
+        The records are formatted as in emit() and written to the stream
+        with a single write, followed by a single flush.
+        """
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:
+                self.handleError(record)
+        self._writeLines(lines, records[-1])
+
+    def _writeLines(self, lines, record):
+        if lines:
+            try:
+                self.stream.write(''.join(lines))
+                self.flush()
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:
+                self.handleError(record)
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1197,6 +1403,17 @@ def emit(self, record):
             self.stream = self._open()
         StreamHandler.emit(self, record)
 
+    def emit_batch(self, records):
+        """
+        Emit a batch of records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before calling the superclass's emit_batch.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        StreamHandler.emit_batch(self, records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -1537,7 +1754,9 @@ def findCaller(self, stack_info=False, stacklevel=1):
         rv = "(unknown file)", 0, "(unknown function)", None
         while hasattr(f, "f_code"):
             co = f.f_code
-            filename = os.path.normcase(co.co_filename)
+            filename = _normcaseCache.get(co.co_filename)
+            if filename is None:
+                filename = _normcase(co.co_filename)
             if filename == _srcfile:
                 f = f.f_back
                 continue
@@ -1564,16 +1783,21 @@ def makeRecord(self, name, level, fn, lno, msg, args, exc_info,
                              sinfo)
         if extra is not None:
             for key in extra:
-                if (key in ["message", "asctime"]) or (key in rv.__dict__):
+                if ((key in ["message", "asctime", "fields"]) or
+                        (key in _recordDict(rv))):
                     raise KeyError("Attempt to overwrite %r in LogRecord" % key)
                 rv.__dict__[key] = extra[key]
         return rv
 
     def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
-             stacklevel=1):
+             stacklevel=1, fields=None):
         """
         Low-level logging routine which creates a LogRecord and then calls
         all the handlers of this logger to handle the record.
+
+        It is only called once the level was checked, so the arguments and
+        fields of the records which are filtered out by level are not
+        captured.
         """
         sinfo = None
         if _srcfile:
@@ -1593,6 +1817,8 @@ def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
                 exc_info = sys.exc_info()
         record = self.makeRecord(self.name, level, fn, lno, msg, args,
                                  exc_info, func, extra, sinfo)
+        if fields is not None:
+            record.fields = fields
         self.handle(record)
 
     def handle(self, record):
@@ -1874,7 +2100,8 @@ def hasHandlers(self):
         """
         return self.logger.hasHandlers()
 
-    def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False):
+    def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
+             fields=None):
         """
         Low-level log implementation, proxied to allow nested logger adapters.
         """
@@ -1885,6 +2112,7 @@ def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False):
             exc_info=exc_info,
             extra=extra,
             stack_info=stack_info,
+            fields=fields,
         )
 
     @property
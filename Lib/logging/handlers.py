@@ -76,6 +76,28 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a batch of records.
+
+        The records are written to the file together, except that the file
+        is rolled over before any record for which shouldRollover() is true.
+        """
+        batch = []
+        for record in records:
+            try:
+                if self.shouldRollover(record):
+                    if batch:
+                        logging.FileHandler.emit_batch(self, batch)
+                        batch = []
+                    self.doRollover()
+            except Exception:
+                self.handleError(record)
+            else:
+                batch.append(record)
+        if batch:
+            logging.FileHandler.emit_batch(self, batch)
+
     def rotation_filename(self, default_name):
         """
         Modify the filename of a log file when rotating.
@@ -142,6 +164,9 @@ def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
         respectively.
 
         If maxBytes is zero, rollover never occurs.
+
+        The size of the file is only looked up when it is opened; after
+        that, the handler keeps count of what it writes to it.
         """
         # If rotation/rollover is wanted, it doesn't make sense to use another
         # mode. If for example 'w' were specified, then if there were multiple
@@ -154,6 +179,8 @@ def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
                                      delay=delay, errors=errors)
         self.maxBytes = maxBytes
         self.backupCount = backupCount
+        self._size = 0
+        self._sizeStream = None
 
     def doRollover(self):
         """
@@ -188,12 +215,101 @@ def shouldRollover(self, record):
         if self.stream is None:                 # delay was set...
             self.stream = self._open()
         if self.maxBytes > 0:                   # are we rolling over?
-            msg = "%s\n" % self.format(record)
-            self.stream.seek(0, 2)  #due to non-posix-compliant Windows feature
-            if self.stream.tell() + len(msg) >= self.maxBytes:
+            msg = self.format(record) + self.terminator
+            if self._streamSize() + self._byteLength(msg) >= self.maxBytes:
                 return 1
         return 0
 
+    def _byteLength(self, msg):
+        # Return the number of bytes which writing msg adds to the file.
+        # The stream translates newlines to os.linesep.
+        if os.linesep != '\n':
+            msg = msg.replace('\n', os.linesep)
+        encoding = self.stream.encoding
+        errors = self.stream.errors
+        length = len(msg.encode(encoding, errors))
+        if self._streamSize():
+            # The byte order mark which encodings such as UTF-16 prepend is
+            # only written at the start of the file.
+            length -= len(''.encode(encoding, errors))
+        return length
+
+    def _streamSize(self):
+        # Return the size of the file, which is only looked up when the
+        # stream changes and is then counted up by emit() and emit_batch().
+        if self.stream is not self._sizeStream:
+            self.stream.seek(0, 2)  #due to non-posix-compliant Windows feature
+            self._size = self.stream.tell()
+            self._sizeStream = self.stream
+        return self._size
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        Output the record to the file, catering for rollover as described
+        in doRollover(). Unless shouldRollover() is overridden, the record
+        is formatted once, both to check its size and for the output.
+        """
+        try:
+            msg = None
+            if type(self).shouldRollover is RotatingFileHandler.shouldRollover:
+                if self.stream is None:
+                    self.stream = self._open()
+                msg = self.format(record) + self.terminator
+                if (self.maxBytes > 0 and
+                        self._streamSize() + self._byteLength(msg) >=
+                        self.maxBytes):
+                    self.doRollover()
+            elif self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            if msg is None:
+                msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self.flush()
+            if self.stream is self._sizeStream:
+                self._size += self._byteLength(msg)
+        except RecursionError:  # See issue 36272
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def emit_batch(self, records):
+        """
+        Emit a batch of records.
+
+        The records are written to the file together, except that the file
+        is rolled over before any record which would make it exceed the size
+        limit, as in emit().
+        """
+        if self.maxBytes <= 0:
+            logging.FileHandler.emit_batch(self, records)
+            return
+        lines = []
+        for record in records:
+            try:
+                msg = self.format(record) + self.terminator
+                if self.stream is None:
+                    self.stream = self._open()
+                length = self._byteLength(msg)
+                if self._streamSize() + length >= self.maxBytes:
+                    self._writeLines(lines, record)
+                    lines = []
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                # The pending lines are counted as written: they go to the
+                # current stream before any rollover.
+                self._size = self._streamSize() + length
+                lines.append(msg)
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:
+                self.handleError(record)
+        self._writeLines(lines, records[-1])
+
 class TimedRotatingFileHandler(BaseRotatingHandler):
     """
     Handler for logging to a file, rotating the log file at certain timed
@@ -439,13 +555,18 @@ class WatchedFileHandler(logging.FileHandler):
 
     This handler is based on a suggestion and patch by Chad J.
     Schroeder.
+
+    If stat_interval is greater than zero, the file is checked at most
+    once every stat_interval seconds rather than on every emit.
     """
     def __init__(self, filename, mode='a', encoding=None, delay=False,
-                 errors=None):
+                 errors=None, stat_interval=0):
         logging.FileHandler.__init__(self, filename, mode=mode,
                                      encoding=encoding, delay=delay,
                                      errors=errors)
         self.dev, self.ino = -1, -1
+        self.stat_interval = stat_interval
+        self._nextStat = None
         self._statstream()
 
     def _statstream(self):
@@ -481,6 +602,16 @@ def reopenIfNeeded(self):
                 self.stream = self._open()
                 self._statstream()
 
+    def _reopenIfDue(self):
+        # Call reopenIfNeeded(), unless the file was checked less than
+        # stat_interval seconds ago.
+        if self.stat_interval > 0:
+            now = time.monotonic()
+            if self._nextStat is not None and now < self._nextStat:
+                return
+            self._nextStat = now + self.stat_interval
+        self.reopenIfNeeded()
+
     def emit(self, record):
         """
         Emit a record.
@@ -488,9 +619,19 @@ def emit(self, record):
         If underlying file has changed, reopen the file before emitting the
         record to it.
         """
-        self.reopenIfNeeded()
+        self._reopenIfDue()
         logging.FileHandler.emit(self, record)
 
+    def emit_batch(self, records):
+        """
+        Emit a batch of records.
+
+        If underlying file has changed, reopen the file before emitting the
+        records to it.
+        """
+        self._reopenIfDue()
+        logging.FileHandler.emit_batch(self, records)
+
 
 class SocketHandler(logging.Handler):
     """
@@ -606,7 +747,7 @@ def makePickle(self, record):
         # See issue #14436: If msg or args are objects, they may not be
         # available on the receiving end. So we convert the msg % args
         # to a string, save it as msg and zap the args.
-        d = dict(record.__dict__)
+        d = dict(logging._recordDict(record))
         d['msg'] = record.getMessage()
         d['args'] = None
         d['exc_info'] = None
@@ -1171,7 +1312,7 @@ def mapLogRecord(self, record):
         that is sent as the CGI data. Overwrite in your class.
         Contributed by Franz Glasner.
         """
-        return record.__dict__
+        return logging._recordDict(record)
 
     def getConnection(self, host, secure):
         """
@@ -1441,15 +1582,23 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=1):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is greater than 1, up to batch_size records which are
+        already in the queue are dequeued together and passed to the
+        handle_batch() method of the handlers.
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
 
     def dequeue(self, block):
         """
@@ -1497,6 +1646,35 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def handle_batch(self, records):
+        """
+        Handle a batch of records.
+
+        This prepares the records and offers them to the handle_batch()
+        method of each handler.
+        """
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if batch:
+                handler.handle_batch(batch)
+
+    def _dequeue_batch(self):
+        # Block for the first record, then take the records which are
+        # already in the queue, up to batch_size or the sentinel.
+        records = [self.dequeue(True)]
+        while (len(records) < self.batch_size and
+               records[-1] is not self._sentinel):
+            try:
+                records.append(self.dequeue(False))
+            except queue.Empty:
+                break
+        return records
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1505,6 +1683,9 @@ def _monitor(self):
         This method runs on a separate, internal thread.
         The thread will terminate if it sees a sentinel object in the queue.
         """
+        if self.batch_size > 1:
+            self._monitor_batches()
+            return
         q = self.queue
         has_task_done = hasattr(q, 'task_done')
         while True:
@@ -1520,6 +1701,25 @@ def _monitor(self):
             except queue.Empty:
                 break
 
+    def _monitor_batches(self):
+        q = self.queue
+        has_task_done = hasattr(q, 'task_done')
+        while True:
+            try:
+                records = self._dequeue_batch()
+            except queue.Empty:
+                break
+            stop = records[-1] is self._sentinel
+            if stop:
+                del records[-1]
+            if records:
+                self.handle_batch(records)
+            if has_task_done:
+                for i in range(len(records) + stop):
+                    q.task_done()
+            if stop:
+                break
+
     def enqueue_sentinel(self):
         """
         This is used to enqueue the sentinel record.
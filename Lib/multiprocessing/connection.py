@@ -39,6 +39,9 @@
 #
 
 BUFSIZE = 8192
+# Largest receive buffer that a connection keeps around for reuse; bigger
+# messages are received into a buffer of their own.
+RECV_BUFFER_MAX = 1024 * 1024
 # A very generous timeout when it comes to local connections...
 CONNECTION_TIMEOUT = 20.
 
@@ -204,12 +207,29 @@ def send_bytes(self, buf, offset=0, size=None):
             raise ValueError("buffer length < offset + size")
         self._send_bytes(m[offset:offset + size])
 
+    def send_bytes_many(self, bufs):
+        """Send each bytes-like object of an iterable as a separate message
+
+        The messages are coalesced so that they are written with as few
+        system calls as possible.  They are received one at a time by
+        recv_bytes() or together by recv_bytes_many().
+        """
+        self._check_closed()
+        self._check_writable()
+        self._send_bytes_many([memoryview(buf).cast('B') for buf in bufs])
+
     def send(self, obj):
         """Send a (picklable) object"""
         self._check_closed()
         self._check_writable()
         self._send_bytes(_ForkingPickler.dumps(obj))
 
+    def send_many(self, objs):
+        """Send each (picklable) object of an iterable as a separate message"""
+        self._check_closed()
+        self._check_writable()
+        self._send_bytes_many([_ForkingPickler.dumps(obj) for obj in objs])
+
     def recv_bytes(self, maxlength=None):
         """
         Receive bytes data as a bytes object.
@@ -218,10 +238,15 @@ def recv_bytes(self, maxlength=None):
         self._check_readable()
         if maxlength is not None and maxlength < 0:
             raise ValueError("negative maxlength")
-        buf = self._recv_bytes(maxlength)
-        if buf is None:
-            self._bad_message_length()
-        return buf.getvalue()
+        return self._recv_message(bytes, maxlength)
+
+    def recv_bytes_many(self, maxcount=None):
+        """
+        Receive one message as bytes, then any further messages that are
+        available without blocking, up to maxcount messages in total.
+        Return a list of bytes objects.
+        """
+        return self._recv_many(self.recv_bytes, maxcount)
 
     def recv_bytes_into(self, buf, offset=0):
         """
@@ -238,22 +263,53 @@ def recv_bytes_into(self, buf, offset=0):
                 raise ValueError("negative offset")
             elif offset > bytesize:
                 raise ValueError("offset too large")
-            result = self._recv_bytes()
-            size = result.tell()
-            if bytesize < offset + size:
-                raise BufferTooShort(result.getvalue())
-            # Message can fit in dest
-            result.seek(0)
-            result.readinto(m[offset // itemsize :
-                              (offset + size) // itemsize])
-            return size
+
+            def copy_into(data):
+                size = len(data)
+                if bytesize < offset + size:
+                    raise BufferTooShort(bytes(data))
+                # Message can fit in dest
+                with m.cast('B') as dest:
+                    dest[offset:offset + size] = data
+                return size
+
+            return self._recv_message(copy_into)
 
     def recv(self):
         """Receive a (picklable) object"""
         self._check_closed()
         self._check_readable()
-        buf = self._recv_bytes()
-        return _ForkingPickler.loads(buf.getbuffer())
+        return self._recv_message(_ForkingPickler.loads)
+
+    def recv_many(self, maxcount=None):
+        """
+        Receive one (picklable) object, then any further objects that are
+        available without blocking, up to maxcount objects in total.
+        Return a list of objects.
+        """
+        return self._recv_many(self.recv, maxcount)
+
+    def _recv_many(self, recv, maxcount):
+        if maxcount is not None and maxcount < 1:
+            raise ValueError("maxcount must be at least 1")
+        result = [recv()]
+        while ((maxcount is None or len(result) < maxcount)
+               and self._poll(0.0)):
+            result.append(recv())
+        return result
+
+    def _recv_message(self, consume, maxsize=None):
+        # Receive one message and return consume(data), where data is a
+        # bytes-like object only valid during the call.
+        buf = self._recv_bytes(maxsize)
+        if buf is None:
+            self._bad_message_length()
+        with buf.getbuffer() as data:
+            return consume(data)
+
+    def _send_bytes_many(self, bufs):
+        for buf in bufs:
+            self._send_bytes(buf)
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -361,11 +417,16 @@ def _close(self, _close=_multiprocessing.closesocket):
             _close(self._handle)
         _write = _multiprocessing.send
         _read = _multiprocessing.recv
+        _readv = None
     else:
         def _close(self, _close=os.close):
             _close(self._handle)
         _write = os.write
         _read = os.read
+        _readv = os.readv
+
+    # Buffer reused to receive messages up to RECV_BUFFER_MAX bytes.
+    _recv_buffer = None
 
     def _send(self, buf, write=_write):
         remaining = len(buf)
@@ -425,6 +486,84 @@ def _recv_bytes(self, maxsize=None):
             return None
         return self._recv(size)
 
+    if _readv is not None:
+        def _recv_message(self, consume, maxsize=None, read=_read):
+            # A message which arrives in a single read is consumed without
+            # any copy; otherwise it is assembled in a buffer reused from
+            # one message to the next, rather than in a new io.BytesIO.
+            handle = self._handle
+            header = read(handle, 4)
+            if len(header) != 4:
+                if not header:
+                    raise EOFError
+                header = self._recv_remaining(header, 4, bytes)
+            size, = struct.unpack("!i", header)
+            if size == -1:
+                header = read(handle, 8)
+                if len(header) != 8:
+                    header = self._recv_remaining(header, 8, bytes)
+                size, = struct.unpack("!Q", header)
+            if maxsize is not None and size > maxsize:
+                self._bad_message_length()
+            if size == 0:
+                return consume(b'')
+            chunk = read(handle, min(size, BUFSIZE * 8))
+            if len(chunk) == size:
+                return consume(chunk)
+            return self._recv_remaining(chunk, size, consume)
+
+        def _recv_remaining(self, chunk, size, consume, readv=_readv):
+            # Receive the rest of a message of which chunk is the start.
+            # The reusable buffer is detached while in use so that a nested
+            # call (for instance from consume) cannot overwrite it.
+            if not chunk:
+                raise EOFError
+            if size > RECV_BUFFER_MAX:
+                buf = bytearray(size)
+            else:
+                buf = self._recv_buffer
+                self._recv_buffer = None
+                if buf is None or len(buf) < size:
+                    buf = bytearray(max(size, BUFSIZE))
+            try:
+                handle = self._handle
+                with memoryview(buf)[:size] as view:
+                    n = len(chunk)
+                    view[:n] = chunk
+                    del chunk
+                    while n < size:
+                        m = readv(handle, [view[n:]])
+                        if m == 0:
+                            raise OSError("got end of file during message")
+                        n += m
+                    return consume(view)
+            finally:
+                if size <= RECV_BUFFER_MAX:
+                    self._recv_buffer = buf
+
+    def _send_bytes_many(self, bufs):
+        # Coalesce small messages into writes of up to about 64 KiB.
+        pending = []
+        npending = 0
+        for buf in bufs:
+            n = len(buf)
+            if n > 16384:
+                if pending:
+                    self._send(b''.join(pending))
+                    pending.clear()
+                    npending = 0
+                self._send_bytes(buf)
+                continue
+            pending.append(struct.pack("!i", n))
+            pending.append(buf)
+            npending += 4 + n
+            if npending >= 65536:
+                self._send(b''.join(pending))
+                pending.clear()
+                npending = 0
+        if pending:
+            self._send(b''.join(pending))
+
     def _poll(self, timeout):
         r = wait([self], timeout)
         return bool(r)
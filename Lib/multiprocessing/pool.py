@@ -390,62 +390,49 @@ def _guarded_task_generation(self, result_job, func, iterable):
         except Exception as e:
             yield (result_job, i+1, _helper_reraises_exception, (e,), {})
 
-    def imap(self, func, iterable, chunksize=1):
+    def imap(self, func, iterable, chunksize=1, *, max_pending=None,
+             chunked=False):
         '''
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
         '''
-        self._check_running()
-        if chunksize == 1:
-            result = IMapIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job, func, iterable),
-                    result._set_length
-                ))
-            return result
-        else:
-            if chunksize < 1:
-                raise ValueError(
-                    "Chunksize must be 1+, not {0:n}".format(
-                        chunksize))
-            task_batches = Pool._get_tasks(func, iterable, chunksize)
-            result = IMapIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job,
-                                                  mapstar,
-                                                  task_batches),
-                    result._set_length
-                ))
-            return (item for chunk in result for item in chunk)
+        return self._imap(IMapIterator, func, iterable, chunksize,
+                          max_pending, chunked)
 
-    def imap_unordered(self, func, iterable, chunksize=1):
+    def imap_unordered(self, func, iterable, chunksize=1, *, max_pending=None,
+                       chunked=False):
         '''
         Like `imap()` method but ordering of results is arbitrary.
         '''
+        return self._imap(IMapUnorderedIterator, func, iterable, chunksize,
+                          max_pending, chunked)
+
+    def _imap(self, iterator_class, func, iterable, chunksize, max_pending,
+              chunked):
+        '''
+        Helper function to implement imap and imap_unordered.
+        '''
         self._check_running()
-        if chunksize == 1:
-            result = IMapUnorderedIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job, func, iterable),
-                    result._set_length
-                ))
-            return result
+        if chunksize < 1:
+            raise ValueError(
+                "Chunksize must be 1+, not {0!r}".format(chunksize))
+        if max_pending is not None and max_pending < 1:
+            raise ValueError(
+                "max_pending must be 1+ or None, not {0!r}".format(max_pending))
+        result = iterator_class(self)
+        if chunksize == 1 and not chunked:
+            tasks = self._guarded_task_generation(result._job, func, iterable)
         else:
-            if chunksize < 1:
-                raise ValueError(
-                    "Chunksize must be 1+, not {0!r}".format(chunksize))
             task_batches = Pool._get_tasks(func, iterable, chunksize)
-            result = IMapUnorderedIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job,
+            tasks = self._guarded_task_generation(result._job,
                                                   mapstar,
-                                                  task_batches),
-                    result._set_length
-                ))
-            return (item for chunk in result for item in chunk)
+                                                  task_batches)
+        if max_pending is None:
+            self._taskqueue.put((tasks, result._set_length))
+        else:
+            result._start_feeding(tasks, max_pending)
+        if chunksize == 1 or chunked:
+            return result
+        return (item for chunk in result for item in chunk)
 
     def apply_async(self, func, args=(), kwds={}, callback=None,
             error_callback=None):
@@ -842,6 +829,10 @@ def __init__(self, pool):
         self._index = 0
         self._length = None
         self._unsorted = {}
+        self._taskqueue = pool._taskqueue
+        self._tasks = None
+        self._feed_lock = None
+        self._submitted = 0
         self._cache[self._job] = self
 
     def __iter__(self):
@@ -864,6 +855,11 @@ def next(self, timeout=None):
                         raise StopIteration from None
                     raise TimeoutError from None
 
+        if self._tasks is not None:
+            # A result was consumed: submit one more task to keep at most
+            # max_pending tasks in flight or waiting to be consumed.
+            self._feed(1)
+
         success, value = item
         if success:
             return value
@@ -896,6 +892,27 @@ def _set_length(self, length):
                 del self._cache[self._job]
                 self._pool = None
 
+    def _start_feeding(self, tasks, max_pending):
+        # Instead of handing the whole task generator to the task handler
+        # thread, which would consume it as fast as the workers accept tasks,
+        # tasks are submitted in small batches from the consuming thread.
+        self._tasks = tasks
+        self._feed_lock = threading.Lock()
+        self._feed(max_pending)
+
+    def _feed(self, n):
+        with self._feed_lock:
+            if self._tasks is None:
+                return
+            batch = list(itertools.islice(self._tasks, n))
+            if batch:
+                self._submitted += len(batch)
+                self._taskqueue.put((batch, None))
+            if len(batch) < n:
+                # The input is exhausted.
+                self._tasks = None
+                self._set_length(self._submitted)
+
 #
 # Class whose instances are returned by `Pool.imap_unordered()`
 #
@@ -80,6 +80,7 @@ def _reset(self, after_fork=False):
         self._closed = False
         self._close = None
         self._send_bytes = self._writer.send_bytes
+        self._send_bytes_many = self._writer.send_bytes_many
         self._recv_bytes = self._reader.recv_bytes
         self._poll = self._reader.poll
 
@@ -168,7 +169,7 @@ def _start_thread(self):
         self._buffer.clear()
         self._thread = threading.Thread(
             target=Queue._feed,
-            args=(self._buffer, self._notempty, self._send_bytes,
+            args=(self._buffer, self._notempty, self._send_bytes_many,
                   self._wlock, self._writer.close, self._ignore_epipe,
                   self._on_queue_feeder_error, self._sem),
             name='QueueFeederThread'
@@ -211,8 +212,8 @@ def _finalize_close(buffer, notempty):
             notempty.notify()
 
     @staticmethod
-    def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
-              onerror, queue_sem):
+    def _feed(buffer, notempty, send_bytes_many, writelock, close,
+              ignore_epipe, onerror, queue_sem):
         debug('starting thread to feed data to pipe')
         nacquire = notempty.acquire
         nrelease = notempty.release
@@ -226,6 +227,8 @@ def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
             wacquire = None
 
         while 1:
+            # The objects which are lost if an exception is raised.
+            objs = []
             try:
                 nacquire()
                 try:
@@ -242,15 +245,36 @@ def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
                             return
 
                         # serialize the data before acquiring the lock
-                        obj = _ForkingPickler.dumps(obj)
+                        objs = [obj]
+                        frames = [_ForkingPickler.dumps(obj)]
+                        # Objects which are already waiting in the buffer are
+                        # written together, with as few system calls as
+                        # possible.  An object which cannot be serialized is
+                        # reported at once and left out.
+                        nbytes = len(frames[0])
+                        while (buffer and nbytes < _MAX_FEED_BATCH_BYTES
+                               and buffer[0] is not sentinel):
+                            obj = bpopleft()
+                            try:
+                                frame = _ForkingPickler.dumps(obj)
+                            except Exception as e:
+                                queue_sem.release()
+                                onerror(e, obj)
+                                continue
+                            objs.append(obj)
+                            frames.append(frame)
+                            nbytes += len(frame)
                         if wacquire is None:
-                            send_bytes(obj)
+                            send_bytes_many(frames)
                         else:
                             wacquire()
                             try:
-                                send_bytes(obj)
+                                send_bytes_many(frames)
                             finally:
                                 wrelease()
+                        # Do not keep the objects alive while waiting.
+                        del frames, obj
+                        objs = []
                 except IndexError:
                     pass
             except Exception as e:
@@ -264,13 +288,14 @@ def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
                     info('error in queue thread: %s', e)
                     return
                 else:
-                    # Since the object has not been sent in the queue, we need
-                    # to decrease the size of the queue. The error acts as
-                    # if the object had been silently removed from the queue
-                    # and this step is necessary to have a properly working
-                    # queue.
-                    queue_sem.release()
-                    onerror(e, obj)
+                    # Since the objects have not been sent in the queue, we
+                    # need to decrease the size of the queue. The error acts
+                    # as if the objects had been silently removed from the
+                    # queue and this step is necessary to have a properly
+                    # working queue.
+                    for obj in objs:
+                        queue_sem.release()
+                        onerror(e, obj)
 
     @staticmethod
     def _on_queue_feeder_error(e, obj):
@@ -284,6 +309,10 @@ def _on_queue_feeder_error(e, obj):
 
 _sentinel = object()
 
+# Upper bound on the amount of serialized data the feeder thread of a Queue
+# accumulates before writing it to the pipe.
+_MAX_FEED_BATCH_BYTES = 64 * 1024
+
 #
 # A queue type which also supports join() and task_done() methods
 #
@@ -14,6 +14,7 @@
     dumps(object) -> string
     load(file) -> object
     loads(bytes) -> object
+    dump_segmented(object, file)
 
 Misc variables:
 
@@ -28,6 +29,7 @@
 from copyreg import _extension_registry, _inverted_registry, _extension_cache
 from itertools import islice
 from functools import partial
+import os
 import sys
 from sys import maxsize
 from struct import pack, unpack
@@ -37,7 +39,8 @@
 import _compat_pickle
 
 __all__ = ["PickleError", "PicklingError", "UnpicklingError", "Pickler",
-           "Unpickler", "dump", "dumps", "load", "loads"]
+           "Unpickler", "dump", "dumps", "load", "loads",
+           "dump_segmented", "SegmentedPickle"]
 
 try:
     from _pickle import PickleBuffer
@@ -402,10 +405,14 @@ def decode_long(data):
 
 # Pickling machinery
 
+# Without memoization, the objects being saved are tracked to detect recursive
+# objects only beyond this nesting depth (same as in _pickle).
+_FAST_NESTING_LIMIT = 50
+
 class _Pickler:
 
     def __init__(self, file, protocol=None, *, fix_imports=True,
-                 buffer_callback=None):
+                 buffer_callback=None, memoize=True):
         """This takes a binary file for writing a pickle data stream.
 
         The optional *protocol* argument tells the pickler to use the
@@ -421,7 +428,8 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
         The *file* argument must have a write() method that accepts a
         single bytes argument. It can thus be a file object opened for
         binary writing, an io.BytesIO instance, or any other custom
-        object that meets this interface.
+        object that meets this interface.  It can be None if the pickler
+        is only used with dumps().
 
         If *fix_imports* is True and *protocol* is less than 3, pickle
         will try to map the new Python 3 names to the old module names
@@ -438,6 +446,11 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
 
         It is an error if *buffer_callback* is not None and *protocol*
         is None or smaller than 5.
+
+        If *memoize* is false, the pickled objects are not memoized:
+        objects referenced several times are pickled by value each time,
+        and recursive objects raise ValueError.  This is faster for data
+        without shared references.
         """
         if protocol is None:
             protocol = DEFAULT_PROTOCOL
@@ -448,17 +461,22 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
         if buffer_callback is not None and protocol < 5:
             raise ValueError("buffer_callback needs protocol >= 5")
         self._buffer_callback = buffer_callback
-        try:
-            self._file_write = file.write
-        except AttributeError:
-            raise TypeError("file must have a 'write' attribute")
+        if file is None:
+            self._file_write = None
+        else:
+            try:
+                self._file_write = file.write
+            except AttributeError:
+                raise TypeError("file must have a 'write' attribute")
         self.framer = _Framer(self._file_write)
         self.write = self.framer.write
         self._write_large_bytes = self.framer.write_large_bytes
         self.memo = {}
         self.proto = int(protocol)
         self.bin = protocol >= 1
-        self.fast = 0
+        self.fast = 0 if memoize else 1
+        self._fast_nesting = 0
+        self._fast_memo = {}
         self.fix_imports = fix_imports and protocol < 3
 
     def clear_memo(self):
@@ -471,13 +489,18 @@ def clear_memo(self):
         """
         self.memo.clear()
 
-    def dump(self, obj):
-        """Write a pickled representation of obj to the open file."""
+    def _check_init(self):
         # Check whether Pickler was initialized correctly. This is
         # only needed to mimic the behavior of _pickle.Pickler.dump().
         if not hasattr(self, "_file_write"):
             raise PicklingError("Pickler.__init__() was not called by "
                                 "%s.__init__()" % (self.__class__.__name__,))
+
+    def dump(self, obj):
+        """Write a pickled representation of obj to the open file."""
+        self._check_init()
+        if self._file_write is None:
+            raise TypeError("the Pickler has no file, use dumps() instead")
         if self.proto >= 2:
             self.write(PROTO + pack("<B", self.proto))
         if self.proto >= 4:
@@ -486,6 +509,29 @@ def dump(self, obj):
         self.write(STOP)
         self.framer.end_framing()
 
+    def dumps(self, obj):
+        """Return the pickled representation of obj as a bytes object.
+
+        The result does not depend on the previous calls: the memo is
+        cleared before and after pickling.  The file is not used.
+        """
+        self._check_init()
+        f = io.BytesIO()
+        saved = (self._file_write, self.framer, self.write,
+                 self._write_large_bytes)
+        self._file_write = f.write
+        self.framer = _Framer(f.write)
+        self.write = self.framer.write
+        self._write_large_bytes = self.framer.write_large_bytes
+        self.memo.clear()
+        try:
+            self.dump(obj)
+        finally:
+            (self._file_write, self.framer, self.write,
+             self._write_large_bytes) = saved
+            self.memo.clear()
+        return f.getvalue()
+
     def memoize(self, obj):
         """Store an object in the memo."""
 
@@ -545,6 +591,32 @@ def save(self, obj, save_persistent_id=True):
             self.write(self.get(x[0]))
             return
 
+        if self.fast:
+            self._save_fast(obj)
+        else:
+            self._save(obj)
+
+    def _save_fast(self, obj):
+        # Without the memo, recursive objects are detected by keeping track
+        # of the objects being saved once the nesting gets deep.
+        self._fast_nesting += 1
+        key = None
+        try:
+            if self._fast_nesting >= _FAST_NESTING_LIMIT:
+                if id(obj) in self._fast_memo:
+                    raise ValueError("can't pickle cyclic objects without "
+                                     "memoization, including object type "
+                                     "%s at %#x" % (type(obj).__name__,
+                                                    id(obj)))
+                key = id(obj)
+                self._fast_memo[key] = obj
+            self._save(obj)
+        finally:
+            if key is not None:
+                del self._fast_memo[key]
+            self._fast_nesting -= 1
+
+    def _save(self, obj):
         rv = NotImplemented
         reduce = getattr(self, "reducer_override", None)
         if reduce is not None:
@@ -1569,6 +1641,10 @@ def get_extension(self, code):
     def find_class(self, module, name):
         # Subclasses may override this.
         sys.audit('pickle.find_class', module, name)
+        if module == 'pickle' and name == '_join_segments':
+            # Segmented pickles are joined by the unpickler itself
+            return _segment_joiner(self, self.fix_imports, self.encoding,
+                                   self.errors, self._buffers)
         if self.proto < 3 and self.fix_imports:
             if (module, name) in _compat_pickle.NAME_MAPPING:
                 module, name = _compat_pickle.NAME_MAPPING[(module, name)]
@@ -1744,14 +1820,16 @@ def load_stop(self):
 
 # Shorthands
 
-def _dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None):
+def _dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None,
+          memoize=True):
     _Pickler(file, protocol, fix_imports=fix_imports,
-             buffer_callback=buffer_callback).dump(obj)
+             buffer_callback=buffer_callback, memoize=memoize).dump(obj)
 
-def _dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None):
+def _dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None,
+           memoize=True):
     f = io.BytesIO()
     _Pickler(f, protocol, fix_imports=fix_imports,
-             buffer_callback=buffer_callback).dump(obj)
+             buffer_callback=buffer_callback, memoize=memoize).dump(obj)
     res = f.getvalue()
     assert isinstance(res, bytes_types)
     return res
@@ -1786,6 +1864,266 @@ def _loads(s, /, *, fix_imports=True, encoding="ASCII", errors="strict",
     Pickler, Unpickler = _Pickler, _Unpickler
     dump, dumps, load, loads = _dump, _dumps, _load, _loads
 
+# Segmented pickles
+
+# The default size of the segments written by dump_segmented(), in items for
+# lists and dicts and in bytes for bytes objects.
+_SEGMENT_ITEMS = 100000
+_SEGMENT_BYTES = 16 * 1024 * 1024
+
+# A segmented pickle is a protocol 4+ pickle of
+# _join_segments(kind, (segment, ...)) where every segment is a BINBYTES8
+# holding an independent pickle of a slice of the object (or the raw data
+# of a slice of a bytes object).  pickle._join_segments does not exist: the
+# find_class() method of the unpickler returns a function which unpickles
+# the segments like the pickle containing them, see _segment_joiner().
+_SEGMENTS_GLOBAL = (SHORT_BINUNICODE + b'\x06pickle' +
+                    SHORT_BINUNICODE + b'\x0e_join_segments' + STACK_GLOBAL)
+_SEGMENT_KINDS = {list: 'list', dict: 'dict', bytes: 'bytes'}
+
+def _segment_joiner(unpickler, fix_imports, encoding, errors, buffers):
+    # Return the function called to join the segments of a segmented pickle
+    # read by unpickler.  The segments are unpickled by unpicklers of the
+    # same class, with the same options, find_class() and persistent_load(),
+    # and they take the next out-of-band buffers.
+    cls = type(unpickler)
+    init = (_Unpickler if isinstance(unpickler, _Unpickler)
+            else Unpickler).__init__
+    persistent_load = getattr(unpickler, 'persistent_load', None)
+
+    def load_segment(data):
+        segment_unpickler = cls.__new__(cls)
+        init(segment_unpickler, io.BytesIO(data), fix_imports=fix_imports,
+             encoding=encoding, errors=errors, buffers=buffers)
+        if persistent_load is not None:
+            segment_unpickler.persistent_load = persistent_load
+        return segment_unpickler.load()
+
+    def join_segments(kind, segments):
+        if kind == 'bytes':
+            return b''.join(segments)
+        if kind == 'list':
+            result = []
+            for segment in segments:
+                result.extend(load_segment(segment))
+            return result
+        if kind == 'dict':
+            result = {}
+            for segment in segments:
+                result.update(load_segment(segment))
+            return result
+        raise UnpicklingError("unknown segment kind: %r" % (kind,))
+    return join_segments
+
+def _split_segments(obj, kind, size):
+    if kind == 'bytes':
+        with memoryview(obj) as view:
+            for i in range(0, len(view), size):
+                yield view[i:i + size]
+    elif kind == 'list':
+        for i in range(0, len(obj), size):
+            yield obj[i:i + size]
+    else:
+        items = iter(obj.items())
+        for i in range(0, len(obj), size):
+            yield dict(islice(items, size))
+
+def dump_segmented(obj, file, protocol=None, *, segment_size=None,
+                   fix_imports=True):
+    """Write a pickled representation of obj to the open file object file,
+    split in independent segments.
+
+    obj must be a list, a dict or a bytes object.  Every segment holds
+    segment_size items of the list or dict (or bytes of the bytes object),
+    and is pickled separately, so that the segments can be loaded one at
+    a time or in parallel with SegmentedPickle.  The result can also be
+    loaded with load().
+
+    Objects referenced from several segments are pickled once in every
+    segment, and the protocol must be 4 or higher.
+    """
+    if protocol is None:
+        protocol = DEFAULT_PROTOCOL
+    if protocol < 0:
+        protocol = HIGHEST_PROTOCOL
+    elif protocol > HIGHEST_PROTOCOL:
+        raise ValueError("pickle protocol must be <= %d" % HIGHEST_PROTOCOL)
+    if protocol < 4:
+        raise ValueError("segmented pickles require protocol 4 or higher")
+    try:
+        kind = _SEGMENT_KINDS[type(obj)]
+    except KeyError:
+        raise TypeError("can only pickle list, dict or bytes in segments, "
+                        "not %s" % type(obj).__name__) from None
+    if segment_size is None:
+        segment_size = _SEGMENT_BYTES if kind == 'bytes' else _SEGMENT_ITEMS
+    elif segment_size <= 0:
+        raise ValueError("segment_size must be positive")
+
+    write = file.write
+    write(PROTO + pack("<B", protocol) + _SEGMENTS_GLOBAL +
+          SHORT_BINUNICODE + pack("<B", len(kind)) + kind.encode() + MARK)
+    for segment in _split_segments(obj, kind, segment_size):
+        if kind != 'bytes':
+            segment = dumps(segment, protocol, fix_imports=fix_imports)
+        write(BINBYTES8 + pack("<Q", len(segment)))
+        write(segment)
+    write(TUPLE + TUPLE2 + REDUCE + STOP)
+
+def _load_segment_file(filename, offset, size, kind, func):
+    # Load a segment in a worker of SegmentedPickle.map()
+    with open(filename, 'rb') as f:
+        f.seek(offset)
+        data = f.read(size)
+    if len(data) != size:
+        raise UnpicklingError("pickle data was truncated")
+    return func(data if kind == 'bytes' else loads(data))
+
+class SegmentedPickle:
+    """Read a pickle written by dump_segmented() segment by segment.
+
+    file is the path of the pickle or a binary file object opened for
+    reading, positioned at the start of the pickle.  The segments are
+    located without reading them, and each segment is only read and
+    unpickled when it is requested.  The file is memory-mapped if possible.
+    """
+
+    def __init__(self, file):
+        if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+            self.name = file
+            self._file = open(file, 'rb')
+            self._owns_file = True
+        else:
+            name = getattr(file, 'name', None)
+            self.name = name if isinstance(name, (str, bytes)) else None
+            self._file = file
+            self._owns_file = False
+        self._mmap = None
+        try:
+            self._segments = self._read_index()
+            self._map_file()
+        except:
+            self.close()
+            raise
+
+    def _read_index(self):
+        f = self._file
+        header = f.read(2 + len(_SEGMENTS_GLOBAL) + 2)
+        if (len(header) != 2 + len(_SEGMENTS_GLOBAL) + 2 or
+                header[:1] != PROTO or header[1] < 4 or
+                header[2:-2] != _SEGMENTS_GLOBAL or
+                header[-2:-1] != SHORT_BINUNICODE):
+            raise UnpicklingError("not a segmented pickle")
+        kind = f.read(header[-1] + 1)
+        if kind[-1:] != MARK:
+            raise UnpicklingError("not a segmented pickle")
+        self.kind = kind[:-1].decode('ascii', 'replace')
+        if self.kind not in _SEGMENT_KINDS.values():
+            raise UnpicklingError("unknown segment kind: %r" % (self.kind,))
+        segments = []
+        while True:
+            opcode = f.read(1)
+            if opcode == BINBYTES8:
+                size, = unpack("<Q", f.read(8))
+                offset = f.tell()
+                if f.seek(size, io.SEEK_CUR) > self._file_size(offset + size):
+                    raise UnpicklingError("pickle data was truncated")
+                segments.append((offset, size))
+            elif opcode == TUPLE:
+                if f.read(3) != TUPLE2 + REDUCE + STOP:
+                    raise UnpicklingError("not a segmented pickle")
+                return segments
+            else:
+                raise UnpicklingError("not a segmented pickle")
+
+    def _file_size(self, default):
+        try:
+            return os.fstat(self._file.fileno()).st_size
+        except (AttributeError, OSError, ValueError):
+            return default
+
+    def _map_file(self):
+        try:
+            import mmap
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except (ImportError, AttributeError, OSError, ValueError):
+            self._mmap = None
+
+    def __len__(self):
+        """Return the number of segments."""
+        return len(self._segments)
+
+    def read_segment(self, index):
+        """Return the raw data of the segment index: a pickle, or a part
+        of a bytes object."""
+        offset, size = self._segments[index]
+        if self._mmap is not None:
+            return self._mmap[offset:offset + size]
+        self._file.seek(offset)
+        data = self._file.read(size)
+        if len(data) != size:
+            raise UnpicklingError("pickle data was truncated")
+        return data
+
+    def load_segment(self, index):
+        """Return the part of the pickled object in the segment index: a
+        list, a dict or a bytes object."""
+        if self.kind == 'bytes':
+            return self.read_segment(index)
+        if self._mmap is not None:
+            offset, size = self._segments[index]
+            with memoryview(self._mmap) as view:
+                with view[offset:offset + size] as data:
+                    return loads(data)
+        return loads(self.read_segment(index))
+
+    def __iter__(self):
+        for index in range(len(self._segments)):
+            yield self.load_segment(index)
+
+    def load(self):
+        """Return the whole pickled object."""
+        if self.kind == 'bytes':
+            return b''.join(self)
+        result = [] if self.kind == 'list' else {}
+        extend = result.extend if self.kind == 'list' else result.update
+        for segment in self:
+            extend(segment)
+        return result
+
+    def map(self, func, executor=None):
+        """Return an iterator of func(segment) for every segment, in order.
+
+        If executor is a concurrent.futures.Executor, the segments are
+        loaded and func is called in its workers, so that only the results
+        are sent back.  The pickle must have been opened from a path for
+        this, and func must be picklable for a process pool.
+        """
+        if executor is None:
+            return map(func, self)
+        if self.name is None:
+            raise ValueError("the pickle was not opened from a path")
+        kind = self.kind
+        return executor.map(_load_segment_file,
+                            *zip(*[(self.name, offset, size, kind, func)
+                                   for offset, size in self._segments]))
+
+    def close(self):
+        """Close the file if it was opened by the constructor."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._owns_file:
+            self._file.close()
+            self._owns_file = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
 # Doctest
 def _test():
     import doctest
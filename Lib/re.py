@@ -96,9 +96,14 @@
     compile   Compile a pattern into a Pattern object.
     purge     Clear the regular expression cache.
     escape    Backslash all non-alphanumerics in a string.
+    set_cache_file Keep the compiled patterns in a file across runs.
 
-Each function other than purge and escape can take an optional 'flags' argument
-consisting of one or more of the following module constants, joined by "|".
+This module also defines the PatternSet class, to match many patterns
+against the same string at once.
+
+Each function other than purge, escape and set_cache_file can take an
+optional 'flags' argument consisting of one or more of the following module
+constants, joined by "|".
 A, L, and U are mutually exclusive.
     A  ASCII       For string patterns, make \w, \W, \b, \B, \d, \D
                    match the corresponding ASCII character categories
@@ -125,6 +130,7 @@
 import sre_compile
 import sre_parse
 import functools
+import _sre
 try:
     import _locale
 except ImportError:
@@ -135,7 +141,8 @@
 __all__ = [
     "match", "fullmatch", "search", "sub", "subn", "split",
     "findall", "finditer", "compile", "purge", "template", "escape",
-    "error", "Pattern", "Match", "A", "I", "L", "M", "S", "X", "U",
+    "set_cache_file", "error", "Pattern", "Match", "PatternSet",
+    "A", "I", "L", "M", "S", "X", "U",
     "ASCII", "IGNORECASE", "LOCALE", "MULTILINE", "DOTALL", "VERBOSE",
     "UNICODE",
 ]
@@ -260,6 +267,32 @@ def template(pattern, flags=0):
     "Compile a template pattern, returning a Pattern object"
     return _compile(pattern, flags|T)
 
+def set_cache_file(filename):
+    """Keep the compiled code of the patterns in a file across runs.
+
+    The code is loaded from the file if it exists, and the patterns which
+    are not found there are parsed and compiled as usual, then added to the
+    file when the interpreter exits.  Pass None to stop using the file."""
+    global _diskcache, _diskcache_file, _diskcache_dirty
+    if filename is None:
+        _diskcache = _diskcache_file = None
+        return
+    import atexit, marshal, os
+    filename = os.fspath(filename)
+    cache = {}
+    try:
+        with open(filename, 'rb') as f:
+            version, data = marshal.load(f)
+        if version == sre_compile.CODE_VERSION and isinstance(data, dict):
+            cache = data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    atexit.unregister(_save_cache)
+    atexit.register(_save_cache)
+    _diskcache = cache
+    _diskcache_file = filename
+    _diskcache_dirty = False
+
 # SPECIAL_CHARS
 # closing ')', '}' and ']'
 # '-' (a range in character set)
@@ -288,6 +321,7 @@ def escape(pattern):
 _MAXCACHE = 512
 def _compile(pattern, flags):
     # internal: compile pattern
+    global _diskcache_dirty
     if isinstance(flags, RegexFlag):
         flags = flags.value
     try:
@@ -301,7 +335,25 @@ def _compile(pattern, flags):
         return pattern
     if not sre_compile.isstring(pattern):
         raise TypeError("first argument must be string or compiled pattern")
-    p = sre_compile.compile(pattern, flags)
+    if _diskcache is not None and not (flags & DEBUG):
+        # This is not a separate function, so that the warnings emitted
+        # by sre_parse have the same stack level in both cases.
+        key = pattern, flags
+        p = None
+        data = _diskcache.get(key)
+        if data is not None:
+            try:
+                p = _sre.compile(pattern, *data)
+            except Exception:
+                # Invalid code, for instance from a damaged file
+                del _diskcache[key]
+        if p is None:
+            data = sre_compile.compile_data(pattern, flags)
+            p = _sre.compile(pattern, *data)
+            _diskcache[key] = data
+            _diskcache_dirty = True
+    else:
+        p = sre_compile.compile(pattern, flags)
     if not (flags & DEBUG):
         if len(_cache) >= _MAXCACHE:
             # Drop the oldest item
@@ -312,6 +364,40 @@ def _compile(pattern, flags):
         _cache[type(pattern), pattern, flags] = p
     return p
 
+# The compiled code of the patterns, keyed by (pattern, flags), when a cache
+# file is used.
+_diskcache = None
+_diskcache_file = None
+_diskcache_dirty = False
+
+_MAXDISKCACHE = 10000
+def _save_cache():
+    # Write the cache file if new patterns were compiled since it was read
+    global _diskcache_dirty
+    if _diskcache is None or not _diskcache_dirty:
+        return
+    import marshal, os
+    # Drop the oldest entries, which were loaded from the file
+    excess = len(_diskcache) - _MAXDISKCACHE
+    if excess > 0:
+        for key in list(_diskcache)[:excess]:
+            del _diskcache[key]
+    data = marshal.dumps((sre_compile.CODE_VERSION, _diskcache))
+    # Write to a temporary file and rename it, so that other processes
+    # never read a partial file
+    tmpname = '%s.%d.tmp' % (_diskcache_file, os.getpid())
+    try:
+        with open(tmpname, 'wb') as f:
+            f.write(data)
+        os.replace(tmpname, _diskcache_file)
+    except OSError:
+        try:
+            os.unlink(tmpname)
+        except OSError:
+            pass
+        return
+    _diskcache_dirty = False
+
 @functools.lru_cache(_MAXCACHE)
 def _compile_repl(repl, pattern):
     # internal: compile replacement pattern
@@ -382,3 +468,172 @@ def scan(self, string):
                 append(action)
             i = j
         return result, string[i:]
+
+
+class PatternSet:
+    """A list of patterns which are matched together against strings.
+
+    The match(), fullmatch() and search() methods return the indices of the
+    patterns which match the string, in increasing order.  Each pattern is
+    only tried if the string contains one of the literals which start all
+    its matches, and all these literals are looked for at once, with a
+    single combined pattern."""
+
+    def __init__(self, patterns, flags=0):
+        self.patterns = []
+        byliteral = {}
+        unfiltered = []
+        for i, pattern in enumerate(patterns):
+            p = _compile(pattern, flags)
+            if self.patterns and (isinstance(p.pattern, str) !=
+                                  isinstance(self.patterns[0].pattern, str)):
+                raise TypeError("cannot mix string and bytes patterns")
+            self.patterns.append(p)
+            literals = _prefix_literals(p)
+            if literals:
+                for literal in literals:
+                    byliteral.setdefault(literal, []).append(i)
+            else:
+                unfiltered.append(i)
+        self._unfiltered = unfiltered
+        # For each literal, the patterns which are started by it or by one
+        # of its prefixes: finding the literal means they can match.
+        self._candidates = candidates = {}
+        for literal in byliteral:
+            indices = set()
+            for j in range(1, len(literal) + 1):
+                indices.update(byliteral.get(literal[:j], ()))
+            indices.update(unfiltered)
+            candidates[literal] = sorted(indices)
+        if byliteral:
+            self._literals = sre_compile.compile(_literal_trie(byliteral))
+        else:
+            self._literals = None
+
+    def match(self, string):
+        """Return the indices of the patterns which match at the beginning
+        of the string."""
+        return self._matching(string, self._literals_at_start(string),
+                              'match')
+
+    def fullmatch(self, string):
+        """Return the indices of the patterns which match all of the
+        string."""
+        return self._matching(string, self._literals_at_start(string),
+                              'fullmatch')
+
+    def search(self, string):
+        """Return the indices of the patterns which match anywhere in the
+        string."""
+        found = set()
+        if self._literals is not None:
+            # The combined pattern matches the longest literal starting at
+            # a given position, which implies its prefixes, so one match
+            # per position is enough.
+            search = self._literals.search
+            count = len(self._candidates)
+            m = search(string)
+            while m is not None:
+                found.add(m.group())
+                if len(found) == count:
+                    break
+                m = search(string, m.start() + 1)
+        return self._matching(string, found, 'search')
+
+    def _literals_at_start(self, string):
+        if self._literals is not None:
+            m = self._literals.match(string)
+            if m is not None:
+                return (m.group(),)
+        return ()
+
+    def _matching(self, string, found, method):
+        if not found:
+            indices = self._unfiltered
+        elif len(found) == 1:
+            for literal in found:
+                indices = self._candidates[literal]
+        else:
+            indices = set()
+            for literal in found:
+                indices.update(self._candidates[literal])
+            indices = sorted(indices)
+        patterns = self.patterns
+        return [i for i in indices
+                if getattr(patterns[i], method)(string) is not None]
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.patterns)
+
+# The literals used by PatternSet are truncated to this length, which bounds
+# the nesting of the combined pattern.
+_MAXLITERAL = 64
+
+def _prefix_literals(pattern):
+    # Return a list of literals, one of which starts every match of the
+    # compiled pattern, or None if there are no such literals.
+    import warnings
+    from sre_constants import AT, ASSERT, ASSERT_NOT, LITERAL, RANGE
+    with warnings.catch_warnings():
+        # The warnings were emitted when the pattern was compiled
+        warnings.simplefilter('ignore')
+        p = sre_parse.parse(pattern.pattern, pattern.flags)
+    flags = p.state.flags
+    if flags & LOCALE and flags & IGNORECASE:
+        return None
+    # Zero-width assertions at the start do not consume anything
+    i = 0
+    while i < len(p.data) and p.data[i][0] in (AT, ASSERT, ASSERT_NOT):
+        i += 1
+    del p.data[:i]
+    prefix, prefix_skip, got_all = sre_compile._get_literal_prefix(p, flags)
+    if prefix:
+        prefixes = [prefix[:_MAXLITERAL]]
+    else:
+        charset = sre_compile._get_charset_prefix(p, flags)
+        if not charset:
+            return None
+        prefixes = []
+        for op, av in charset:
+            if op is LITERAL:
+                prefixes.append([av])
+            elif op is RANGE and av[1] - av[0] < 256:
+                prefixes.extend([c] for c in range(av[0], av[1] + 1))
+            else:
+                return None
+        if len(prefixes) > 256:
+            return None
+    if isinstance(pattern.pattern, str):
+        return [''.join(map(chr, prefix)) for prefix in prefixes]
+    return [bytes(prefix) for prefix in prefixes]
+
+def _literal_trie(literals):
+    # Return a pattern matching the longest of the literals which starts at
+    # a given position, shaped like a trie: "abc", "abd" and "b" give
+    # "(?:ab(?:c|d)|b)".
+    empty = next(iter(literals))[:0]
+    trie = {}
+    for literal in literals:
+        node = trie
+        for i in range(len(literal)):
+            node = node.setdefault(literal[i:i+1], {})
+        node[empty] = None
+    if isinstance(empty, bytes):
+        open_, bar, close, optional = b'(?:', b'|', b')', b')?'
+    else:
+        open_, bar, close, optional = '(?:', '|', ')', ')?'
+    def build(node):
+        alternatives = [escape(c) + build(node[c])
+                        for c in sorted(node) if c]
+        if not alternatives:
+            return empty
+        if empty in node:
+            # Try the longer literals first
+            return open_ + bar.join(alternatives) + optional
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return open_ + bar.join(alternatives) + close
+    return build(trie)
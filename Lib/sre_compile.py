@@ -533,10 +533,34 @@ def _get_charset_prefix(pattern, flags):
         return charset
     return None
 
+def _get_required_literal(pattern, flags):
+    # internal: find the longest run of literal characters that any
+    # match must contain, and the width of what precedes it
+    iscased = _get_iscased(flags)
+    best = []
+    bestpos = 0
+    run = []
+    for i, (op, av) in enumerate(pattern.data):
+        if op is LITERAL and not (iscased and iscased(av)):
+            run.append(av)
+            if len(run) > len(best):
+                best = run[:]
+                bestpos = i + 1 - len(run)
+        else:
+            run = []
+    if not best:
+        return None
+    lo, hi = sre_parse.SubPattern(pattern.state,
+                                  pattern.data[:bestpos]).getwidth()
+    if lo >= MAXCODE:
+        return None
+    return best, lo, min(hi, MAXCODE)
+
 def _compile_info(code, pattern, flags):
     # internal: compile an info block.  in the current version,
     # this contains min/max pattern width, and an optional literal
-    # prefix or a character map
+    # prefix, a character map, or a literal required somewhere in
+    # the pattern
     lo, hi = pattern.getwidth()
     if hi > MAXCODE:
         hi = MAXCODE
@@ -547,12 +571,16 @@ def _compile_info(code, pattern, flags):
     prefix = []
     prefix_skip = 0
     charset = [] # not used
+    required = None
     if not (flags & SRE_FLAG_IGNORECASE and flags & SRE_FLAG_LOCALE):
         # look for literal prefix
         prefix, prefix_skip, got_all = _get_literal_prefix(pattern, flags)
         # if no prefix, look for charset prefix
         if not prefix:
             charset = _get_charset_prefix(pattern, flags)
+            # if neither, look for a literal further in
+            if not charset:
+                required = _get_required_literal(pattern, flags)
 ##     if prefix:
 ##         print("*** PREFIX", prefix, prefix_skip)
 ##     if charset:
@@ -569,6 +597,8 @@ def _compile_info(code, pattern, flags):
             mask = mask | SRE_INFO_LITERAL
     elif charset:
         mask = mask | SRE_INFO_CHARSET
+    elif required:
+        mask = mask | SRE_INFO_REQUIRED
     emit(mask)
     # pattern length
     if lo < MAXCODE:
@@ -590,6 +620,12 @@ def _compile_info(code, pattern, flags):
         charset, hascased = _optimize_charset(charset)
         assert not hascased
         _compile_charset(charset, flags, code)
+    elif required:
+        literal, required_lo, required_hi = required
+        emit(len(literal)) # length
+        emit(required_lo) # width before the literal
+        emit(required_hi)
+        code.extend(literal)
     code[skip] = len(code) - skip
 
 def isstring(obj):
@@ -742,6 +778,16 @@ def print_2(*args):
                     start += prefix_len
                     print_2('  overlap', code[start: start+prefix_len])
                     start += prefix_len
+                if flags & SRE_INFO_REQUIRED:
+                    required_len, required_lo, required_hi = code[i+4: i+7]
+                    if required_hi == MAXREPEAT:
+                        required_hi = 'MAXREPEAT'
+                    print_2('  required_width', required_lo, required_hi)
+                    start = i + 7
+                    required = code[start: start+required_len]
+                    print_2('  required',
+                            '[%s]' % ', '.join('%#02x' % x for x in required),
+                            '(%r)' % ''.join(map(chr, required)))
                 if flags & SRE_INFO_CHARSET:
                     level += 1
                     print_2('in')
@@ -756,14 +802,9 @@ def print_2(*args):
     dis_(0, len(code))
 
 
-def compile(p, flags=0):
-    # internal: convert pattern list to internal format
-
-    if isstring(p):
-        pattern = p
-        p = sre_parse.parse(p, flags)
-    else:
-        pattern = None
+def _compile_parsed(p, flags):
+    # internal: return the arguments of _sre.compile() which follow the
+    # pattern, for parsed pattern p
 
     code = _code(p, flags)
 
@@ -777,8 +818,37 @@ def compile(p, flags=0):
     for k, i in groupindex.items():
         indexgroup[i] = k
 
-    return _sre.compile(
-        pattern, flags | p.state.flags, code,
+    return (
+        flags | p.state.flags, code,
         p.state.groups-1,
         groupindex, tuple(indexgroup)
         )
+
+def compile(p, flags=0):
+    # internal: convert pattern list to internal format
+
+    if isstring(p):
+        pattern = p
+        p = sre_parse.parse(p, flags)
+    else:
+        pattern = None
+
+    return _sre.compile(pattern, *_compile_parsed(p, flags))
+
+# The compiled code of a pattern is only valid for the same version of the
+# engine and the same code size and limits.
+CODE_VERSION = (MAGIC, _sre.CODESIZE, int(MAXREPEAT), MAXGROUPS)
+
+def compile_data(p, flags=0):
+    """Compile pattern p and return the arguments of _sre.compile() which
+    follow the pattern: (flags, code, groups, groupindex, indexgroup).
+
+    They are made of plain ints, strings, lists, dicts and tuples, so they
+    can be serialized with marshal or pickle and passed to _sre.compile()
+    again by any process using the same CODE_VERSION, without parsing and
+    compiling the pattern anew."""
+    flags = int(flags)
+    if isstring(p):
+        p = sre_parse.parse(p, flags)
+    flags, code, groups, groupindex, indexgroup = _compile_parsed(p, flags)
+    return flags, list(map(int, code)), groups, groupindex, indexgroup
@@ -13,7 +13,7 @@
 
 # update when constants are added or removed
 
-MAGIC = 20171005
+MAGIC = 20201019
 
 from _sre import MAXREPEAT, MAXGROUPS
 
@@ -213,6 +213,7 @@ def _makecodes(names):
 SRE_INFO_PREFIX = 1 # has prefix
 SRE_INFO_LITERAL = 2 # entire pattern is literal (given by prefix)
 SRE_INFO_CHARSET = 4 # pattern starts with character from given set
+SRE_INFO_REQUIRED = 8 # pattern contains a required literal
 
 if __name__ == "__main__":
     def dump(f, d, prefix):
@@ -255,5 +256,6 @@ def dump(f, d, prefix):
         f.write("#define SRE_INFO_PREFIX %d\n" % SRE_INFO_PREFIX)
         f.write("#define SRE_INFO_LITERAL %d\n" % SRE_INFO_LITERAL)
         f.write("#define SRE_INFO_CHARSET %d\n" % SRE_INFO_CHARSET)
+        f.write("#define SRE_INFO_REQUIRED %d\n" % SRE_INFO_REQUIRED)
 
     print("done")
@@ -77,9 +77,15 @@
 NUL = b"\0"                     # the null character
 BLOCKSIZE = 512                 # length of processing blocks
 RECORDSIZE = BLOCKSIZE * 20     # length of records
+_INDEX_MAGIC = b"TARIDX\x01"    # magic of the index files
 GNU_MAGIC = b"ustar  \0"        # magic gnu tar string
 POSIX_MAGIC = b"ustar\x0000"    # magic posix tar string
 
+# The fields of a header block: name, mode, uid, gid, size, mtime, chksum,
+# type, linkname, magic, uname, gname, devmajor, devminor and prefix.
+_HEADER = struct.Struct("100s8s8s8s12s12s8sc100s8s32s32s8s8s155s12x")
+_HIGH_BYTES = bytes(range(128, 256))
+
 LENGTH_NAME = 100               # maximum length of a filename
 LENGTH_LINK = 100               # maximum length of a linkname
 LENGTH_PREFIX = 155             # maximum length of the prefix field
@@ -175,16 +181,12 @@ def nti(s):
     # There are two possible encodings for a number field, see
     # itn() below.
     if s[0] in (0o200, 0o377):
-        n = 0
-        for i in range(len(s) - 1):
-            n <<= 8
-            n += s[i + 1]
+        n = int.from_bytes(s[1:], "big")
         if s[0] == 0o377:
             n = -(256 ** (len(s) - 1) - n)
     else:
         try:
-            s = nts(s, "ascii", "strict")
-            n = int(s.strip() or "0", 8)
+            n = int(s.split(NUL, 1)[0].strip() or b"0", 8)
         except ValueError:
             raise InvalidHeaderError("invalid header")
     return n
@@ -202,7 +204,7 @@ def itn(n, digits=8, format=DEFAULT_FORMAT):
     # number.
     n = int(n)
     if 0 <= n < 8 ** (digits - 1):
-        s = bytes("%0*o" % (digits - 1, n), "ascii") + NUL
+        s = b"%0*o\0" % (digits - 1, n)
     elif format == GNU_FORMAT and -256 ** (digits - 1) <= n < 256 ** (digits - 1):
         if n >= 0:
             s = bytearray([0o200])
@@ -227,9 +229,11 @@ def calc_chksums(buf):
        the high bit set. So we calculate two checksums, unsigned and
        signed.
     """
-    unsigned_chksum = 256 + sum(struct.unpack_from("148B8x356B", buf))
-    signed_chksum = 256 + sum(struct.unpack_from("148b8x356b", buf))
-    return unsigned_chksum, signed_chksum
+    buf = bytes(buf[:148]) + bytes(buf[156:512])
+    unsigned_chksum = 256 + sum(buf)
+    # Every byte with the high bit set counts 256 less as a signed char.
+    high = len(buf) - len(buf.translate(None, _HIGH_BYTES))
+    return unsigned_chksum, unsigned_chksum - 256 * high
 
 def copyfileobj(src, dst, length=None, exception=OSError, bufsize=None):
     """Copy length bytes from fileobj src to fileobj dst.
@@ -700,6 +704,56 @@ def close(self):
         self.closed = True
 #class _FileInFile
 
+class _MappedFile(object):
+    """A read-only file object which reads an existing file
+       through a memory map of it.
+    """
+
+    def __init__(self, fileobj):
+        import mmap
+        self._map = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        self.fileobj = fileobj
+        self.name = getattr(fileobj, "name", None)
+        self.position = fileobj.tell()
+        self.closed = False
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, position, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            position += self.position
+        elif whence == io.SEEK_END:
+            position += len(self._map)
+        elif whence != io.SEEK_SET:
+            raise ValueError("Invalid argument")
+        if position < 0:
+            raise ValueError("negative seek position %d" % position)
+        self.position = position
+        return self.position
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            stop = len(self._map)
+        else:
+            stop = self.position + size
+        buf = self._map[self.position:stop]
+        self.position += len(buf)
+        return buf
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._map.close()
+            self.fileobj.close()
+#class _MappedFile
+
 class ExFileObject(io.BufferedReader):
 
     def __init__(self, tarfile, tarinfo):
@@ -937,11 +991,12 @@ def _create_header(info, format, encoding, errors):
             devmajor = itn(info.get("devmajor", 0), 8, format)
             devminor = itn(info.get("devminor", 0), 8, format)
         else:
-            devmajor = stn("", 8, encoding, errors)
-            devminor = stn("", 8, encoding, errors)
+            devmajor = devminor = b""
 
-        parts = [
-            stn(info.get("name", ""), 100, encoding, errors),
+        # The string fields are truncated and padded with NUL by the "s"
+        # format of _HEADER, like stn() does.
+        buf = _HEADER.pack(
+            info.get("name", "").encode(encoding, errors),
             itn(info.get("mode", 0) & 0o7777, 8, format),
             itn(info.get("uid", 0), 8, format),
             itn(info.get("gid", 0), 8, format),
@@ -949,18 +1004,19 @@ def _create_header(info, format, encoding, errors):
             itn(info.get("mtime", 0), 12, format),
             b"        ", # checksum field
             info.get("type", REGTYPE),
-            stn(info.get("linkname", ""), 100, encoding, errors),
+            info.get("linkname", "").encode(encoding, errors),
             info.get("magic", POSIX_MAGIC),
-            stn(info.get("uname", ""), 32, encoding, errors),
-            stn(info.get("gname", ""), 32, encoding, errors),
+            info.get("uname", "").encode(encoding, errors),
+            info.get("gname", "").encode(encoding, errors),
             devmajor,
             devminor,
-            stn(info.get("prefix", ""), 155, encoding, errors)
-        ]
+            info.get("prefix", "").encode(encoding, errors)
+        )
 
-        buf = struct.pack("%ds" % BLOCKSIZE, b"".join(parts))
-        chksum = calc_chksums(buf[-BLOCKSIZE:])[0]
-        buf = buf[:-364] + bytes("%06o\0" % chksum, "ascii") + buf[-357:]
+        # The checksum field is filled with spaces, which is how it counts
+        # in the checksum.
+        chksum = sum(buf)
+        buf = buf[:148] + b"%06o\0" % chksum + buf[155:]
         return buf
 
     @staticmethod
@@ -1052,25 +1108,28 @@ def frombuf(cls, buf, encoding, errors):
         if buf.count(NUL) == BLOCKSIZE:
             raise EOFHeaderError("end of file header")
 
-        chksum = nti(buf[148:156])
+        (name, mode, uid, gid, size, mtime, chksum, type, linkname, magic,
+         uname, gname, devmajor, devminor, prefix) = _HEADER.unpack(buf)
+
+        chksum = nti(chksum)
         if chksum not in calc_chksums(buf):
             raise InvalidHeaderError("bad checksum")
 
         obj = cls()
-        obj.name = nts(buf[0:100], encoding, errors)
-        obj.mode = nti(buf[100:108])
-        obj.uid = nti(buf[108:116])
-        obj.gid = nti(buf[116:124])
-        obj.size = nti(buf[124:136])
-        obj.mtime = nti(buf[136:148])
+        obj.name = nts(name, encoding, errors)
+        obj.mode = nti(mode)
+        obj.uid = nti(uid)
+        obj.gid = nti(gid)
+        obj.size = nti(size)
+        obj.mtime = nti(mtime)
         obj.chksum = chksum
-        obj.type = buf[156:157]
-        obj.linkname = nts(buf[157:257], encoding, errors)
-        obj.uname = nts(buf[265:297], encoding, errors)
-        obj.gname = nts(buf[297:329], encoding, errors)
-        obj.devmajor = nti(buf[329:337])
-        obj.devminor = nti(buf[337:345])
-        prefix = nts(buf[345:500], encoding, errors)
+        obj.type = type
+        obj.linkname = nts(linkname, encoding, errors)
+        obj.uname = nts(uname, encoding, errors)
+        obj.gname = nts(gname, encoding, errors)
+        obj.devmajor = nti(devmajor)
+        obj.devminor = nti(devminor)
+        prefix = nts(prefix, encoding, errors)
 
         # Old V7 tar format represents a directory as a regular
         # file with a trailing slash.
@@ -1451,7 +1510,7 @@ class TarFile(object):
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None,
-            errorlevel=None, copybufsize=None):
+            errorlevel=None, copybufsize=None, use_mmap=False):
         """Open an (uncompressed) tar archive `name'. `mode' is either 'r' to
            read from an existing archive, 'a' to append data to an existing
            file or 'w' to create a new file overwriting an existing one. `mode'
@@ -1459,6 +1518,8 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
            If `fileobj' is given, it is used for reading or writing data. If it
            can be determined, `mode' is overridden by `fileobj's mode.
            `fileobj' is not closed, when TarFile is closed.
+           If `use_mmap' is true, an archive opened from `name' for reading
+           is read through a memory map.
         """
         modes = {"r": "rb", "a": "r+b", "w": "wb", "x": "xb"}
         if mode not in modes:
@@ -1473,6 +1534,12 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
                 self._mode = "wb"
             fileobj = bltn_open(name, self._mode)
             self._extfileobj = False
+            if use_mmap and self.mode == "r":
+                try:
+                    fileobj = _MappedFile(fileobj)
+                except (ImportError, OSError, ValueError):
+                    # Fall back to regular reads, e.g. for an empty file.
+                    pass
         else:
             if (name is None and hasattr(fileobj, "name") and
                 isinstance(fileobj.name, (str, bytes))):
@@ -1511,6 +1578,8 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
         self.closed = False
         self.members = []       # list of members as TarInfo objects
         self._loaded = False    # flag if all members have been read
+        self._index = None      # dictionary of the offsets of the members,
+                                # read by load_index()
         self.offset = self.fileobj.tell()
                                 # current position in the archive file
         self.inodes = {}        # dictionary caching the inodes of
@@ -1785,7 +1854,10 @@ def getmember(self, name):
            than once in the archive, its last occurrence is assumed to be the
            most up-to-date version.
         """
-        tarinfo = self._getmember(name)
+        if self._index is not None and not self._loaded:
+            tarinfo = self._getindexed(name)
+        else:
+            tarinfo = self._getmember(name)
         if tarinfo is None:
             raise KeyError("filename %r not found" % name)
         return tarinfo
@@ -1806,6 +1878,53 @@ def getnames(self):
         """
         return [tarinfo.name for tarinfo in self.getmembers()]
 
+    def save_index(self, file):
+        """Write an index of the members of the archive to `file', which is
+           a filename or a binary file object. With the index, load_index()
+           lets getmember() and extractfile() find a member without reading
+           the headers of the members before it.
+        """
+        self._check("r")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "wb") as f:
+                self.save_index(f)
+            return
+
+        # The offsets of all the members come first, followed by their
+        # names separated by NUL characters, which cannot occur in a name.
+        members = self.getmembers()
+        file.write(_INDEX_MAGIC + struct.pack("<Q", len(members)))
+        file.write(b"".join(struct.pack("<QQQ", tarinfo.offset,
+                                        tarinfo.offset_data, tarinfo.size)
+                            for tarinfo in members))
+        file.write("\0".join(tarinfo.name for tarinfo in members).encode(
+                "utf-8", "surrogateescape"))
+
+    def load_index(self, file):
+        """Read an index written by save_index() from `file', which is a
+           filename or a binary file object.
+        """
+        self._check("r")
+        if isinstance(self.fileobj, _Stream):
+            raise StreamError("cannot use an index with a stream")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "rb") as f:
+                self.load_index(f)
+            return
+
+        if file.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+            raise ReadError("not a tar index file")
+        try:
+            count, = struct.unpack("<Q", file.read(8))
+            offsets = list(struct.iter_unpack("<QQQ", file.read(count * 24)))
+        except struct.error:
+            raise ReadError("truncated tar index file") from None
+        names = file.read().decode("utf-8", "surrogateescape")
+        names = names.split("\0") if count else []
+        if len(offsets) != count or len(names) != count:
+            raise ReadError("truncated tar index file")
+        self._index = dict(zip(names, offsets))
+
     def gettarinfo(self, name=None, arcname=None, fileobj=None):
         """Create a TarInfo object from the result of os.stat or equivalent
            on an existing file. The file is either named by `name', or
@@ -2377,6 +2496,31 @@ def _getmember(self, name, tarinfo=None, normalize=False):
             if name == member_name:
                 return member
 
+    def _getindexed(self, name):
+        """Read the header of member `name' at the offset found in the
+           index.
+        """
+        try:
+            offset, offset_data, size = self._index[name]
+        except KeyError:
+            return None
+
+        # Don't disturb the iteration over the members.
+        saved_offset = self.offset
+        try:
+            self.fileobj.seek(offset)
+            self.offset = offset
+            tarinfo = self.tarinfo.fromtarfile(self)
+        except HeaderError as e:
+            raise ReadError(str(e)) from None
+        finally:
+            self.offset = saved_offset
+
+        if (tarinfo.name != name or tarinfo.offset_data != offset_data or
+                tarinfo.size != size):
+            raise ReadError("the index does not match the archive")
+        return tarinfo
+
     def _load(self):
         """Read through the entire archive file and look for readable
            members.
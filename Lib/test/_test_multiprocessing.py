@@ -2,6 +2,7 @@
 # Unit tests for the multiprocessing package
 #
 
+import collections
 import unittest
 import unittest.mock
 import queue as pyqueue
@@ -1217,6 +1218,56 @@ def _on_queue_feeder_error(e, obj):
         self.assertTrue(not_serializable_obj.reduce_was_called)
         self.assertTrue(not_serializable_obj.on_queue_feeder_error_was_called)
 
+    def _feed(self, objs, send_bytes_many):
+        # Run the feeder of a Queue in this thread until it reaches the end
+        # of objs, and return the objects reported to the error hook and
+        # the semaphore released for them.
+        buffer = collections.deque(objs)
+        buffer.append(multiprocessing.queues._sentinel)
+        errors = []
+        sem = threading.Semaphore(0)
+        multiprocessing.queues.Queue._feed(
+            buffer, threading.Condition(), send_bytes_many, threading.Lock(),
+            lambda: None, False, lambda e, obj: errors.append((e, obj)), sem)
+        return errors, sem
+
+    def test_queue_feeder_batch_send_error(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        error = OSError('send failed')
+        def send_bytes_many(frames):
+            raise error
+        errors, sem = self._feed([1, 2, 3], send_bytes_many)
+        # Every object of the batch is reported and released.
+        self.assertEqual(errors, [(error, 1), (error, 2), (error, 3)])
+        for i in range(3):
+            self.assertTrue(sem.acquire(blocking=False))
+        self.assertFalse(sem.acquire(blocking=False))
+
+    def test_queue_feeder_batch_not_serializable(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        class NotSerializable(object):
+            reduce_calls = 0
+            def __reduce__(self):
+                self.reduce_calls += 1
+                raise AttributeError
+
+        sent = []
+        def send_bytes_many(frames):
+            sent.extend(pickle.loads(frame) for frame in frames)
+        obj = NotSerializable()
+        errors, sem = self._feed([1, obj, 2], send_bytes_many)
+        self.assertEqual(sent, [1, 2])
+        self.assertEqual(obj.reduce_calls, 1)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0][0], AttributeError)
+        self.assertIs(errors[0][1], obj)
+        self.assertTrue(sem.acquire(blocking=False))
+        self.assertFalse(sem.acquire(blocking=False))
+
     def test_closed_queue_put_get_exceptions(self):
         for q in multiprocessing.Queue(), multiprocessing.JoinableQueue():
             q.close()
@@ -2486,6 +2537,58 @@ def test_imap_handle_iterable_exception(self):
             self.assertEqual(next(it), i*i)
         self.assertRaises(SayWhenError, it.__next__)
 
+    def test_imap_max_pending(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        consumed = []
+        def gen(n):
+            for i in range(n):
+                consumed.append(i)
+                yield i
+
+        it = self.pool.imap(sqr, gen(100), max_pending=4)
+        self.assertEqual(len(consumed), 4)
+        self.assertEqual(next(it), 0)
+        self.assertEqual(len(consumed), 5)
+        self.assertEqual(list(it), [i*i for i in range(1, 100)])
+        self.assertEqual(len(consumed), 100)
+
+        consumed.clear()
+        it = self.pool.imap(sqr, gen(100), chunksize=10, max_pending=2)
+        self.assertEqual(len(consumed), 20)
+        self.assertEqual(list(it), [i*i for i in range(100)])
+
+        it = self.pool.imap_unordered(sqr, gen(100), chunksize=3,
+                                      max_pending=2)
+        self.assertEqual(sorted(it), [i*i for i in range(100)])
+
+        it = self.pool.imap(sqr, [], max_pending=3)
+        self.assertEqual(list(it), [])
+
+        it = self.pool.imap(sqr, exception_throwing_generator(10, 3),
+                            max_pending=2)
+        for i in range(3):
+            self.assertEqual(next(it), i*i)
+        self.assertRaises(SayWhenError, it.__next__)
+
+        self.assertRaises(ValueError, self.pool.imap, sqr, range(10),
+                          max_pending=0)
+
+    def test_imap_chunked(self):
+        it = self.pool.imap(sqr, list(range(10)), chunksize=4, chunked=True)
+        self.assertEqual(list(it), [[0, 1, 4, 9], [16, 25, 36, 49], [64, 81]])
+
+        it = self.pool.imap(sqr, list(range(3)), chunked=True)
+        self.assertEqual(list(it), [[0], [1], [4]])
+
+        it = self.pool.imap_unordered(sqr, list(range(10)), chunksize=4,
+                                      chunked=True)
+        chunks = list(it)
+        self.assertEqual(sorted(len(chunk) for chunk in chunks), [2, 4, 4])
+        self.assertEqual(sorted(x for chunk in chunks for x in chunk),
+                         [i*i for i in range(10)])
+
     def test_imap_unordered(self):
         it = self.pool.imap_unordered(sqr, list(range(10)))
         self.assertEqual(sorted(it), list(map(sqr, list(range(10)))))
@@ -3116,6 +3219,62 @@ def test_duplex_false(self):
             self.assertRaises(OSError, writer.recv)
             self.assertRaises(OSError, writer.poll)
 
+    def test_send_recv_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        reader, writer = self.Pipe(duplex=False)
+        self.addCleanup(reader.close)
+        self.addCleanup(writer.close)
+
+        objs = [1, 'two', [3.0], None, b'']
+        writer.send_many(objs)
+        self.assertEqual(reader.recv_many(), objs)
+
+        writer.send_many(objs)
+        self.assertEqual(reader.recv_many(2), objs[:2])
+        self.assertEqual(reader.recv(), objs[2])
+        self.assertEqual(reader.recv_many(10), objs[3:])
+
+        msgs = [b'a' * n for n in (0, 1, 100, 20000, 10, 17000)]
+        writer.send_bytes_many(msgs)
+        self.assertEqual([reader.recv_bytes() for _ in msgs], msgs)
+
+        writer.send_bytes_many([bytearray(b'xy'), memoryview(b'z'),
+                                array.array('i', [1, 2])])
+        self.assertEqual(reader.recv_bytes_many(),
+                         [b'xy', b'z', array.array('i', [1, 2]).tobytes()])
+
+        writer.send_many([])
+        writer.send(42)
+        self.assertEqual(reader.recv_many(), [42])
+        self.assertRaises(ValueError, reader.recv_many, 0)
+
+    def test_recv_buffer_reuse(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        reader, writer = self.Pipe(duplex=False)
+        self.addCleanup(reader.close)
+        self.addCleanup(writer.close)
+
+        # Messages of decreasing and increasing sizes must not leak data
+        # from the previous message left in the receive buffer.
+        for msg in (b'x' * 20000, b'y' * 10, b'', b'z' * 30000, b'w'):
+            writer.send_bytes(msg)
+            self.assertEqual(reader.recv_bytes(), msg)
+
+        # A message larger than RECV_BUFFER_MAX is received into a buffer
+        # of its own.
+        big = b'b' * (multiprocessing.connection.RECV_BUFFER_MAX + 1)
+        t = threading.Thread(target=writer.send_bytes, args=(big,))
+        t.start()
+        self.assertEqual(reader.recv_bytes(), big)
+        t.join()
+        writer.send([1, 2, 3])
+        self.assertEqual(reader.recv(), [1, 2, 3])
+
+        writer.send_bytes(b'abcdef')
+        self.assertRaises(OSError, reader.recv_bytes, 3)
+
     def test_spawn_close(self):
         # We test that a pipe connection can be closed by parent
         # process immediately after child is spawned.  On Windows this
@@ -1651,6 +1651,47 @@ def test_recursive_set_subclass_and_inst(self):
     def test_recursive_frozenset_subclass_and_inst(self):
         self.check_recursive_collection_and_inst(MyFrozenSet)
 
+    def test_no_memoize(self):
+        expected = self._testdata
+        a = [1, 'abc']
+        for proto in protocols:
+            s = self.dumps(expected, proto, memoize=False)
+            self.assert_is_copy(expected, self.loads(s))
+            # Shared objects are pickled by value
+            x = self.loads(self.dumps([a, a], proto, memoize=False))
+            self.assertEqual(x, [a, a])
+            self.assertIsNot(x[0], x[1])
+            s = self.dumps([a, a], proto, memoize=False)
+            self.assertNotIn(pickle.MEMOIZE, s)
+            self.assertNotIn(pickle.BINPUT, s)
+
+    def test_no_memoize_recursive(self):
+        l = []
+        l.append(l)
+        i = C()
+        i.attr = i
+        h = H()
+        h.attr = frozenset([h])
+        d = {}
+        d[1] = [(d,)]
+        for obj in l, i, h, d:
+            for proto in protocols:
+                with self.subTest(obj=type(obj), proto=proto):
+                    with self.assertRaisesRegex(ValueError, 'cyclic'):
+                        self.dumps(obj, proto, memoize=False)
+
+    def test_no_memoize_deep(self):
+        # Deeply nested and repeated objects are not mistaken for recursive
+        # objects
+        fs = frozenset([1, 2])
+        t = (1,)
+        obj = [fs] * 100 + [t] * 100
+        for i in range(100):
+            obj = [obj, {'a': fs}, fs, t]
+        for proto in protocols:
+            s = self.dumps(obj, proto, memoize=False)
+            self.assertEqual(self.loads(s), obj)
+
     def test_unicode(self):
         endcases = ['', '<\\u>', '<\\\u1234>', '<\n>',
                     '<\\>', '<\\\U00012345>',
@@ -3330,6 +3371,48 @@ def test_clear_pickler_memo(self):
             self.assertNotEqual(first_pickled, second_pickled)
             self.assertEqual(first_pickled, third_pickled)
 
+    def test_pickler_dumps(self):
+        a = ["abcdefg"]
+        data = [a, a, 44]
+        for proto in protocols:
+            f = io.BytesIO()
+            self.pickler_class(f, proto).dump(data)
+            expected = f.getvalue()
+            f = io.BytesIO()
+            pickler = self.pickler_class(f, proto)
+            # Every call is independent from the previous ones
+            for i in range(3):
+                self.assertEqual(pickler.dumps(data), expected)
+            self.assertEqual(f.getvalue(), b'')
+            pickler.dump(data)
+            self.assertEqual(f.getvalue(), expected)
+            self.assertEqual(pickler.dumps(data), expected)
+            x = self.unpickler_class(io.BytesIO(pickler.dumps(data))).load()
+            self.assertIs(x[0], x[1])
+
+            pickler = self.pickler_class(None, proto)
+            self.assertEqual(pickler.dumps(data), expected)
+            self.assertRaises(TypeError, pickler.dump, data)
+            self.assertEqual(pickler.dumps(data), expected)
+
+    def test_pickler_no_memoize(self):
+        data = [["abcdefg"]] * 2
+        for proto in protocols:
+            pickler = self.pickler_class(None, proto, memoize=False)
+            self.assertTrue(pickler.fast)
+            s = pickler.dumps(data)
+            f = io.BytesIO()
+            self.pickler_class(f, proto, memoize=False).dump(data)
+            self.assertEqual(s, f.getvalue())
+            x = self.unpickler_class(io.BytesIO(s)).load()
+            self.assertEqual(x, data)
+            self.assertIsNot(x[0], x[1])
+            # The pickler can be reused after an error
+            l = []
+            l.append(l)
+            self.assertRaises(ValueError, pickler.dumps, l)
+            self.assertEqual(pickler.dumps(data), s)
+
     def test_priming_pickler_memo(self):
         # Verify that we can set the Pickler's memo attribute.
         data = ["abcdefg", "abcdefg", 44]
@@ -371,6 +371,25 @@ def test__run_once(self):
         self.assertEqual([h2], self.loop._scheduled)
         self.assertTrue(self.loop._process_events.called)
 
+    def test_call_soon_threadsafe_coalesces_wakeups(self):
+        self.loop._process_events = mock.Mock()
+        self.loop._write_to_self = mock.Mock()
+        calls = []
+
+        for i in range(10):
+            self.loop.call_soon_threadsafe(calls.append, i)
+        self.assertEqual(self.loop._write_to_self.call_count, 1)
+
+        self.loop._run_once()
+        self.assertEqual(calls, list(range(10)))
+
+        # Once the loop has polled, a new call needs a new wakeup.
+        self.loop.call_soon_threadsafe(calls.append, 10)
+        self.loop.call_soon_threadsafe(calls.append, 11)
+        self.assertEqual(self.loop._write_to_self.call_count, 2)
+        self.loop._run_once()
+        self.assertEqual(calls, list(range(12)))
+
     def test_set_debug(self):
         self.loop.set_debug(True)
         self.assertTrue(self.loop.get_debug())
@@ -663,6 +663,36 @@ def test_timeout(self):
         self.assertEqual(set([future2]), pending)
 
 
+    def test_waiters_removed_from_pending_futures(self):
+        futures_list = [Future() for _ in range(100)]
+        for f in futures_list[::2]:
+            f.set_result(None)
+
+        done, not_done = futures.wait(futures_list, timeout=0)
+        self.assertEqual(done, set(futures_list[::2]))
+        self.assertEqual(not_done, set(futures_list[1::2]))
+        for f in not_done:
+            self.assertEqual(f._waiters, [])
+
+    def test_many_futures(self):
+        futures_list = [Future() for _ in range(10000)]
+        def complete():
+            for f in futures_list:
+                f.set_result(None)
+        t = threading.Thread(target=complete)
+        t.start()
+        try:
+            done, not_done = futures.wait(futures_list + futures_list[:10])
+        finally:
+            t.join()
+        self.assertEqual(done, set(futures_list))
+        self.assertEqual(not_done, set())
+
+    def test_invalid_return_when(self):
+        with self.assertRaises(ValueError):
+            futures.wait([Future()], return_when='FIRST_SOMETHING')
+
+
 class ThreadPoolWaitTests(ThreadPoolMixin, WaitTests, BaseTestCase):
 
     def test_pending_calls_race(self):
@@ -757,6 +787,32 @@ def test_free_reference_yielded_future(self):
             if futures_list:
                 futures_list[0].set_result("test")
 
+    def test_waiters_removed_from_pending_futures(self):
+        futures_list = [Future() for _ in range(10)]
+        futures_list[3].set_result(None)
+        it = futures.as_completed(futures_list)
+        self.assertIs(next(it), futures_list[3])
+        futures_list[5].set_result(None)
+        self.assertIs(next(it), futures_list[5])
+        it.close()
+        for f in futures_list:
+            if not f.done():
+                self.assertEqual(f._waiters, [])
+
+    def test_many_futures(self):
+        futures_list = [Future() for _ in range(10000)]
+        def complete():
+            for f in futures_list:
+                f.set_result(None)
+        t = threading.Thread(target=complete)
+        t.start()
+        try:
+            completed = list(futures.as_completed(futures_list))
+        finally:
+            t.join()
+        self.assertEqual(len(completed), len(futures_list))
+        self.assertEqual(set(completed), set(futures_list))
+
     def test_correct_timeout_exception_msg(self):
         futures_list = [CANCELLED_AND_NOTIFIED_FUTURE, PENDING_FUTURE,
                         RUNNING_FUTURE, SUCCESSFUL_FUTURE]
@@ -1005,11 +1061,105 @@ def test_idle_process_reuse_multiple(self):
         self.assertLessEqual(len(executor._processes), 2)
         executor.shutdown()
 
+    def test_max_tasks_per_child(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context, max_tasks_per_child=3)
+            return
+        # not using self.executor as we need to control construction.
+        # arguably this could go in another class w/o that mixin.
+        executor = self.executor_type(
+                1, mp_context=context, max_tasks_per_child=3)
+        f1 = executor.submit(os.getpid)
+        original_pid = f1.result()
+        # The worker pid remains the same as the worker could be reused
+        f2 = executor.submit(os.getpid)
+        self.assertEqual(f2.result(), original_pid)
+        self.assertEqual(len(executor._processes), 1)
+        f3 = executor.submit(os.getpid)
+        self.assertEqual(f3.result(), original_pid)
+
+        # A new worker is spawned, with a statistically different pid,
+        # while the previous was reaped.
+        f4 = executor.submit(os.getpid)
+        new_pid = f4.result()
+        self.assertNotEqual(original_pid, new_pid)
+        self.assertEqual(len(executor._processes), 1)
+
+        executor.shutdown()
+
+    def test_max_tasks_per_child_defaults_to_spawn_context(self):
+        # not using self.executor as we need to control construction.
+        # arguably this could go in another class w/o that mixin.
+        executor = self.executor_type(1, max_tasks_per_child=3)
+        self.assertEqual(executor._mp_context.get_start_method(), "spawn")
+
+    def test_max_tasks_per_child_invalid(self):
+        context = self.get_context()
+        with self.assertRaises(TypeError):
+            self.executor_type(1, mp_context=context, max_tasks_per_child=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, mp_context=context, max_tasks_per_child=0)
+
+    def test_max_tasks_early_shutdown(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            raise unittest.SkipTest("Incompatible with the fork start method.")
+        # not using self.executor as we need to control construction.
+        # arguably this could go in another class w/o that mixin.
+        executor = self.executor_type(
+                3, mp_context=context, max_tasks_per_child=1)
+        futures = []
+        for i in range(6):
+            futures.append(executor.submit(mul, i, i))
+        executor.shutdown()
+        for i, future in enumerate(futures):
+            self.assertEqual(future.result(), mul(i, i))
+
+    def test_max_tasks_per_child_replaces_workers(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            raise unittest.SkipTest("Incompatible with the fork start method.")
+        for max_workers, max_tasks_per_child in [(1, 2), (2, 2), (2, 3)]:
+            with self.subTest(max_workers=max_workers,
+                              max_tasks_per_child=max_tasks_per_child):
+                executor = self.executor_type(
+                        max_workers, mp_context=context,
+                        max_tasks_per_child=max_tasks_per_child)
+                # Queue more tasks than the first workers can run.
+                count = max_workers * max_tasks_per_child * 3 + 1
+                fs = [executor.submit(mul, i, i) for i in range(count)]
+                done, not_done = futures.wait(fs,
+                                              timeout=support.SHORT_TIMEOUT)
+                self.assertEqual(not_done, set())
+                for i, future in enumerate(fs):
+                    self.assertEqual(future.result(), mul(i, i))
+                executor.shutdown()
+
+    def test_preload(self):
+        executor = self.executor_type(
+                1, mp_context=self.get_context(), preload=['json', 'csv'])
+        future = executor.submit(_modules_loaded, ['json', 'csv'])
+        self.assertEqual(future.result(), [True, True])
+        executor.shutdown()
+
+    def test_preload_invalid(self):
+        context = self.get_context()
+        with self.assertRaises(TypeError):
+            self.executor_type(1, mp_context=context, preload='json')
+        with self.assertRaises(TypeError):
+            self.executor_type(1, mp_context=context, preload=[1])
+
 create_executor_tests(ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
                                        ProcessPoolSpawnMixin))
 
+def _modules_loaded(names):
+    return [name in sys.modules for name in names]
+
+
 def _crash(delay=None):
     """Induces a segfault."""
     if delay:
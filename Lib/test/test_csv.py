@@ -812,6 +812,101 @@ def test_read_semi_sep(self):
         self.assertEqual(next(reader), {"1": '1', "2": '2', "3": 'abc',
                                          "4": '4', "5": '5', "6": '6'})
 
+class TestColumns(unittest.TestCase):
+    def test_readcolumns(self):
+        reader = csv.reader(["1,2.5,abc\r\n", "\r\n", "-30,1e3,\"d,e\"\r\n",
+                             " 4 , 5 ,f\r\n", "7,8,g\r\n"])
+        self.assertEqual(reader.readcolumns(3, [int, float, None]),
+                         [[1, -30, 4], [2.5, 1000.0, 5.0],
+                          ['abc', 'd,e', 'f']])
+        self.assertEqual(reader.line_num, 4)
+        self.assertEqual(reader.readcolumns(3, (str, None, len)),
+                         [['7'], ['8'], [1]])
+        self.assertEqual(reader.readcolumns(3, [int, float, None]),
+                         [[], [], []])
+
+    def test_readcolumns_converters(self):
+        values = ['0', '-0', '+12', '999999999999999999',
+                  '-1000000000000000000', '1_000', ' 7', '']
+        reader = csv.reader(['%s,%s' % (v, v or 0) for v in values])
+        ints, floats = reader.readcolumns(100, [str, float])
+        self.assertEqual(ints, values)
+        self.assertEqual(floats, [float(v or 0) for v in values])
+        reader = csv.reader(['%s,%s' % (v, v) for v in values[:-1]])
+        ints, floats = reader.readcolumns(100, [int, float])
+        self.assertEqual(ints, [int(v) for v in values[:-1]])
+        self.assertEqual(floats, [float(v) for v in values[:-1]])
+        reader = csv.reader(['1e400,-inf,nan,.5,5.,1E-3'])
+        self.assertEqual(str(reader.readcolumns(1, [float] * 6)),
+                         '[[inf], [-inf], [nan], [0.5], [5.0], [0.001]]')
+        for value in ['""', 'x', '1.5', '1e3']:
+            reader = csv.reader([value])
+            self.assertRaises(ValueError, reader.readcolumns, 1, [int])
+        for value in ['""', '.', '1-2', 'e5', '1e']:
+            reader = csv.reader([value])
+            self.assertRaises(ValueError, reader.readcolumns, 1, [float])
+
+    def test_readcolumns_quote_nonnumeric(self):
+        reader = csv.reader(['1,"2",3'], quoting=csv.QUOTE_NONNUMERIC)
+        self.assertEqual(reader.readcolumns(1, [None, None, int]),
+                         [[1.0], ['2'], [3]])
+
+    def test_readcolumns_field_count(self):
+        reader = csv.reader(["1,2\r\n", "3\r\n"])
+        with self.assertRaisesRegex(csv.Error, 'expected 2 fields, saw 1'):
+            reader.readcolumns(10, [int, int])
+        reader = csv.reader(["1,2\r\n", "3,4,5\r\n"])
+        with self.assertRaisesRegex(csv.Error, 'expected 2 fields, saw 3'):
+            reader.readcolumns(10, [int, int])
+
+    def test_readcolumns_and_next(self):
+        def convert(field):
+            next(reader)
+        reader = csv.reader(["1\r\n", "2\r\n"])
+        self.assertRaises(RuntimeError, reader.readcolumns, 10, [convert])
+        self.assertEqual(next(reader), ['2'])
+
+    def test_column_reader(self):
+        from array import array
+        data = "id,price,name\r\n1,2.5,a\r\n2,3,b\r\n\r\n3,1e2,c\r\n"
+        reader = csv.ColumnReader(StringIO(data), batch_size=2,
+                                  converters={'id': 'q', 'price': float})
+        self.assertEqual(reader.fieldnames, ['id', 'price', 'name'])
+        self.assertEqual(next(reader),
+                         {'id': array('q', [1, 2]), 'price': [2.5, 3.0],
+                          'name': ['a', 'b']})
+        self.assertEqual(reader.line_num, 3)
+        self.assertEqual(list(reader),
+                         [{'id': array('q', [3]), 'price': [100.0],
+                           'name': ['c']}])
+        self.assertEqual(reader.line_num, 5)
+        self.assertEqual(list(reader), [])
+
+    def test_column_reader_fieldnames(self):
+        from array import array
+        reader = csv.ColumnReader(["1;2\r\n", "3;4\r\n"], ['a', 'b'],
+                                  converters={'b': 'd'}, delimiter=';')
+        self.assertEqual(list(reader),
+                         [{'a': ['1', '3'], 'b': array('d', [2.0, 4.0])}])
+        self.assertEqual(list(csv.ColumnReader([])), [])
+
+    def test_column_reader_matches_dict_reader(self):
+        rows = [[i, i / 7, 'name %d' % i, ''] for i in range(250)]
+        fileobj = StringIO()
+        writer = csv.writer(fileobj)
+        writer.writerow(['i', 'x', 'name', 'empty'])
+        writer.writerows(rows)
+        fileobj.seek(0)
+        expected = list(csv.DictReader(fileobj))
+        fileobj.seek(0)
+        columns = {}
+        for batch in csv.ColumnReader(fileobj, batch_size=100):
+            self.assertLessEqual(len(batch['i']), 100)
+            for name, column in batch.items():
+                columns.setdefault(name, []).extend(column)
+        self.assertEqual([dict(zip(columns, row))
+                          for row in zip(*columns.values())], expected)
+
 class TestArrayWrites(unittest.TestCase):
     def test_int_write(self):
         import array
@@ -9,6 +9,7 @@
 import struct
 import sys
 import unittest
+import zlib
 from subprocess import PIPE, Popen
 from test import support
 from test.support import import_helper
@@ -542,6 +543,98 @@ def test_compress(self):
                 with gzip.GzipFile(fileobj=io.BytesIO(datac), mode="rb") as f:
                     self.assertEqual(f.read(), data)
 
+    def test_compress_threads(self):
+        data = b''.join(data1 * (i % 7) + data2 * (i % 5) for i in range(2000))
+        self.assertGreater(len(data), 4 * gzip._BLOCK_SIZE)
+        for args in [(), (1,), (6,)]:
+            with self.subTest(args=args):
+                datac = gzip.compress(data, *args, threads=4)
+                self.assertEqual(gzip.decompress(datac), data)
+                # The blocks are joined into a single member
+                self.assertEqual(zlib.decompress(datac, 31), data)
+        self.assertEqual(gzip.decompress(gzip.compress(b'', threads=2)), b'')
+
+    def test_write_threads(self):
+        data = bytes(range(256)) * 3000
+        with gzip.GzipFile(self.filename, 'wb', threads=3) as f:
+            for i in range(0, len(data), 9999):
+                f.write(memoryview(data)[i:i + 9999])
+            self.assertEqual(f.tell(), len(data))
+            f.flush()
+            f.write(data1)
+            f.flush(zlib.Z_FULL_FLUSH)
+            f.write(data2)
+        with gzip.GzipFile(self.filename) as f:
+            self.assertEqual(f.read(), data + data1 + data2)
+
+    def test_write_threads_bounded(self):
+        # A single large write keeps no more than 2 blocks per thread in
+        # flight.
+        data = bytes(range(256)) * (40 * gzip._BLOCK_SIZE // 256 + 1)
+        with gzip.GzipFile(self.filename, 'wb', threads=2) as f:
+            submit = f._submit_block
+            pending = []
+            def submit_block(*args):
+                submit(*args)
+                pending.append(len(f._pending))
+            f._submit_block = submit_block
+            f.write(b'x')
+            f.write(data)
+            self.assertGreaterEqual(len(pending), 40)
+            self.assertLessEqual(max(pending), 2 * 2 + 1)
+            f.write(array.array('I', data[:4000]))
+        with gzip.GzipFile(self.filename) as f:
+            self.assertEqual(f.read(), b'x' + data + data[:4000])
+
+    def test_index(self):
+        data = b''.join(b'%d %r\n' % (i, data1[i % len(data1):])
+                        for i in range(20000))
+        half = len(data) // 2
+        with open(self.filename, 'wb') as f:
+            f.write(gzip.compress(data[:half]) + gzip.compress(data[half:]))
+        offsets = [0, 10, 50000, half - 3, half, len(data) - 3, 12345, 5]
+        with gzip.GzipFile(self.filename, index_interval=20000) as f:
+            self.assertEqual(f.read(), data)
+            index = f._buffer.raw._index
+            self.assertGreater(len(index), 1)
+            # The second member is indexed from its header
+            self.assertIn(None, [point[3] for point in index])
+            for offset in offsets:
+                with self.subTest(offset=offset):
+                    self.assertEqual(f.seek(offset), offset)
+                    self.assertEqual(f.read(100), data[offset:offset + 100])
+            self.assertEqual(f.read(), data[5 + 100:])
+            f.save_index(self.filename + '.idx')
+        self.addCleanup(os_helper.unlink, self.filename + '.idx')
+        with gzip.GzipFile(self.filename) as f:
+            f.load_index(self.filename + '.idx')
+            self.assertEqual(f.seek(-20, io.SEEK_END), len(data) - 20)
+            self.assertEqual(f.read(), data[-20:])
+            for offset in offsets:
+                with self.subTest(offset=offset):
+                    f.seek(offset)
+                    self.assertEqual(f.read(100), data[offset:offset + 100])
+            f.seek(50000)
+            self.assertEqual(f.read(), data[50000:])
+
+    def test_index_mismatch(self):
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            f.write(data1 * 500)
+        buf = io.BytesIO()
+        with gzip.GzipFile(self.filename, index_interval=100) as f:
+            f.read()
+            f.save_index(buf)
+            self.assertRaises(OSError, f.write, b'')
+        with gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(data1))) as f:
+            buf.seek(0)
+            self.assertRaises(ValueError, f.load_index, buf)
+            self.assertRaises(ValueError, f.load_index, io.BytesIO(b'GZIP'))
+            buf.seek(0)
+            self.assertRaises(ValueError, f.load_index,
+                              io.BytesIO(buf.read()[:20]))
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            self.assertRaises(OSError, f.save_index, buf)
+
     def test_compress_mtime(self):
         mtime = 123456789
         for data in [data1, data2]:
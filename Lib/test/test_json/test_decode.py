@@ -62,6 +62,44 @@ def test_keys_reuse(self):
         self.check_keys_reuse(s, decoder.decode)
         self.assertFalse(decoder.memo)
 
+    def test_key_cache(self):
+        decoder = self.json.decoder.JSONDecoder(key_cache_size=3)
+        a = decoder.decode('{"a_key": 1, "b_\xe9": 2}')
+        b = decoder.decode('[{"b_\xe9": 3, "a_key": 4}]')[0]
+        (k1, k2), (k3, k4) = sorted(a), sorted(b)
+        self.assertIs(k1, k3)
+        self.assertIs(k2, k4)
+        # Keys are not shared between calls by default
+        decoder = self.json.decoder.JSONDecoder()
+        k1, = decoder.decode('{"a_key": 1}')
+        k2, = decoder.decode('{"a_key": 1}')
+        self.assertIsNot(k1, k2)
+
+    def test_key_cache_shapes(self):
+        # Objects with the same first key but different keys
+        s = ('[{"a":1,"b":2},{"a":1,"c":3},{"a":{"a":1,"b":{"a":2}},"b":2},'
+             '{"a":1,"b":2,"c":3},{"a":1},{},{"a\\"b":1},{"a\\"b":2},'
+             '{"\\u00e9":1,"a":2},{"\xe9":1,"a":2},{"a":1,"a":2},'
+             '{"a":1,"a":2}, {"ab":1}, {"a":1, "b" : 2}]')
+        expected = self.loads(s)
+        decoder = self.json.decoder.JSONDecoder(key_cache_size=100)
+        for i in range(3):
+            self.assertEqual(decoder.decode(s), expected)
+        self.assertEqual(decoder.decode('{"a":1,"b":2}'), {'a': 1, 'b': 2})
+        self.assertEqual(decoder.decode('{"a":1,"b}":2}'), {'a': 1, 'b}': 2})
+        self.assertRaises(self.JSONDecodeError, decoder.decode, '{"a":1,"b')
+        self.assertRaises(self.JSONDecodeError, decoder.decode, '{"a":1,"b"')
+        decoder = self.json.decoder.JSONDecoder(key_cache_size=100,
+                                                object_pairs_hook=list)
+        self.assertEqual(decoder.decode('[{"a":1},{"a":2}]'),
+                         [[('a', 1)], [('a', 2)]])
+
+    def test_key_cache_invalid(self):
+        self.assertRaises(TypeError, self.json.decoder.JSONDecoder,
+                          key_cache_size=None)
+        self.assertRaises(ValueError, self.json.decoder.JSONDecoder,
+                          key_cache_size=-1)
+
     def test_extra_data(self):
         s = '[1, 2, 3]5'
         msg = 'Extra data'
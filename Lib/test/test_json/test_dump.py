@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, StringIO
 from test.test_json import PyTest, CTest
 
 from test.support import bigmemtest, _1G
@@ -12,6 +12,65 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dump_binary(self):
+        obj = {'a': ['\xe9\u20ac\U0001f600', '\x7f\n"', 1.5, None]}
+        for kwargs in ({}, {'ensure_ascii': False}, {'indent': 2},
+                       {'separators': (',', ':'), 'sort_keys': True}):
+            with self.subTest(**kwargs):
+                bio = BytesIO()
+                self.json.dump(obj, bio, **kwargs)
+                self.assertEqual(bio.getvalue(),
+                                 self.dumps(obj, **kwargs).encode('utf-8'))
+
+    def test_dump_blocks(self):
+        # The output is written in large blocks, not one chunk at a time
+        class Writer(StringIO):
+            sizes = []
+            def write(self, data):
+                self.sizes.append(len(data))
+                return super().write(data)
+        obj = [{'key': 'value %d' % i} for i in range(20000)]
+        for kwargs in ({}, {'indent': 1}):
+            with self.subTest(**kwargs):
+                f = Writer()
+                f.sizes = []
+                self.json.dump(obj, f, **kwargs)
+                self.assertEqual(f.getvalue(), self.dumps(obj, **kwargs))
+                self.assertLess(len(f.sizes), 20)
+                self.assertGreater(min(f.sizes[:-1]), 1000)
+
+    def test_dump_subclass(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield 'custom'
+        sio = StringIO()
+        self.json.dump([1], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), 'custom')
+        self.assertEqual(Encoder().encode_bytes([1]), b'custom')
+
+    def test_encode_bytes(self):
+        obj = {'\xe9': ['abc\x00\x1f\x7f\\"', '\u20ac\U0001f600', 2 ** 70,
+                         -0.5, float('inf'), True, False, None, [], {}],
+               3: (1, 2)}
+        for kwargs in ({}, {'ensure_ascii': False}, {'indent': 2},
+                       {'separators': (',', ':'), 'sort_keys': False}):
+            with self.subTest(**kwargs):
+                encoder = self.json.JSONEncoder(**kwargs)
+                self.assertEqual(encoder.encode_bytes(obj),
+                                 encoder.encode(obj).encode('utf-8'))
+        encoder = self.json.JSONEncoder(ensure_ascii=False)
+        self.assertEqual(encoder.encode_bytes('\u20ac'), '"\u20ac"'.encode())
+        self.assertRaises(UnicodeEncodeError, encoder.encode_bytes, '\udc80')
+        encoder = self.json.JSONEncoder()
+        self.assertEqual(encoder.encode_bytes('\udc80'), b'"\\udc80"')
+        self.assertRaises(TypeError, encoder.encode_bytes, {b'x': 1})
+        self.assertRaises(ValueError,
+                          self.json.JSONEncoder(allow_nan=False).encode_bytes,
+                          [float('nan')])
+        a = []
+        a.append(a)
+        self.assertRaises(ValueError, encoder.encode_bytes, a)
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
@@ -76,3 +135,13 @@ def test_large_list(self, size):
         self.assertEqual(encoded[:1], "[")
         self.assertEqual(encoded[-2:], "1]")
         self.assertEqual(encoded[1:-2], "1, " * (N - 1))
+
+    @bigmemtest(size=_1G, memuse=1)
+    def test_large_list_bytes(self, size):
+        N = int(30 * 1024 * 1024 * (size / _1G))
+        l = [1] * N
+        encoded = self.json.JSONEncoder().encode_bytes(l)
+        self.assertEqual(len(encoded), N * 3)
+        self.assertEqual(encoded[:1], b"[")
+        self.assertEqual(encoded[-2:], b"1]")
+        self.assertEqual(encoded[1:-2], b"1, " * (N - 1))
@@ -0,0 +1,208 @@
+import decimal
+from dataclasses import dataclass, field, InitVar
+from typing import Any, ClassVar, List, Optional, TypedDict
+from test.test_json import PyTest, CTest
+
+
+@dataclass
+class Point:
+    x: int
+    y: float = 0.0
+    tags: list[str] = field(default_factory=list)
+    count: ClassVar[int] = 0
+    label: str = field(default='', init=False)
+
+
+@dataclass
+class Node:
+    name: str
+    children: 'list[Node]' = field(default_factory=list)
+    parent: Optional['Node'] = None
+    data: dict[str, Any] = field(default_factory=dict)
+    scale: InitVar[int] = 1
+
+    def __post_init__(self, scale):
+        self.name *= scale
+
+
+class Movie(TypedDict):
+    title: str
+    year: int
+    points: List[Point]
+
+
+class PartialMovie(Movie, total=False):
+    rating: Optional[float]
+
+
+@dataclass
+class Many:
+    # More fields than fit in the C decoder's stack buffer
+    a0: int = 0; a1: int = 0; a2: int = 0; a3: int = 0; a4: int = 0
+    a5: int = 0; a6: int = 0; a7: int = 0; a8: int = 0; a9: int = 0
+    b0: int = 0; b1: int = 0; b2: int = 0; b3: int = 0; b4: int = 0
+    b5: int = 0; b6: int = 0; b7: int = 0; b8: int = 0; b9: int = 0
+
+
+class TestSchema:
+    def decode(self, s, schema, **kwargs):
+        return self.json.JSONDecoder(schema=schema, **kwargs).decode(s)
+
+    def test_dataclass(self):
+        self.assertEqual(self.decode('{"x": 1, "y": 2.5, "tags": ["a"]}',
+                                     Point),
+                         Point(1, 2.5, ['a']))
+        self.assertEqual(self.decode(' { "y" : 2 , "x" : 1 } ', Point),
+                         Point(1, 2.0))
+        self.assertEqual(self.decode('{"x": 1, "x": 2}', Point), Point(2))
+        self.assertEqual(self.decode('[{"x": 1}, {"x": 2}]', list[Point]),
+                         [Point(1), Point(2)])
+        self.assertEqual(self.decode('{"a5": 5, "b9": 9}', Many),
+                         Many(a5=5, b9=9))
+        self.assertEqual(self.loads('{"x": 3}', schema=Point), Point(3))
+
+    def test_nested(self):
+        doc = ('{"name": "a", "scale": 2, "children": [{"name": "b", '
+               '"data": {"k": [1, {"z": null}]}}], "parent": null}')
+        self.assertEqual(self.decode(doc, Node),
+                         Node('aa', [Node('b', data={'k': [1, {'z': None}]})]))
+        self.assertEqual(self.decode('{"name": "a", "parent": {"name": "b"}}',
+                                     Node),
+                         Node('a', parent=Node('b')))
+
+    def test_typeddict(self):
+        doc = '{"year": 1999, "title": "x", "points": [{"x": 1}]}'
+        result = self.decode(doc, Movie)
+        self.assertIs(type(result), dict)
+        self.assertEqual(result,
+                         {'year': 1999, 'title': 'x', 'points': [Point(1)]})
+        doc = '{"title": "x", "year": 1999, "points": [], "rating": null}'
+        self.assertEqual(self.decode(doc, PartialMovie),
+                         {'title': 'x', 'year': 1999, 'points': [],
+                          'rating': None})
+        with self.assertRaisesRegex(self.JSONDecodeError,
+                                    "Missing key 'points'"):
+            self.decode('{"title": "x", "year": 1999}', PartialMovie)
+
+    def test_containers(self):
+        self.assertEqual(self.decode('{"a": [1, 2], "b": []}',
+                                     dict[str, list[int]]),
+                         {'a': [1, 2], 'b': []})
+        self.assertEqual(self.decode('[1, null]', list[Optional[int]]),
+                         [1, None])
+        self.assertEqual(self.decode('[1, [true]]', list), [1, [True]])
+        self.assertEqual(self.decode('{"a": {}}', dict), {'a': {}})
+        self.assertEqual(self.decode('[1, "a", {}]', list[Any]), [1, 'a', {}])
+        self.assertEqual(self.decode('[1, null]', list[int | None]),
+                         [1, None])
+
+    def test_scalars(self):
+        self.assertEqual(self.decode('[1, 2.5]', list[float]), [1.0, 2.5])
+        self.assertIs(type(self.decode('1', float)), float)
+        self.assertEqual(self.decode('[true, false]', list[bool]),
+                         [True, False])
+        self.assertEqual(self.decode('"a"', str), 'a')
+        self.assertEqual(self.decode('null', type(None)), None)
+        self.assertEqual(self.json.JSONDecoder(
+                             schema=list[decimal.Decimal],
+                             parse_float=decimal.Decimal).decode('[1.5]'),
+                         [decimal.Decimal('1.5')])
+
+    def test_type_errors(self):
+        tests = [
+            (Point, '{"x": true}', 'Expecting int', 6),
+            (Point, '{"x": 1.5}', 'Expecting int', 6),
+            (Point, '{"x": 1, "y": "1"}', 'Expecting float', 14),
+            (Point, '{"x": 1, "tags": ["a", 1]}', 'Expecting str', 23),
+            (Point, '{"x": 1, "tags": null}', 'Expecting array', 17),
+            (Point, '[]', 'Expecting object', 0),
+            (Point, 'null', 'Expecting object', 0),
+            (list[int], '{}', 'Expecting array', 0),
+            (list[float], '[false]', 'Expecting float', 1),
+            (dict[str, int], '{"a": "b"}', 'Expecting int', 6),
+            (dict[str, int], '[]', 'Expecting object', 0),
+            (Movie, '{"title": 1}', 'Expecting str', 10),
+        ]
+        for schema, doc, msg, pos in tests:
+            with self.subTest(schema=schema, doc=doc):
+                with self.assertRaisesRegex(self.JSONDecodeError, msg) as cm:
+                    self.decode(doc, schema)
+                self.assertEqual(cm.exception.pos, pos)
+
+    def test_syntax_errors(self):
+        tests = [
+            ('{"x": 1,}', 'Expecting property name', 8),
+            ('{"x" 1}', "Expecting ':' delimiter", 5),
+            ('{"x": }', 'Expecting value', 6),
+            ('{"x": 1', "Expecting ',' delimiter", 7),
+            ('{"x": 1, "tags": ["a" "b"]}', "Expecting ',' delimiter", 22),
+            ('{"x": 1, "tags": ["a",', 'Expecting value', 22),
+            ('{"x": 1} x', 'Extra data', 9),
+        ]
+        for doc, msg, pos in tests:
+            with self.subTest(doc=doc):
+                with self.assertRaisesRegex(self.JSONDecodeError, msg) as cm:
+                    self.decode(doc, Point)
+                self.assertEqual(cm.exception.pos, pos)
+
+    def test_unknown_keys(self):
+        with self.assertRaisesRegex(self.JSONDecodeError,
+                                    "Unknown key 'z'") as cm:
+            self.decode('{"x": 1, "z": 2}', Point)
+        self.assertEqual(cm.exception.pos, 9)
+        # Fields which are not init parameters are unknown
+        for key in 'count', 'label':
+            with self.assertRaisesRegex(self.JSONDecodeError, 'Unknown key'):
+                self.decode('{"x": 1, "%s": 2}' % key, Point)
+        self.assertEqual(self.decode('{"z": {"a": [1]}, "x": 1, "count": 2}',
+                                     Point, unknown_keys='ignore'),
+                         Point(1))
+        self.assertEqual(self.decode('{"title": "x", "year": 1, '
+                                     '"points": [{"x": 1, "z": 2}], "z": 3}',
+                                     Movie, unknown_keys='ignore'),
+                         {'title': 'x', 'year': 1, 'points': [Point(1)]})
+
+    def test_missing_keys(self):
+        with self.assertRaisesRegex(self.JSONDecodeError,
+                                    "Missing key 'x'") as cm:
+            self.decode('[{"x": 1}, {"y": 1}]', list[Point])
+        self.assertEqual(cm.exception.pos, 11)
+        with self.assertRaisesRegex(self.JSONDecodeError, "Missing key"):
+            self.decode('{}', Movie)
+
+    def test_hooks(self):
+        # Hooks apply to the objects decoded without a schema
+        decoder = self.json.JSONDecoder(schema=Node, object_pairs_hook=list)
+        self.assertEqual(decoder.decode('{"name": "a", "data": {"b": {}}}'),
+                         Node('a', data={'b': []}))
+
+    def test_constructor_errors(self):
+        @dataclass
+        class Positive:
+            value: int
+            def __post_init__(self):
+                if self.value <= 0:
+                    raise ValueError('not positive')
+        with self.assertRaisesRegex(ValueError, 'not positive'):
+            self.decode('{"value": 0}', Positive)
+
+    def test_iterload(self):
+        doc = '{"x": 1}\n{"x": 2}\n'
+        decoder = self.json.JSONDecoder(schema=Point)
+        result = []
+        incremental = self.json.JSONIncrementalDecoder(decoder=decoder)
+        for c in doc:
+            result.extend(incremental.decode(c))
+        self.assertEqual(result, [Point(1), Point(2)])
+
+    def test_invalid_schema(self):
+        for schema in (int | str, tuple[int], dict[int, int], 'Point'):
+            with self.subTest(schema=schema):
+                self.assertRaises(TypeError, self.json.JSONDecoder,
+                                  schema=schema)
+        self.assertRaises(ValueError, self.json.JSONDecoder,
+                          schema=Point, unknown_keys='skip')
+
+
+class TestPySchema(TestSchema, PyTest): pass
+class TestCSchema(TestSchema, CTest): pass
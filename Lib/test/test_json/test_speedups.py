@@ -1,3 +1,4 @@
+import sys
 from test.test_json import CTest
 
 
@@ -28,6 +29,13 @@ def test(value):
         self.assertRaises(ZeroDivisionError, test, '""')
         self.assertRaises(ZeroDivisionError, test, '{}')
 
+    def test_key_cache_interning(self):
+        decoder = self.json.decoder.JSONDecoder(key_cache_size=10)
+        key, = decoder.decode('{"interned key": 1}')
+        self.assertIs(key, sys.intern('interned key'))
+        key, = self.json.decoder.JSONDecoder().decode('{"other key": 1}')
+        self.assertIsNot(key, sys.intern('other key'))
+
 
 class TestEncode(CTest):
     def test_make_encoder(self):
@@ -0,0 +1,198 @@
+import decimal
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+DOCS = [
+    '[1, 2.5e3, -Infinity, "a\\u00e9\\ud834\\udd1e\\"b", '
+    '{"k": [true, false, null]}, [], {}, NaN, "x\u20ac"]',
+    '{"a": {"b": [1, {"c": "d"}]}, "e": ""}',
+    '[ ]',
+    '"str"',
+    '-12.5E+3',
+]
+
+
+def events(obj):
+    if isinstance(obj, dict):
+        yield ('start_object', None)
+        for key, value in obj.items():
+            yield ('key', key)
+            yield from events(value)
+        yield ('end_object', None)
+    elif isinstance(obj, list):
+        yield ('start_array', None)
+        for value in obj:
+            yield from events(value)
+        yield ('end_array', None)
+    else:
+        yield ('value', obj)
+
+
+class TestStream:
+    def decode_chunks(self, mode, data, size, **kwargs):
+        decoder = self.json.JSONIncrementalDecoder(mode, **kwargs)
+        result = []
+        for i in range(0, len(data), size):
+            result.extend(decoder.decode(data[i:i + size]))
+        result.extend(decoder.decode(data[:0], final=True))
+        return result
+
+    def check(self, mode, doc, expected):
+        for data in (doc, doc.encode('utf-8'), doc.encode('utf-16')):
+            for size in (1, 2, 3, 7, 1000):
+                with self.subTest(mode=mode, data=data, size=size):
+                    result = self.decode_chunks(mode, data, size)
+                    # repr() makes NaN compare equal
+                    self.assertEqual(repr(result), repr(expected))
+
+    def test_values(self):
+        for doc in DOCS:
+            self.check('values', doc, [self.loads(doc)])
+        self.check('values', '', [])
+        self.check('values', '  \n', [])
+
+    def test_json_lines(self):
+        doc = '\n'.join(DOCS) + '\n'
+        self.check('values', doc, [self.loads(d) for d in DOCS])
+        self.check('values', '1 2 3', [1, 2, 3])
+
+    def test_items(self):
+        for doc in DOCS:
+            obj = self.loads(doc)
+            if isinstance(obj, list):
+                self.check('items', doc, obj)
+
+    def test_events(self):
+        for doc in DOCS:
+            self.check('events', doc, list(events(self.loads(doc))))
+        doc = '{"a": 1} [2]'
+        self.check('events', doc,
+                   list(events({'a': 1})) + list(events([2])))
+
+    def test_large_value(self):
+        # A value larger than the chunks is scanned once when it is complete
+        obj = [{'key%d' % i: ['\\"' * 10, i]} for i in range(2000)]
+        doc = self.dumps({'x': obj, 'y': 'z' * 10000})
+        self.assertEqual(self.decode_chunks('items', '[%s]' % doc, 100),
+                         [self.loads(doc)])
+        self.assertEqual(self.decode_chunks('values', doc, 100),
+                         [self.loads(doc)])
+
+    def test_large_value_linear(self):
+        # The chunks of an incomplete value are joined once when it is
+        # complete, not copied into the buffer one at a time, which takes
+        # quadratic time.
+        obj = list(range(100000))
+        doc = self.dumps(obj)
+        decoder = self.json.JSONIncrementalDecoder()
+        self.assertEqual(decoder.decode(doc[:64]), [])
+        size = len(decoder._buf)
+        for i in range(64, len(doc) - 64, 64):
+            self.assertEqual(decoder.decode(doc[i:i + 64]), [])
+        self.assertEqual(len(decoder._buf), size)
+        self.assertEqual(decoder.decode(doc[i + 64:]), [obj])
+        self.assertEqual(decoder._buf, '')
+
+    def test_decoder(self):
+        decoder = self.json.JSONDecoder(parse_float=decimal.Decimal)
+        result = self.decode_chunks('items', '[1.5, {"a": 2.25}]', 3,
+                                    decoder=decoder)
+        self.assertEqual(result, [decimal.Decimal('1.5'),
+                                  {'a': decimal.Decimal('2.25')}])
+
+    def test_partial_results(self):
+        decoder = self.json.JSONIncrementalDecoder('items')
+        self.assertEqual(decoder.decode('[{"a": 1}, {"b"'), [{'a': 1}])
+        self.assertEqual(decoder.decode(': 2}, 3'), [{'b': 2}])
+        self.assertEqual(decoder.decode('4'), [])
+        self.assertEqual(decoder.decode(']'), [34])
+        self.assertEqual(decoder.decode('', final=True), [])
+        # The decoded text is not kept
+        self.assertEqual(decoder._buf, '')
+
+        decoder = self.json.JSONIncrementalDecoder('events')
+        self.assertEqual(decoder.decode('{"ab'), [('start_object', None)])
+        self.assertEqual(decoder.decode('c": tr'), [('key', 'abc')])
+        self.assertEqual(decoder.decode('ue'), [('value', True)])
+        self.assertEqual(decoder.decode('}', final=True),
+                         [('end_object', None)])
+
+    def test_reset(self):
+        decoder = self.json.JSONIncrementalDecoder('items')
+        self.assertEqual(decoder.decode('[1, 2'), [1])
+        decoder.reset()
+        self.assertEqual(decoder.decode(b'[3]', final=True), [3])
+
+    def test_errors(self):
+        tests = [
+            ('values', '[1, x, 2]', 'Expecting value'),
+            ('values', '"abc', 'Unterminated string'),
+            ('values', 'tru', 'Expecting value'),
+            ('values', '{"a": tru}', 'Expecting value'),
+            ('items', '[1, 2 3]', "Expecting ',' delimiter"),
+            ('items', '[1,]', 'Expecting value'),
+            ('items', '[1', "Expecting ',' delimiter"),
+            ('items', '', 'Expecting value'),
+            ('items', '{}', 'Expecting array'),
+            ('items', '[1] 2', 'Extra data'),
+            ('events', '{"a" 1}', "Expecting ':' delimiter"),
+            ('events', '{"a": 1,}', 'Expecting property name'),
+            ('events', '[1 2]', "Expecting ',' delimiter"),
+            ('events', '[1', "Expecting ',' delimiter"),
+            ('events', '{', 'Expecting property name'),
+        ]
+        for mode, doc, msg in tests:
+            for size in (1, 3, 100):
+                with self.subTest(mode=mode, doc=doc, size=size):
+                    with self.assertRaisesRegex(self.JSONDecodeError, msg):
+                        self.decode_chunks(mode, doc, size)
+
+    def test_early_error(self):
+        # Invalid input is reported without waiting for the end of the value
+        decoder = self.json.JSONIncrementalDecoder('items')
+        with self.assertRaisesRegex(self.JSONDecodeError, 'Expecting value'):
+            decoder.decode('[[1, x' + ' ' * 20)
+
+    def test_invalid_input(self):
+        self.assertRaises(ValueError, self.json.JSONIncrementalDecoder, 'x')
+        decoder = self.json.JSONIncrementalDecoder()
+        self.assertRaises(TypeError, decoder.decode, 1)
+        decoder.decode('[')
+        self.assertRaises(TypeError, decoder.decode, b'1]')
+        decoder = self.json.JSONIncrementalDecoder()
+        decoder.decode(b'[1')
+        self.assertRaises(TypeError, decoder.decode, '1]')
+
+    def test_utf8_bom(self):
+        decoder = self.json.JSONIncrementalDecoder()
+        with self.assertRaisesRegex(self.JSONDecodeError, 'BOM'):
+            decoder.decode('\ufeff[1]')
+        decoder = self.json.JSONIncrementalDecoder()
+        self.assertEqual(decoder.decode('[1]'.encode('utf-8-sig'), True),
+                         [[1]])
+
+    def test_iterload(self):
+        doc = '{"a": [1, 2]}\n{"b": null}\n'
+        self.assertEqual(list(self.json.iterload(StringIO(doc))),
+                         [{'a': [1, 2]}, {'b': None}])
+        self.assertEqual(list(self.json.iterload(BytesIO(doc.encode()))),
+                         [{'a': [1, 2]}, {'b': None}])
+        self.assertEqual(list(self.json.iterload(StringIO('[1, 2.5]'),
+                                                 mode='items',
+                                                 parse_float=str)),
+                         [1, '2.5'])
+        self.assertEqual(list(self.json.iterload(StringIO('[1]'),
+                                                 mode='events')),
+                         [('start_array', None), ('value', 1),
+                          ('end_array', None)])
+        self.assertEqual(list(self.json.iterload(StringIO(''))), [])
+
+        doc = self.dumps([{'x': i} for i in range(20000)])
+        self.assertEqual(list(self.json.iterload(StringIO(doc),
+                                                 mode='items')),
+                         self.loads(doc))
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
@@ -598,6 +598,28 @@ def test_builtin_handlers(self):
         self.assertFalse(h.shouldFlush(r))
         h.close()
 
+    @unittest.skipIf(os.name == 'nt', 'WatchedFileHandler not appropriate for Windows.')
+    def test_watched_file_stat_interval(self):
+        fd, fn = tempfile.mkstemp('.log', 'test_logging-watched-')
+        os.close(fd)
+        self.addCleanup(os_helper.unlink, fn)
+        h = logging.handlers.WatchedFileHandler(fn, stat_interval=3600)
+        r = logging.makeLogRecord({'msg': 'Test'})
+        h.handle(r)
+        os.unlink(fn)
+        # The file is not checked again within the interval
+        h.handle(r)
+        self.assertFalse(os.path.exists(fn))
+        h.stat_interval = 0
+        h.handle(r)
+        self.assertTrue(os.path.exists(fn))
+        # emit_batch() checks the file too
+        os.unlink(fn)
+        h.emit_batch([r, r])
+        h.close()
+        with open(fn) as f:
+            self.assertEqual(f.read(), 'Test\nTest\n')
+
     def test_path_objects(self):
         """
         Test that Path objects are accepted as filename arguments to handlers.
@@ -799,6 +821,38 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_emit_batch(self):
+        class CountingStream(io.StringIO):
+            writes = flushes = 0
+            def write(self, data):
+                self.writes += 1
+                return super().write(data)
+            def flush(self):
+                self.flushes += 1
+
+        stream = CountingStream()
+        h = TestStreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        h.addFilter(lambda record: record.msg != 'filtered')
+        records = [logging.makeLogRecord({'msg': msg, 'levelname': 'INFO'})
+                   for msg in ['a', 'filtered', 'b', 'c']]
+        self.assertEqual(h.handle_batch(records),
+                         [records[0], records[2], records[3]])
+        self.assertEqual(stream.getvalue(), 'INFO a\nINFO b\nINFO c\n')
+        self.assertEqual((stream.writes, stream.flushes), (1, 1))
+
+        # A record which cannot be formatted does not prevent writing the
+        # other records
+        bad = logging.makeLogRecord({'msg': '%d', 'args': ('x',)})
+        h.emit_batch([bad, records[0]])
+        self.assertIs(h.error_record, bad)
+        self.assertEqual(stream.getvalue(),
+                         'INFO a\nINFO b\nINFO c\nINFO a\n')
+
+        h = TestStreamHandler(BadStream())
+        h.emit_batch(records)
+        self.assertIs(h.error_record, records[-1])
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -3507,6 +3561,54 @@ def test_logrecord_class(self):
         ])
 
 
+class SlottedLogRecordTest(BaseTest):
+
+    expected_log_pat = r"^([\w.]+) -> (\w+): (\w+) (.*)$"
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.orig_factory = logging.getLogRecordFactory()
+        logging.setLogRecordFactory(logging.SlottedLogRecord)
+        self.root_formatter = logging.Formatter(
+            "%(name)s -> %(levelname)s: %(message)s %(funcName)s")
+        self.root_hdlr.setFormatter(self.root_formatter)
+
+    def tearDown(self):
+        logging.setLogRecordFactory(self.orig_factory)
+        BaseTest.tearDown(self)
+
+    def test_slotted_record(self):
+        h = RecordingHandler()
+        self.root_logger.addHandler(h)
+        self.addCleanup(self.root_logger.removeHandler, h)
+        self.root_logger.error('%d %s', 1, 'message', extra={'custom': 'x'})
+        self.assert_log_lines([
+            ('root', 'ERROR', '1', 'message test_slotted_record'),
+        ])
+        r = h.records[0]
+        self.assertIsInstance(r, logging.SlottedLogRecord)
+        self.assertEqual(r.custom, 'x')
+        self.assertEqual(vars(r), {'custom': 'x'})
+        self.assertEqual(r.filename, os.path.basename(__file__))
+        with self.assertRaises(KeyError):
+            self.root_logger.error('x', extra={'lineno': 1})
+
+        c = copy.copy(r)
+        self.assertEqual(c.getMessage(), '1 message')
+        self.assertEqual(c.custom, 'x')
+
+        d = pickle.loads(logging.handlers.SocketHandler('localhost', None)
+                         .makePickle(r)[4:])
+        self.assertEqual(d['msg'], '1 message')
+        self.assertEqual(d['levelname'], 'ERROR')
+        self.assertEqual(d['custom'], 'x')
+        r = logging.makeLogRecord(d)
+        self.assertIsInstance(r, logging.SlottedLogRecord)
+        self.assertEqual(r.getMessage(), '1 message')
+        self.assertEqual(r.levelname, 'ERROR')
+        self.assertEqual(r.custom, 'x')
+
+
 class QueueHandlerTest(BaseTest):
     # Do not bother with a logger name group.
     expected_log_pat = r"^[\w.]+ -> (\w+): (\d+)$"
@@ -3587,6 +3689,32 @@ def test_queue_listener(self):
 
     @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
                          'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batches(self):
+        class BatchRecordingHandler(logging.NullHandler):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+            def emit_batch(self, records):
+                self.batches.append([record.msg for record in records])
+
+        handler = BatchRecordingHandler()
+        critical_handler = BatchRecordingHandler()
+        critical_handler.setLevel(logging.CRITICAL)
+        self.assertRaises(ValueError, logging.handlers.QueueListener,
+                          self.queue, handler, batch_size=0)
+        listener = logging.handlers.QueueListener(
+            self.queue, handler, critical_handler,
+            respect_handler_level=True, batch_size=4)
+        for i in range(5):
+            self.que_logger.warning(str(i))
+        self.que_logger.critical('5')
+        listener.start()
+        listener.stop()
+        self.assertEqual(handler.batches, [['0', '1', '2', '3'], ['4', '5']])
+        self.assertEqual(critical_handler.batches, [['5']])
+        # All the tasks are done
+        self.queue.join()
+
     def test_queue_listener_with_StreamHandler(self):
         # Test that traceback only appends once (bpo-34334).
         listener = logging.handlers.QueueListener(self.queue, self.root_hdlr)
@@ -4008,6 +4136,137 @@ class NoMsecFormatter(logging.Formatter):
         f.converter = time.gmtime
         self.assertEqual(f.formatTime(r), '21/04/1993 08:03:00')
 
+    def test_time_cache(self):
+        # The formatted time is cached for one second
+        r = self.get_record()
+        dt = datetime.datetime(1993, 4, 21, 8, 3, 0, 0, utc)
+        r.created = dt.timestamp() + 0.25
+        r.msecs = 250
+        f = logging.Formatter('%(asctime)s %(message)s')
+        f.converter = time.gmtime
+        self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,250')
+        r.created += 0.5
+        r.msecs = 750
+        self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,750')
+        self.assertEqual(f.formatTime(r, '%H:%M:%S'), '08:03:00')
+        r.created += 0.5
+        r.msecs = 250
+        self.assertEqual(f.formatTime(r, '%H:%M:%S'), '08:03:01')
+        self.assertEqual(f.formatTime(r), '1993-04-21 08:03:01,250')
+        f.converter = lambda t: time.gmtime(t + 3600)
+        self.assertEqual(f.formatTime(r), '1993-04-21 09:03:01,250')
+        f.default_time_format = '%H:%M:%S'
+        self.assertEqual(f.formatTime(r), '09:03:01,250')
+
+    def test_slotted_record(self):
+        r = logging.SlottedLogRecord('formatter.test', logging.DEBUG,
+                                     os.path.join('path', 'to', 'dummy.ext'),
+                                     42, 'Message with %d %s',
+                                     (2, 'placeholders'), None)
+        r.custom = 1234
+        for fmt, style in [('%(custom)s %(message)s %(lineno)d', '%'),
+                           ('{custom} {message} {lineno}', '{'),
+                           ('${custom} ${message} ${lineno}', '$')]:
+            f = logging.Formatter(fmt, style=style)
+            self.assertEqual(f.format(r), '1234 Message with 2 placeholders 42')
+            f = logging.Formatter(fmt.replace('custom', 'other'), style=style,
+                                  defaults={'other': 5, 'lineno': 0})
+            self.assertEqual(f.format(r), '5 Message with 2 placeholders 42')
+
+
+class JSONFormatterTest(BaseTest):
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.root_hdlr.setFormatter(logging.JSONFormatter())
+
+    def get_lines(self):
+        return [json.loads(line)
+                for line in self.stream.getvalue().splitlines()]
+
+    def test_format(self):
+        r = logging.makeLogRecord({'name': 'app', 'levelno': logging.INFO,
+                                   'levelname': 'INFO', 'created': 12.5,
+                                   'msg': 'Message %s', 'args': ('one',)})
+        f = logging.JSONFormatter()
+        self.assertEqual(f.format(r), '{"created":12.5,"levelname":"INFO",'
+                                      '"name":"app","message":"Message one"}')
+        self.assertEqual(r.message, 'Message one')
+        self.assertFalse(f.usesTime())
+        f = logging.JSONFormatter(['asctime', 'lineno', 'custom'],
+                                  datefmt='%Y')
+        self.assertTrue(f.usesTime())
+        self.assertEqual(json.loads(f.format(r)),
+                         {'asctime': time.strftime('%Y', time.localtime(12.5)),
+                          'lineno': 0, 'custom': None})
+        f = logging.JSONFormatter(['message'],
+                                  encoder=json.JSONEncoder(sort_keys=True))
+        r.fields = {'b': 2, 'a': 1}
+        self.assertEqual(f.format(r), '{"a": 1, "b": 2, "message": "Message one"}')
+
+    def test_fields(self):
+        logger = logging.getLogger('app')
+        logger.info('user logged in', fields={'user': 'bob', 'ip': None})
+        logger.info('%d users', 2)
+        logging.LoggerAdapter(logger, {}).warning('adapted',
+                                                  fields={'tags': ['a', 'b']})
+        lines = self.get_lines()
+        for line in lines:
+            self.assertIsInstance(line.pop('created'), float)
+        self.assertEqual(lines, [
+            {'levelname': 'INFO', 'name': 'app', 'message': 'user logged in',
+             'user': 'bob', 'ip': None},
+            {'levelname': 'INFO', 'name': 'app', 'message': '2 users'},
+            {'levelname': 'WARNING', 'name': 'app', 'message': 'adapted',
+             'tags': ['a', 'b']},
+        ])
+
+    def test_fields_reserved(self):
+        logger = logging.getLogger('app')
+        with self.assertRaises(KeyError):
+            logger.warning('hi', extra={'fields': 'abc'})
+        r = logging.makeLogRecord({'msg': 'hi', 'fields': 'abc'})
+        with self.assertRaisesRegex(TypeError, 'must be a mapping, not str'):
+            logging.JSONFormatter().format(r)
+
+    def test_not_serializable(self):
+        class Value:
+            count = 0
+            def __str__(self):
+                Value.count += 1
+                return 'value'
+        logger = logging.getLogger('app')
+        logger.setLevel(logging.INFO)
+        logger.debug('filtered', fields={'value': Value()})
+        self.assertEqual(Value.count, 0)
+        self.assertEqual(self.stream.getvalue(), '')
+        logger.info('logged', fields={'value': Value()})
+        self.assertEqual(Value.count, 1)
+        self.assertEqual(self.get_lines()[0]['value'], 'value')
+
+    def test_exception(self):
+        logger = logging.getLogger('app')
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logger.exception('failed', fields={'id': 1})
+        logger.info('stack', stack_info=True)
+        first, second = self.get_lines()
+        self.assertEqual(first['message'], 'failed')
+        self.assertEqual(first['id'], 1)
+        self.assertTrue(first['exc_info'].startswith('Traceback'))
+        self.assertTrue(first['exc_info'].endswith('division by zero'))
+        self.assertTrue(second['stack_info'].startswith('Stack (most recent'))
+
+    def test_slotted_record(self):
+        orig_factory = logging.getLogRecordFactory()
+        logging.setLogRecordFactory(logging.SlottedLogRecord)
+        self.addCleanup(logging.setLogRecordFactory, orig_factory)
+        logging.getLogger('app').error('slotted', fields={'id': 2})
+        line, = self.get_lines()
+        self.assertEqual(line['message'], 'slotted')
+        self.assertEqual(line['id'], 2)
+
 
 class TestBufferingFormatter(logging.BufferingFormatter):
     def formatHeader(self, records):
@@ -4350,6 +4609,20 @@ def test_str_rep(self):
         self.assertTrue(s.startswith('<LogRecord: '))
         self.assertTrue(s.endswith('>'))
 
+    def test_filename(self):
+        for i in range(logging._MAX_CACHE_SIZE + 10):
+            pathname = os.path.join('path', 'to', 'mod%d.py' % i)
+            for j in range(2):
+                r = logging.LogRecord('test', logging.INFO, pathname, 1,
+                                      'msg', (), None)
+                self.assertEqual(r.filename, 'mod%d.py' % i)
+                self.assertEqual(r.module, 'mod%d' % i)
+        self.assertLessEqual(len(logging._pathnameCache),
+                             logging._MAX_CACHE_SIZE)
+        r = logging.LogRecord('test', logging.INFO, None, 1, 'msg', (), None)
+        self.assertIsNone(r.filename)
+        self.assertEqual(r.module, 'Unknown module')
+
     def test_dict_arg(self):
         h = RecordingHandler()
         r = logging.getLogger()
@@ -5151,6 +5424,117 @@ def test_file_created(self):
         self.assertLogFile(self.fn)
         rh.close()
 
+    def test_emit_batch(self):
+        # The files are the same as when the records are emitted one by one
+        contents = []
+        for batch in [False, True]:
+            rh = logging.handlers.RotatingFileHandler(
+                self.fn, backupCount=3, maxBytes=40, delay=True)
+            records = [logging.makeLogRecord({'msg': 'message %d' % i})
+                       for i in range(12)]
+            if batch:
+                rh.emit_batch(records[:5])
+                rh.emit_batch(records[5:])
+            else:
+                for record in records:
+                    rh.emit(record)
+            rh.close()
+            files = [self.fn] + ['%s.%d' % (self.fn, i) for i in (1, 2, 3)]
+            result = []
+            for fn in files:
+                self.assertLogFile(fn)
+                with open(fn) as f:
+                    result.append(f.read())
+                os.unlink(fn)
+            self.rmfiles = []
+            contents.append(result)
+        self.assertEqual(contents[0], contents[1])
+        self.assertEqual(contents[0][0], 'message 9\nmessage 10\nmessage 11\n')
+
+    def test_format_once(self):
+        class CountingFormatter(logging.Formatter):
+            count = 0
+            def format(self, record):
+                self.count += 1
+                return super().format(record)
+        rh = logging.handlers.RotatingFileHandler(self.fn, maxBytes=1000)
+        fmt = CountingFormatter()
+        rh.setFormatter(fmt)
+        for i in range(5):
+            rh.emit(self.next_rec())
+        rh.close()
+        self.assertEqual(fmt.count, 5)
+
+    def test_size_counted(self):
+        # The size of the file is counted in bytes, not in characters
+        self.addCleanup(os_helper.unlink, self.fn + '.1')
+        with open(self.fn, 'w', encoding='utf-8') as f:
+            f.write('x' * 10)
+        for batch in [False, True]:
+            rh = logging.handlers.RotatingFileHandler(
+                self.fn, backupCount=1, maxBytes=25, encoding='utf-8')
+            records = [logging.makeLogRecord({'msg': '\xe9' * 4}),
+                       logging.makeLogRecord({'msg': '\u20ac' * 3})]
+            if batch:
+                rh.emit_batch(records)
+            else:
+                for record in records:
+                    rh.emit(record)
+            rh.close()
+            # 10 + 9 bytes fit in the first file, 10 more bytes do not
+            with open(self.fn + '.1', encoding='utf-8') as f:
+                self.assertEqual(f.read(), 'x' * 10 + '\xe9' * 4 + '\n')
+            with open(self.fn, encoding='utf-8') as f:
+                self.assertEqual(f.read(), '\u20ac' * 3 + '\n')
+            os.unlink(self.fn + '.1')
+            with open(self.fn, 'w', encoding='utf-8') as f:
+                f.write('x' * 10)
+
+    def test_size_counted_bom(self):
+        # The byte order mark is only written at the start of the file
+        self.addCleanup(os_helper.unlink, self.fn + '.1')
+        for batch in [False, True]:
+            os.unlink(self.fn)
+            rh = logging.handlers.RotatingFileHandler(
+                self.fn, backupCount=1, maxBytes=27, encoding='utf-16')
+            records = [logging.makeLogRecord({'msg': 'ab%d' % i})
+                       for i in range(4)]
+            if batch:
+                rh.emit_batch(records)
+            else:
+                for record in records:
+                    rh.emit(record)
+            rh.close()
+            # 2 + 3 * 8 bytes fit in the first file, 8 more bytes do not
+            self.assertEqual(os.path.getsize(self.fn + '.1'), 26)
+            with open(self.fn + '.1', encoding='utf-16') as f:
+                self.assertEqual(f.read(), 'ab0\nab1\nab2\n')
+            with open(self.fn, encoding='utf-16') as f:
+                self.assertEqual(f.read(), 'ab3\n')
+
+    def test_should_rollover_no_side_effect(self):
+        rh = logging.handlers.RotatingFileHandler(self.fn, maxBytes=1000)
+        record = self.next_rec()
+        self.assertFalse(rh.shouldRollover(record))
+        self.assertFalse(rh.shouldRollover(record))
+        self.assertNotIn('_formatted', vars(rh))
+        rh.close()
+
+    def test_should_rollover_overridden(self):
+        # emit() calls an overridden shouldRollover()
+        calls = []
+        class Handler(logging.handlers.RotatingFileHandler):
+            def shouldRollover(self, record):
+                calls.append(record)
+                return False
+        rh = Handler(self.fn, maxBytes=1)
+        record = self.next_rec()
+        rh.emit(record)
+        rh.close()
+        self.assertEqual(calls, [record])
+        self.assertLogFile(self.fn)
+        self.assertFalse(os.path.exists(self.fn + '.1'))
+
     def test_rollover_filenames(self):
         def namer(name):
             return name + ".test"
@@ -5442,8 +5826,10 @@ def test_main():
         BuiltinLevelsTest, BasicFilterTest, CustomLevelsAndFiltersTest,
         HandlerTest, MemoryHandlerTest, ConfigFileTest, SocketHandlerTest,
         DatagramHandlerTest, MemoryTest, EncodingTest, WarningsTest,
-        ConfigDictTest, ManagerTest, FormatterTest, BufferingFormatterTest,
-        StreamHandlerTest, LogRecordFactoryTest, ChildLoggerTest,
+        ConfigDictTest, ManagerTest, FormatterTest, JSONFormatterTest,
+        BufferingFormatterTest,
+        StreamHandlerTest, LogRecordFactoryTest, SlottedLogRecordTest,
+        ChildLoggerTest,
         QueueHandlerTest, ShutdownTest, ModuleLevelMiscTest, BasicConfigTest,
         LoggerAdapterTest, LoggerTest, SMTPHandlerTest, FileHandlerTest,
         RotatingFileHandlerTest,  LastResortTest, LogRecordTest,
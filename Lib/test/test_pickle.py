@@ -11,6 +11,7 @@
 import unittest
 from test import support
 from test.support import import_helper
+from test.support import os_helper
 
 from test.pickletester import AbstractHookTests
 from test.pickletester import AbstractUnpickleTests
@@ -509,11 +510,135 @@ def test_multiprocessing_exceptions(self):
                                  ('multiprocessing.context', name))
 
 
+class SegmentedPickleTests(unittest.TestCase):
+    def dump(self, obj, **kwargs):
+        f = io.BytesIO()
+        pickle.dump_segmented(obj, f, **kwargs)
+        return f.getvalue()
+
+    def test_load(self):
+        objects = [
+            [(i, str(i)) for i in range(10)],
+            {str(i): [i] for i in range(10)},
+            bytes(range(10)),
+            [], {}, b'',
+        ]
+        for proto in range(4, pickle.HIGHEST_PROTOCOL + 1):
+            for obj in objects:
+                for size in (1, 3, 10, None):
+                    with self.subTest(proto=proto, obj=obj, size=size):
+                        data = self.dump(obj, protocol=proto,
+                                         segment_size=size)
+                        self.assertEqual(pickle.loads(data), obj)
+                        self.assertEqual(pickle._loads(data), obj)
+                        with pickle.SegmentedPickle(io.BytesIO(data)) as p:
+                            self.assertEqual(p.load(), obj)
+
+    def test_segments(self):
+        obj = [(i, str(i)) for i in range(10)]
+        data = self.dump(obj, segment_size=4)
+        p = pickle.SegmentedPickle(io.BytesIO(data))
+        self.assertEqual(p.kind, 'list')
+        self.assertEqual(len(p), 3)
+        self.assertEqual(p.load_segment(2), obj[8:])
+        self.assertEqual(p.load_segment(-1), obj[8:])
+        self.assertRaises(IndexError, p.load_segment, 3)
+        self.assertEqual(pickle.loads(p.read_segment(1)), obj[4:8])
+        self.assertEqual(list(p), [obj[:4], obj[4:8], obj[8:]])
+        self.assertEqual(list(p.map(len)), [4, 4, 2])
+
+        obj = {str(i): i for i in range(5)}
+        p = pickle.SegmentedPickle(io.BytesIO(self.dump(obj, segment_size=2)))
+        self.assertEqual(p.kind, 'dict')
+        self.assertEqual(list(p), [{'0': 0, '1': 1}, {'2': 2, '3': 3},
+                                   {'4': 4}])
+
+        p = pickle.SegmentedPickle(io.BytesIO(self.dump(b'abcde',
+                                                        segment_size=2)))
+        self.assertEqual(p.kind, 'bytes')
+        self.assertEqual(list(p), [b'ab', b'cd', b'e'])
+
+    def test_file(self):
+        obj = [(i, str(i)) for i in range(100)]
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        with open(filename, 'wb') as f:
+            f.write(b'prefix')
+            pickle.dump_segmented(obj, f, segment_size=30)
+        with open(filename, 'rb') as f:
+            f.seek(6)
+            with pickle.SegmentedPickle(f) as p:
+                self.assertEqual(p.load_segment(3), obj[90:])
+                self.assertEqual(p.load(), obj)
+            self.assertFalse(f.closed)
+            f.seek(6)
+            self.assertEqual(pickle.load(f), obj)
+        with open(filename, 'rb') as f:
+            f.seek(6)
+            with pickle.SegmentedPickle(f) as p:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(2) as executor:
+                    self.assertEqual(list(p.map(len, executor)),
+                                     [30, 30, 30, 10])
+
+    def test_map_without_path(self):
+        data = self.dump([1, 2, 3], segment_size=2)
+        with pickle.SegmentedPickle(io.BytesIO(data)) as p:
+            self.assertRaises(ValueError, p.map, len, object())
+
+    def test_shared_references(self):
+        # Objects shared between segments are pickled in every segment
+        item = []
+        obj = [item] * 4
+        result = pickle.loads(self.dump(obj, segment_size=2))
+        self.assertEqual(result, obj)
+        self.assertIs(result[0], result[1])
+        self.assertIsNot(result[1], result[2])
+
+    def test_find_class(self):
+        # The segments are unpickled by the unpickler of the whole pickle
+        self.assertFalse(hasattr(pickle, '_join_segments'))
+        data = self.dump([1, collections.OrderedDict()], segment_size=1)
+        for unpickler in (pickle.Unpickler, pickle._Unpickler):
+            class RestrictedUnpickler(unpickler):
+                def find_class(self, module, name):
+                    if (module, name) == ('pickle', '_join_segments'):
+                        return super().find_class(module, name)
+                    raise pickle.UnpicklingError('forbidden global')
+            with self.subTest(unpickler=unpickler):
+                self.assertEqual(unpickler(io.BytesIO(data)).load(),
+                                 [1, collections.OrderedDict()])
+                with self.assertRaisesRegex(pickle.UnpicklingError,
+                                            'forbidden global'):
+                    RestrictedUnpickler(io.BytesIO(data)).load()
+                self.assertEqual(RestrictedUnpickler(io.BytesIO(
+                    self.dump([1, 2], segment_size=1))).load(), [1, 2])
+
+    def test_errors(self):
+        f = io.BytesIO()
+        for proto in range(4):
+            self.assertRaises(ValueError, pickle.dump_segmented, [], f,
+                              protocol=proto)
+        self.assertRaises(ValueError, pickle.dump_segmented, [], f,
+                          protocol=pickle.HIGHEST_PROTOCOL + 1)
+        self.assertRaises(ValueError, pickle.dump_segmented, [], f,
+                          segment_size=0)
+        for obj in (set(), bytearray(), (), collections.OrderedDict()):
+            self.assertRaises(TypeError, pickle.dump_segmented, obj, f)
+
+        data = self.dump([1, 2, 3], segment_size=2)
+        for bad in (pickle.dumps([1, 2, 3], protocol=4), b'', data[:-1],
+                    data[:30], data.replace(b'list', b'lizt')):
+            with self.subTest(data=bad):
+                self.assertRaises(pickle.UnpicklingError,
+                                  pickle.SegmentedPickle, io.BytesIO(bad))
+
+
 def test_main():
     tests = [PyPickleTests, PyUnpicklerTests, PyPicklerTests,
              PyPersPicklerTests, PyIdPersPicklerTests,
              PyDispatchTableTests, PyChainDispatchTableTests,
-             CompatPickleTests, PyPicklerHookTests]
+             CompatPickleTests, PyPicklerHookTests, SegmentedPickleTests]
     if has_c_implementation:
         tests.extend([CPickleTests, CUnpicklerTests, CPicklerTests,
                       CPersPicklerTests, CIdPersPicklerTests,
@@ -1,6 +1,10 @@
 from test.support import (gc_collect, bigmemtest, _2G,
                           cpython_only, captured_stdout)
+from test.support import os_helper
+from test.support.script_helper import assert_python_ok
 import locale
+import marshal
+import os
 import re
 import sre_compile
 import string
@@ -82,6 +86,39 @@ def test_search_star_plus(self):
         self.assertEqual(re.match('x*', 'xxxa').span(), (0, 3))
         self.assertIsNone(re.match('a+', 'xxx'))
 
+    def test_search_required_literal(self):
+        # The literal in the middle of the pattern is searched first
+        for s in ['ERROR code=42', 'x\nINFO\nERROR code=42 y']:
+            self.assertEqual(re.search(r'.*ERROR code=(\d+)', s).group(1),
+                             '42')
+            self.assertEqual(re.search(rb'.*ERROR code=(\d+)',
+                                       s.encode()).group(1), b'42')
+        self.assertIsNone(re.search(r'.*ERROR code=(\d+)', 'ERROR code'))
+        self.assertEqual(re.findall(r'\w+@example\.com',
+                                    'a@example.com, b@example.org bc@example.com'),
+                         ['a@example.com', 'bc@example.com'])
+        self.assertEqual(re.sub(rb'\d+-\d+', b'N', b'1-2 -3 4- 5-66'),
+                         b'N -3 4- N')
+        # Bounded and unbounded width before the literal
+        self.assertEqual(re.search('a{2,3}bc', 'aaaaaabc').span(), (3, 8))
+        self.assertEqual(re.search('[ab]{0,2}cab', 'bbbcacab').span(), (4, 8))
+        self.assertEqual(re.search('x*?ab', 'xxab').span(), (0, 4))
+        self.assertEqual(re.search(r'(a|b)\1ab', 'abbbab').span(), (2, 6))
+        self.assertEqual(re.search(r'(?<=a)b?cd', 'bcdacd').span(), (4, 6))
+        # pos and endpos
+        p = re.compile(r'\d+-\d+')
+        self.assertEqual(p.search('12-34', 1).span(), (1, 5))
+        self.assertEqual(p.search('12-34', 3), None)
+        self.assertEqual(p.search('12-34', 0, 3), None)
+        self.assertEqual(p.search('12-34-5', 0, 4).span(), (0, 4))
+        # Cased characters are not required under IGNORECASE
+        self.assertEqual(re.search('(?i)x*abc=', 'ABC=').span(), (0, 4))
+        self.assertEqual(re.search('(?i)x*ABC=', 'abc=').span(), (0, 4))
+        # Characters wider than the subject
+        self.assertIsNone(re.search('x*\u20acab', 'xxab'))
+        self.assertEqual(re.search('x*\u20acab', 'x\u20acab').span(), (0, 4))
+        self.assertEqual(re.search('x*ab', 'x\U0001f600xab').span(), (2, 5))
+
     def bump_num(self, matchobj):
         int_value = int(matchobj.group(0))
         return str(int_value + 1)
@@ -2198,6 +2235,138 @@ def test_overlap_table(self):
         self.assertEqual(f("abcabdac"), [0, 0, 0, 1, 2, 0, 1, 0])
 
 
+    def test_compile_data(self):
+        import _sre
+        for pattern, flags in [(r'(?P<a>x+)(y)?|\w{2,}', 0),
+                               (b'[a-z]+', re.I),
+                               ('', re.M | re.S)]:
+            data = sre_compile.compile_data(pattern, flags)
+            data = marshal.loads(marshal.dumps(data))
+            p = _sre.compile(pattern, *data)
+            self.assertEqual(p, re.compile(pattern, flags))
+            self.assertEqual(p.groupindex, re.compile(pattern, flags).groupindex)
+
+
+class PatternSetTests(unittest.TestCase):
+
+    def check(self, patterns, strings, flags=0):
+        ps = re.PatternSet(patterns, flags)
+        compiled = [re.compile(p, flags) for p in patterns]
+        for string in strings:
+            for method in ('match', 'fullmatch', 'search'):
+                with self.subTest(string=string, method=method):
+                    expected = [i for i, p in enumerate(compiled)
+                                if getattr(p, method)(string)]
+                    self.assertEqual(getattr(ps, method)(string), expected)
+
+    def test_literal_prefixes(self):
+        patterns = [r'abc', r'ab', r'abd\d+', r'a', r'b(c|d)', r'^bcd',
+                    r'(?<=a)bc', r'\babc\b', r'(ab)+', r'abc$', r'a.*c',
+                    r'[b-c]cd', r'(?:xy|b)', r'\d{2}x', r'x?y?', r'(?i)aB',
+                    r'(?i)1a', r'\w+', r'ab*', r'(?:)abc']
+        strings = ['', 'a', 'ab', 'abc', 'abd12', 'xabc', 'bcd', 'abcd',
+                   'bd', 'ababab', 'xy', '12x', 'AB', '1A', 'c', 'ccd',
+                   'a b abc', 'zzzbczzz']
+        self.check(patterns, strings)
+        self.check([p.encode() for p in patterns],
+                   [s.encode() for s in strings])
+
+    def test_many_patterns(self):
+        patterns = [r'/api/v%d/(users|groups)/(\d+)' % i for i in range(300)]
+        patterns += [r'error code=%d\b' % i for i in range(300)]
+        strings = ['/api/v12/users/5', '/api/v299/groups/7/x',
+                   'x /api/v3/users/1', 'error code=42', 'warn error code=7 ',
+                   'error code=1234', '/api/v1000/users/1']
+        self.check(patterns, strings)
+        ps = re.PatternSet(patterns)
+        self.assertEqual(len(ps), 600)
+        self.assertEqual(ps.match('/api/v12/users/5'), [12])
+        self.assertEqual(ps.search('error code=4, error code=42'), [304, 342])
+
+    def test_flags(self):
+        self.check([r'ab', r'x\d'], ['AB', 'x1', 'X1 ab'], re.I)
+        ps = re.PatternSet([re.compile('a', re.I), 'b'])
+        self.assertEqual(ps.search('AB'), [0])
+        self.assertRaises(ValueError, re.PatternSet, [re.compile('a')], re.I)
+
+    def test_errors(self):
+        ps = re.PatternSet([])
+        self.assertEqual(ps.search('abc'), [])
+        self.assertEqual(ps.patterns, [])
+        self.assertRaises(TypeError, re.PatternSet, ['a', b'b'])
+        self.assertRaises(re.error, re.PatternSet, ['a', '('])
+        ps = re.PatternSet(['a', 'b'])
+        self.assertRaises(TypeError, ps.search, b'a')
+        self.assertEqual(repr(ps),
+                         "PatternSet([re.compile('a'), re.compile('b')])")
+
+    def test_literal_trie(self):
+        self.assertEqual(re._literal_trie(['abc', 'abd', 'b']),
+                         '(?:ab(?:c|d)|b)')
+        self.assertEqual(re._literal_trie(['ab', 'abc', 'a.']),
+                         r'a(?:\.|b(?:c)?)')
+        self.assertEqual(re._literal_trie([b'x']), b'x')
+
+
+class CacheFileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, self.filename)
+        self.addCleanup(re.set_cache_file, None)
+        self.addCleanup(re.purge)
+
+    def compile(self, pattern, flags=0):
+        re.purge()
+        return re.compile(pattern, flags)
+
+    def test_cache_file(self):
+        code = '''if 1:
+            import re, sre_compile, sys
+            if sys.argv[2] == 'cached':
+                def compile_data(*args):
+                    raise AssertionError('compiled again')
+                sre_compile.compile_data = compile_data
+            re.set_cache_file(sys.argv[1])
+            assert re.match(r'(?P<word>\\w+) (\\d+)', 'abc 12').groups() == ('abc', '12')
+            assert re.search(b'B+', b'abb', re.I).span() == (1, 3)
+            '''
+        assert_python_ok('-c', code, self.filename, 'new')
+        self.assertTrue(os.path.exists(self.filename))
+        assert_python_ok('-c', code, self.filename, 'cached')
+
+    def test_save_and_load(self):
+        re.set_cache_file(self.filename)
+        p = self.compile(r'(a)|b', re.I)
+        re._save_cache()
+        with open(self.filename, 'rb') as f:
+            version, data = marshal.load(f)
+        self.assertEqual(version, sre_compile.CODE_VERSION)
+        self.assertEqual(list(data), [(r'(a)|b', re.I.value)])
+        re.set_cache_file(self.filename)
+        self.assertEqual(self.compile(r'(a)|b', re.I), p)
+        # Patterns compiled with the DEBUG flag are not cached
+        with captured_stdout():
+            self.compile('x', re.DEBUG)
+        self.assertEqual(list(re._diskcache), [(r'(a)|b', re.I.value)])
+
+    def test_damaged_file(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'damaged')
+        re.set_cache_file(self.filename)
+        self.assertEqual(re._diskcache, {})
+        # Invalid code is dropped and compiled again
+        re._diskcache[('a+', 0)] = (0, [1, 2, 3], 0, {}, ())
+        self.assertTrue(self.compile('a+').fullmatch('aa'))
+        self.assertEqual(re._diskcache[('a+', 0)],
+                         sre_compile.compile_data('a+'))
+        # Another version of the engine
+        with open(self.filename, 'wb') as f:
+            marshal.dump(((0,), {('a+', 0): (0, [], 0, {}, ())}), f)
+        re.set_cache_file(self.filename)
+        self.assertEqual(re._diskcache, {})
+
+
 class ExternalTests(unittest.TestCase):
 
     def test_re_benchmarks(self):
@@ -951,6 +951,67 @@ def test_find_pax_umlauts(self):
         self._test_member(tarinfo, size=7011, chksum=sha256_regtype)
 
 
+class IndexedMemberReadTest(MemberReadTest):
+    # Find the members through an index
+
+    def setUp(self):
+        with tarfile.open(self.tarname, encoding="iso8859-1") as tar:
+            self.index = io.BytesIO()
+            tar.save_index(self.index)
+        self.tar = tarfile.open(self.tarname, mode=self.mode,
+                                encoding="iso8859-1", use_mmap=True)
+        self.index.seek(0)
+        self.tar.load_index(self.index)
+
+    def test_index(self):
+        self.assertIsInstance(self.tar.fileobj, tarfile._MappedFile)
+        tarinfo = self.tar.getmember("ustar/regtype")
+        self.assertFalse(self.tar._loaded)
+        # The members can still be iterated over
+        self.assertEqual(self.tar.next().name, "ustar/conttype")
+        self.assertEqual(self.tar.getmember("misc/eof").name, "misc/eof")
+        self.assertEqual(self.tar.next().name, "ustar/regtype")
+        self.assertRaises(KeyError, self.tar.getmember, "ustar/missing")
+        with self.tar.extractfile("gnu/sparse") as f:
+            self.assertEqual(sha256sum(f.read()), sha256_sparse)
+        self.assertFalse(self.tar._loaded)
+        names = self.tar.getnames()
+        self.assertIn("ustar/regtype", names)
+        self.assertEqual(self.tar.getmember("ustar/regtype").offset,
+                         tarinfo.offset)
+
+    def test_index_file(self):
+        self.tar.close()
+        index = os.path.join(TEMPDIR, "index")
+        self.addCleanup(os_helper.unlink, index)
+        with tarfile.open(self.tarname) as tar:
+            tar.save_index(index)
+        with tarfile.open(self.tarname) as tar:
+            tar.load_index(index)
+            with tar.extractfile("ustar/regtype") as f:
+                self.assertEqual(sha256sum(f.read()), sha256_regtype)
+
+    def test_index_mismatch(self):
+        self.tar.close()
+        with open(tmpname, "wb") as fobj:
+            with tarfile.open(fileobj=fobj, mode="w") as tar:
+                tarinfo = tarfile.TarInfo("ustar/regtype")
+                tar.addfile(tarinfo, io.BytesIO())
+        with tarfile.open(tmpname) as self.tar:
+            self.index.seek(0)
+            self.tar.load_index(self.index)
+            self.assertRaises(tarfile.ReadError, self.tar.getmember,
+                              "ustar/regtype")
+            self.assertRaises(tarfile.ReadError, self.tar.load_index,
+                              io.BytesIO(b"TARIDX"))
+            self.assertRaises(tarfile.ReadError, self.tar.load_index,
+                              io.BytesIO(self.index.getvalue()[:100]))
+        with open(tmpname, "rb") as fobj:
+            with tarfile.open(fileobj=fobj, mode="r|") as tar:
+                self.assertRaises(tarfile.StreamError, tar.load_index,
+                                  self.index)
+
+
 class LongnameTest:
 
     def test_read_longname(self):
@@ -2254,6 +2315,21 @@ def test_read_number_fields(self):
         self.assertEqual(tarfile.nti(b"\0"), 0)
         self.assertEqual(tarfile.nti(b"       \0"), 0)
 
+        with self.assertRaises(tarfile.InvalidHeaderError):
+            tarfile.nti(b"000008\0\0")
+        with self.assertRaises(tarfile.InvalidHeaderError):
+            tarfile.nti(b"00\xe900\0\0\0")
+
+    def test_calc_chksums(self):
+        buf = bytes(range(256)) * 2
+        unsigned = 256 + sum(buf[:148]) + sum(buf[156:])
+        signed = 256 + sum(b - 256 if b >= 128 else b
+                           for b in buf[:148] + buf[156:])
+        self.assertEqual(tarfile.calc_chksums(buf), (unsigned, signed))
+        self.assertEqual(tarfile.calc_chksums(bytearray(buf)),
+                         (unsigned, signed))
+        self.assertEqual(tarfile.calc_chksums(bytes(512)), (256, 256))
+
     def test_write_number_fields(self):
         self.assertEqual(tarfile.itn(1), b"0000001\x00")
         self.assertEqual(tarfile.itn(0o7777777), b"7777777\x00")
@@ -1,3 +1,4 @@
+import array
 import contextlib
 import importlib.util
 import io
@@ -1118,6 +1119,69 @@ def test_write_after_close(self):
             self.assertRaises(ValueError, w.write, b'')
             self.assertEqual(zipf.read('test'), data)
 
+    def test_batch(self):
+        self.addCleanup(rmtree, TESTFN)
+        os.mkdir(TESTFN)
+        with open(os.path.join(TESTFN, 'file'), 'wb') as f:
+            f.write(b'file content' * 1000)
+        names = []
+        with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipf:
+            zipf.writestr('first', b'1')
+            with zipf.batch(threads=3) as batch:
+                for i in range(20):
+                    name = 'data%d' % i
+                    batch.writestr(name, b'%d' % i * 1000 * i)
+                    names.append(name)
+                batch.write(TESTFN, 'dir')
+                batch.write(os.path.join(TESTFN, 'file'), 'dir/file',
+                            compresslevel=1)
+                batch.writestr('text', 'text content',
+                               compress_type=zipfile.ZIP_STORED)
+                names += ['dir/', 'dir/file', 'text']
+            self.assertRaises(ValueError, batch.writestr, 'late', b'')
+            zipf.writestr('last', b'2')
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            self.assertEqual(zipf.namelist(), ['first'] + names + ['last'])
+            self.assertIsNone(zipf.testzip())
+            for i in range(20):
+                self.assertEqual(zipf.read('data%d' % i), b'%d' % i * 1000 * i)
+                self.assertEqual(zipf.getinfo('data%d' % i).compress_type,
+                                 self.compression)
+            self.assertEqual(zipf.read('dir/file'), b'file content' * 1000)
+            self.assertEqual(zipf.read('text'), b'text content')
+            self.assertEqual(zipf.getinfo('text').compress_type,
+                             zipfile.ZIP_STORED)
+
+    def test_batch_mutable_data(self):
+        # The data is copied when writestr() is called
+        buf = bytearray(b'a' * 1000)
+        with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipf:
+            with zipf.batch(threads=2) as batch:
+                batch.writestr('bytearray', buf)
+                buf[:] = b'b' * 1000
+                batch.writestr('memoryview', memoryview(buf))
+                buf[:] = b'c' * 1000
+                batch.writestr('array', array.array('I', [1, 2]))
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            self.assertEqual(zipf.read('bytearray'), b'a' * 1000)
+            self.assertEqual(zipf.read('memoryview'), b'b' * 1000)
+            self.assertEqual(zipf.read('array'),
+                             bytes(array.array('I', [1, 2])))
+
+    def test_batch_error(self):
+        with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipf:
+            with self.assertRaises(FileNotFoundError):
+                with zipf.batch(threads=2) as batch:
+                    batch.writestr('data', b'content')
+                    batch.write(TESTFN)
+            # Nothing of a failed batch is written
+            with self.assertRaises(ZeroDivisionError):
+                with zipf.batch(threads=2) as batch:
+                    batch.writestr('data', b'content')
+                    1/0
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            self.assertEqual(zipf.namelist(), [])
+
 class StoredWriterTests(AbstractWriterTests, unittest.TestCase):
     compression = zipfile.ZIP_STORED
 
@@ -1415,6 +1479,33 @@ def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(pathlib.Path(extdir))
 
+    def test_extract_all_threads(self):
+        with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            zipfp.writestr('emptydir/', b'')
+            for i in range(50):
+                zipfp.writestr('dir%d/file%d' % (i % 3, i), b'data%d' % i * i)
+            with self.assertWarns(UserWarning):
+                zipfp.writestr('dir1/file1', b'last')
+        self.addCleanup(unlink, TESTFN2)
+        with open(TESTFN2, 'rb') as f:
+            for file, kwargs in [(TESTFN2, {}), (TESTFN2, {'use_mmap': True}),
+                                 (f, {})]:
+                with self.subTest(file=file, kwargs=kwargs), \
+                     temp_dir() as extdir, \
+                     zipfile.ZipFile(file, **kwargs) as zipfp:
+                    zipfp.extractall(extdir, threads=4)
+                    self.assertTrue(os.path.isdir(
+                        os.path.join(extdir, 'emptydir')))
+                    for i in range(50):
+                        self.check_file(
+                            os.path.join(extdir, 'dir%d' % (i % 3),
+                                         'file%d' % i),
+                            b'last' if i == 1 else b'data%d' % i * i)
+                    os.remove(os.path.join(extdir, 'dir2', 'file2'))
+                    zipfp.extractall(extdir, ['dir2/file2'], threads=2)
+                    self.check_file(os.path.join(extdir, 'dir2', 'file2'),
+                                    b'data2' * 2)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -1520,6 +1611,71 @@ def _test_extract_hackers_arcnames(self, hacknames):
 
 
 class OtherTests(unittest.TestCase):
+    def test_lazy_central_directory(self):
+        with zipfile.ZipFile(TESTFN, "w") as zipfp:
+            for i in range(20):
+                zipfp.writestr("file%d" % i, b"data%d" % i)
+            with self.assertWarns(UserWarning):
+                zipfp.writestr("file3", b"last")
+        for kwargs in [{}, {'use_mmap': True}]:
+            with zipfile.ZipFile(TESTFN, **kwargs) as zipfp:
+                names = ["file%d" % i for i in range(20)] + ["file3"]
+                self.assertEqual(zipfp.namelist(), names)
+                info = zipfp.getinfo("file7")
+                self.assertEqual(zipfp.read(info), b"data7")
+                self.assertEqual(zipfp.read("file3"), b"last")
+                infolist = zipfp.infolist()
+                self.assertIs(infolist[7], info)
+                self.assertIs(zipfp.getinfo("file3"), infolist[-1])
+                self.assertEqual([x.filename for x in infolist], names)
+                self.assertEqual(zipfp.namelist(), names)
+                self.assertRaises(KeyError, zipfp.getinfo, "file20")
+
+    def test_use_mmap(self):
+        data = b"x" * 10000
+        for f in get_files(self):
+            with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zipfp:
+                zipfp.writestr("ones", b"1" + data)
+                zipfp.writestr("twos", b"2" + data)
+            with zipfile.ZipFile(f, use_mmap=True) as zipfp:
+                with zipfp.open("ones") as zopen1, \
+                     zipfp.open("twos") as zopen2:
+                    data1 = zopen1.read(500)
+                    data2 = zopen2.read(500)
+                    zopen1.seek(1)
+                    data1 += zopen1.read()
+                    data2 += zopen2.read()
+                self.assertEqual(data1, b"1" + data[:499] + data)
+                self.assertEqual(data2, b"2" + data)
+            with zipfile.ZipFile(f, "a", use_mmap=True) as zipfp:
+                zipfp.writestr("threes", b"3")
+            with zipfile.ZipFile(f, use_mmap=True) as zipfp:
+                self.assertEqual(zipfp.read("threes"), b"3")
+        # The map is closed with the last file object
+        zipfp = zipfile.ZipFile(TESTFN2, use_mmap=True)
+        zopen = zipfp.open("ones")
+        zipfp.close()
+        self.assertEqual(zopen.read(), b"1" + data)
+        zopen.close()
+
+    def test_use_mmap_info_after_close(self):
+        # The ZipInfo objects can be created after the map is closed
+        with zipfile.ZipFile(TESTFN2, "w") as zipfp:
+            for i in range(5):
+                zipfp.writestr("file%d" % i, b"x" * i)
+        names = ["file%d" % i for i in range(5)]
+        zipfp = zipfile.ZipFile(TESTFN2, use_mmap=True)
+        zipfp.getinfo("file1")
+        zipfp.close()
+        self.assertEqual(zipfp.getinfo("file3").file_size, 3)
+        self.assertEqual([x.filename for x in zipfp.infolist()], names)
+        self.assertEqual(zipfp.namelist(), names)
+
+        with zipfile.ZipFile(TESTFN2, use_mmap=True) as zipfp:
+            pass
+        self.assertEqual([x.file_size for x in zipfp.infolist()],
+                         list(range(5)))
+
     def test_open_via_zip_info(self):
         # Create the ZIP archive
         with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_STORED) as zipfp:
@@ -571,6 +571,45 @@ def test_decompress_eof_incomplete_stream(self):
         dco.flush()
         self.assertFalse(dco.eof)
 
+    def test_decompress_block(self):
+        data = HAMLET_SCENE * 200
+        co = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        x = co.compress(data[:len(data) // 2]) + co.flush(zlib.Z_FULL_FLUSH)
+        x += co.compress(data[len(data) // 2:]) + co.flush()
+        dco = zlib.decompressobj(-zlib.MAX_WBITS)
+        self.assertEqual(dco.data_type, 0)
+        chunks = []
+        boundaries = []
+        tail = x
+        while not dco.eof:
+            chunks.append(dco.decompress_block(tail))
+            tail = dco.unconsumed_tail
+            if dco.data_type & 128 and not dco.data_type & 64:
+                boundaries.append((sum(map(len, chunks)),
+                                   len(x) - len(tail), dco.data_type & 7))
+        self.assertEqual(b''.join(chunks), data)
+        self.assertTrue(boundaries)
+        # Decompression can restart at any block boundary from the window
+        # and the bits left in the previous byte
+        for out, pos, bits in boundaries:
+            with self.subTest(out=out, pos=pos, bits=bits):
+                dco = zlib.decompressobj(-zlib.MAX_WBITS,
+                                         zdict=data[max(out - 32768, 0):out])
+                if bits:
+                    dco.prime(bits, x[pos - 1] >> (8 - bits))
+                self.assertEqual(dco.decompress(x[pos:]), data[out:])
+
+    def test_prime(self):
+        dco = zlib.decompressobj(-zlib.MAX_WBITS)
+        self.assertRaises(ValueError, dco.prime, 17, 0)
+        self.assertRaises(ValueError, dco.prime, -1, 0)
+        dco.prime(0, 0)
+        # A final stored block, with its header shifted by one bit
+        x = zlib.compress(b'abc', 0)[2:]
+        dco = zlib.decompressobj(-zlib.MAX_WBITS)
+        dco.prime(1, x[0] & 1)
+        self.assertEqual(dco.decompress(bytes([x[0] >> 1]) + x[1:]), b'abc')
+
     def test_decompress_unused_data(self):
         # Repeated calls to decompress() after EOF should accumulate data in
         # dco.unused_data, instead of just storing the arg to the last call.
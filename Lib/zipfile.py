@@ -3,6 +3,7 @@
 
 XXX references to utf-8 need further investigation.
 """
+import array
 import binascii
 import importlib.util
 import io
@@ -166,6 +167,7 @@ class LargeZipFile(Exception):
 _DD_SIGNATURE = 0x08074b50
 
 _EXTRA_FIELD_STRUCT = struct.Struct('<HH')
+_CENTRAL_DIR_STRUCT = struct.Struct(structCentralDir)
 
 def _strip_extra(extra, xids):
     # Remove Extra Fields with specified IDs.
@@ -314,6 +316,20 @@ def _EndRecData(fpin):
     return None
 
 
+def _normalize_filename(filename):
+    # Terminate the file name at the first null byte.  Null bytes in file
+    # names are used as tricks by viruses in archives.
+    null_byte = filename.find(chr(0))
+    if null_byte >= 0:
+        filename = filename[0:null_byte]
+    # This is used to ensure paths in generated ZIP files always use
+    # forward slashes as the directory separator, as required by the
+    # ZIP format specification.
+    if os.sep != "/" and os.sep in filename:
+        filename = filename.replace(os.sep, "/")
+    return filename
+
+
 class ZipInfo (object):
     """Class with attributes describing each file in the ZIP archive."""
 
@@ -343,18 +359,7 @@ class ZipInfo (object):
     def __init__(self, filename="NoName", date_time=(1980,1,1,0,0,0)):
         self.orig_filename = filename   # Original file name in archive
 
-        # Terminate the file name at the first null byte.  Null bytes in file
-        # names are used as tricks by viruses in archives.
-        null_byte = filename.find(chr(0))
-        if null_byte >= 0:
-            filename = filename[0:null_byte]
-        # This is used to ensure paths in generated ZIP files always use
-        # forward slashes as the directory separator, as required by the
-        # ZIP format specification.
-        if os.sep != "/" and os.sep in filename:
-            filename = filename.replace(os.sep, "/")
-
-        self.filename = filename        # Normalized file name
+        self.filename = _normalize_filename(filename) # Normalized file name
         self.date_time = date_time      # year, month, day, hour, min, sec
 
         if date_time[0] < 1980:
@@ -749,6 +754,44 @@ def close(self):
             self._file = None
             self._close(fileobj)
 
+class _MappedFile:
+    # Like _SharedFile, but reads from a memory map of the file, so that
+    # archive members can be read at the same time without locking
+    def __init__(self, file, pos, close, buf):
+        self._file = file
+        self._pos = pos
+        self._close = close
+        self._buf = buf
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += len(self._buf)
+        self._pos = offset
+        return self._pos
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            end = len(self._buf)
+        else:
+            end = self._pos + n
+        data = self._buf[self._pos:end]
+        self._pos += len(data)
+        return data
+
+    def close(self):
+        if self._file is not None:
+            fileobj = self._file
+            self._file = None
+            self._close(fileobj)
+
 # Provide the tell method for unseekable stream
 class _Tellable:
     def __init__(self, fp):
@@ -1125,10 +1168,18 @@ def write(self, data):
         self._crc = crc32(data, self._crc)
         if self._compressor:
             data = self._compressor.compress(data)
-            self._compress_size += len(data)
+        self._compress_size += len(data)
         self._fileobj.write(data)
         return nbytes
 
+    def _write_compressed(self, data, crc, file_size):
+        # Write the whole data of the member, compressed by _compress_data()
+        self._compressor = None
+        self._file_size = file_size
+        self._crc = crc
+        self._compress_size = len(data)
+        self._fileobj.write(data)
+
     def close(self):
         if self.closed:
             return
@@ -1139,9 +1190,7 @@ def close(self):
                 buf = self._compressor.flush()
                 self._compress_size += len(buf)
                 self._fileobj.write(buf)
-                self._zinfo.compress_size = self._compress_size
-            else:
-                self._zinfo.compress_size = self._file_size
+            self._zinfo.compress_size = self._compress_size
             self._zinfo.CRC = self._crc
             self._zinfo.file_size = self._file_size
 
@@ -1177,6 +1226,262 @@ def close(self):
 
 
 
+def _compress_data(data, compress_type, compresslevel):
+    compressor = _get_compressor(compress_type, compresslevel)
+    crc = crc32(data)
+    if compressor:
+        compressed = compressor.compress(data) + compressor.flush()
+    else:
+        compressed = data
+    return compressed, crc, len(data)
+
+
+def _compress_file(filename, compress_type, compresslevel):
+    with open(filename, "rb") as src:
+        data = src.read()
+    return _compress_data(data, compress_type, compresslevel)
+
+
+class _BatchWriter:
+    """Add members to a ZIP file, compressing them in a pool of threads.
+
+    Returned by ZipFile.batch().  The members are written to the archive
+    in the order in which write() and writestr() were called.
+    """
+
+    def __init__(self, zf, threads):
+        from concurrent.futures import ThreadPoolExecutor
+
+        if threads is None:
+            threads = os.cpu_count() or 1
+        self._zipfile = zf
+        self._executor = ThreadPoolExecutor(threads)
+        # Members compressed or being compressed, waiting to be written
+        self._pending = []
+        self._max_pending = 2 * threads
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if type is None:
+            self.close()
+        else:
+            # Don't write the members of a failed batch
+            for func, args in self._pending:
+                if func == self._zipfile._write_compressed:
+                    args[1].cancel()
+            self._pending.clear()
+            self._executor.shutdown()
+
+    def _check(self):
+        if self._executor is None:
+            raise ValueError("I/O operation on closed batch.")
+        if not self._zipfile.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+
+    def write(self, filename, arcname=None,
+              compress_type=None, compresslevel=None):
+        """Put the bytes from filename into the archive under the name
+        arcname, as ZipFile.write() does."""
+        self._check()
+        zf = self._zipfile
+        zinfo = ZipInfo.from_file(filename, arcname,
+                                  strict_timestamps=zf._strict_timestamps)
+        if zinfo.is_dir():
+            self._pending.append((zf.write, (filename, arcname)))
+            return
+        if compress_type is not None:
+            zinfo.compress_type = compress_type
+        else:
+            zinfo.compress_type = zf.compression
+        if compresslevel is not None:
+            zinfo._compresslevel = compresslevel
+        else:
+            zinfo._compresslevel = zf.compresslevel
+        self._submit(zinfo, _compress_file, filename)
+
+    def writestr(self, zinfo_or_arcname, data,
+                 compress_type=None, compresslevel=None):
+        """Write a file into the archive, as ZipFile.writestr() does."""
+        self._check()
+        zf = self._zipfile
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        elif not isinstance(data, bytes):
+            # The data is compressed later, take a copy of a mutable buffer
+            data = bytes(data)
+        if not isinstance(zinfo_or_arcname, ZipInfo):
+            zinfo = ZipInfo(filename=zinfo_or_arcname,
+                            date_time=time.localtime(time.time())[:6])
+            zinfo.compress_type = zf.compression
+            zinfo._compresslevel = zf.compresslevel
+            if zinfo.filename[-1] == '/':
+                zinfo.external_attr = 0o40775 << 16   # drwxrwxr-x
+                zinfo.external_attr |= 0x10           # MS-DOS directory flag
+            else:
+                zinfo.external_attr = 0o600 << 16     # ?rw-------
+        else:
+            zinfo = zinfo_or_arcname
+        if compress_type is not None:
+            zinfo.compress_type = compress_type
+        if compresslevel is not None:
+            zinfo._compresslevel = compresslevel
+        self._submit(zinfo, _compress_data, data)
+
+    def _submit(self, zinfo, func, arg):
+        future = self._executor.submit(func, arg, zinfo.compress_type,
+                                       zinfo._compresslevel)
+        self._pending.append((self._zipfile._write_compressed,
+                              (zinfo, future)))
+        self._flush(self._max_pending)
+
+    def _flush(self, max_pending):
+        # Write the oldest members until at most max_pending are left
+        while len(self._pending) > max_pending:
+            func, args = self._pending.pop(0)
+            func(*args)
+
+    def close(self):
+        """Write the remaining members to the archive."""
+        if self._executor is None:
+            return
+        try:
+            self._flush(0)
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class _CentralDirectory:
+    """Compact index of the central directory of a ZIP file.
+
+    Only the offsets and the file names of the entries are kept, the ZipInfo
+    instances are created when they are first needed.
+    """
+
+    def __init__(self, data, start, size, concat):
+        self._data = data
+        self._concat = concat
+        self._start = start
+        self._base = 0  # position of the data in the archive
+        self._offsets = array.array('Q')
+        self._names = []
+        self._name_index = None
+        infos = {}
+        unpack = _CENTRAL_DIR_STRUCT.unpack_from
+        pos = start
+        end = min(start + size, len(data))
+        while pos < start + size:
+            if pos + sizeCentralDir > end:
+                raise BadZipFile("Truncated central directory")
+            centdir = unpack(data, pos)
+            if centdir[_CD_SIGNATURE] != stringCentralDir:
+                raise BadZipFile("Bad magic number for central directory")
+            if centdir[_CD_EXTRACT_VERSION] > MAX_EXTRACT_VERSION:
+                raise NotImplementedError("zip file version %.1f" %
+                                          (centdir[_CD_EXTRACT_VERSION] / 10))
+            filename = self._filename(pos, centdir)
+            extra_length = centdir[_CD_EXTRA_FIELD_LENGTH]
+            if extra_length:
+                if 0xFFFF_FFFF in (centdir[_CD_COMPRESSED_SIZE],
+                                   centdir[_CD_UNCOMPRESSED_SIZE],
+                                   centdir[_CD_LOCAL_HEADER_OFFSET]):
+                    # The ZIP64 extra field is checked by _decodeExtra()
+                    infos[len(self._offsets)] = self._info(pos)
+                else:
+                    extra_start = (pos + sizeCentralDir
+                                   + centdir[_CD_FILENAME_LENGTH])
+                    self._check_extra(data[extra_start:
+                                           extra_start + extra_length])
+            self._offsets.append(pos)
+            self._names.append(_normalize_filename(filename))
+            pos += (sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
+                    + extra_length + centdir[_CD_COMMENT_LENGTH])
+        self._end = pos
+        self._infos = [None] * len(self._offsets)
+        for i, info in infos.items():
+            self._infos[i] = info
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, i):
+        info = self._infos[i]
+        if info is None:
+            info = self._infos[i] = self._info(self._offsets[i] - self._base)
+        return info
+
+    def namelist(self):
+        return self._names[:]
+
+    def detach(self):
+        """Copy the central directory out of the data it was read from.
+
+        Called before the mapped file is closed, so that the remaining
+        ZipInfo instances can still be created.
+        """
+        if not isinstance(self._data, bytes):
+            self._data = bytes(self._data[self._start:self._end])
+            self._base = self._start
+
+    def infolist(self):
+        return [self[i] for i in range(len(self._offsets))]
+
+    def get(self, name):
+        if self._name_index is None:
+            self._name_index = {n: i for i, n in enumerate(self._names)}
+        i = self._name_index.get(name)
+        if i is None:
+            return None
+        return self[i]
+
+    def _filename(self, pos, centdir):
+        start = pos + sizeCentralDir
+        filename = self._data[start:start + centdir[_CD_FILENAME_LENGTH]]
+        if centdir[_CD_FLAG_BITS] & 0x800:
+            # UTF-8 file names extension
+            return filename.decode('utf-8')
+        else:
+            # Historical ZIP filename encoding
+            return filename.decode('cp437')
+
+    @staticmethod
+    def _check_extra(extra):
+        unpack = _EXTRA_FIELD_STRUCT.unpack_from
+        i = 0
+        while len(extra) - i >= 4:
+            tp, ln = unpack(extra, i)
+            if ln + 4 > len(extra) - i:
+                raise BadZipFile("Corrupt extra field %04x (size=%d)"
+                                 % (tp, ln))
+            i += ln + 4
+
+    def _info(self, pos):
+        data = self._data
+        centdir = _CENTRAL_DIR_STRUCT.unpack_from(data, pos)
+        # Create ZipInfo instance to store file information
+        x = ZipInfo(self._filename(pos, centdir))
+        pos += sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
+        x.extra = data[pos:pos + centdir[_CD_EXTRA_FIELD_LENGTH]]
+        pos += centdir[_CD_EXTRA_FIELD_LENGTH]
+        x.comment = data[pos:pos + centdir[_CD_COMMENT_LENGTH]]
+        x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
+        (x.create_version, x.create_system, x.extract_version, x.reserved,
+         x.flag_bits, x.compress_type, t, d,
+         x.CRC, x.compress_size, x.file_size) = centdir[1:12]
+        x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+        # Convert date/time code to (year, month, day, hour, min, sec)
+        x._raw_time = t
+        x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
+                        t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
+
+        x._decodeExtra()
+        x.header_offset = x.header_offset + self._concat
+        return x
+
+
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
@@ -1197,6 +1502,9 @@ class ZipFile:
                    When using ZIP_STORED or ZIP_LZMA this keyword has no effect.
                    When using ZIP_DEFLATED integers 0 through 9 are accepted.
                    When using ZIP_BZIP2 integers 1 through 9 are accepted.
+    use_mmap: if True and mode is 'r', the file is mapped in memory and
+              archive members are read from the map, which lets several
+              threads read members at the same time.
 
     """
 
@@ -1204,7 +1512,8 @@ class ZipFile:
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True):
+                 compresslevel=None, *, strict_timestamps=True,
+                 use_mmap=False):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
@@ -1223,6 +1532,8 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
         self.pwd = None
         self._comment = b''
         self._strict_timestamps = strict_timestamps
+        self._index = None      # Central directory, when read from the file
+        self._mmap = None
 
         # Check if we were passed a file-like object
         if isinstance(file, os.PathLike):
@@ -1254,6 +1565,8 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
 
         try:
             if mode == 'r':
+                if use_mmap:
+                    self._map_file()
                 self._RealGetContents()
             elif mode in ('w', 'x'):
                 # set the modified flag so central directory gets written
@@ -1313,6 +1626,37 @@ def __repr__(self):
         result.append('>')
         return ''.join(result)
 
+    @property
+    def filelist(self):
+        """List of ZipInfo instances for the archive."""
+        if self._filelist is None:
+            self._filelist = self._index.infolist()
+        return self._filelist
+
+    @filelist.setter
+    def filelist(self, filelist):
+        self._filelist = filelist
+
+    @property
+    def NameToInfo(self):
+        """Dictionary to find the ZipInfo instance given a file name."""
+        if self._NameToInfo is None:
+            self._NameToInfo = {x.filename: x for x in self.filelist}
+        return self._NameToInfo
+
+    @NameToInfo.setter
+    def NameToInfo(self, name_to_info):
+        self._NameToInfo = name_to_info
+
+    def _map_file(self):
+        try:
+            import mmap
+            self._mmap = mmap.mmap(self.fp.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except (ImportError, AttributeError, OSError, ValueError):
+            # Not a regular file: read it with seek() and read()
+            self._mmap = None
+
     def _RealGetContents(self):
         """Read in the table of contents for the ZIP file."""
         fp = self.fp
@@ -1339,60 +1683,24 @@ def _RealGetContents(self):
             print("given, inferred, offset", offset_cd, inferred, concat)
         # self.start_dir:  Position of start of central directory
         self.start_dir = offset_cd + concat
-        fp.seek(self.start_dir, 0)
-        data = fp.read(size_cd)
-        fp = io.BytesIO(data)
-        total = 0
-        while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
-                raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
-            if centdir[_CD_SIGNATURE] != stringCentralDir:
-                raise BadZipFile("Bad magic number for central directory")
-            if self.debug > 2:
-                print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            flags = centdir[5]
-            if flags & 0x800:
-                # UTF-8 file names extension
-                filename = filename.decode('utf-8')
-            else:
-                # Historical ZIP filename encoding
-                filename = filename.decode('cp437')
-            # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
-            x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
-            (x.create_version, x.create_system, x.extract_version, x.reserved,
-             x.flag_bits, x.compress_type, t, d,
-             x.CRC, x.compress_size, x.file_size) = centdir[1:12]
-            if x.extract_version > MAX_EXTRACT_VERSION:
-                raise NotImplementedError("zip file version %.1f" %
-                                          (x.extract_version / 10))
-            x.volume, x.internal_attr, x.external_attr = centdir[15:18]
-            # Convert date/time code to (year, month, day, hour, min, sec)
-            x._raw_time = t
-            x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
-                            t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-
-            x._decodeExtra()
-            x.header_offset = x.header_offset + concat
-            self.filelist.append(x)
-            self.NameToInfo[x.filename] = x
-
-            # update total bytes read from central directory
-            total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
-                     + centdir[_CD_EXTRA_FIELD_LENGTH]
-                     + centdir[_CD_COMMENT_LENGTH])
-
-            if self.debug > 2:
-                print("total", total)
+        if self._mmap is not None:
+            self._index = _CentralDirectory(self._mmap, self.start_dir,
+                                            size_cd, concat)
+        else:
+            fp.seek(self.start_dir, 0)
+            data = fp.read(size_cd)
+            self._index = _CentralDirectory(data, 0, size_cd, concat)
+        if self.debug > 2:
+            print("entries", len(self._index))
+        # The ZipInfo instances are created on first use
+        self._filelist = None
+        self._NameToInfo = None
 
 
     def namelist(self):
         """Return a list of file names in the archive."""
+        if self._filelist is None:
+            return self._index.namelist()
         return [data.filename for data in self.filelist]
 
     def infolist(self):
@@ -1424,7 +1732,10 @@ def testzip(self):
 
     def getinfo(self, name):
         """Return the instance of ZipInfo given 'name'."""
-        info = self.NameToInfo.get(name)
+        if self._NameToInfo is None:
+            info = self._index.get(name)
+        else:
+            info = self.NameToInfo.get(name)
         if info is None:
             raise KeyError(
                 'There is no item named %r in the archive' % name)
@@ -1511,8 +1822,16 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
 
         # Open for reading:
         self._fileRefCnt += 1
-        zef_file = _SharedFile(self.fp, zinfo.header_offset,
-                               self._fpclose, self._lock, lambda: self._writing)
+        if self._mmap is not None:
+            zef_file = _MappedFile(self.fp, zinfo.header_offset,
+                                   self._fpclose, self._mmap)
+        else:
+            zef_file = _SharedFile(self.fp, zinfo.header_offset,
+                                   self._fpclose, self._lock,
+                                   lambda: self._writing)
+        return self._open_member(zef_file, zinfo, pwd, name)
+
+    def _open_member(self, zef_file, zinfo, pwd, name):
         try:
             # Skip the file header:
             fheader = zef_file.read(sizeFileHeader)
@@ -1556,7 +1875,7 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
             else:
                 pwd = None
 
-            return ZipExtFile(zef_file, mode, zinfo, pwd, True)
+            return ZipExtFile(zef_file, "r", zinfo, pwd, True)
         except:
             zef_file.close()
             raise
@@ -1615,11 +1934,12 @@ def extract(self, member, path=None, pwd=None):
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, threads=1):
         """Extract all members from the archive to the current working
            directory. `path' specifies a different directory to extract to.
            `members' is optional and must be a subset of the list returned
-           by namelist().
+           by namelist().  If `threads' is greater than 1, the files are
+           extracted by that many threads.
         """
         if members is None:
             members = self.namelist()
@@ -1629,9 +1949,60 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
+        if threads > 1:
+            self._extract_parallel(members, path, pwd, threads)
+            return
+
         for zipinfo in members:
             self._extract_member(zipinfo, path, pwd)
 
+    def _extract_parallel(self, members, path, pwd, threads):
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not self.fp:
+            raise ValueError(
+                "Attempt to use ZIP archive that was already closed")
+
+        # Create the directories first, and extract only the last member of
+        # a given name, so that the result does not depend on the order in
+        # which the threads run.
+        files = {}
+        for member in members:
+            if not isinstance(member, ZipInfo):
+                member = self.getinfo(member)
+            if member.is_dir():
+                self._extract_member(member, path, pwd)
+            else:
+                files.pop(member.filename, None)
+                files[member.filename] = member
+
+        handles = []
+        if self._mmap is not None or self._filePassed:
+            opener = self.open
+        else:
+            # Give each thread its own file object, so that the threads do
+            # not wait for each other to seek and read.
+            local = threading.local()
+            def opener(zinfo, pwd=None):
+                fp = getattr(local, 'fp', None)
+                if fp is None:
+                    fp = local.fp = io.open(self.filename, 'rb')
+                    handles.append(fp)
+                zef_file = _SharedFile(fp, zinfo.header_offset,
+                                       lambda fp: None, threading.Lock(),
+                                       lambda: self._writing)
+                return self._open_member(zef_file, zinfo, pwd, zinfo.filename)
+
+        try:
+            with ThreadPoolExecutor(threads) as executor:
+                for future in [executor.submit(self._extract_member, member,
+                                               path, pwd, opener)
+                               for member in files.values()]:
+                    future.result()
+        finally:
+            for fp in handles:
+                fp.close()
+
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
         """Replace bad characters and remove trailing dots from parts."""
@@ -1647,7 +2018,7 @@ def _sanitize_windows_name(cls, arcname, pathsep):
         arcname = pathsep.join(x for x in arcname if x)
         return arcname
 
-    def _extract_member(self, member, targetpath, pwd):
+    def _extract_member(self, member, targetpath, pwd, opener=None):
         """Extract the ZipInfo object 'member' to a physical
            file on the path targetpath.
         """
@@ -1676,14 +2047,17 @@ def _extract_member(self, member, targetpath, pwd):
         # Create all upper directories if necessary.
         upperdirs = os.path.dirname(targetpath)
         if upperdirs and not os.path.exists(upperdirs):
-            os.makedirs(upperdirs)
+            # Another thread can create it concurrently
+            os.makedirs(upperdirs, exist_ok=True)
 
         if member.is_dir():
             if not os.path.isdir(targetpath):
                 os.mkdir(targetpath)
             return targetpath
 
-        with self.open(member, pwd=pwd) as source, \
+        if opener is None:
+            opener = self.open
+        with opener(member, pwd=pwd) as source, \
              open(targetpath, "wb") as target:
             shutil.copyfileobj(source, target)
 
@@ -1761,6 +2135,34 @@ def write(self, filename, arcname=None,
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
 
+    def batch(self, threads=None):
+        """Return an object to add many members to the archive at once.
+
+        Its write() and writestr() methods take the same arguments as the
+        methods of ZipFile, but the members are compressed by a pool of
+        threads.  They are written to the archive in the order of the calls,
+        at the latest when the object is closed.  threads is the number of
+        threads, by default the number of CPUs.
+        """
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        return _BatchWriter(self, threads)
+
+    def _write_compressed(self, zinfo, future):
+        compressed, crc, file_size = future.result()
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists."
+            )
+        zinfo.file_size = file_size
+        with self._lock:
+            with self._open_to_write(zinfo) as dest:
+                dest._write_compressed(compressed, crc, file_size)
+
     def writestr(self, zinfo_or_arcname, data,
                  compress_type=None, compresslevel=None):
         """Write a file into the archive.  The contents is 'data', which
@@ -1925,8 +2327,14 @@ def _write_end_record(self):
     def _fpclose(self, fp):
         assert self._fileRefCnt > 0
         self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        if not self._fileRefCnt:
+            if self._mmap is not None:
+                if self._index is not None:
+                    self._index.detach()
+                self._mmap.close()
+                self._mmap = None
+            if not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
@@ -108,6 +108,9 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     int numeric_field;          /* treat field as numeric */
     unsigned long line_num;     /* Source-file line number */
+    PyObject *columns;          /* column lists filled by readcolumns() */
+    PyObject *converters;       /* converter of each column (tuple) */
+    Py_ssize_t field_count;     /* number of fields in current record */
 } ReaderObj;
 
 static PyTypeObject Reader_Type;
@@ -522,11 +525,15 @@ _call_dialect(PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
+static int parse_save_column(ReaderObj *self);
+
 static int
 parse_save_field(ReaderObj *self)
 {
     PyObject *field;
 
+    if (self->columns != NULL)
+        return parse_save_column(self);
     field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                       (void *) self->field, self->field_len);
     if (field == NULL)
@@ -550,6 +557,112 @@ parse_save_field(ReaderObj *self)
     return 0;
 }
 
+/* Convert the current field to an int without creating a string first.
+ * Only plain decimal integers which fit in a long long are handled here;
+ * return NULL without an exception set for anything else.
+ */
+static PyObject *
+parse_field_as_int(ReaderObj *self)
+{
+    Py_UCS4 *p = self->field, *end = self->field + self->field_len;
+    unsigned long long value = 0;
+    int negative = 0;
+
+    if (p < end && (*p == '-' || *p == '+')) {
+        negative = (*p == '-');
+        p++;
+    }
+    if (p == end || end - p > 18)
+        return NULL;
+    for (; p < end; p++) {
+        if (*p < '0' || *p > '9')
+            return NULL;
+        value = value * 10 + (*p - '0');
+    }
+    if (negative)
+        return PyLong_FromLongLong(-(long long)value);
+    return PyLong_FromLongLong((long long)value);
+}
+
+/* Convert the current field to a float without creating a string first.
+ * Only fields made of digits, signs, dots and exponents are handled here;
+ * return NULL without an exception set for anything else.
+ */
+static PyObject *
+parse_field_as_float(ReaderObj *self)
+{
+    char buf[64], *end;
+    Py_ssize_t i;
+    double value;
+
+    if (self->field_len == 0 || self->field_len >= (Py_ssize_t)sizeof(buf))
+        return NULL;
+    for (i = 0; i < self->field_len; i++) {
+        Py_UCS4 c = self->field[i];
+        if (!(('0' <= c && c <= '9') || c == '.' || c == '-' || c == '+' ||
+              c == 'e' || c == 'E'))
+            return NULL;
+        buf[i] = (char)c;
+    }
+    buf[i] = '\0';
+    value = PyOS_string_to_double(buf, &end, NULL);
+    if (value == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return NULL;
+    }
+    if (end != buf + i)
+        return NULL;
+    return PyFloat_FromDouble(value);
+}
+
+/* Append the current field to its column, converted by the converter of
+ * that column.
+ */
+static int
+parse_save_column(ReaderObj *self)
+{
+    PyObject *field = NULL, *converter, *column;
+    Py_ssize_t index = self->field_count++;
+
+    if (index >= PyList_GET_SIZE(self->columns)) {
+        /* the record is too long: only count the field */
+        self->field_len = 0;
+        self->numeric_field = 0;
+        return 0;
+    }
+    converter = PyTuple_GET_ITEM(self->converters, index);
+    if (converter == (PyObject *)&PyLong_Type)
+        field = parse_field_as_int(self);
+    else if (converter == (PyObject *)&PyFloat_Type)
+        field = parse_field_as_float(self);
+    if (field == NULL) {
+        if (PyErr_Occurred())
+            return -1;
+        field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                          (void *) self->field,
+                                          self->field_len);
+        if (field == NULL)
+            return -1;
+        if (converter != Py_None) {
+            Py_SETREF(field, PyObject_CallOneArg(converter, field));
+        }
+        else if (self->numeric_field) {
+            Py_SETREF(field, PyNumber_Float(field));
+        }
+        if (field == NULL)
+            return -1;
+    }
+    self->field_len = 0;
+    self->numeric_field = 0;
+    column = PyList_GET_ITEM(self->columns, index);
+    if (PyList_Append(column, field) < 0) {
+        Py_DECREF(field);
+        return -1;
+    }
+    Py_DECREF(field);
+    return 0;
+}
+
 static int
 parse_grow_buff(ReaderObj *self)
 {
@@ -765,19 +878,27 @@ parse_process_char(ReaderObj *self, Py_UCS4 c)
 static int
 parse_reset(ReaderObj *self)
 {
-    Py_XSETREF(self->fields, PyList_New(0));
-    if (self->fields == NULL)
-        return -1;
+    if (self->columns != NULL) {
+        Py_CLEAR(self->fields);
+    }
+    else {
+        Py_XSETREF(self->fields, PyList_New(0));
+        if (self->fields == NULL)
+            return -1;
+    }
     self->field_len = 0;
+    self->field_count = 0;
     self->state = START_RECORD;
     self->numeric_field = 0;
     return 0;
 }
 
-static PyObject *
-Reader_iternext(ReaderObj *self)
+/* Parse the next record.  Return 1 if there is one, 0 at the end of the
+ * input and -1 on error.
+ */
+static int
+parse_record(ReaderObj *self)
 {
-    PyObject *fields = NULL;
     Py_UCS4 c;
     Py_ssize_t pos, linelen;
     unsigned int kind;
@@ -785,7 +906,7 @@ Reader_iternext(ReaderObj *self)
     PyObject *lineobj;
 
     if (parse_reset(self) < 0)
-        return NULL;
+        return -1;
     do {
         lineobj = PyIter_Next(self->input_iter);
         if (lineobj == NULL) {
@@ -798,7 +919,7 @@ Reader_iternext(ReaderObj *self)
                 else if (parse_save_field(self) >= 0)
                     break;
             }
-            return NULL;
+            return PyErr_Occurred() ? -1 : 0;
         }
         if (!PyUnicode_Check(lineobj)) {
             PyErr_Format(_csvstate_global->error_obj,
@@ -808,11 +929,11 @@ Reader_iternext(ReaderObj *self)
                          Py_TYPE(lineobj)->tp_name
                 );
             Py_DECREF(lineobj);
-            return NULL;
+            return -1;
         }
         if (PyUnicode_READY(lineobj) == -1) {
             Py_DECREF(lineobj);
-            return NULL;
+            return -1;
         }
         ++self->line_num;
         kind = PyUnicode_KIND(lineobj);
@@ -825,25 +946,111 @@ Reader_iternext(ReaderObj *self)
                 Py_DECREF(lineobj);
                 PyErr_Format(_csvstate_global->error_obj,
                              "line contains NUL");
-                goto err;
+                return -1;
             }
             if (parse_process_char(self, c) < 0) {
                 Py_DECREF(lineobj);
-                goto err;
+                return -1;
             }
             pos++;
         }
         Py_DECREF(lineobj);
         if (parse_process_char(self, 0) < 0)
-            goto err;
+            return -1;
     } while (self->state != START_RECORD);
 
+    return 1;
+}
+
+static PyObject *
+Reader_iternext(ReaderObj *self)
+{
+    PyObject *fields;
+
+    if (self->columns != NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "reader is already reading columns");
+        return NULL;
+    }
+    if (parse_record(self) <= 0)
+        return NULL;
     fields = self->fields;
     self->fields = NULL;
-err:
     return fields;
 }
 
+PyDoc_STRVAR(Reader_readcolumns_doc,
+"readcolumns(size, converters)\n"
+"\n"
+"Read up to size records and return a list of columns: one list for\n"
+"each item of converters, holding the fields of that column.  Each\n"
+"converter is None to keep the fields as strings, or a callable applied\n"
+"to each field; int and float are applied without creating the strings.\n"
+"Empty records are skipped, and the columns are empty at the end of\n"
+"the input.");
+
+static PyObject *
+Reader_readcolumns(ReaderObj *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"size", "converters", NULL};
+    PyObject *converters, *columns;
+    Py_ssize_t size, ncolumns, i, nrows = 0;
+    int r = 1;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "nO:readcolumns", kwlist,
+                                     &size, &converters))
+        return NULL;
+    if (self->columns != NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "reader is already reading columns");
+        return NULL;
+    }
+    converters = PySequence_Tuple(converters);
+    if (converters == NULL)
+        return NULL;
+    ncolumns = PyTuple_GET_SIZE(converters);
+    columns = PyList_New(ncolumns);
+    if (columns == NULL) {
+        Py_DECREF(converters);
+        return NULL;
+    }
+    for (i = 0; i < ncolumns; i++) {
+        PyObject *column = PyList_New(0);
+        if (column == NULL) {
+            Py_DECREF(converters);
+            Py_DECREF(columns);
+            return NULL;
+        }
+        PyList_SET_ITEM(columns, i, column);
+    }
+
+    self->columns = columns;
+    self->converters = converters;
+    while (nrows < size) {
+        r = parse_record(self);
+        if (r <= 0)
+            break;
+        if (self->field_count == 0)
+            continue;
+        if (self->field_count != ncolumns) {
+            PyErr_Format(_csvstate_global->error_obj,
+                         "expected %zd fields, saw %zd",
+                         ncolumns, self->field_count);
+            r = -1;
+            break;
+        }
+        nrows++;
+    }
+    self->columns = NULL;
+    self->converters = NULL;
+    Py_DECREF(converters);
+    if (r < 0) {
+        Py_DECREF(columns);
+        return NULL;
+    }
+    return columns;
+}
+
 static void
 Reader_dealloc(ReaderObj *self)
 {
@@ -882,6 +1089,8 @@ PyDoc_STRVAR(Reader_Type_doc,
 );
 
 static struct PyMethodDef Reader_methods[] = {
+    { "readcolumns", (PyCFunction)(void(*)(void))Reader_readcolumns,
+        METH_VARARGS | METH_KEYWORDS, Reader_readcolumns_doc},
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -944,6 +1153,8 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->columns = NULL;
+    self->converters = NULL;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -35,6 +35,9 @@ typedef struct _PyScannerObject {
     PyObject *parse_int;
     PyObject *parse_constant;
     PyObject *memo;
+    Py_ssize_t key_cache_size;
+    PyObject *shapes;
+    PyObject *schema_plan;
 } PyScannerObject;
 
 static PyMemberDef scanner_members[] = {
@@ -44,6 +47,7 @@ static PyMemberDef scanner_members[] = {
     {"parse_float", T_OBJECT, offsetof(PyScannerObject, parse_float), READONLY, "parse_float"},
     {"parse_int", T_OBJECT, offsetof(PyScannerObject, parse_int), READONLY, "parse_int"},
     {"parse_constant", T_OBJECT, offsetof(PyScannerObject, parse_constant), READONLY, "parse_constant"},
+    {"key_cache_size", T_PYSSIZET, offsetof(PyScannerObject, key_cache_size), READONLY, "key_cache_size"},
     {NULL}
 };
 
@@ -73,6 +77,21 @@ static PyMemberDef encoder_members[] = {
     {NULL}
 };
 
+/* Output of the encoder: either a list of str fragments accumulated in acc,
+   or UTF-8 encoded bytes in buffer.  If write is not NULL, the output is
+   passed to it in blocks of about WRITER_CHUNK_SIZE characters or bytes
+   instead. */
+typedef struct {
+    int binary;
+    PyObject *write;
+    _PyAccu acc;
+    Py_ssize_t acc_len;
+    PyObject *buffer;
+    Py_ssize_t size;
+} _JSONWriter;
+
+#define WRITER_CHUNK_SIZE (64 * 1024)
+
 /* Forward decls */
 
 static PyObject *
@@ -97,11 +116,11 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyEncoderObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc, PyObject *seq, Py_ssize_t indent_level);
+encoder_listencode_list(PyEncoderObject *s, _JSONWriter *writer, PyObject *seq, Py_ssize_t indent_level);
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc, PyObject *obj, Py_ssize_t indent_level);
+encoder_listencode_obj(PyEncoderObject *s, _JSONWriter *writer, PyObject *obj, Py_ssize_t indent_level);
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc, PyObject *dct, Py_ssize_t indent_level);
+encoder_listencode_dict(PyEncoderObject *s, _JSONWriter *writer, PyObject *dct, Py_ssize_t indent_level);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -150,27 +169,21 @@ ascii_escape_unichar(Py_UCS4 c, unsigned char *output, Py_ssize_t chars)
     return chars;
 }
 
-static PyObject *
-ascii_escape_unicode(PyObject *pystr)
+static Py_ssize_t
+ascii_escape_size(PyObject *pystr)
 {
-    /* Take a PyUnicode pystr and return a new ASCII-only escaped PyUnicode */
+    /* Return the size of the ASCII-only escaped representation of the ready
+       PyUnicode pystr, including the quotes, or -1 if it is too long */
     Py_ssize_t i;
     Py_ssize_t input_chars;
     Py_ssize_t output_size;
-    Py_ssize_t chars;
-    PyObject *rval;
     const void *input;
-    Py_UCS1 *output;
     int kind;
 
-    if (PyUnicode_READY(pystr) == -1)
-        return NULL;
-
     input_chars = PyUnicode_GET_LENGTH(pystr);
     input = PyUnicode_DATA(pystr);
     kind = PyUnicode_KIND(pystr);
 
-    /* Compute the output size */
     for (i = 0, output_size = 2; i < input_chars; i++) {
         Py_UCS4 c = PyUnicode_READ(kind, input, i);
         Py_ssize_t d;
@@ -188,16 +201,29 @@ ascii_escape_unicode(PyObject *pystr)
         }
         if (output_size > PY_SSIZE_T_MAX - d) {
             PyErr_SetString(PyExc_OverflowError, "string is too long to escape");
-            return NULL;
+            return -1;
         }
         output_size += d;
     }
+    return output_size;
+}
+
+static Py_ssize_t
+ascii_escape_fill(PyObject *pystr, Py_UCS1 *output)
+{
+    /* Write the ASCII-only escaped representation of the ready PyUnicode
+       pystr to output, which must have room for ascii_escape_size(pystr)
+       characters, and return the number of characters written */
+    Py_ssize_t i;
+    Py_ssize_t input_chars;
+    Py_ssize_t chars;
+    const void *input;
+    int kind;
+
+    input_chars = PyUnicode_GET_LENGTH(pystr);
+    input = PyUnicode_DATA(pystr);
+    kind = PyUnicode_KIND(pystr);
 
-    rval = PyUnicode_New(output_size, 127);
-    if (rval == NULL) {
-        return NULL;
-    }
-    output = PyUnicode_1BYTE_DATA(rval);
     chars = 0;
     output[chars++] = '"';
     for (i = 0; i < input_chars; i++) {
@@ -210,34 +236,50 @@ ascii_escape_unicode(PyObject *pystr)
         }
     }
     output[chars++] = '"';
+    return chars;
+}
+
+static PyObject *
+ascii_escape_unicode(PyObject *pystr)
+{
+    /* Take a PyUnicode pystr and return a new ASCII-only escaped PyUnicode */
+    Py_ssize_t output_size;
+    PyObject *rval;
+
+    if (PyUnicode_READY(pystr) == -1)
+        return NULL;
+
+    output_size = ascii_escape_size(pystr);
+    if (output_size < 0) {
+        return NULL;
+    }
+
+    rval = PyUnicode_New(output_size, 127);
+    if (rval == NULL) {
+        return NULL;
+    }
+    ascii_escape_fill(pystr, PyUnicode_1BYTE_DATA(rval));
 #ifdef Py_DEBUG
     assert(_PyUnicode_CheckConsistency(rval, 1));
 #endif
     return rval;
 }
 
-static PyObject *
-escape_unicode(PyObject *pystr)
+static Py_ssize_t
+escape_unicode_size(PyObject *pystr)
 {
-    /* Take a PyUnicode pystr and return a new escaped PyUnicode */
+    /* Return the size of the escaped representation of the ready PyUnicode
+       pystr, including the quotes, or -1 if it is too long */
     Py_ssize_t i;
     Py_ssize_t input_chars;
     Py_ssize_t output_size;
-    Py_ssize_t chars;
-    PyObject *rval;
     const void *input;
     int kind;
-    Py_UCS4 maxchar;
-
-    if (PyUnicode_READY(pystr) == -1)
-        return NULL;
 
-    maxchar = PyUnicode_MAX_CHAR_VALUE(pystr);
     input_chars = PyUnicode_GET_LENGTH(pystr);
     input = PyUnicode_DATA(pystr);
     kind = PyUnicode_KIND(pystr);
 
-    /* Compute the output size */
     for (i = 0, output_size = 2; i < input_chars; i++) {
         Py_UCS4 c = PyUnicode_READ(kind, input, i);
         Py_ssize_t d;
@@ -254,16 +296,12 @@ escape_unicode(PyObject *pystr)
         }
         if (output_size > PY_SSIZE_T_MAX - d) {
             PyErr_SetString(PyExc_OverflowError, "string is too long to escape");
-            return NULL;
+            return -1;
         }
         output_size += d;
     }
-
-    rval = PyUnicode_New(output_size, maxchar);
-    if (rval == NULL)
-        return NULL;
-
-    kind = PyUnicode_KIND(rval);
+    return output_size;
+}
 
 #define ENCODE_OUTPUT do { \
         chars = 0; \
@@ -294,6 +332,36 @@ escape_unicode(PyObject *pystr)
         output[chars++] = '"'; \
     } while (0)
 
+static PyObject *
+escape_unicode(PyObject *pystr)
+{
+    /* Take a PyUnicode pystr and return a new escaped PyUnicode */
+    Py_ssize_t i;
+    Py_ssize_t input_chars;
+    Py_ssize_t output_size;
+    Py_ssize_t chars;
+    PyObject *rval;
+    const void *input;
+    int kind;
+    Py_UCS4 maxchar;
+
+    if (PyUnicode_READY(pystr) == -1)
+        return NULL;
+
+    maxchar = PyUnicode_MAX_CHAR_VALUE(pystr);
+    input_chars = PyUnicode_GET_LENGTH(pystr);
+    input = PyUnicode_DATA(pystr);
+
+    output_size = escape_unicode_size(pystr);
+    if (output_size < 0)
+        return NULL;
+
+    rval = PyUnicode_New(output_size, maxchar);
+    if (rval == NULL)
+        return NULL;
+
+    kind = PyUnicode_KIND(rval);
+
     if (kind == PyUnicode_1BYTE_KIND) {
         Py_UCS1 *output = PyUnicode_1BYTE_DATA(rval);
         ENCODE_OUTPUT;
@@ -305,7 +373,6 @@ escape_unicode(PyObject *pystr)
         assert(kind == PyUnicode_4BYTE_KIND);
         ENCODE_OUTPUT;
     }
-#undef ENCODE_OUTPUT
 
 #ifdef Py_DEBUG
     assert(_PyUnicode_CheckConsistency(rval, 1));
@@ -313,6 +380,24 @@ escape_unicode(PyObject *pystr)
     return rval;
 }
 
+static Py_ssize_t
+escape_ascii_fill(PyObject *pystr, Py_UCS1 *output)
+{
+    /* Write the escaped representation of the ready ASCII-only PyUnicode
+       pystr to output, which must have room for escape_unicode_size(pystr)
+       characters, and return the number of characters written */
+    Py_ssize_t i;
+    Py_ssize_t input_chars = PyUnicode_GET_LENGTH(pystr);
+    Py_ssize_t chars;
+    const void *input = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_1BYTE_KIND;
+
+    assert(PyUnicode_IS_ASCII(pystr));
+    ENCODE_OUTPUT;
+    return chars;
+}
+#undef ENCODE_OUTPUT
+
 static void
 raise_errmsg(const char *msg, PyObject *s, Py_ssize_t end)
 {
@@ -654,6 +739,8 @@ scanner_traverse(PyScannerObject *self, visitproc visit, void *arg)
     Py_VISIT(self->parse_int);
     Py_VISIT(self->parse_constant);
     Py_VISIT(self->memo);
+    Py_VISIT(self->shapes);
+    Py_VISIT(self->schema_plan);
     return 0;
 }
 
@@ -666,9 +753,84 @@ scanner_clear(PyScannerObject *self)
     Py_CLEAR(self->parse_int);
     Py_CLEAR(self->parse_constant);
     Py_CLEAR(self->memo);
+    Py_CLEAR(self->shapes);
+    Py_CLEAR(self->schema_plan);
     return 0;
 }
 
+static int
+_is_plain_key(PyObject *key)
+{
+    /* Return 1 if the str key only contains ASCII characters which are never
+       escaped in JSON, so that it can be compared with the JSON text as is */
+    const Py_UCS1 *data;
+    Py_ssize_t i, len;
+
+    if (!PyUnicode_IS_ASCII(key))
+        return 0;
+    data = PyUnicode_1BYTE_DATA(key);
+    len = PyUnicode_GET_LENGTH(key);
+    for (i = 0; i < len; i++) {
+        if (!S_CHAR(data[i]))
+            return 0;
+    }
+    return 1;
+}
+
+static int
+_match_plain_key(PyObject *pystr, Py_ssize_t idx, PyObject *key,
+                 Py_ssize_t *next_idx_ptr)
+{
+    /* Return 1 if the JSON string whose first character is at index idx of
+       pystr is the plain key, and set *next_idx_ptr to the index after the
+       closing quote.  Return 0 otherwise. */
+    const void *str = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_KIND(pystr);
+    const Py_UCS1 *data = PyUnicode_1BYTE_DATA(key);
+    Py_ssize_t len = PyUnicode_GET_LENGTH(key);
+    Py_ssize_t i;
+
+    if (len >= PyUnicode_GET_LENGTH(pystr) - idx)
+        return 0;
+    if (kind == PyUnicode_1BYTE_KIND) {
+        if (memcmp((const Py_UCS1 *)str + idx, data, len) != 0)
+            return 0;
+    }
+    else {
+        for (i = 0; i < len; i++) {
+            if (PyUnicode_READ(kind, str, idx + i) != data[i])
+                return 0;
+        }
+    }
+    if (PyUnicode_READ(kind, str, idx + len) != '"')
+        return 0;
+    *next_idx_ptr = idx + len + 1;
+    return 1;
+}
+
+static int
+_store_shape(PyScannerObject *s, PyObject *first_key, PyObject *dct)
+{
+    /* Remember the keys of dct as the shape of the objects starting with
+       first_key, if they are all plain keys */
+    PyObject *keys;
+    Py_ssize_t i;
+    int rv;
+
+    keys = PyDict_Keys(dct);
+    if (keys == NULL)
+        return -1;
+    for (i = 0; i < PyList_GET_SIZE(keys); i++) {
+        if (!_is_plain_key(PyList_GET_ITEM(keys, i))) {
+            Py_DECREF(keys);
+            return 0;
+        }
+    }
+    rv = PyDict_SetItem(s->shapes, first_key, keys);
+    Py_DECREF(keys);
+    return rv;
+}
+
 static PyObject *
 _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
@@ -685,7 +847,14 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     PyObject *val = NULL;
     PyObject *rval = NULL;
     PyObject *key = NULL;
+    PyObject *first_key = NULL;
+    PyObject *shape = NULL;
     int has_pairs_hook = (s->object_pairs_hook != Py_None);
+    /* With the key cache, the keys of the previous object starting with the
+       same key are used to presize the dict and to match the next keys
+       without decoding them */
+    int use_shapes = (s->key_cache_size > 0 && !has_pairs_hook);
+    Py_ssize_t nkeys = 0;
     Py_ssize_t next_idx;
 
     if (PyUnicode_READY(pystr) == -1)
@@ -697,9 +866,9 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
 
     if (has_pairs_hook)
         rval = PyList_New(0);
-    else
+    else if (!use_shapes)
         rval = PyDict_New();
-    if (rval == NULL)
+    if (rval == NULL && !use_shapes)
         return NULL;
 
     /* skip whitespace after { */
@@ -715,18 +884,45 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
                 raise_errmsg("Expecting property name enclosed in double quotes", pystr, idx);
                 goto bail;
             }
-            key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
-            if (key == NULL)
-                goto bail;
-            memokey = PyDict_SetDefault(s->memo, key, key);
-            if (memokey == NULL) {
-                goto bail;
+            if (shape != NULL && nkeys < PyList_GET_SIZE(shape) &&
+                _match_plain_key(pystr, idx + 1,
+                                 PyList_GET_ITEM(shape, nkeys), &next_idx)) {
+                key = PyList_GET_ITEM(shape, nkeys);
+                Py_INCREF(key);
+            }
+            else {
+                /* The object does not have the expected shape */
+                Py_CLEAR(shape);
+                key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
+                if (key == NULL)
+                    goto bail;
+                if (s->key_cache_size > 0)
+                    PyUnicode_InternInPlace(&key);
+                memokey = PyDict_SetDefault(s->memo, key, key);
+                if (memokey == NULL) {
+                    goto bail;
+                }
+                Py_INCREF(memokey);
+                Py_DECREF(key);
+                key = memokey;
             }
-            Py_INCREF(memokey);
-            Py_DECREF(key);
-            key = memokey;
             idx = next_idx;
 
+            if (rval == NULL) {
+                first_key = key;
+                Py_INCREF(first_key);
+                shape = PyDict_GetItemWithError(s->shapes, first_key);
+                if (shape == NULL && PyErr_Occurred())
+                    goto bail;
+                /* Keep a reference: nested objects can replace the shape */
+                Py_XINCREF(shape);
+                rval = _PyDict_NewPresized(
+                    shape == NULL ? 0 : PyList_GET_SIZE(shape));
+                if (rval == NULL)
+                    goto bail;
+            }
+            nkeys++;
+
             /* skip whitespace between key and : delimiter, read :, skip whitespace */
             while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
             if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ':') {
@@ -780,6 +976,20 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
 
     *next_idx_ptr = idx + 1;
 
+    if (use_shapes) {
+        if (rval == NULL) {
+            rval = PyDict_New();
+            if (rval == NULL)
+                goto bail;
+        }
+        else if (shape == NULL || nkeys != PyList_GET_SIZE(shape)) {
+            if (_store_shape(s, first_key, rval) < 0)
+                goto bail;
+        }
+        Py_CLEAR(first_key);
+        Py_CLEAR(shape);
+    }
+
     if (has_pairs_hook) {
         val = PyObject_CallOneArg(s->object_pairs_hook, rval);
         Py_DECREF(rval);
@@ -797,6 +1007,8 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     Py_XDECREF(key);
     Py_XDECREF(val);
     Py_XDECREF(rval);
+    Py_XDECREF(first_key);
+    Py_XDECREF(shape);
     return NULL;
 }
 
@@ -1130,76 +1342,588 @@ scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_
     return _match_number_unicode(s, pystr, idx, next_idx_ptr);
 }
 
+/* Kinds of the decoding plans compiled by json.decoder._compile_schema() */
+#define PLAN_SCALAR 0
+#define PLAN_ARRAY 1
+#define PLAN_MAP 2
+#define PLAN_OBJECT 3
+
 static PyObject *
-scanner_call(PyScannerObject *self, PyObject *args, PyObject *kwds)
-{
-    /* Python callable interface to scan_once_{str,unicode} */
-    PyObject *pystr;
-    PyObject *rval;
-    Py_ssize_t idx;
-    Py_ssize_t next_idx = -1;
-    static char *kwlist[] = {"string", "idx", NULL};
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:scan_once", kwlist, &pystr, &idx))
-        return NULL;
+_parse_typed(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, PyObject *plan, Py_ssize_t *next_idx_ptr);
 
-    if (PyUnicode_Check(pystr)) {
-        rval = scan_once_unicode(self, pystr, idx, &next_idx);
+static int
+_check_plan(PyObject *plan, long *kind)
+{
+    if (!PyTuple_Check(plan) || PyTuple_GET_SIZE(plan) != 3) {
+        PyErr_SetString(PyExc_TypeError, "invalid JSON schema plan");
+        return -1;
     }
+    *kind = PyLong_AsLong(PyTuple_GET_ITEM(plan, 0));
+    if (*kind == -1 && PyErr_Occurred())
+        return -1;
+    if (*kind == PLAN_OBJECT) {
+        PyObject *body = PyTuple_GET_ITEM(plan, 2);
+        if (!PyList_Check(body) || PyList_GET_SIZE(body) != 6 ||
+            !PyDict_Check(PyList_GET_ITEM(body, 3)) ||
+            !PyTuple_Check(PyList_GET_ITEM(body, 4)) ||
+            !PyTuple_Check(PyList_GET_ITEM(body, 5)) ||
+            PyTuple_GET_SIZE(PyList_GET_ITEM(body, 4)) !=
+                PyTuple_GET_SIZE(PyList_GET_ITEM(body, 5)))
+        {
+            PyErr_SetString(PyExc_TypeError, "invalid JSON schema plan");
+            return -1;
+        }
+    }
+    else if (*kind < PLAN_SCALAR || *kind > PLAN_OBJECT) {
+        PyErr_SetString(PyExc_TypeError, "invalid JSON schema plan");
+        return -1;
+    }
+    return 0;
+}
+
+static void
+raise_errmsg_format(PyObject *s, Py_ssize_t end, const char *format, ...)
+{
+    PyObject *msg;
+    const char *utf8;
+    va_list vargs;
+
+#ifdef HAVE_STDARG_PROTOTYPES
+    va_start(vargs, format);
+#else
+    va_start(vargs);
+#endif
+    msg = PyUnicode_FromFormatV(format, vargs);
+    va_end(vargs);
+    if (msg == NULL)
+        return;
+    utf8 = PyUnicode_AsUTF8(msg);
+    if (utf8 != NULL)
+        raise_errmsg(utf8, s, end);
+    Py_DECREF(msg);
+}
+
+static PyObject *
+_check_scalar(PyObject *pystr, Py_ssize_t idx, PyObject *cls, PyObject *val)
+{
+    /* Check that val, decoded at idx, is an instance of cls.
+       Steals the reference to val. */
+    int r;
+    if ((PyObject *)Py_TYPE(val) == cls)
+        return val;
+    if (cls == (PyObject *)&PyFloat_Type && PyLong_CheckExact(val)) {
+        PyObject *res = PyNumber_Float(val);
+        Py_DECREF(val);
+        return res;
+    }
+    if (PyBool_Check(val) && (cls == (PyObject *)&PyLong_Type ||
+                              cls == (PyObject *)&PyFloat_Type))
+        r = 0;
     else {
-        PyErr_Format(PyExc_TypeError,
-                 "first argument must be a string, not %.80s",
-                 Py_TYPE(pystr)->tp_name);
-        return NULL;
+        r = PyObject_IsInstance(val, cls);
+        if (r < 0) {
+            Py_DECREF(val);
+            return NULL;
+        }
     }
-    PyDict_Clear(self->memo);
-    if (rval == NULL)
-        return NULL;
-    return _build_rval_index_tuple(rval, next_idx);
+    Py_DECREF(val);
+    if (!r) {
+        if (PyType_Check(cls))
+            raise_errmsg_format(pystr, idx, "Expecting %s",
+                                ((PyTypeObject *)cls)->tp_name);
+        else
+            raise_errmsg_format(pystr, idx, "Expecting %R", cls);
+    }
+    return NULL;
 }
 
 static PyObject *
-scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+_parse_typed_array(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, PyObject *plan, Py_ssize_t *next_idx_ptr)
 {
-    PyScannerObject *s;
-    PyObject *ctx;
-    PyObject *strict;
-    static char *kwlist[] = {"context", NULL};
+    /* Read a JSON array whose items are decoded with plan.
+    idx is the index of the first character after the opening brace. */
+    const void *str = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_KIND(pystr);
+    Py_ssize_t end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    PyObject *val = NULL;
+    PyObject *rval;
+    Py_ssize_t next_idx;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:make_scanner", kwlist, &ctx))
+    rval = PyList_New(0);
+    if (rval == NULL)
         return NULL;
 
-    s = (PyScannerObject *)type->tp_alloc(type, 0);
-    if (s == NULL) {
-        return NULL;
-    }
+    /* skip whitespace after [ */
+    while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
 
-    s->memo = PyDict_New();
-    if (s->memo == NULL)
-        goto bail;
+    /* only loop if the array is non-empty */
+    if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ']') {
+        while (1) {
+            val = _parse_typed(s, pystr, idx, plan, &next_idx);
+            if (val == NULL)
+                goto bail;
+            if (PyList_Append(rval, val) == -1)
+                goto bail;
+            Py_CLEAR(val);
+            idx = next_idx;
 
-    /* All of these will fail "gracefully" so we don't need to verify them */
-    strict = PyObject_GetAttrString(ctx, "strict");
-    if (strict == NULL)
-        goto bail;
-    s->strict = PyObject_IsTrue(strict);
-    Py_DECREF(strict);
-    if (s->strict < 0)
-        goto bail;
-    s->object_hook = PyObject_GetAttrString(ctx, "object_hook");
-    if (s->object_hook == NULL)
-        goto bail;
-    s->object_pairs_hook = PyObject_GetAttrString(ctx, "object_pairs_hook");
-    if (s->object_pairs_hook == NULL)
-        goto bail;
-    s->parse_float = PyObject_GetAttrString(ctx, "parse_float");
-    if (s->parse_float == NULL)
-        goto bail;
-    s->parse_int = PyObject_GetAttrString(ctx, "parse_int");
-    if (s->parse_int == NULL)
-        goto bail;
-    s->parse_constant = PyObject_GetAttrString(ctx, "parse_constant");
+            /* skip whitespace between term and , */
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            /* bail if the array is closed or we didn't get the , delimiter */
+            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']')
+                break;
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
+                raise_errmsg("Expecting ',' delimiter", pystr, idx);
+                goto bail;
+            }
+            idx++;
+
+            /* skip whitespace after , */
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+        }
+    }
+    *next_idx_ptr = idx + 1;
+    return rval;
+bail:
+    Py_XDECREF(val);
+    Py_DECREF(rval);
+    return NULL;
+}
+
+static PyObject *
+_build_typed_object(PyObject *pystr, Py_ssize_t start, PyObject *body,
+                    PyObject **values, Py_ssize_t nfields, Py_ssize_t nvalues)
+{
+    /* Check that the required fields are set, and call the class with
+       the values set as keyword arguments */
+    PyObject *cls = PyList_GET_ITEM(body, 0);
+    PyObject *names = PyList_GET_ITEM(body, 4);
+    PyObject *required = PyList_GET_ITEM(body, 5);
+    PyObject *kwnames;
+    PyObject *rval;
+    Py_ssize_t i, j;
+
+    if (nvalues != nfields) {
+        for (i = 0; i < nfields; i++) {
+            if (values[i] == NULL && PyTuple_GET_ITEM(required, i) == Py_True) {
+                raise_errmsg_format(pystr, start, "Missing key %R",
+                                    PyTuple_GET_ITEM(names, i));
+                return NULL;
+            }
+        }
+        /* Pack the values which are set */
+        kwnames = PyTuple_New(nvalues);
+        if (kwnames == NULL)
+            return NULL;
+        for (i = j = 0; i < nfields; i++) {
+            if (values[i] != NULL) {
+                PyObject *name = PyTuple_GET_ITEM(names, i);
+                Py_INCREF(name);
+                PyTuple_SET_ITEM(kwnames, j, name);
+                values[j++] = values[i];
+                if (j <= i)
+                    values[i] = NULL;
+            }
+        }
+    }
+    else {
+        kwnames = names;
+        Py_INCREF(kwnames);
+    }
+    rval = PyObject_Vectorcall(cls, values, 0, nvalues ? kwnames : NULL);
+    Py_DECREF(kwnames);
+    return rval;
+}
+
+static PyObject *
+_parse_typed_object(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, PyObject *plan, long plan_kind, Py_ssize_t *next_idx_ptr)
+{
+    /* Read a JSON object decoded with a map or object plan.
+    idx is the index of the first character after the opening curly brace.
+    */
+    const void *str = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_KIND(pystr);
+    Py_ssize_t end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    Py_ssize_t start = idx - 1;
+    PyObject *body = NULL;
+    PyObject *fields = NULL;
+    PyObject *value_plan = NULL;
+    PyObject *small_values[16];
+    PyObject **values = NULL;
+    PyObject *rval = NULL;
+    PyObject *key = NULL;
+    PyObject *val = NULL;
+    Py_ssize_t nfields = 0, nvalues = 0, i;
+    int is_dict = 1, ignore_unknown = 0;
+    Py_ssize_t next_idx;
+
+    if (plan_kind == PLAN_MAP) {
+        value_plan = PyTuple_GET_ITEM(plan, 2);
+    }
+    else {
+        body = PyTuple_GET_ITEM(plan, 2);
+        /* Keep a reference: the plan can be shared */
+        Py_INCREF(body);
+        is_dict = PyObject_IsTrue(PyList_GET_ITEM(body, 1));
+        if (is_dict < 0)
+            goto bail;
+        ignore_unknown = PyObject_IsTrue(PyList_GET_ITEM(body, 2));
+        if (ignore_unknown < 0)
+            goto bail;
+        fields = PyList_GET_ITEM(body, 3);
+        nfields = PyTuple_GET_SIZE(PyList_GET_ITEM(body, 4));
+        if (!is_dict) {
+            if (nfields <= (Py_ssize_t)Py_ARRAY_LENGTH(small_values))
+                values = small_values;
+            else {
+                values = PyMem_New(PyObject *, nfields);
+                if (values == NULL) {
+                    PyErr_NoMemory();
+                    goto bail;
+                }
+            }
+            for (i = 0; i < nfields; i++)
+                values[i] = NULL;
+        }
+    }
+    if (is_dict) {
+        rval = _PyDict_NewPresized(nfields);
+        if (rval == NULL)
+            goto bail;
+    }
+
+    /* skip whitespace after { */
+    while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind,str, idx))) idx++;
+
+    /* only loop if the object is non-empty */
+    if (idx > end_idx || PyUnicode_READ(kind, str, idx) != '}') {
+        while (1) {
+            Py_ssize_t index = -1;
+
+            /* read key */
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != '"') {
+                raise_errmsg("Expecting property name enclosed in double quotes", pystr, idx);
+                goto bail;
+            }
+            key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
+            if (key == NULL)
+                goto bail;
+            if (fields == NULL) {
+                PyObject *memokey = PyDict_SetDefault(s->memo, key, key);
+                if (memokey == NULL)
+                    goto bail;
+                Py_INCREF(memokey);
+                Py_SETREF(key, memokey);
+            }
+            else {
+                PyObject *field = PyDict_GetItemWithError(fields, key);
+                if (field == NULL) {
+                    if (PyErr_Occurred())
+                        goto bail;
+                    if (!ignore_unknown) {
+                        raise_errmsg_format(pystr, idx, "Unknown key %R", key);
+                        goto bail;
+                    }
+                    value_plan = Py_None;
+                }
+                else {
+                    if (!PyTuple_Check(field) || PyTuple_GET_SIZE(field) != 2) {
+                        PyErr_SetString(PyExc_TypeError,
+                                        "invalid JSON schema plan");
+                        goto bail;
+                    }
+                    index = PyLong_AsSsize_t(PyTuple_GET_ITEM(field, 0));
+                    if (index < 0 || index >= nfields) {
+                        if (!PyErr_Occurred())
+                            PyErr_SetString(PyExc_TypeError,
+                                            "invalid JSON schema plan");
+                        goto bail;
+                    }
+                    value_plan = PyTuple_GET_ITEM(field, 1);
+                    /* Use the field name from the class */
+                    Py_INCREF(PyTuple_GET_ITEM(PyList_GET_ITEM(body, 4), index));
+                    Py_SETREF(key, PyTuple_GET_ITEM(PyList_GET_ITEM(body, 4), index));
+                }
+            }
+            idx = next_idx;
+
+            /* skip whitespace between key and : delimiter, read :, skip whitespace */
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ':') {
+                raise_errmsg("Expecting ':' delimiter", pystr, idx);
+                goto bail;
+            }
+            idx++;
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            val = _parse_typed(s, pystr, idx, value_plan, &next_idx);
+            if (val == NULL)
+                goto bail;
+
+            if (fields != NULL && index < 0) {
+                /* Ignored key */
+                Py_CLEAR(val);
+            }
+            else if (is_dict) {
+                if (PyDict_SetItem(rval, key, val) < 0)
+                    goto bail;
+                Py_CLEAR(val);
+            }
+            else {
+                if (values[index] == NULL)
+                    nvalues++;
+                Py_XSETREF(values[index], val);
+                val = NULL;
+            }
+            Py_CLEAR(key);
+            idx = next_idx;
+
+            /* skip whitespace before } or , */
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+
+            /* bail if the object is closed or we didn't get the , delimiter */
+            if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == '}')
+                break;
+            if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
+                raise_errmsg("Expecting ',' delimiter", pystr, idx);
+                goto bail;
+            }
+            idx++;
+
+            /* skip whitespace after , delimiter */
+            while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
+        }
+    }
+    *next_idx_ptr = idx + 1;
+
+    if (body != NULL) {
+        if (is_dict) {
+            if (PyDict_GET_SIZE(rval) != nfields) {
+                PyObject *names = PyList_GET_ITEM(body, 4);
+                PyObject *required = PyList_GET_ITEM(body, 5);
+                for (i = 0; i < nfields; i++) {
+                    PyObject *name = PyTuple_GET_ITEM(names, i);
+                    int r;
+                    if (PyTuple_GET_ITEM(required, i) != Py_True)
+                        continue;
+                    r = PyDict_Contains(rval, name);
+                    if (r < 0)
+                        goto bail;
+                    if (!r) {
+                        raise_errmsg_format(pystr, start, "Missing key %R",
+                                            name);
+                        goto bail;
+                    }
+                }
+            }
+        }
+        else {
+            rval = _build_typed_object(pystr, start, body,
+                                       values, nfields, nvalues);
+            if (rval == NULL)
+                goto bail;
+        }
+    }
+    goto done;
+bail:
+    Py_CLEAR(rval);
+done:
+    Py_XDECREF(key);
+    Py_XDECREF(val);
+    if (values != NULL) {
+        for (i = 0; i < nfields; i++)
+            Py_XDECREF(values[i]);
+        if (values != small_values)
+            PyMem_Free(values);
+    }
+    Py_XDECREF(body);
+    return rval;
+}
+
+static PyObject *
+_parse_typed(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, PyObject *plan, Py_ssize_t *next_idx_ptr)
+{
+    /* Read one JSON term from PyUnicode pystr and decode it with plan,
+    as compiled by json.decoder._compile_schema().
+    idx is the index of the first character of the term
+    *next_idx_ptr is a return-by-reference index to the first character after
+        the term.
+
+    Returns a new PyObject representation of the term.
+    */
+    const void *str;
+    int kind;
+    Py_ssize_t length;
+    long plan_kind;
+    Py_UCS4 c;
+    PyObject *res;
+
+    if (plan == Py_None)
+        return scan_once_unicode(s, pystr, idx, next_idx_ptr);
+    if (_check_plan(plan, &plan_kind) < 0)
+        return NULL;
+
+    if (PyUnicode_READY(pystr) == -1)
+        return NULL;
+    str = PyUnicode_DATA(pystr);
+    kind = PyUnicode_KIND(pystr);
+    length = PyUnicode_GET_LENGTH(pystr);
+    if (idx < 0) {
+        PyErr_SetString(PyExc_ValueError, "idx cannot be negative");
+        return NULL;
+    }
+    if (idx >= length) {
+        raise_stop_iteration(idx);
+        return NULL;
+    }
+    c = PyUnicode_READ(kind, str, idx);
+
+    /* Optional values */
+    if (c == 'n' && PyTuple_GET_ITEM(plan, 1) == Py_True &&
+        (idx + 3 < length) && PyUnicode_READ(kind, str, idx + 1) == 'u' &&
+        PyUnicode_READ(kind, str, idx + 2) == 'l' &&
+        PyUnicode_READ(kind, str, idx + 3) == 'l')
+    {
+        *next_idx_ptr = idx + 4;
+        Py_RETURN_NONE;
+    }
+
+    switch (plan_kind) {
+        case PLAN_SCALAR:
+            res = scan_once_unicode(s, pystr, idx, next_idx_ptr);
+            if (res == NULL)
+                return NULL;
+            return _check_scalar(pystr, idx, PyTuple_GET_ITEM(plan, 2), res);
+        case PLAN_ARRAY:
+            if (c != '[') {
+                raise_errmsg("Expecting array", pystr, idx);
+                return NULL;
+            }
+            if (Py_EnterRecursiveCall(" while decoding a JSON array "
+                                      "from a unicode string"))
+                return NULL;
+            res = _parse_typed_array(s, pystr, idx + 1,
+                                     PyTuple_GET_ITEM(plan, 2), next_idx_ptr);
+            Py_LeaveRecursiveCall();
+            return res;
+        default:
+            if (c != '{') {
+                raise_errmsg("Expecting object", pystr, idx);
+                return NULL;
+            }
+            if (Py_EnterRecursiveCall(" while decoding a JSON object "
+                                      "from a unicode string"))
+                return NULL;
+            res = _parse_typed_object(s, pystr, idx + 1, plan, plan_kind,
+                                      next_idx_ptr);
+            Py_LeaveRecursiveCall();
+            return res;
+    }
+}
+
+static PyObject *
+scanner_call(PyScannerObject *self, PyObject *args, PyObject *kwds)
+{
+    /* Python callable interface to scan_once_{str,unicode} */
+    PyObject *pystr;
+    PyObject *rval;
+    Py_ssize_t idx;
+    Py_ssize_t next_idx = -1;
+    static char *kwlist[] = {"string", "idx", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:scan_once", kwlist, &pystr, &idx))
+        return NULL;
+
+    if (PyUnicode_Check(pystr)) {
+        rval = _parse_typed(self, pystr, idx, self->schema_plan, &next_idx);
+    }
+    else {
+        PyErr_Format(PyExc_TypeError,
+                 "first argument must be a string, not %.80s",
+                 Py_TYPE(pystr)->tp_name);
+        return NULL;
+    }
+    /* The memo is only kept across calls up to key_cache_size keys */
+    if (PyDict_GET_SIZE(self->memo) > self->key_cache_size) {
+        PyDict_Clear(self->memo);
+        PyDict_Clear(self->shapes);
+    }
+    if (rval == NULL)
+        return NULL;
+    return _build_rval_index_tuple(rval, next_idx);
+}
+
+static PyObject *
+scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    PyScannerObject *s;
+    PyObject *ctx;
+    PyObject *strict;
+    PyObject *key_cache_size;
+    static char *kwlist[] = {"context", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:make_scanner", kwlist, &ctx))
+        return NULL;
+
+    s = (PyScannerObject *)type->tp_alloc(type, 0);
+    if (s == NULL) {
+        return NULL;
+    }
+
+    s->memo = PyDict_New();
+    if (s->memo == NULL)
+        goto bail;
+    s->shapes = PyDict_New();
+    if (s->shapes == NULL)
+        goto bail;
+
+    /* All of these will fail "gracefully" so we don't need to verify them */
+    strict = PyObject_GetAttrString(ctx, "strict");
+    if (strict == NULL)
+        goto bail;
+    s->strict = PyObject_IsTrue(strict);
+    Py_DECREF(strict);
+    if (s->strict < 0)
+        goto bail;
+    s->object_hook = PyObject_GetAttrString(ctx, "object_hook");
+    if (s->object_hook == NULL)
+        goto bail;
+    s->object_pairs_hook = PyObject_GetAttrString(ctx, "object_pairs_hook");
+    if (s->object_pairs_hook == NULL)
+        goto bail;
+    s->parse_float = PyObject_GetAttrString(ctx, "parse_float");
+    if (s->parse_float == NULL)
+        goto bail;
+    s->parse_int = PyObject_GetAttrString(ctx, "parse_int");
+    if (s->parse_int == NULL)
+        goto bail;
+    s->parse_constant = PyObject_GetAttrString(ctx, "parse_constant");
     if (s->parse_constant == NULL)
         goto bail;
+    /* Older contexts do not have key_cache_size */
+    key_cache_size = PyObject_GetAttrString(ctx, "key_cache_size");
+    if (key_cache_size == NULL) {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+            goto bail;
+        PyErr_Clear();
+        s->key_cache_size = 0;
+    }
+    else {
+        s->key_cache_size = PyNumber_AsSsize_t(key_cache_size,
+                                               PyExc_OverflowError);
+        Py_DECREF(key_cache_size);
+        if (s->key_cache_size == -1 && PyErr_Occurred())
+            goto bail;
+    }
+    /* Without a schema, schema_plan is None */
+    s->schema_plan = PyObject_GetAttrString(ctx, "_schema_plan");
+    if (s->schema_plan == NULL) {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+            goto bail;
+        PyErr_Clear();
+        Py_INCREF(Py_None);
+        s->schema_plan = Py_None;
+    }
 
     return (PyObject *)s;
 
@@ -1229,6 +1953,187 @@ static PyType_Spec PyScannerType_spec = {
     .slots = PyScannerType_slots,
 };
 
+static int
+writer_init(_JSONWriter *writer, int binary, PyObject *write)
+{
+    writer->binary = binary;
+    writer->write = write;
+    writer->acc.large = NULL;
+    writer->acc.small = NULL;
+    writer->acc_len = 0;
+    writer->buffer = NULL;
+    writer->size = 0;
+    if (binary) {
+        /* The buffer is allocated lazily */
+        return 0;
+    }
+    return _PyAccu_Init(&writer->acc);
+}
+
+static void
+writer_destroy(_JSONWriter *writer)
+{
+    _PyAccu_Destroy(&writer->acc);
+    Py_CLEAR(writer->buffer);
+}
+
+static int
+writer_flush(_JSONWriter *writer)
+{
+    /* Pass the pending output to writer->write() */
+    PyObject *data, *res;
+
+    if (writer->binary) {
+        if (writer->size == 0)
+            return 0;
+        /* Shrinking the buffer does not copy it */
+        if (_PyBytes_Resize(&writer->buffer, writer->size) < 0)
+            return -1;
+        data = writer->buffer;
+        writer->buffer = NULL;
+        writer->size = 0;
+    }
+    else {
+        if (writer->acc_len == 0)
+            return 0;
+        data = _PyAccu_Finish(&writer->acc);
+        writer->acc_len = 0;
+        if (data == NULL)
+            return -1;
+        if (_PyAccu_Init(&writer->acc)) {
+            Py_DECREF(data);
+            return -1;
+        }
+    }
+    res = PyObject_CallOneArg(writer->write, data);
+    Py_DECREF(data);
+    if (res == NULL)
+        return -1;
+    Py_DECREF(res);
+    return 0;
+}
+
+static PyObject *
+writer_finish(_JSONWriter *writer)
+{
+    /* Return the output: None if it was passed to writer->write(), the
+       bytes object if binary, and the list of fragments otherwise */
+    PyObject *res;
+
+    if (writer->write != NULL) {
+        if (writer_flush(writer))
+            return NULL;
+        Py_RETURN_NONE;
+    }
+    if (!writer->binary)
+        return _PyAccu_FinishAsList(&writer->acc);
+    if (writer->buffer == NULL)
+        return PyBytes_FromStringAndSize(NULL, 0);
+    if (_PyBytes_Resize(&writer->buffer, writer->size) < 0)
+        return NULL;
+    res = writer->buffer;
+    writer->buffer = NULL;
+    return res;
+}
+
+static char *
+writer_reserve(_JSONWriter *writer, Py_ssize_t n)
+{
+    /* Return a pointer to at least n free bytes at the end of the binary
+       output.  writer_commit() must be called once they are filled. */
+    Py_ssize_t allocated, newsize;
+
+    assert(writer->binary);
+    allocated = writer->buffer == NULL ? 0 : PyBytes_GET_SIZE(writer->buffer);
+    if (n > allocated - writer->size) {
+        if (n > PY_SSIZE_T_MAX - writer->size) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        newsize = writer->size + n;
+        /* Overallocate to amortize the cost of resizing */
+        if (allocated <= PY_SSIZE_T_MAX / 2 && newsize < allocated * 2)
+            newsize = allocated * 2;
+        if (writer->buffer == NULL) {
+            newsize = Py_MAX(newsize, writer->write != NULL ?
+                                      WRITER_CHUNK_SIZE + 1024 : 1024);
+            writer->buffer = PyBytes_FromStringAndSize(NULL, newsize);
+            if (writer->buffer == NULL)
+                return NULL;
+        }
+        else if (_PyBytes_Resize(&writer->buffer, newsize) < 0) {
+            return NULL;
+        }
+    }
+    return PyBytes_AS_STRING(writer->buffer) + writer->size;
+}
+
+static int
+writer_commit(_JSONWriter *writer, Py_ssize_t n)
+{
+    /* Add n bytes filled after writer_reserve() to the binary output */
+    writer->size += n;
+    if (writer->write != NULL && writer->size >= WRITER_CHUNK_SIZE)
+        return writer_flush(writer);
+    return 0;
+}
+
+static int
+writer_write(_JSONWriter *writer, PyObject *unicode)
+{
+    /* Append the str unicode to the output */
+    PyObject *encoded;
+    Py_ssize_t size;
+    const char *data;
+    char *output;
+    int rval;
+
+    if (!writer->binary) {
+        if (_PyAccu_Accumulate(&writer->acc, unicode))
+            return -1;
+        if (writer->write != NULL) {
+            writer->acc_len += PyUnicode_GET_LENGTH(unicode);
+            if (writer->acc_len >= WRITER_CHUNK_SIZE)
+                return writer_flush(writer);
+        }
+        return 0;
+    }
+
+    if (PyUnicode_READY(unicode) == -1)
+        return -1;
+    if (PyUnicode_IS_ASCII(unicode)) {
+        size = PyUnicode_GET_LENGTH(unicode);
+        output = writer_reserve(writer, size);
+        if (output == NULL)
+            return -1;
+        memcpy(output, PyUnicode_1BYTE_DATA(unicode), size);
+        return writer_commit(writer, size);
+    }
+    encoded = PyUnicode_AsUTF8String(unicode);
+    if (encoded == NULL)
+        return -1;
+    size = PyBytes_GET_SIZE(encoded);
+    data = PyBytes_AS_STRING(encoded);
+    output = writer_reserve(writer, size);
+    if (output == NULL) {
+        Py_DECREF(encoded);
+        return -1;
+    }
+    memcpy(output, data, size);
+    Py_DECREF(encoded);
+    rval = writer_commit(writer, size);
+    return rval;
+}
+
+static int
+_steal_write(_JSONWriter *writer, PyObject *stolen)
+{
+    /* Append stolen and then decrement its reference count */
+    int rval = writer_write(writer, stolen);
+    Py_DECREF(stolen);
+    return rval;
+}
+
 static PyObject *
 encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
@@ -1290,17 +2195,67 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
     static char *kwlist[] = {"obj", "_current_indent_level", NULL};
     PyObject *obj;
     Py_ssize_t indent_level;
-    _PyAccu acc;
+    _JSONWriter writer;
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
         &obj, &indent_level))
         return NULL;
-    if (_PyAccu_Init(&acc))
+    if (writer_init(&writer, 0, NULL))
+        return NULL;
+    if (encoder_listencode_obj(self, &writer, obj, indent_level)) {
+        writer_destroy(&writer);
+        return NULL;
+    }
+    return writer_finish(&writer);
+}
+
+PyDoc_STRVAR(encoder_encode_bytes_doc,
+"encode_bytes(obj) -> bytes\n\
+\n\
+Return the UTF-8 encoded JSON representation of obj.");
+
+static PyObject *
+encoder_encode_bytes(PyEncoderObject *self, PyObject *obj)
+{
+    _JSONWriter writer;
+    PyObject *rval;
+
+    if (writer_init(&writer, 1, NULL))
         return NULL;
-    if (encoder_listencode_obj(self, &acc, obj, indent_level)) {
-        _PyAccu_Destroy(&acc);
+    if (encoder_listencode_obj(self, &writer, obj, 0)) {
+        writer_destroy(&writer);
         return NULL;
     }
-    return _PyAccu_FinishAsList(&acc);
+    rval = writer_finish(&writer);
+    writer_destroy(&writer);
+    return rval;
+}
+
+PyDoc_STRVAR(encoder_dump_doc,
+"dump(obj, write, binary=False)\n\
+\n\
+Pass the JSON representation of obj to write() in large blocks,\n\
+as UTF-8 encoded bytes if binary is true and as str otherwise.");
+
+static PyObject *
+encoder_dump(PyEncoderObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"obj", "write", "binary", NULL};
+    PyObject *obj, *write, *rval;
+    int binary = 0;
+    _JSONWriter writer;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|p:dump", kwlist,
+        &obj, &write, &binary))
+        return NULL;
+    if (writer_init(&writer, binary, write))
+        return NULL;
+    if (encoder_listencode_obj(self, &writer, obj, 0)) {
+        writer_destroy(&writer);
+        return NULL;
+    }
+    rval = writer_finish(&writer);
+    writer_destroy(&writer);
+    return rval;
 }
 
 static PyObject *
@@ -1384,16 +2339,46 @@ encoder_encode_string(PyEncoderObject *s, PyObject *obj)
 }
 
 static int
-_steal_accumulate(_PyAccu *acc, PyObject *stolen)
+encoder_write_string(PyEncoderObject *s, _JSONWriter *writer, PyObject *obj)
 {
-    /* Append stolen and then decrement its reference count */
-    int rval = _PyAccu_Accumulate(acc, stolen);
-    Py_DECREF(stolen);
-    return rval;
+    /* Append the JSON representation of a string to the output */
+    PyObject *encoded;
+
+    if (writer->binary && s->fast_encode) {
+        /* Escape the string directly into the output buffer when the
+           result is ASCII-only */
+        Py_ssize_t size;
+        Py_UCS1 *output;
+
+        if (PyUnicode_READY(obj) == -1)
+            return -1;
+        if (s->fast_encode == (PyCFunction)py_encode_basestring_ascii) {
+            size = ascii_escape_size(obj);
+            if (size < 0)
+                return -1;
+            output = (Py_UCS1 *)writer_reserve(writer, size);
+            if (output == NULL)
+                return -1;
+            return writer_commit(writer, ascii_escape_fill(obj, output));
+        }
+        if (PyUnicode_IS_ASCII(obj)) {
+            size = escape_unicode_size(obj);
+            if (size < 0)
+                return -1;
+            output = (Py_UCS1 *)writer_reserve(writer, size);
+            if (output == NULL)
+                return -1;
+            return writer_commit(writer, escape_ascii_fill(obj, output));
+        }
+    }
+    encoded = encoder_encode_string(s, obj);
+    if (encoded == NULL)
+        return -1;
+    return _steal_write(writer, encoded);
 }
 
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_obj(PyEncoderObject *s, _JSONWriter *writer,
                        PyObject *obj, Py_ssize_t indent_level)
 {
     /* Encode Python object obj to a JSON term */
@@ -1404,38 +2389,35 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
         PyObject *cstr = _encoded_const(obj);
         if (cstr == NULL)
             return -1;
-        return _steal_accumulate(acc, cstr);
+        return _steal_write(writer, cstr);
     }
     else if (PyUnicode_Check(obj))
     {
-        PyObject *encoded = encoder_encode_string(s, obj);
-        if (encoded == NULL)
-            return -1;
-        return _steal_accumulate(acc, encoded);
+        return encoder_write_string(s, writer, obj);
     }
     else if (PyLong_Check(obj)) {
         PyObject *encoded = PyLong_Type.tp_repr(obj);
         if (encoded == NULL)
             return -1;
-        return _steal_accumulate(acc, encoded);
+        return _steal_write(writer, encoded);
     }
     else if (PyFloat_Check(obj)) {
         PyObject *encoded = encoder_encode_float(s, obj);
         if (encoded == NULL)
             return -1;
-        return _steal_accumulate(acc, encoded);
+        return _steal_write(writer, encoded);
     }
     else if (PyList_Check(obj) || PyTuple_Check(obj)) {
         if (Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_list(s, acc, obj, indent_level);
+        rv = encoder_listencode_list(s, writer, obj, indent_level);
         Py_LeaveRecursiveCall();
         return rv;
     }
     else if (PyDict_Check(obj)) {
         if (Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_dict(s, acc, obj, indent_level);
+        rv = encoder_listencode_dict(s, writer, obj, indent_level);
         Py_LeaveRecursiveCall();
         return rv;
     }
@@ -1469,7 +2451,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
             Py_XDECREF(ident);
             return -1;
         }
-        rv = encoder_listencode_obj(s, acc, newobj, indent_level);
+        rv = encoder_listencode_obj(s, writer, newobj, indent_level);
         Py_LeaveRecursiveCall();
 
         Py_DECREF(newobj);
@@ -1489,7 +2471,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
 }
 
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_dict(PyEncoderObject *s, _JSONWriter *writer,
                         PyObject *dct, Py_ssize_t indent_level)
 {
     /* Encode Python dict dct a JSON term */
@@ -1511,7 +2493,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
             return -1;
     }
     if (PyDict_GET_SIZE(dct) == 0)  /* Fast path */
-        return _PyAccu_Accumulate(acc, empty_dict);
+        return writer_write(writer, empty_dict);
 
     if (s->markers != Py_None) {
         int has_key;
@@ -1529,7 +2511,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_dict))
+    if (writer_write(writer, open_dict))
         goto bail;
 
     if (s->indent != Py_None) {
@@ -1555,7 +2537,8 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         goto bail;
     idx = 0;
     while ((item = PyIter_Next(it)) != NULL) {
-        PyObject *encoded, *key, *value;
+        PyObject *key, *value;
+        int rv;
         if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
             PyErr_SetString(PyExc_ValueError, "items must return 2-tuples");
             goto bail;
@@ -1595,24 +2578,19 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
 
         if (idx) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (writer_write(writer, s->item_separator))
                 goto bail;
         }
 
-        encoded = encoder_encode_string(s, kstr);
+        rv = encoder_write_string(s, writer, kstr);
         Py_CLEAR(kstr);
-        if (encoded == NULL)
+        if (rv)
             goto bail;
-        if (_PyAccu_Accumulate(acc, encoded)) {
-            Py_DECREF(encoded);
-            goto bail;
-        }
-        Py_DECREF(encoded);
-        if (_PyAccu_Accumulate(acc, s->key_separator))
+        if (writer_write(writer, s->key_separator))
             goto bail;
 
         value = PyTuple_GET_ITEM(item, 1);
-        if (encoder_listencode_obj(s, acc, value, indent_level))
+        if (encoder_listencode_obj(s, writer, value, indent_level))
             goto bail;
         idx += 1;
         Py_DECREF(item);
@@ -1632,7 +2610,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
 
         yield '\n' + (' ' * (_indent * _current_indent_level))
     }*/
-    if (_PyAccu_Accumulate(acc, close_dict))
+    if (writer_write(writer, close_dict))
         goto bail;
     return 0;
 
@@ -1646,7 +2624,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
 
 
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_list(PyEncoderObject *s, _JSONWriter *writer,
                         PyObject *seq, Py_ssize_t indent_level)
 {
     /* Encode Python list seq to a JSON term */
@@ -1670,7 +2648,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         return -1;
     if (PySequence_Fast_GET_SIZE(s_fast) == 0) {
         Py_DECREF(s_fast);
-        return _PyAccu_Accumulate(acc, empty_array);
+        return writer_write(writer, empty_array);
     }
 
     if (s->markers != Py_None) {
@@ -1689,7 +2667,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_array))
+    if (writer_write(writer, open_array))
         goto bail;
     if (s->indent != Py_None) {
         /* TODO: DOES NOT RUN */
@@ -1703,10 +2681,10 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
         PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
         if (i) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (writer_write(writer, s->item_separator))
                 goto bail;
         }
-        if (encoder_listencode_obj(s, acc, obj, indent_level))
+        if (encoder_listencode_obj(s, writer, obj, indent_level))
             goto bail;
     }
     if (ident != NULL) {
@@ -1721,7 +2699,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
 
         yield '\n' + (' ' * (_indent * _current_indent_level))
     }*/
-    if (_PyAccu_Accumulate(acc, close_array))
+    if (writer_write(writer, close_array))
         goto bail;
     Py_DECREF(s_fast);
     return 0;
@@ -1771,6 +2749,14 @@ encoder_clear(PyEncoderObject *self)
 
 PyDoc_STRVAR(encoder_doc, "_iterencode(obj, _current_indent_level) -> iterable");
 
+static PyMethodDef encoder_methods[] = {
+    {"encode_bytes", (PyCFunction)encoder_encode_bytes, METH_O,
+     encoder_encode_bytes_doc},
+    {"dump", (PyCFunction)(void(*)(void))encoder_dump,
+     METH_VARARGS | METH_KEYWORDS, encoder_dump_doc},
+    {NULL, NULL, 0, NULL}
+};
+
 static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_doc, (void *)encoder_doc},
     {Py_tp_dealloc, encoder_dealloc},
@@ -1778,6 +2764,7 @@ static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_traverse, encoder_traverse},
     {Py_tp_clear, encoder_clear},
     {Py_tp_members, encoder_members},
+    {Py_tp_methods, encoder_methods},
     {Py_tp_new, encoder_new},
     {0, 0}
 };
@@ -640,12 +640,13 @@ typedef struct PicklerObject {
                                    is no frame currently open. */
 
     Py_ssize_t buf_size;        /* Size of the current buffered pickle data */
-    int fast;                   /* Enable fast mode if set to a true value.
-                                   The fast mode disable the usage of memo,
-                                   therefore speeding the pickling process by
-                                   not generating superfluous PUT opcodes. It
-                                   should not be used if with self-referential
-                                   objects. */
+    int fast;                   /* Disable the usage of memo if set to a
+                                   true value (memoize=False or the "fast
+                                   mode"), therefore speeding the pickling
+                                   process by not generating superfluous PUT
+                                   opcodes. Shared objects are pickled by
+                                   value, and recursive objects are detected
+                                   by fast_save_enter(). */
     int fast_nesting;
     int fix_imports;            /* Indicate whether Pickler should fix
                                    the name of globals for Python 2.x. */
@@ -785,6 +786,9 @@ PyMemoTable_Clear(PyMemoTable *self)
 {
     Py_ssize_t i = self->mt_allocated;
 
+    if (self->mt_used == 0)
+        return 0;
+
     while (--i >= 0) {
         Py_XDECREF(self->mt_table[i].me_key);
     }
@@ -1979,53 +1983,45 @@ whichmodule(PyObject *global, PyObject *dotted_path)
 }
 
 /* fast_save_enter() and fast_save_leave() are guards against recursive
-   objects when Pickler is used with the "fast mode" (i.e., with object
-   memoization disabled). If the nesting of a list or dict object exceed
-   FAST_NESTING_LIMIT, these guards will start keeping an internal
-   reference to the seen list or dict objects and check whether these objects
-   are recursive. These are not strictly necessary, since save() has a
-   hard-coded recursion limit, but they give a nicer error message than the
-   typical RuntimeError. */
+   objects when Pickler is used without memoization (i.e., with memoize=False
+   or the "fast mode"). If the nesting of objects exceeds FAST_NESTING_LIMIT,
+   these guards will start keeping an internal reference to the objects being
+   saved and check whether these objects are recursive. These are not
+   strictly necessary, since save() has a hard-coded recursion limit, but
+   they give a nicer error message than the typical RecursionError. */
 static int
 fast_save_enter(PicklerObject *self, PyObject *obj)
 {
-    /* if fast_nesting < 0, we're doing an error exit. */
     if (++self->fast_nesting >= FAST_NESTING_LIMIT) {
         PyObject *key = NULL;
         if (self->fast_memo == NULL) {
             self->fast_memo = PyDict_New();
-            if (self->fast_memo == NULL) {
-                self->fast_nesting = -1;
-                return 0;
-            }
+            if (self->fast_memo == NULL)
+                goto error;
         }
         key = PyLong_FromVoidPtr(obj);
-        if (key == NULL) {
-            self->fast_nesting = -1;
-            return 0;
-        }
+        if (key == NULL)
+            goto error;
         if (PyDict_GetItemWithError(self->fast_memo, key)) {
             Py_DECREF(key);
             PyErr_Format(PyExc_ValueError,
-                         "fast mode: can't pickle cyclic objects "
+                         "can't pickle cyclic objects without memoization, "
                          "including object type %.200s at %p",
                          Py_TYPE(obj)->tp_name, obj);
-            self->fast_nesting = -1;
-            return 0;
-        }
-        if (PyErr_Occurred()) {
-            Py_DECREF(key);
-            self->fast_nesting = -1;
-            return 0;
+            goto error;
         }
-        if (PyDict_SetItem(self->fast_memo, key, Py_None) < 0) {
+        if (PyErr_Occurred() ||
+            PyDict_SetItem(self->fast_memo, key, Py_None) < 0) {
             Py_DECREF(key);
-            self->fast_nesting = -1;
-            return 0;
+            goto error;
         }
         Py_DECREF(key);
     }
     return 1;
+
+  error:
+    self->fast_nesting--;
+    return 0;
 }
 
 static int
@@ -3045,9 +3041,6 @@ save_list(PicklerObject *self, PyObject *obj)
     Py_ssize_t len;
     int status = 0;
 
-    if (self->fast && !fast_save_enter(self, obj))
-        goto error;
-
     /* Create an empty list. */
     if (self->bin) {
         header[0] = EMPTY_LIST;
@@ -3095,9 +3088,6 @@ save_list(PicklerObject *self, PyObject *obj)
         status = -1;
     }
 
-    if (self->fast && !fast_save_leave(self, obj))
-        status = -1;
-
     return status;
 }
 
@@ -3306,9 +3296,6 @@ save_dict(PicklerObject *self, PyObject *obj)
     int status = 0;
     assert(PyDict_Check(obj));
 
-    if (self->fast && !fast_save_enter(self, obj))
-        goto error;
-
     /* Create an empty dict. */
     if (self->bin) {
         header[0] = EMPTY_DICT;
@@ -3360,9 +3347,6 @@ save_dict(PicklerObject *self, PyObject *obj)
         status = -1;
     }
 
-    if (self->fast && !fast_save_leave(self, obj))
-        status = -1;
-
     return status;
 }
 
@@ -3440,9 +3424,6 @@ save_frozenset(PicklerObject *self, PyObject *obj)
     const char mark_op = MARK;
     const char frozenset_op = FROZENSET;
 
-    if (self->fast && !fast_save_enter(self, obj))
-        return -1;
-
     if (self->proto < 4) {
         PyObject *items;
         PyObject *reduce_value;
@@ -4262,6 +4243,7 @@ save(PicklerObject *self, PyObject *obj, int pers_save)
     PyObject *reduce_func = NULL;
     PyObject *reduce_value = NULL;
     int status = 0;
+    int fast_entered = 0;
 
     if (_Pickler_OpcodeBoundary(self) < 0)
         return -1;
@@ -4303,7 +4285,7 @@ save(PicklerObject *self, PyObject *obj, int pers_save)
     /* Check the memo to see if it has the object. If so, generate
        a GET (or BINGET) opcode, instead of pickling the object
        once again. */
-    if (PyMemoTable_Get(self->memo, obj)) {
+    if (!self->fast && PyMemoTable_Get(self->memo, obj)) {
         return memo_get(self, obj);
     }
 
@@ -4319,6 +4301,13 @@ save(PicklerObject *self, PyObject *obj, int pers_save)
     if (Py_EnterRecursiveCall(" while pickling an object")) {
         return -1;
     }
+    if (self->fast) {
+        if (!fast_save_enter(self, obj)) {
+            Py_LeaveRecursiveCall();
+            return -1;
+        }
+        fast_entered = 1;
+    }
 
     if (type == &PyDict_Type) {
         status = save_dict(self, obj);
@@ -4477,6 +4466,8 @@ save(PicklerObject *self, PyObject *obj, int pers_save)
     }
   done:
 
+    if (fast_entered && !fast_save_leave(self, obj))
+        status = -1;
     Py_LeaveRecursiveCall();
     Py_XDECREF(reduce_func);
     Py_XDECREF(reduce_value);
@@ -4504,6 +4495,11 @@ dump(PicklerObject *self, PyObject *obj)
         Py_CLEAR(self->reducer_override);
     }
 
+    /* Forget the objects of a previous call which failed */
+    self->fast_nesting = 0;
+    if (self->fast_memo != NULL)
+        PyDict_Clear(self->fast_memo);
+
     if (self->proto >= 2) {
         char header[2];
 
@@ -4537,6 +4533,19 @@ dump(PicklerObject *self, PyObject *obj)
     return status;
 }
 
+static int
+Pickler_check_init(PicklerObject *self)
+{
+    if (self->memo == NULL) {
+        PickleState *st = _Pickle_GetGlobalState();
+        PyErr_Format(st->PicklingError,
+                     "Pickler.__init__() was not called by %s.__init__()",
+                     Py_TYPE(self)->tp_name);
+        return -1;
+    }
+    return 0;
+}
+
 /*[clinic input]
 
 _pickle.Pickler.clear_memo
@@ -4576,11 +4585,11 @@ _pickle_Pickler_dump(PicklerObject *self, PyObject *obj)
     /* Check whether the Pickler was initialized correctly (issue3664).
        Developers often forget to call __init__() in their subclasses, which
        would trigger a segfault without this check. */
+    if (Pickler_check_init(self) < 0)
+        return NULL;
     if (self->write == NULL) {
-        PickleState *st = _Pickle_GetGlobalState();
-        PyErr_Format(st->PicklingError,
-                     "Pickler.__init__() was not called by %s.__init__()",
-                     Py_TYPE(self)->tp_name);
+        PyErr_SetString(PyExc_TypeError,
+                        "the Pickler has no file, use dumps() instead");
         return NULL;
     }
 
@@ -4598,6 +4607,42 @@ _pickle_Pickler_dump(PicklerObject *self, PyObject *obj)
 
 /*[clinic input]
 
+_pickle.Pickler.dumps
+
+  obj: object
+  /
+
+Return the pickled representation of the object as a bytes object.
+
+The result does not depend on the previous calls: the memo is cleared
+before and after pickling, but its table is kept allocated so that the
+Pickler can be reused efficiently for many objects.  The file is not
+used.
+[clinic start generated code]*/
+
+static PyObject *
+_pickle_Pickler_dumps(PicklerObject *self, PyObject *obj)
+/*[clinic end generated code: output=1569755b7cbd7879 input=7661182f8661a372]*/
+{
+    PyObject *write;
+    PyObject *result = NULL;
+
+    if (Pickler_check_init(self) < 0)
+        return NULL;
+
+    PyMemoTable_Clear(self->memo);
+    /* Keep all the output in the buffer */
+    write = self->write;
+    self->write = NULL;
+    if (_Pickler_ClearBuffer(self) == 0 && dump(self, obj) == 0)
+        result = _Pickler_GetString(self);
+    self->write = write;
+    PyMemoTable_Clear(self->memo);
+    return result;
+}
+
+/*[clinic input]
+
 _pickle.Pickler.__sizeof__ -> Py_ssize_t
 
 Returns size in memory, in bytes.
@@ -4625,6 +4670,7 @@ _pickle_Pickler___sizeof___impl(PicklerObject *self)
 
 static struct PyMethodDef Pickler_methods[] = {
     _PICKLE_PICKLER_DUMP_METHODDEF
+    _PICKLE_PICKLER_DUMPS_METHODDEF
     _PICKLE_PICKLER_CLEAR_MEMO_METHODDEF
     _PICKLE_PICKLER___SIZEOF___METHODDEF
     {NULL, NULL}                /* sentinel */
@@ -4688,6 +4734,8 @@ _pickle.Pickler.__init__
   protocol: object = None
   fix_imports: bool = True
   buffer_callback: object = None
+  *
+  memoize: bool = True
 
 This takes a binary file for writing a pickle data stream.
 
@@ -4703,7 +4751,8 @@ version of Python needed to read the pickle produced.
 The *file* argument must have a write() method that accepts a single
 bytes argument. It can thus be a file object opened for binary
 writing, an io.BytesIO instance, or any other custom object that meets
-this interface.
+this interface.  It can be None if the pickler is only used with
+dumps().
 
 If *fix_imports* is True and protocol is less than 3, pickle will try
 to map the new Python 3 names to the old module names used in Python
@@ -4720,25 +4769,30 @@ buffer is serialized in-band, i.e. inside the pickle stream.
 It is an error if *buffer_callback* is not None and *protocol*
 is None or smaller than 5.
 
+If *memoize* is false, the pickled objects are not memoized: objects
+referenced several times are pickled by value each time, and
+recursive objects raise ValueError.  This is faster for data without
+shared references.
+
 [clinic start generated code]*/
 
 static int
 _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
                               PyObject *protocol, int fix_imports,
-                              PyObject *buffer_callback)
-/*[clinic end generated code: output=0abedc50590d259b input=a7c969699bf5dad3]*/
+                              PyObject *buffer_callback, int memoize)
+/*[clinic end generated code: output=6ebb6baffb55826a input=bb1532c81f6f6697]*/
 {
     _Py_IDENTIFIER(persistent_id);
     _Py_IDENTIFIER(dispatch_table);
 
     /* In case of multiple __init__() calls, clear previous content. */
-    if (self->write != NULL)
+    if (self->memo != NULL)
         (void)Pickler_clear(self);
 
     if (_Pickler_SetProtocol(self, protocol, fix_imports) < 0)
         return -1;
 
-    if (_Pickler_SetOutputStream(self, file) < 0)
+    if (file != Py_None && _Pickler_SetOutputStream(self, file) < 0)
         return -1;
 
     if (_Pickler_SetBufferCallback(self, buffer_callback) < 0)
@@ -4759,7 +4813,7 @@ _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
             return -1;
     }
 
-    self->fast = 0;
+    self->fast = !memoize;
     self->fast_nesting = 0;
     self->fast_memo = NULL;
 
@@ -7045,6 +7099,26 @@ _pickle_Unpickler_find_class_impl(UnpicklerObject *self,
         return NULL;
     }
 
+    /* Segmented pickles are joined by the unpickler itself, see
+       pickle._segment_joiner(). */
+    if (PyUnicode_Check(module_name) && PyUnicode_Check(global_name) &&
+        _PyUnicode_EqualToASCIIString(module_name, "pickle") &&
+        _PyUnicode_EqualToASCIIString(global_name, "_join_segments")) {
+        PyObject *pickle_module, *joiner;
+
+        pickle_module = PyImport_ImportModule("pickle");
+        if (pickle_module == NULL) {
+            return NULL;
+        }
+        joiner = PyObject_CallMethod(pickle_module, "_segment_joiner", "OOssO",
+                                     (PyObject *)self,
+                                     self->fix_imports ? Py_True : Py_False,
+                                     self->encoding, self->errors,
+                                     self->buffers ? self->buffers : Py_None);
+        Py_DECREF(pickle_module);
+        return joiner;
+    }
+
     /* Try to map the old names used in Python 2.x to the new ones used in
        Python 3.x.  We do this only with old pickle protocols and when the
        user has not disabled the feature. */
@@ -7646,6 +7720,7 @@ _pickle.dump
   *
   fix_imports: bool = True
   buffer_callback: object = None
+  memoize: bool = True
 
 Write a pickled representation of obj to the open file object file.
 
@@ -7674,13 +7749,16 @@ If *buffer_callback* is None (the default), buffer views are serialized
 into *file* as part of the pickle stream.  It is an error if
 *buffer_callback* is not None and *protocol* is None or smaller than 5.
 
+If *memoize* is false, objects referenced several times are pickled by
+value each time, and recursive objects raise ValueError.
+
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
                   PyObject *protocol, int fix_imports,
-                  PyObject *buffer_callback)
-/*[clinic end generated code: output=706186dba996490c input=5ed6653da99cd97c]*/
+                  PyObject *buffer_callback, int memoize)
+/*[clinic end generated code: output=7c0107c92fde0822 input=2664bd8fec993b49]*/
 {
     PicklerObject *pickler = _Pickler_New();
 
@@ -7696,6 +7774,8 @@ _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
     if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
         goto error;
 
+    pickler->fast = !memoize;
+
     if (dump(pickler, obj) < 0)
         goto error;
 
@@ -7719,6 +7799,7 @@ _pickle.dumps
   *
   fix_imports: bool = True
   buffer_callback: object = None
+  memoize: bool = True
 
 Return the pickled representation of the object as a bytes object.
 
@@ -7739,12 +7820,15 @@ If *buffer_callback* is None (the default), buffer views are serialized
 into *file* as part of the pickle stream.  It is an error if
 *buffer_callback* is not None and *protocol* is None or smaller than 5.
 
+If *memoize* is false, objects referenced several times are pickled by
+value each time, and recursive objects raise ValueError.
+
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
-                   int fix_imports, PyObject *buffer_callback)
-/*[clinic end generated code: output=fbab0093a5580fdf input=e543272436c6f987]*/
+                   int fix_imports, PyObject *buffer_callback, int memoize)
+/*[clinic end generated code: output=790234514c393629 input=8e4b1537c3cbdd97]*/
 {
     PyObject *result;
     PicklerObject *pickler = _Pickler_New();
@@ -7758,6 +7842,8 @@ _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
     if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
         goto error;
 
+    pickler->fast = !memoize;
+
     if (dump(pickler, obj) < 0)
         goto error;
 
@@ -223,6 +223,40 @@ data_stack_grow(SRE_STATE* state, Py_ssize_t size)
     return 0;
 }
 
+/* find the literal required by the pattern in the target slice, using
+   the same fast search as str.find() for strings.  returns its index,
+   -1 if it is not there, or -2 on error */
+
+static Py_ssize_t
+sre_find_required(SRE_STATE* state, Py_ssize_t start)
+{
+    Py_ssize_t end = ((char*) state->end - (char*) state->beginning) /
+                     state->charsize;
+    const char *s, *p, *last;
+    const char *literal;
+    Py_ssize_t length;
+
+    if (!state->isbytes)
+        return PyUnicode_Find(state->string, state->required, start, end, 1);
+
+    literal = PyBytes_AS_STRING(state->required);
+    length = PyBytes_GET_SIZE(state->required);
+    if (end - start < length)
+        return -1;
+    s = (const char*) state->beginning;
+    p = s + start;
+    last = s + end - length;
+    while (p <= last) {
+        p = memchr(p, literal[0], last - p + 1);
+        if (p == NULL)
+            return -1;
+        if (memcmp(p + 1, literal + 1, length - 1) == 0)
+            return p - s;
+        p++;
+    }
+    return -1;
+}
+
 /* generate 8-bit version */
 
 #define SRE_CHAR Py_UCS1
@@ -441,6 +475,7 @@ state_init(SRE_STATE* state, PatternObject* pattern, PyObject* string,
     state->charsize = charsize;
     state->match_all = 0;
     state->must_advance = 0;
+    state->required = pattern->required;
 
     state->beginning = ptr;
 
@@ -554,6 +589,7 @@ pattern_dealloc(PatternObject* self)
     Py_XDECREF(self->pattern);
     Py_XDECREF(self->groupindex);
     Py_XDECREF(self->indexgroup);
+    Py_XDECREF(self->required);
     PyObject_DEL(self);
 }
 
@@ -1349,6 +1385,7 @@ _sre_compile_impl(PyObject *module, PyObject *pattern, int flags,
     self->pattern = NULL;
     self->groupindex = NULL;
     self->indexgroup = NULL;
+    self->required = NULL;
 
     self->codesize = n;
 
@@ -1406,6 +1443,38 @@ _sre_compile_impl(PyObject *module, PyObject *pattern, int flags,
         return NULL;
     }
 
+    if (self->code[0] == SRE_OP_INFO &&
+        self->code[2] & SRE_INFO_REQUIRED && self->isbytes >= 0) {
+        /* <INFO> <1=skip> <2=flags> <3=min> <4=max> <5=length>
+           <6=min before> <7=max before> <8=literal> */
+        SRE_CODE *literal = self->code + 8;
+        SRE_CODE maxchar = self->isbytes ? 0xff : 0x10ffff;
+        n = self->code[5];
+        for (i = 0; i < n; i++) {
+            if (literal[i] > maxchar)
+                break;
+        }
+        /* otherwise the pattern can never match; let search find out */
+        if (i == n) {
+            if (self->isbytes) {
+                self->required = PyBytes_FromStringAndSize(NULL, n);
+                if (self->required) {
+                    char *p = PyBytes_AS_STRING(self->required);
+                    for (i = 0; i < n; i++)
+                        p[i] = (char) literal[i];
+                }
+            }
+            else {
+                self->required = PyUnicode_FromKindAndData(
+                    PyUnicode_4BYTE_KIND, literal, n);
+            }
+            if (!self->required) {
+                Py_DECREF(self);
+                return NULL;
+            }
+        }
+    }
+
     return (PyObject*) self;
 }
 
@@ -1649,8 +1718,8 @@ _validate_inner(SRE_CODE *code, SRE_CODE *end, Py_ssize_t groups)
             {
                 /* A minimal info field is
                    <INFO> <1=skip> <2=flags> <3=min> <4=max>;
-                   If SRE_INFO_PREFIX or SRE_INFO_CHARSET is in the flags,
-                   more follows. */
+                   If SRE_INFO_PREFIX, SRE_INFO_CHARSET or SRE_INFO_REQUIRED
+                   is in the flags, more follows. */
                 SRE_CODE flags, i;
                 SRE_CODE *newcode;
                 GET_SKIP;
@@ -1661,11 +1730,13 @@ _validate_inner(SRE_CODE *code, SRE_CODE *end, Py_ssize_t groups)
                 /* Check that only valid flags are present */
                 if ((flags & ~(SRE_INFO_PREFIX |
                                SRE_INFO_LITERAL |
-                               SRE_INFO_CHARSET)) != 0)
+                               SRE_INFO_CHARSET |
+                               SRE_INFO_REQUIRED)) != 0)
                     FAIL;
-                /* PREFIX and CHARSET are mutually exclusive */
-                if ((flags & SRE_INFO_PREFIX) &&
-                    (flags & SRE_INFO_CHARSET))
+                /* PREFIX, CHARSET and REQUIRED are mutually exclusive */
+                if ((flags & SRE_INFO_PREFIX ? 1 : 0) +
+                    (flags & SRE_INFO_CHARSET ? 1 : 0) +
+                    (flags & SRE_INFO_REQUIRED ? 1 : 0) > 1)
                     FAIL;
                 /* LITERAL implies PREFIX */
                 if ((flags & SRE_INFO_LITERAL) &&
@@ -1690,6 +1761,19 @@ _validate_inner(SRE_CODE *code, SRE_CODE *end, Py_ssize_t groups)
                     }
                     code += prefix_len;
                 }
+                /* Validate the required literal */
+                if (flags & SRE_INFO_REQUIRED) {
+                    SRE_CODE required_len;
+                    GET_ARG; required_len = arg;
+                    if (required_len == 0)
+                        FAIL;
+                    GET_ARG;
+                    GET_ARG;
+                    /* Here comes the literal */
+                    if (required_len > (uintptr_t)(newcode - code))
+                        FAIL;
+                    code += required_len;
+                }
                 /* Validate the charset */
                 if (flags & SRE_INFO_CHARSET) {
                     if (!_validate_charset(code, newcode-1))
@@ -34,6 +34,20 @@ PyDoc_STRVAR(_pickle_Pickler_dump__doc__,
 #define _PICKLE_PICKLER_DUMP_METHODDEF    \
     {"dump", (PyCFunction)_pickle_Pickler_dump, METH_O, _pickle_Pickler_dump__doc__},
 
+PyDoc_STRVAR(_pickle_Pickler_dumps__doc__,
+"dumps($self, obj, /)\n"
+"--\n"
+"\n"
+"Return the pickled representation of the object as a bytes object.\n"
+"\n"
+"The result does not depend on the previous calls: the memo is cleared\n"
+"before and after pickling, but its table is kept allocated so that the\n"
+"Pickler can be reused efficiently for many objects.  The file is not\n"
+"used.");
+
+#define _PICKLE_PICKLER_DUMPS_METHODDEF    \
+    {"dumps", (PyCFunction)_pickle_Pickler_dumps, METH_O, _pickle_Pickler_dumps__doc__},
+
 PyDoc_STRVAR(_pickle_Pickler___sizeof____doc__,
 "__sizeof__($self, /)\n"
 "--\n"
@@ -63,7 +77,8 @@ _pickle_Pickler___sizeof__(PicklerObject *self, PyObject *Py_UNUSED(ignored))
 }
 
 PyDoc_STRVAR(_pickle_Pickler___init____doc__,
-"Pickler(file, protocol=None, fix_imports=True, buffer_callback=None)\n"
+"Pickler(file, protocol=None, fix_imports=True, buffer_callback=None, *,\n"
+"        memoize=True)\n"
 "--\n"
 "\n"
 "This takes a binary file for writing a pickle data stream.\n"
@@ -80,7 +95,8 @@ PyDoc_STRVAR(_pickle_Pickler___init____doc__,
 "The *file* argument must have a write() method that accepts a single\n"
 "bytes argument. It can thus be a file object opened for binary\n"
 "writing, an io.BytesIO instance, or any other custom object that meets\n"
-"this interface.\n"
+"this interface.  It can be None if the pickler is only used with\n"
+"dumps().\n"
 "\n"
 "If *fix_imports* is True and protocol is less than 3, pickle will try\n"
 "to map the new Python 3 names to the old module names used in Python\n"
@@ -95,20 +111,25 @@ PyDoc_STRVAR(_pickle_Pickler___init____doc__,
 "buffer is serialized in-band, i.e. inside the pickle stream.\n"
 "\n"
 "It is an error if *buffer_callback* is not None and *protocol*\n"
-"is None or smaller than 5.");
+"is None or smaller than 5.\n"
+"\n"
+"If *memoize* is false, the pickled objects are not memoized: objects\n"
+"referenced several times are pickled by value each time, and\n"
+"recursive objects raise ValueError.  This is faster for data without\n"
+"shared references.");
 
 static int
 _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
                               PyObject *protocol, int fix_imports,
-                              PyObject *buffer_callback);
+                              PyObject *buffer_callback, int memoize);
 
 static int
 _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
 {
     int return_value = -1;
-    static const char * const _keywords[] = {"file", "protocol", "fix_imports", "buffer_callback", NULL};
+    static const char * const _keywords[] = {"file", "protocol", "fix_imports", "buffer_callback", "memoize", NULL};
     static _PyArg_Parser _parser = {NULL, _keywords, "Pickler", 0};
-    PyObject *argsbuf[4];
+    PyObject *argsbuf[5];
     PyObject * const *fastargs;
     Py_ssize_t nargs = PyTuple_GET_SIZE(args);
     Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 1;
@@ -116,6 +137,7 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
     PyObject *protocol = Py_None;
     int fix_imports = 1;
     PyObject *buffer_callback = Py_None;
+    int memoize = 1;
 
     fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 1, 4, 0, argsbuf);
     if (!fastargs) {
@@ -140,9 +162,22 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
             goto skip_optional_pos;
         }
     }
-    buffer_callback = fastargs[3];
+    if (fastargs[3]) {
+        buffer_callback = fastargs[3];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
 skip_optional_pos:
-    return_value = _pickle_Pickler___init___impl((PicklerObject *)self, file, protocol, fix_imports, buffer_callback);
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    memoize = PyObject_IsTrue(fastargs[4]);
+    if (memoize < 0) {
+        goto exit;
+    }
+skip_optional_kwonly:
+    return_value = _pickle_Pickler___init___impl((PicklerObject *)self, file, protocol, fix_imports, buffer_callback, memoize);
 
 exit:
     return return_value;
@@ -455,7 +490,7 @@ _pickle_UnpicklerMemoProxy___reduce__(UnpicklerMemoProxyObject *self, PyObject *
 
 PyDoc_STRVAR(_pickle_dump__doc__,
 "dump($module, /, obj, file, protocol=None, *, fix_imports=True,\n"
-"     buffer_callback=None)\n"
+"     buffer_callback=None, memoize=True)\n"
 "--\n"
 "\n"
 "Write a pickled representation of obj to the open file object file.\n"
@@ -483,7 +518,10 @@ PyDoc_STRVAR(_pickle_dump__doc__,
 "\n"
 "If *buffer_callback* is None (the default), buffer views are serialized\n"
 "into *file* as part of the pickle stream.  It is an error if\n"
-"*buffer_callback* is not None and *protocol* is None or smaller than 5.");
+"*buffer_callback* is not None and *protocol* is None or smaller than 5.\n"
+"\n"
+"If *memoize* is false, objects referenced several times are pickled by\n"
+"value each time, and recursive objects raise ValueError.");
 
 #define _PICKLE_DUMP_METHODDEF    \
     {"dump", (PyCFunction)(void(*)(void))_pickle_dump, METH_FASTCALL|METH_KEYWORDS, _pickle_dump__doc__},
@@ -491,21 +529,22 @@ PyDoc_STRVAR(_pickle_dump__doc__,
 static PyObject *
 _pickle_dump_impl(PyObject *module, PyObject *obj, PyObject *file,
                   PyObject *protocol, int fix_imports,
-                  PyObject *buffer_callback);
+                  PyObject *buffer_callback, int memoize);
 
 static PyObject *
 _pickle_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
-    static const char * const _keywords[] = {"obj", "file", "protocol", "fix_imports", "buffer_callback", NULL};
+    static const char * const _keywords[] = {"obj", "file", "protocol", "fix_imports", "buffer_callback", "memoize", NULL};
     static _PyArg_Parser _parser = {NULL, _keywords, "dump", 0};
-    PyObject *argsbuf[5];
+    PyObject *argsbuf[6];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 2;
     PyObject *obj;
     PyObject *file;
     PyObject *protocol = Py_None;
     int fix_imports = 1;
     PyObject *buffer_callback = Py_None;
+    int memoize = 1;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 2, 3, 0, argsbuf);
     if (!args) {
@@ -535,9 +574,18 @@ _pickle_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
             goto skip_optional_kwonly;
         }
     }
-    buffer_callback = args[4];
+    if (args[4]) {
+        buffer_callback = args[4];
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    memoize = PyObject_IsTrue(args[5]);
+    if (memoize < 0) {
+        goto exit;
+    }
 skip_optional_kwonly:
-    return_value = _pickle_dump_impl(module, obj, file, protocol, fix_imports, buffer_callback);
+    return_value = _pickle_dump_impl(module, obj, file, protocol, fix_imports, buffer_callback, memoize);
 
 exit:
     return return_value;
@@ -545,7 +593,7 @@ _pickle_dump(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject
 
 PyDoc_STRVAR(_pickle_dumps__doc__,
 "dumps($module, /, obj, protocol=None, *, fix_imports=True,\n"
-"      buffer_callback=None)\n"
+"      buffer_callback=None, memoize=True)\n"
 "--\n"
 "\n"
 "Return the pickled representation of the object as a bytes object.\n"
@@ -565,27 +613,31 @@ PyDoc_STRVAR(_pickle_dumps__doc__,
 "\n"
 "If *buffer_callback* is None (the default), buffer views are serialized\n"
 "into *file* as part of the pickle stream.  It is an error if\n"
-"*buffer_callback* is not None and *protocol* is None or smaller than 5.");
+"*buffer_callback* is not None and *protocol* is None or smaller than 5.\n"
+"\n"
+"If *memoize* is false, objects referenced several times are pickled by\n"
+"value each time, and recursive objects raise ValueError.");
 
 #define _PICKLE_DUMPS_METHODDEF    \
     {"dumps", (PyCFunction)(void(*)(void))_pickle_dumps, METH_FASTCALL|METH_KEYWORDS, _pickle_dumps__doc__},
 
 static PyObject *
 _pickle_dumps_impl(PyObject *module, PyObject *obj, PyObject *protocol,
-                   int fix_imports, PyObject *buffer_callback);
+                   int fix_imports, PyObject *buffer_callback, int memoize);
 
 static PyObject *
 _pickle_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
-    static const char * const _keywords[] = {"obj", "protocol", "fix_imports", "buffer_callback", NULL};
+    static const char * const _keywords[] = {"obj", "protocol", "fix_imports", "buffer_callback", "memoize", NULL};
     static _PyArg_Parser _parser = {NULL, _keywords, "dumps", 0};
-    PyObject *argsbuf[4];
+    PyObject *argsbuf[5];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     PyObject *obj;
     PyObject *protocol = Py_None;
     int fix_imports = 1;
     PyObject *buffer_callback = Py_None;
+    int memoize = 1;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 2, 0, argsbuf);
     if (!args) {
@@ -614,9 +666,18 @@ _pickle_dumps(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
             goto skip_optional_kwonly;
         }
     }
-    buffer_callback = args[3];
+    if (args[3]) {
+        buffer_callback = args[3];
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    memoize = PyObject_IsTrue(args[4]);
+    if (memoize < 0) {
+        goto exit;
+    }
 skip_optional_kwonly:
-    return_value = _pickle_dumps_impl(module, obj, protocol, fix_imports, buffer_callback);
+    return_value = _pickle_dumps_impl(module, obj, protocol, fix_imports, buffer_callback, memoize);
 
 exit:
     return return_value;
@@ -836,4 +897,4 @@ _pickle_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=324aad69644beda2 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=ef241d3f00094131 input=a9049054013a1b77]*/
@@ -406,6 +406,54 @@ zlib_Decompress_decompress(compobject *self, PyTypeObject *cls, PyObject *const
     return return_value;
 }
 
+PyDoc_STRVAR(zlib_Decompress_decompress_block__doc__,
+"decompress_block($self, data, /, max_length=0)\n"
+"--\n"
+"\n"
+"Decompress data up to the end of the current deflate block.\n"
+"\n"
+"  data\n"
+"    The binary data to decompress.\n"
+"  max_length\n"
+"    The maximum allowable length of the decompressed data.\n"
+"    Unconsumed input data will be stored in\n"
+"    the unconsumed_tail attribute.\n"
+"\n"
+"Like decompress(), but stop at the end of a deflate block, storing the rest\n"
+"of the input in the unconsumed_tail attribute.  The data_type attribute\n"
+"then tells where decompression stopped.");
+
+#define ZLIB_DECOMPRESS_DECOMPRESS_BLOCK_METHODDEF    \
+    {"decompress_block", (PyCFunction)(void(*)(void))zlib_Decompress_decompress_block, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, zlib_Decompress_decompress_block__doc__},
+
+static PyObject *
+zlib_Decompress_decompress_block_impl(compobject *self, PyTypeObject *cls,
+                                      Py_buffer *data, Py_ssize_t max_length);
+
+static PyObject *
+zlib_Decompress_decompress_block(compobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", "max_length", NULL};
+    static _PyArg_Parser _parser = {"y*|n:decompress_block", _keywords, 0};
+    Py_buffer data = {NULL, NULL};
+    Py_ssize_t max_length = 0;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &data, &max_length)) {
+        goto exit;
+    }
+    return_value = zlib_Decompress_decompress_block_impl(self, cls, &data, max_length);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+
+    return return_value;
+}
+
 PyDoc_STRVAR(zlib_Compress_flush__doc__,
 "flush($self, mode=zlib.Z_FINISH, /)\n"
 "--\n"
@@ -640,6 +688,47 @@ zlib_Decompress___deepcopy__(compobject *self, PyTypeObject *cls, PyObject *cons
 
 #endif /* defined(HAVE_ZLIB_COPY) */
 
+PyDoc_STRVAR(zlib_Decompress_prime__doc__,
+"prime($self, bits, value, /)\n"
+"--\n"
+"\n"
+"Insert bits into the input of the decompressor.\n"
+"\n"
+"  bits\n"
+"    The number of bits to insert, from 0 to 16.\n"
+"  value\n"
+"    The bits to insert, in its low-order bits.\n"
+"\n"
+"The bits are decompressed before the data passed to the next call of\n"
+"decompress().  This allows to start decompressing at a deflate block which\n"
+"does not begin on a byte boundary.");
+
+#define ZLIB_DECOMPRESS_PRIME_METHODDEF    \
+    {"prime", (PyCFunction)(void(*)(void))zlib_Decompress_prime, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, zlib_Decompress_prime__doc__},
+
+static PyObject *
+zlib_Decompress_prime_impl(compobject *self, PyTypeObject *cls, int bits,
+                           int value);
+
+static PyObject *
+zlib_Decompress_prime(compobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", "", NULL};
+    static _PyArg_Parser _parser = {"ii:prime", _keywords, 0};
+    int bits;
+    int value;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &bits, &value)) {
+        goto exit;
+    }
+    return_value = zlib_Decompress_prime_impl(self, cls, bits, value);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(zlib_Decompress_flush__doc__,
 "flush($self, length=zlib.DEF_BUF_SIZE, /)\n"
 "--\n"
@@ -803,4 +892,4 @@ zlib_crc32(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=6736bae59fab268b input=a9049054013a1b77]*/
+/*[clinic end generated code: output=6509b21a64de494d input=a9049054013a1b77]*/
@@ -34,6 +34,7 @@ typedef struct {
     int flags; /* flags used when compiling pattern source */
     PyObject *weakreflist; /* List of weak references */
     int isbytes; /* pattern type (1 - bytes, 0 - string, -1 - None) */
+    PyObject *required; /* literal required by the pattern (or NULL) */
     /* pattern code */
     Py_ssize_t codesize;
     SRE_CODE code[1];
@@ -77,6 +78,8 @@ typedef struct {
     const void** mark;
     int match_all;
     int must_advance;
+    /* literal required by the pattern (borrowed, or NULL) */
+    PyObject *required;
     /* dynamically allocated stuff */
     char* data_stack;
     size_t data_stack_size;
@@ -1376,6 +1376,8 @@ SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
     SRE_CODE* prefix = NULL;
     SRE_CODE* charset = NULL;
     SRE_CODE* overlap = NULL;
+    Py_ssize_t required_lo = 0;
+    Py_ssize_t required_hi = 0;
     int flags = 0;
 
     if (ptr > end)
@@ -1411,6 +1413,12 @@ SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
             /* pattern starts with a character from a known set */
             /* <charset> */
             charset = pattern + 5;
+        else if (flags & SRE_INFO_REQUIRED) {
+            /* pattern contains a known literal further in */
+            /* <length> <min before> <max before> <literal> */
+            required_lo = pattern[6];
+            required_hi = pattern[7];
+        }
 
         pattern += 1 + pattern[1];
     }
@@ -1516,6 +1524,38 @@ SRE(search)(SRE_STATE* state, SRE_CODE* pattern)
             ptr++;
             RESET_CAPTURE_GROUP();
         }
+    } else if (flags & SRE_INFO_REQUIRED && state->required) {
+        /* pattern contains a known literal.  find it with a fast
+           substring search, and only try the positions from which
+           it can be reached */
+        SRE_CHAR* beginning = (SRE_CHAR *)state->beginning;
+        Py_ssize_t next = -1;
+        assert(ptr <= end);
+        for (;;) {
+            if (next < ptr - beginning + required_lo) {
+                next = sre_find_required(state,
+                                         ptr - beginning + required_lo);
+                if (next == -1)
+                    return 0;
+                if (next < 0)
+                    return SRE_ERROR_INTERRUPTED;
+            }
+            if ((SRE_CODE) required_hi != SRE_MAXREPEAT &&
+                next - (ptr - beginning) > required_hi) {
+                ptr = beginning + next - required_hi;
+                if (ptr > end)
+                    return 0;
+                state->must_advance = 0;
+            }
+            TRACE(("|%p|%p|SEARCH REQUIRED\n", pattern, ptr));
+            state->start = state->ptr = ptr;
+            status = SRE(match)(state, pattern, 1);
+            state->must_advance = 0;
+            if (status != 0 || ptr >= end)
+                break;
+            ptr++;
+            RESET_CAPTURE_GROUP();
+        }
     } else {
         /* general case */
         assert(ptr <= end);
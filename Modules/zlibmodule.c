@@ -544,6 +544,7 @@ zlib_decompressobj_impl(PyObject *module, int wbits, PyObject *zdict)
     self->zst.zfree = PyZlib_Free;
     self->zst.next_in = NULL;
     self->zst.avail_in = 0;
+    self->zst.data_type = 0;
     if (zdict != NULL) {
         Py_INCREF(zdict);
         self->zdict = zdict;
@@ -720,6 +721,10 @@ save_unconsumed_input(compobject *self, Py_buffer *data, int err)
     return 0;
 }
 
+static PyObject *
+decompress_data(compobject *self, PyTypeObject *cls, Py_buffer *data,
+                Py_ssize_t max_length, int flush);
+
 /*[clinic input]
 zlib.Decompress.decompress
 
@@ -743,6 +748,40 @@ static PyObject *
 zlib_Decompress_decompress_impl(compobject *self, PyTypeObject *cls,
                                 Py_buffer *data, Py_ssize_t max_length)
 /*[clinic end generated code: output=b024a93c2c922d57 input=bfb37b3864cfb606]*/
+{
+    return decompress_data(self, cls, data, max_length, Z_SYNC_FLUSH);
+}
+
+/*[clinic input]
+zlib.Decompress.decompress_block
+
+    cls: defining_class
+    data: Py_buffer
+        The binary data to decompress.
+    /
+    max_length: Py_ssize_t = 0
+        The maximum allowable length of the decompressed data.
+        Unconsumed input data will be stored in
+        the unconsumed_tail attribute.
+
+Decompress data up to the end of the current deflate block.
+
+Like decompress(), but stop at the end of a deflate block, storing the rest
+of the input in the unconsumed_tail attribute.  The data_type attribute
+then tells where decompression stopped.
+[clinic start generated code]*/
+
+static PyObject *
+zlib_Decompress_decompress_block_impl(compobject *self, PyTypeObject *cls,
+                                      Py_buffer *data, Py_ssize_t max_length)
+/*[clinic end generated code: output=9fd65f3eec977b34 input=6c9a16ffd042f079]*/
+{
+    return decompress_data(self, cls, data, max_length, Z_BLOCK);
+}
+
+static PyObject *
+decompress_data(compobject *self, PyTypeObject *cls, Py_buffer *data,
+                Py_ssize_t max_length, int flush)
 {
     int err = Z_OK;
     Py_ssize_t ibuflen, obuflen = DEF_BUF_SIZE, hard_limit;
@@ -787,7 +826,7 @@ zlib_Decompress_decompress_impl(compobject *self, PyTypeObject *cls,
             }
 
             Py_BEGIN_ALLOW_THREADS
-            err = inflate(&self->zst, Z_SYNC_FLUSH);
+            err = inflate(&self->zst, flush);
             Py_END_ALLOW_THREADS
 
             switch (err) {
@@ -805,6 +844,10 @@ zlib_Decompress_decompress_impl(compobject *self, PyTypeObject *cls,
                 }
                 goto save;
             }
+            /* Stop at the end of a block */
+            if (flush == Z_BLOCK && (self->zst.data_type & 128)) {
+                goto save;
+            }
 
         } while (self->zst.avail_out == 0 || err == Z_NEED_DICT);
 
@@ -1101,6 +1144,51 @@ zlib_Decompress___deepcopy___impl(compobject *self, PyTypeObject *cls,
 
 #endif
 
+/*[clinic input]
+zlib.Decompress.prime
+
+    cls: defining_class
+    bits: int
+        The number of bits to insert, from 0 to 16.
+    value: int
+        The bits to insert, in its low-order bits.
+    /
+
+Insert bits into the input of the decompressor.
+
+The bits are decompressed before the data passed to the next call of
+decompress().  This allows to start decompressing at a deflate block which
+does not begin on a byte boundary.
+[clinic start generated code]*/
+
+static PyObject *
+zlib_Decompress_prime_impl(compobject *self, PyTypeObject *cls, int bits,
+                           int value)
+/*[clinic end generated code: output=bf3e51998b94e95a input=11657a7f1753e8da]*/
+{
+    int err;
+
+    PyObject *module = PyType_GetModule(cls);
+    if (module == NULL)
+        return NULL;
+
+    if (bits < 0 || bits > 16) {
+        PyErr_SetString(PyExc_ValueError, "bits must be between 0 and 16");
+        return NULL;
+    }
+
+    ENTER_ZLIB(self);
+    err = inflatePrime(&self->zst, bits, value & ((1 << bits) - 1));
+    LEAVE_ZLIB(self);
+
+    if (err != Z_OK) {
+        zlib_error(get_zlib_state(module), self->zst, err,
+                   "while priming the decompressor");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
 /*[clinic input]
 zlib.Decompress.flush
 
@@ -1220,6 +1308,8 @@ static PyMethodDef comp_methods[] =
 static PyMethodDef Decomp_methods[] =
 {
     ZLIB_DECOMPRESS_DECOMPRESS_METHODDEF
+    ZLIB_DECOMPRESS_DECOMPRESS_BLOCK_METHODDEF
+    ZLIB_DECOMPRESS_PRIME_METHODDEF
     ZLIB_DECOMPRESS_FLUSH_METHODDEF
     ZLIB_DECOMPRESS_COPY_METHODDEF
     ZLIB_DECOMPRESS___COPY___METHODDEF
@@ -1232,6 +1322,7 @@ static PyMemberDef Decomp_members[] = {
     {"unused_data",     T_OBJECT, COMP_OFF(unused_data), READONLY},
     {"unconsumed_tail", T_OBJECT, COMP_OFF(unconsumed_tail), READONLY},
     {"eof",             T_BOOL,   COMP_OFF(eof), READONLY},
+    {"data_type",       T_INT,    COMP_OFF(zst.data_type), READONLY},
     {NULL},
 };
 
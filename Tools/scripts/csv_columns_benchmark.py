@@ -0,0 +1,79 @@
+'Compare loading a CSV file into typed columns with DictReader and ColumnReader.'
+
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+
+COUNT = 500000
+FIELDNAMES = ['id', 'price', 'quantity', 'name']
+
+
+def write_file(filename):
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for i in range(COUNT):
+            writer.writerow([i, i / 7, i % 100, 'item %d' % i])
+
+
+def dict_reader(filename):
+    # Load the rows, then convert the columns, as applications do
+    columns = {name: [] for name in FIELDNAMES}
+    with open(filename, newline='') as f:
+        for row in csv.DictReader(f):
+            columns['id'].append(int(row['id']))
+            columns['price'].append(float(row['price']))
+            columns['quantity'].append(int(row['quantity']))
+            columns['name'].append(row['name'])
+    return columns
+
+
+def column_reader(filename, converters):
+    columns = {}
+    with open(filename, newline='') as f:
+        for batch in csv.ColumnReader(f, converters=converters):
+            for name, column in batch.items():
+                if name in columns:
+                    columns[name] += column
+                else:
+                    columns[name] = column
+    return columns
+
+
+def column_reader_lists(filename):
+    return column_reader(filename, {'id': int, 'price': float,
+                                    'quantity': int})
+
+
+def column_reader_arrays(filename):
+    return column_reader(filename, {'id': 'q', 'price': 'd',
+                                    'quantity': 'q'})
+
+
+def measure(func, filename):
+    start = time.perf_counter()
+    func(filename)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(filename)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return COUNT / elapsed, peak / 1e6
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'data.csv')
+        write_file(filename)
+        print('Input: %d rows, %.1f MB'
+              % (COUNT, os.path.getsize(filename) / 1e6))
+        print('%-30s %12s %14s' % ('', 'rows/s', 'peak memory'))
+        for name, func in [
+                ('DictReader + int()/float()', dict_reader),
+                ('ColumnReader, lists', column_reader_lists),
+                ('ColumnReader, arrays', column_reader_arrays),
+                ]:
+            speed, peak = measure(func, filename)
+            print('%-30s %12.0f %11.1f MB' % (name, speed, peak))
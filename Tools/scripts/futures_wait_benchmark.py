@@ -0,0 +1,71 @@
+'Show how concurrent.futures.wait() and as_completed() scale with the number of futures.'
+
+import threading
+import time
+from concurrent.futures import (Future, wait, as_completed,
+                                FIRST_COMPLETED, ALL_COMPLETED)
+
+SIZES = [1000, 10000, 100000]
+
+
+def complete_later(fs, delay=0.05):
+    # Complete the futures from another thread once the caller is waiting.
+    def run():
+        time.sleep(delay)
+        for f in fs:
+            f.set_result(None)
+    t = threading.Thread(target=run)
+    t.start()
+    return t
+
+
+def bench_wait_all(n):
+    fs = [Future() for i in range(n)]
+    t = complete_later(fs)
+    start = time.perf_counter()
+    wait(fs, return_when=ALL_COMPLETED)
+    elapsed = time.perf_counter() - start
+    t.join()
+    return elapsed
+
+
+def bench_as_completed(n):
+    fs = [Future() for i in range(n)]
+    t = complete_later(fs)
+    start = time.perf_counter()
+    for f in as_completed(fs):
+        pass
+    elapsed = time.perf_counter() - start
+    t.join()
+    return elapsed
+
+
+def bench_wait_first_completed(n):
+    # One future completes while the others stay pending: the cost should
+    # not depend much on the number of outstanding futures.
+    fs = [Future() for i in range(n)]
+    t = complete_later(fs[:1], delay=0)
+    start = time.perf_counter()
+    wait(fs, return_when=FIRST_COMPLETED)
+    elapsed = time.perf_counter() - start
+    t.join()
+    return elapsed
+
+
+def bench_wait_done(n):
+    # All futures are already done.
+    fs = [Future() for i in range(n)]
+    for f in fs:
+        f.set_result(None)
+    start = time.perf_counter()
+    wait(fs)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    for bench in [bench_wait_all, bench_as_completed,
+                  bench_wait_first_completed, bench_wait_done]:
+        print(bench.__name__[len('bench_'):])
+        for n in SIZES:
+            timing = min(bench(n) for i in range(5))
+            print('{:10d} futures {:10.1f} ms'.format(n, timing * 1000))
@@ -0,0 +1,41 @@
+'Measure the throughput of gzip compression with one or more threads.'
+
+import gzip
+import io
+import os
+import time
+
+COUNT = 500000
+
+
+def make_data():
+    return b''.join(b'2020-10-19 12:00:%02d host%d INFO request %d handled '
+                    b'for user%d in %dms\n'
+                    % (i % 60, i % 7, i, i % 1000, i % 300)
+                    for i in range(COUNT))
+
+
+def write(data, threads, compresslevel):
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel,
+                       threads=threads) as f:
+        for i in range(0, len(data), 64 * 1024):
+            f.write(data[i:i + 64 * 1024])
+    return len(buf.getvalue())
+
+
+def timeit(data, threads, compresslevel):
+    start = time.perf_counter()
+    size = write(data, threads, compresslevel)
+    return time.perf_counter() - start, size
+
+
+if __name__ == '__main__':
+    data = make_data()
+    print('Input: %.1f MB, %d CPUs' % (len(data) / 1e6, os.cpu_count()))
+    for compresslevel in [6, 9]:
+        for threads in [1, 2, 4, 8]:
+            elapsed, size = min(timeit(data, threads, compresslevel)
+                                for i in range(3))
+            print('compresslevel=%d threads=%d %8.1f MB/s %10d bytes'
+                  % (compresslevel, threads, len(data) / elapsed / 1e6, size))
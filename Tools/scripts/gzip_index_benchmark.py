@@ -0,0 +1,70 @@
+'Measure random seeks in a gzip file with and without a seek index.'
+
+import gzip
+import os
+import random
+import tempfile
+import time
+
+COUNT = 1000000
+SEEKS = 20
+INTERVAL = 1024 * 1024
+
+
+def write_file(filename):
+    with gzip.open(filename, 'wb') as f:
+        for i in range(0, COUNT, 1000):
+            f.write(b''.join(b'2020-10-19 12:00:%02d host%d INFO request %d '
+                             b'handled for user%d in %dms\n'
+                             % (j % 60, j % 7, j, j % 1000, j % 300)
+                             for j in range(i, i + 1000)))
+
+
+def build_index(filename, index_filename):
+    with gzip.GzipFile(filename, index_interval=INTERVAL) as f:
+        while f.read(INTERVAL):
+            pass
+        size = f.tell()
+        f.save_index(index_filename)
+    return size
+
+
+def seek(filename, offsets, index_filename=None):
+    with gzip.GzipFile(filename) as f:
+        if index_filename:
+            f.load_index(index_filename)
+        for offset in offsets:
+            f.seek(offset)
+            f.read(100)
+
+
+def timeit(func, *args):
+    return min(_time(func, *args) for i in range(3))
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'data.gz')
+        index_filename = filename + '.idx'
+        write_file(filename)
+        start = time.perf_counter()
+        size = build_index(filename, index_filename)
+        elapsed = time.perf_counter() - start
+        print('Input: %.1f MB, %.1f MB compressed, index of %.1f kB '
+              'built in %.2f s'
+              % (size / 1e6, os.path.getsize(filename) / 1e6,
+                 os.path.getsize(index_filename) / 1e3, elapsed))
+        offsets = [random.randrange(size) for i in range(SEEKS)]
+        for name, args in [
+                ('without index', ()),
+                ('with index', (index_filename,)),
+                ]:
+            elapsed = timeit(seek, filename, offsets, *args)
+            print('%-15s %8.1f ms per seek'
+                  % (name, elapsed / SEEKS * 1e3))
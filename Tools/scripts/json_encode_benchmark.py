@@ -0,0 +1,67 @@
+'Compare the ways of encoding a large JSON document to bytes or to a file.'
+
+import json
+import os
+import tempfile
+import time
+
+COUNT = 200000
+
+
+def make_data():
+    return [{'id': i, 'name': 'item %d' % i, 'price': i / 7,
+             'tags': ['a', 'b€'], 'active': i % 2 == 0}
+            for i in range(COUNT)]
+
+
+def dumps_encode(data, filename):
+    return json.dumps(data).encode('utf-8')
+
+
+def encode_bytes(data, filename):
+    return json.JSONEncoder().encode_bytes(data)
+
+
+def dump_per_chunk(data, filename):
+    # What json.dump() did before it could use the C encoder
+    with open(filename, 'w', encoding='utf-8') as f:
+        for chunk in json.JSONEncoder().iterencode(data):
+            f.write(chunk)
+
+
+def dump_text(data, filename):
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def dump_binary(data, filename):
+    with open(filename, 'wb') as f:
+        json.dump(data, f)
+
+
+def timeit(func, data, filename):
+    return min(_time(func, data, filename) for i in range(3))
+
+
+def _time(func, data, filename):
+    start = time.perf_counter()
+    func(data, filename)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    data = make_data()
+    size = len(json.JSONEncoder().encode_bytes(data))
+    print('Output: %d objects, %.1f MB' % (COUNT, size / 1e6))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'out.json')
+        for name, func in [
+                ("json.dumps().encode()", dumps_encode),
+                ("JSONEncoder().encode_bytes()", encode_bytes),
+                ("iterencode() + write() per chunk", dump_per_chunk),
+                ("json.dump() to a text file", dump_text),
+                ("json.dump() to a binary file", dump_binary),
+                ]:
+            elapsed = timeit(func, data, filename)
+            print('%-35s %8.1f ms %8.1f MB/s'
+                  % (name, elapsed * 1e3, size / elapsed / 1e6))
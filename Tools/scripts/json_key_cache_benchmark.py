@@ -0,0 +1,60 @@
+'Compare JSONDecoder with and without a key cache on documents sharing keys.'
+
+import json
+import time
+import tracemalloc
+
+COUNT = 200000
+KEY_CACHE_SIZE = 1000
+
+
+def make_items():
+    return [{'id': i, 'name': 'item %d' % i, 'price': i / 7,
+             'tags': ['a', 'b'], 'active': i % 2 == 0,
+             'owner': {'first_name': 'x', 'last_name': 'y'},
+             'created_at': None, 'updated_at': None}
+            for i in range(COUNT)]
+
+
+def decode_array(decoder, doc):
+    return decoder.decode(doc)
+
+
+def decode_lines(decoder, lines):
+    decode = decoder.decode
+    return [decode(line) for line in lines]
+
+
+def measure(func, decoder, data):
+    elapsed = min(_time(func, decoder, data) for i in range(3))
+    tracemalloc.start()
+    result = func(decoder, data)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+def _time(func, decoder, data):
+    start = time.perf_counter()
+    func(decoder, data)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    items = make_items()
+    doc = json.dumps(items)
+    lines = [json.dumps(item) for item in items]
+    del items
+    print('Input: %d objects, %.1f MB' % (COUNT, len(doc) / 1e6))
+    print('%-45s %10s %15s' % ('', 'time', 'retained'))
+    for name, func, data in [
+            ('one array', decode_array, doc),
+            ('one document per line', decode_lines, lines),
+            ]:
+        for cache in (0, KEY_CACHE_SIZE):
+            decoder = json.JSONDecoder(key_cache_size=cache)
+            elapsed, retained = measure(func, decoder, data)
+            print('%-45s %7.1f ms %12.1f MB'
+                  % ('%s, key_cache_size=%d' % (name, cache),
+                     elapsed * 1e3, retained / 1e6))
@@ -0,0 +1,78 @@
+'Compare decoding JSON into dataclasses with a schema and with object_hook.'
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+COUNT = 100000
+
+
+@dataclass
+class Owner:
+    first_name: str
+    last_name: str
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    price: float
+    tags: list[str] = field(default_factory=list)
+    active: bool = True
+    owner: Optional[Owner] = None
+
+
+def make_doc():
+    return json.dumps([{'id': i, 'name': 'item %d' % i, 'price': i / 7,
+                        'tags': ['a', 'b'], 'active': i % 2 == 0,
+                        'owner': {'first_name': 'x', 'last_name': 'y'}}
+                       for i in range(COUNT)])
+
+
+def object_hook(d):
+    # Tell the objects apart by their keys
+    if 'first_name' in d:
+        return Owner(**d)
+    return Item(**d)
+
+
+def loads_dicts(doc):
+    return json.loads(doc)
+
+
+def loads_object_hook(doc):
+    return json.loads(doc, object_hook=object_hook)
+
+
+def loads_convert(doc):
+    return [Item(**dict(d, owner=Owner(**d['owner'])))
+            for d in json.loads(doc)]
+
+
+def loads_schema(doc):
+    return json.loads(doc, schema=list[Item])
+
+
+def timeit(func, doc):
+    return min(_time(func, doc) for i in range(3))
+
+
+def _time(func, doc):
+    start = time.perf_counter()
+    func(doc)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    doc = make_doc()
+    assert loads_schema(doc) == loads_object_hook(doc) == loads_convert(doc)
+    print('Input: %d objects, %.1f MB' % (COUNT, len(doc) / 1e6))
+    for name, func in [
+            ('json.loads() to dicts', loads_dicts),
+            ('json.loads(object_hook=...)', loads_object_hook),
+            ('json.loads() then Item(**d)', loads_convert),
+            ('json.loads(schema=list[Item])', loads_schema),
+            ]:
+        print('%-35s %8.1f ms' % (name, timeit(func, doc) * 1e3))
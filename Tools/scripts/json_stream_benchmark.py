@@ -0,0 +1,90 @@
+'Compare json.JSONIncrementalDecoder with json.loads() on large inputs.'
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+COUNT = 200000
+
+
+def make_array():
+    return json.dumps([{'id': i, 'name': 'item %d' % i, 'price': i / 7,
+                        'tags': ['a', 'b'], 'active': i % 2 == 0}
+                       for i in range(COUNT)])
+
+
+def loads_array(filename):
+    with open(filename, 'rb') as f:
+        return len(json.load(f))
+
+
+def stream_array(filename):
+    n = 0
+    with open(filename, 'rb') as f:
+        for item in json.iterload(f, mode='items'):
+            n += 1
+    return n
+
+
+def loads_lines(filename):
+    n = 0
+    with open(filename, 'rb') as f:
+        for line in f:
+            json.loads(line)
+            n += 1
+    return n
+
+
+def stream_lines(filename):
+    n = 0
+    with open(filename, 'rb') as f:
+        for item in json.iterload(f):
+            n += 1
+    return n
+
+
+def stream_events(filename):
+    n = 0
+    with open(filename, 'rb') as f:
+        for event in json.iterload(f, mode='events'):
+            n += 1
+    return n
+
+
+def measure(func, filename):
+    start = time.perf_counter()
+    func(filename)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(filename)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return os.path.getsize(filename) / elapsed / 1e6, peak / 1e6
+
+
+def write_file(dirname, name, data):
+    filename = os.path.join(dirname, name)
+    with open(filename, 'w') as f:
+        f.write(data)
+    return filename
+
+
+if __name__ == '__main__':
+    array = make_array()
+    lines = '\n'.join(json.dumps(item) for item in json.loads(array)) + '\n'
+    print('Input: %d objects, %.1f MB' % (COUNT, len(array) / 1e6))
+    print('%-30s %10s %14s' % ('', 'MB/s', 'peak memory'))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        array = write_file(tmpdir, 'array.json', array)
+        lines = write_file(tmpdir, 'lines.json', lines)
+        for name, func, filename in [
+                ('json.load(array)', loads_array, array),
+                ("iterload(mode='items')", stream_array, array),
+                ('json.loads() per line', loads_lines, lines),
+                ("iterload(mode='values')", stream_lines, lines),
+                ("iterload(mode='events')", stream_events, array),
+                ]:
+            speed, peak = measure(func, filename)
+            print('%-30s %10.1f %11.1f MB' % (name, speed, peak))
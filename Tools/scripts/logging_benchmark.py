@@ -0,0 +1,145 @@
+'Measure the throughput of logging calls through the usual handler stack.'
+
+import io
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import tempfile
+import time
+
+COUNT = 100000
+FORMAT = ('%(asctime)s %(levelname)s %(name)s '
+          '%(filename)s:%(lineno)d %(message)s')
+
+
+def log_records(logger):
+    for i in range(COUNT):
+        logger.info('request %d handled in %.1f ms', i, 1.5)
+
+
+def log_fields(logger):
+    for i in range(COUNT):
+        logger.info('request handled', fields={'request': i, 'ms': 1.5})
+
+
+def log_filtered(logger):
+    for i in range(COUNT):
+        logger.debug('request %d handled in %.1f ms', i, 1.5)
+
+
+def make_logger(handler):
+    logger = logging.Logger('bench', logging.INFO)
+    handler.setFormatter(logging.Formatter(FORMAT))
+    logger.addHandler(handler)
+    return logger
+
+
+def timeit(func, logger):
+    start = time.perf_counter()
+    func(logger)
+    return time.perf_counter() - start
+
+
+def time_listener(handler, batch_size):
+    # Time the listener thread alone: the records are queued before it starts
+    q = queue.SimpleQueue()
+    logger = logging.Logger('bench', logging.INFO)
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    handler.setFormatter(logging.Formatter(FORMAT))
+    log_records(logger)
+    listener = logging.handlers.QueueListener(q, handler,
+                                              batch_size=batch_size)
+    start = time.perf_counter()
+    listener.start()
+    listener.stop()
+    return time.perf_counter() - start
+
+
+def run_listener(tmpdir):
+    filename = os.path.join(tmpdir, 'bench.log')
+    for batch_size in [1, 100]:
+        file_handler = logging.FileHandler(filename)
+        elapsed = min(time_listener(file_handler, batch_size)
+                      for i in range(3))
+        print('%-12s %-25s %10.0f records/s'
+              % ('QueueListener', 'batch_size=%d' % batch_size,
+                 COUNT / elapsed))
+        file_handler.close()
+
+
+class DumpsFormatter(logging.Formatter):
+    # A JSON formatter built on top of Formatter, as found in applications
+    def format(self, record):
+        return json.dumps({'created': record.created,
+                           'levelname': record.levelname,
+                           'name': record.name,
+                           'message': super().format(record),
+                           **(record.fields or {})})
+
+
+def run_formatters():
+    for name, formatter in [
+            ('Formatter', logging.Formatter()),
+            ('json.dumps() per record', DumpsFormatter()),
+            ('JSONFormatter', logging.JSONFormatter()),
+            ]:
+        handler = logging.StreamHandler(io.StringIO())
+        logger = logging.Logger('bench', logging.INFO)
+        logger.addHandler(handler)
+        handler.setFormatter(formatter)
+        elapsed = min(timeit(log_fields, logger) for i in range(3))
+        print('%-12s %-25s %10.0f records/s'
+              % ('Fields', name, COUNT / elapsed))
+
+
+def run_file_handlers(tmpdir):
+    filename = os.path.join(tmpdir, 'bench.log')
+    for name, factory in [
+            ('FileHandler', logging.FileHandler),
+            ('RotatingFileHandler', lambda filename:
+                logging.handlers.RotatingFileHandler(
+                    filename, maxBytes=2**30, backupCount=1)),
+            ('WatchedFileHandler', logging.handlers.WatchedFileHandler),
+            ('stat_interval=1', lambda filename:
+                logging.handlers.WatchedFileHandler(
+                    filename, stat_interval=1)),
+            ]:
+        handler = factory(filename)
+        elapsed = min(timeit(log_records, make_logger(handler))
+                      for i in range(3))
+        print('%-12s %-25s %10.0f records/s'
+              % ('Handler', name, COUNT / elapsed))
+        handler.close()
+        os.unlink(filename)
+
+
+def run(factory_name, tmpdir):
+    filename = os.path.join(tmpdir, 'bench.log')
+    file_handler = logging.FileHandler(filename)
+    for name, func, logger in [
+            ('StreamHandler(StringIO)', log_records,
+             make_logger(logging.StreamHandler(io.StringIO()))),
+            ('FileHandler', log_records, make_logger(file_handler)),
+            ('filtered by level', log_filtered,
+             make_logger(logging.NullHandler())),
+            ]:
+        elapsed = min(timeit(func, logger) for i in range(3))
+        print('%-12s %-25s %10.0f records/s'
+              % (factory_name, name, COUNT / elapsed))
+    file_handler.close()
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for factory_name, factory in [
+                ('LogRecord', logging.LogRecord),
+                ('SlottedLogRecord', logging.SlottedLogRecord),
+                ]:
+            logging.setLogRecordFactory(factory)
+            run(factory_name, tmpdir)
+        logging.setLogRecordFactory(logging.LogRecord)
+        run_listener(tmpdir)
+        run_file_handlers(tmpdir)
+    run_formatters()
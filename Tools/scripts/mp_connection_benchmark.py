@@ -0,0 +1,93 @@
+'Measure latency and throughput of multiprocessing connections and queues.'
+
+import multiprocessing
+import sys
+import time
+
+ROUND_TRIPS = 20000
+MESSAGES = 200000
+BATCH = 100
+PAYLOAD = b'x' * 64
+
+
+def echo(conn):
+    for msg in iter(conn.recv_bytes, b''):
+        conn.send_bytes(msg)
+    conn.close()
+
+
+def drain(conn, done, count):
+    recv_bytes = conn.recv_bytes
+    for i in range(count):
+        recv_bytes()
+    done.send_bytes(b'done')
+
+
+def drain_queue(queue, done, count):
+    get = queue.get
+    for i in range(count):
+        get()
+    done.send_bytes(b'done')
+
+
+def ping_pong(ctx):
+    conn, child_conn = ctx.Pipe()
+    p = ctx.Process(target=echo, args=(child_conn,))
+    p.start()
+    send_bytes = conn.send_bytes
+    recv_bytes = conn.recv_bytes
+    start = time.perf_counter()
+    for i in range(ROUND_TRIPS):
+        send_bytes(PAYLOAD)
+        recv_bytes()
+    elapsed = time.perf_counter() - start
+    send_bytes(b'')
+    p.join()
+    return elapsed / ROUND_TRIPS * 1e6
+
+
+def one_way(ctx, batched):
+    reader, writer = ctx.Pipe(duplex=False)
+    done_reader, done_writer = ctx.Pipe(duplex=False)
+    p = ctx.Process(target=drain, args=(reader, done_writer, MESSAGES))
+    p.start()
+    start = time.perf_counter()
+    if batched:
+        batch = [PAYLOAD] * BATCH
+        for i in range(MESSAGES // BATCH):
+            writer.send_bytes_many(batch)
+    else:
+        send_bytes = writer.send_bytes
+        for i in range(MESSAGES):
+            send_bytes(PAYLOAD)
+    done_reader.recv_bytes()
+    elapsed = time.perf_counter() - start
+    p.join()
+    return MESSAGES / elapsed
+
+
+def queue_throughput(ctx):
+    queue = ctx.Queue()
+    reader, writer = ctx.Pipe(duplex=False)
+    p = ctx.Process(target=drain_queue, args=(queue, writer, MESSAGES))
+    p.start()
+    put = queue.put
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        put(PAYLOAD)
+    reader.recv_bytes()
+    elapsed = time.perf_counter() - start
+    p.join()
+    return MESSAGES / elapsed
+
+
+if __name__ == '__main__':
+    method = sys.argv[1] if len(sys.argv) > 1 else None
+    ctx = multiprocessing.get_context(method)
+    print('Start method: %s' % ctx.get_start_method())
+    print('Payload: %d bytes' % len(PAYLOAD))
+    print('%10.1f us\tping-pong round trip' % ping_pong(ctx))
+    print('%10.0f msg/s\tsend_bytes' % one_way(ctx, False))
+    print('%10.0f msg/s\tsend_bytes_many (batches of %d)'
+          % (one_way(ctx, True), BATCH))
+    print('%10.0f msg/s\tQueue.put/get' % queue_throughput(ctx))
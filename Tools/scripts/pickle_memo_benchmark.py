@@ -0,0 +1,63 @@
+'Compare the ways of pickling many small messages with and without the memo.'
+
+import pickle
+import time
+
+COUNT = 200000
+
+
+def make_messages():
+    return [{'method': 'get_item', 'id': i,
+             'params': [i, 'name %d' % i, i / 7, True],
+             'meta': {'user': 'guest', 'tags': ('a', 'b')}}
+            for i in range(COUNT)]
+
+
+def dumps(messages):
+    for msg in messages:
+        pickle.dumps(msg)
+
+
+def dumps_no_memoize(messages):
+    for msg in messages:
+        pickle.dumps(msg, memoize=False)
+
+
+def pickler_dumps(messages):
+    dumps = pickle.Pickler(None).dumps
+    for msg in messages:
+        dumps(msg)
+
+
+def pickler_dumps_no_memoize(messages):
+    dumps = pickle.Pickler(None, memoize=False).dumps
+    for msg in messages:
+        dumps(msg)
+
+
+def timeit(func, messages):
+    return min(_time(func, messages) for i in range(3))
+
+
+def _time(func, messages):
+    start = time.perf_counter()
+    func(messages)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    messages = make_messages()
+    size = len(pickle.dumps(messages[0]))
+    size_no_memo = len(pickle.dumps(messages[0], memoize=False))
+    print('Messages: %d, %d bytes each (%d bytes without the memo)'
+          % (COUNT, size, size_no_memo))
+    for name, func in [
+            ("pickle.dumps()", dumps),
+            ("pickle.dumps(memoize=False)", dumps_no_memoize),
+            ("Pickler(None).dumps()", pickler_dumps),
+            ("Pickler(None, memoize=False).dumps()",
+             pickler_dumps_no_memoize),
+            ]:
+        elapsed = timeit(func, messages)
+        print('%-40s %8.1f ms %8.0f msg/s'
+              % (name, elapsed * 1e3, COUNT / elapsed))
@@ -0,0 +1,85 @@
+'Compare pickle.dump() with pickle.dump_segmented() on a large list.'
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+COUNT = 2000000
+
+
+def make_data():
+    return [(i, 'item %d' % i, i / 7) for i in range(COUNT)]
+
+
+def total(segment):
+    return sum(item[0] for item in segment)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def dump(data, filename):
+    with open(filename, 'wb') as f:
+        pickle.dump(data, f, protocol=4)
+
+
+def dump_segmented(data, filename):
+    with open(filename, 'wb') as f:
+        pickle.dump_segmented(data, f, protocol=4)
+
+
+def load(filename):
+    with open(filename, 'rb') as f:
+        return pickle.load(f)
+
+
+def load_segmented(filename):
+    with pickle.SegmentedPickle(filename) as p:
+        return p.load()
+
+
+def sum_load(filename):
+    return total(load(filename))
+
+
+def sum_segments(filename):
+    with pickle.SegmentedPickle(filename) as p:
+        return sum(p.map(total))
+
+
+def sum_segments_parallel(filename, workers):
+    with pickle.SegmentedPickle(filename) as p:
+        with ProcessPoolExecutor(workers) as executor:
+            return sum(p.map(total, executor))
+
+
+if __name__ == '__main__':
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    data = make_data()
+    print('Data: list of %d tuples' % COUNT)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plain = os.path.join(tmpdir, 'plain.pickle')
+        segmented = os.path.join(tmpdir, 'segmented.pickle')
+        for name, func, args in [
+                ('pickle.dump()', dump, (data, plain)),
+                ('pickle.dump_segmented()', dump_segmented,
+                 (data, segmented)),
+                ('pickle.load()', load, (plain,)),
+                ('pickle.load() of segments', load, (segmented,)),
+                ('SegmentedPickle.load()', load_segmented, (segmented,)),
+                ('load() then sum', sum_load, (plain,)),
+                ('SegmentedPickle.map(sum)', sum_segments, (segmented,)),
+                ('SegmentedPickle.map(sum, %d workers)' % workers,
+                 sum_segments_parallel, (segmented, workers)),
+                ]:
+            elapsed, result = timed(func, *args)
+            print('%-40s %8.1f ms' % (name, elapsed * 1e3))
+        print('File sizes: %.1f MB plain, %.1f MB segmented'
+              % (os.path.getsize(plain) / 1e6,
+                 os.path.getsize(segmented) / 1e6))
@@ -0,0 +1,44 @@
+'Measure how re.set_cache_file() shortens the start of a process using many patterns.'
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+COUNT = 500
+
+# A routing table: each process compiles every pattern once.
+CODE = '''if 1:
+    import re, sys
+    if sys.argv[1]:
+        re.set_cache_file(sys.argv[1])
+    routes = [re.compile(r'^/api/v%%d/(?P<kind>users|groups|items)/'
+                         r'(?P<id>\\d+)(?:/(?P<action>[a-z_]+))?/?$' %% i)
+              for i in range(%d)]
+    ''' % COUNT
+
+
+def run(cache_file):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', CODE, cache_file], check=True)
+    return time.perf_counter() - start
+
+
+def timeit(cache_file):
+    return min(run(cache_file) for i in range(5))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_file = os.path.join(tmpdir, 're.cache')
+        for name, filename in [
+                ('no cache file', ''),
+                ('cache file', cache_file),
+                ]:
+            if filename:
+                # Fill the cache file
+                run(filename)
+            elapsed = timeit(filename)
+            print('%-20s %8.1f ms per process start (%d patterns)'
+                  % (name, elapsed * 1e3, COUNT))
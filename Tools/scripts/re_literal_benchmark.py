@@ -0,0 +1,77 @@
+'Measure searching log lines for patterns with a literal past the start.'
+
+import _sre
+import re
+import sre_compile
+import sre_constants
+import time
+
+COUNT = 100000
+PATTERNS = [
+    r'.*ERROR code=(\d+)',
+    r'(\w+)@example\.com',
+    r'\d+ms elapsed',
+    r'[\w.]+:\d+ timed out',
+    ]
+
+
+def make_lines():
+    lines = []
+    for i in range(COUNT):
+        if i % 100 == 0:
+            lines.append('2020-10-19 12:00:%02d host%d ERROR code=%d '
+                         'user%d@example.com db.py:%d timed out'
+                         % (i % 60, i % 7, i % 500, i, i % 900))
+        else:
+            lines.append('2020-10-19 12:00:%02d host%d INFO request %d '
+                         'handled for user%d in %dms'
+                         % (i % 60, i % 7, i, i % 1000, i % 300))
+    return lines
+
+
+def without_required(pattern):
+    # Compile the pattern with a plain info block, as before the
+    # required literal was searched for
+    flags, code, groups, groupindex, indexgroup = \
+        sre_compile.compile_data(pattern)
+    assert code[0] == sre_constants.INFO
+    code = code[:5] + code[1 + code[1]:]
+    code[1] = 4
+    code[2] &= ~sre_constants.SRE_INFO_REQUIRED
+    return _sre.compile(pattern, flags, code, groups, groupindex, indexgroup)
+
+
+def search_lines(pattern, lines):
+    search = pattern.search
+    for line in lines:
+        search(line)
+
+
+def search_text(pattern, text):
+    pattern.findall(text)
+
+
+def timeit(func, pattern, data):
+    return min(_time(func, pattern, data) for i in range(3))
+
+
+def _time(func, pattern, data):
+    start = time.perf_counter()
+    func(pattern, data)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    lines = make_lines()
+    text = '\n'.join(lines)
+    print('Input: %d lines, %.1f MB' % (COUNT, len(text) / 1e6))
+    print('%-25s %-12s %12s %12s' % ('', '', 'before', 'after'))
+    for pattern in PATTERNS:
+        for name, func, data in [
+                ('search() per line', search_lines, lines),
+                ('findall() on text', search_text, text),
+                ]:
+            before = timeit(func, without_required(pattern), data)
+            after = timeit(func, re.compile(pattern), data)
+            print('%-25s %-18s %9.1f ms %9.1f ms'
+                  % (pattern, name, before * 1e3, after * 1e3))
@@ -0,0 +1,71 @@
+'Compare re.PatternSet with trying 1000 compiled patterns one by one.'
+
+import random
+import re
+import time
+
+COUNT = 1000
+LINES = 2000
+
+WORDS = ['disk', 'user', 'request', 'cache', 'queue', 'worker', 'session',
+         'backup', 'index', 'socket']
+
+
+def make_routes():
+    return [r'/%s/v%d/(?P<id>\d+)(?:/(?P<action>[a-z]+))?$'
+            % (WORDS[i % len(WORDS)], i) for i in range(COUNT)]
+
+
+def make_log_patterns():
+    return [r'%s %d (failed|timed out) after (\d+) ms'
+            % (WORDS[i % len(WORDS)], i) for i in range(COUNT)]
+
+
+def make_paths(rng):
+    return ['/%s/v%d/%d/edit' % (rng.choice(WORDS), rng.randrange(COUNT * 2),
+                                 rng.randrange(1000))
+            for i in range(LINES)]
+
+
+def make_log_lines(rng):
+    return ['2020-10-05 12:00:00 worker-%d ERROR %s %d failed after %d ms'
+            % (rng.randrange(8), rng.choice(WORDS), rng.randrange(COUNT * 2),
+               rng.randrange(1000))
+            for i in range(LINES)]
+
+
+def one_by_one(patterns, strings, method):
+    for s in strings:
+        [i for i, p in enumerate(patterns) if getattr(p, method)(s)]
+
+
+def pattern_set(ps, strings, method):
+    for s in strings:
+        getattr(ps, method)(s)
+
+
+def timeit(func, *args):
+    times = []
+    for i in range(3):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    rng = random.Random(0)
+    for name, patterns, strings, method in [
+            ('routes', make_routes(), make_paths(rng), 'match'),
+            ('log lines', make_log_patterns(), make_log_lines(rng), 'search'),
+            ]:
+        compiled = [re.compile(p) for p in patterns]
+        start = time.perf_counter()
+        ps = re.PatternSet(patterns)
+        build = time.perf_counter() - start
+        t1 = timeit(one_by_one, compiled, strings, method)
+        t2 = timeit(pattern_set, ps, strings, method)
+        print('%-10s %s() of %d patterns: one by one %8.1f us, '
+              'PatternSet %6.1f us per string (built in %.0f ms)'
+              % (name, method, COUNT, t1 / LINES * 1e6, t2 / LINES * 1e6,
+                 build * 1e3))
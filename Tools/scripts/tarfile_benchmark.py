@@ -0,0 +1,64 @@
+'Measure finding members of a large tar archive with and without an index.'
+
+import io
+import os
+import random
+import tarfile
+import tempfile
+import time
+
+COUNT = 100000
+LOOKUPS = 10
+
+
+def write_archive(filename):
+    data = b'x' * 1000
+    with tarfile.open(filename, 'w') as tar:
+        for i in range(COUNT):
+            tarinfo = tarfile.TarInfo('dir%d/file%d.txt' % (i % 100, i))
+            tarinfo.size = len(data)
+            tar.addfile(tarinfo, io.BytesIO(data))
+
+
+def lookup(filename, names, index=None, **kwargs):
+    # Open the archive for each member, as a server handling requests does
+    for name in names:
+        with tarfile.open(filename, **kwargs) as tar:
+            if index:
+                tar.load_index(index)
+            with tar.extractfile(name) as f:
+                f.read()
+
+
+def timeit(func, *args, **kwargs):
+    return min(_time(func, *args, **kwargs) for i in range(3))
+
+
+def _time(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'archive.tar')
+        index = filename + '.idx'
+        write_archive(filename)
+        start = time.perf_counter()
+        with tarfile.open(filename) as tar:
+            tar.save_index(index)
+        elapsed = time.perf_counter() - start
+        print('Input: %d members, %.1f MB, index of %.1f MB built in %.2f s'
+              % (COUNT, os.path.getsize(filename) / 1e6,
+                 os.path.getsize(index) / 1e6, elapsed))
+        names = ['dir%d/file%d.txt' % (i % 100, i)
+                 for i in random.sample(range(COUNT), LOOKUPS)]
+        for name, args, kwargs in [
+                ('without index', (), {}),
+                ('with index', (index,), {}),
+                ('with index, use_mmap=True', (index,), {'use_mmap': True}),
+                ]:
+            elapsed = timeit(lookup, filename, names, *args, **kwargs)
+            print('%-30s %10.2f ms per member'
+                  % (name, elapsed / LOOKUPS * 1e3))
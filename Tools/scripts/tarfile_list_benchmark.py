@@ -0,0 +1,44 @@
+'Measure creating and listing a tar archive of many small members.'
+
+import os
+import tarfile
+import tempfile
+import time
+
+COUNT = 1000000
+
+
+def write_archive(filename, format):
+    with tarfile.open(filename, 'w', format=format) as tar:
+        for i in range(COUNT):
+            tarinfo = tarfile.TarInfo('dir%d/file%d.txt' % (i % 1000, i))
+            tarinfo.mtime = 1603108800 + i
+            tarinfo.uname = tarinfo.gname = 'user'
+            tar.addfile(tarinfo)
+
+
+def list_archive(filename):
+    with tarfile.open(filename) as tar:
+        return len(tar.getnames())
+
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'archive.tar')
+        for name, format in [
+                ('USTAR_FORMAT', tarfile.USTAR_FORMAT),
+                ('GNU_FORMAT', tarfile.GNU_FORMAT),
+                ('PAX_FORMAT', tarfile.PAX_FORMAT),
+                ]:
+            elapsed = timeit(write_archive, filename, format)
+            print('%-14s write %10.0f members/s %8.1f MB'
+                  % (name, COUNT / elapsed, os.path.getsize(filename) / 1e6))
+            elapsed = timeit(list_archive, filename)
+            print('%-14s list  %10.0f members/s' % (name, COUNT / elapsed))
+            os.unlink(filename)
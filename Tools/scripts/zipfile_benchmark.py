@@ -0,0 +1,111 @@
+'Measure opening, extracting and writing ZIP files with many members.'
+
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+COUNT = 500000
+EXTRACT_COUNT = 2000
+
+
+def write_many(filename):
+    with zipfile.ZipFile(filename, 'w') as zf:
+        for i in range(COUNT):
+            zinfo = zipfile.ZipInfo('dir%d/file%d.txt' % (i % 100, i))
+            zf.writestr(zinfo, b'')
+
+
+def write_large(filename):
+    data = b''.join(b'line %d of the file\n' % i for i in range(20000))
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for i in range(EXTRACT_COUNT):
+            zf.writestr('dir%d/file%d.txt' % (i % 10, i), data)
+
+
+def make_members():
+    return [('dir%d/file%d.txt' % (i % 10, i),
+             b''.join(b'line %d of file %d\n' % (j, i) for j in range(2000)))
+            for i in range(EXTRACT_COUNT)]
+
+
+def write_serial(filename, members):
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members:
+            zf.writestr(name, data)
+
+
+def write_batch(filename, members, threads):
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zf.batch(threads) as batch:
+            for name, data in members:
+                batch.writestr(name, data)
+
+
+def open_names(filename, **kwargs):
+    with zipfile.ZipFile(filename, **kwargs) as zf:
+        zf.getinfo(zf.namelist()[-1])
+
+
+def open_infolist(filename, **kwargs):
+    # What opening cost when every ZipInfo was created by the constructor
+    with zipfile.ZipFile(filename, **kwargs) as zf:
+        zf.infolist()
+
+
+def extract(filename, path, threads, **kwargs):
+    with zipfile.ZipFile(filename, **kwargs) as zf:
+        zf.extractall(path, threads=threads)
+    shutil.rmtree(path)
+
+
+def timeit(func, *args, **kwargs):
+    return min(_time(func, *args, **kwargs) for i in range(3))
+
+
+def _time(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'many.zip')
+        write_many(filename)
+        print('Open: %d members, %.1f MB'
+              % (COUNT, os.path.getsize(filename) / 1e6))
+        for name, func, kwargs in [
+                ('namelist() + getinfo()', open_names, {}),
+                ('use_mmap=True', open_names, {'use_mmap': True}),
+                ('infolist()', open_infolist, {}),
+                ]:
+            elapsed = timeit(func, filename, **kwargs)
+            print('%-25s %8.1f ms' % (name, elapsed * 1e3))
+        os.unlink(filename)
+
+        filename = os.path.join(tmpdir, 'large.zip')
+        write_large(filename)
+        size = sum(zinfo.file_size
+                   for zinfo in zipfile.ZipFile(filename).infolist())
+        print('Extract: %d members, %.1f MB, %d CPUs'
+              % (EXTRACT_COUNT, size / 1e6, os.cpu_count()))
+        path = os.path.join(tmpdir, 'extracted')
+        for threads in [1, 2, 4, 8]:
+            for name, kwargs in [('', {}), ('use_mmap=True',
+                                            {'use_mmap': True})]:
+                elapsed = timeit(extract, filename, path, threads, **kwargs)
+                print('threads=%d %-15s %8.1f MB/s'
+                      % (threads, name, size / elapsed / 1e6))
+        os.unlink(filename)
+
+        members = make_members()
+        size = sum(len(data) for name, data in members)
+        print('Write: %d members, %.1f MB' % (EXTRACT_COUNT, size / 1e6))
+        elapsed = timeit(write_serial, filename, members)
+        print('%-25s %8.1f MB/s' % ('writestr()', size / elapsed / 1e6))
+        for threads in [1, 2, 4, 8]:
+            elapsed = timeit(write_batch, filename, members, threads)
+            print('%-25s %8.1f MB/s' % ('batch(%d).writestr()' % threads,
+                                         size / elapsed / 1e6))